@@ -0,0 +1,37 @@
+"""Add LLM usage columns to messages
+
+Revision ID: 003_add_message_usage
+Revises: 002_add_documents_table
+Create Date: 2024-12-02 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '003_add_message_usage'
+down_revision = '002_add_documents_table'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('messages', sa.Column('provider', sa.String(length=50), nullable=True))
+    op.add_column('messages', sa.Column('model_id', sa.String(length=255), nullable=True))
+    op.add_column('messages', sa.Column('input_tokens', sa.Integer(), nullable=True))
+    op.add_column('messages', sa.Column('output_tokens', sa.Integer(), nullable=True))
+    op.add_column('messages', sa.Column('latency_ms', sa.Float(), nullable=True))
+    op.add_column('messages', sa.Column('time_to_first_token_ms', sa.Float(), nullable=True))
+
+    # Usage reports filter by time range
+    op.create_index('idx_messages_created_at', 'messages', ['created_at'])
+
+
+def downgrade():
+    op.drop_index('idx_messages_created_at', table_name='messages')
+    op.drop_column('messages', 'time_to_first_token_ms')
+    op.drop_column('messages', 'latency_ms')
+    op.drop_column('messages', 'output_tokens')
+    op.drop_column('messages', 'input_tokens')
+    op.drop_column('messages', 'model_id')
+    op.drop_column('messages', 'provider')
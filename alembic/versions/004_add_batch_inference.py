@@ -0,0 +1,60 @@
+"""Add ingestion jobs and batch inference results tables
+
+Revision ID: 004_add_batch_inference
+Revises: 003_add_message_usage
+Create Date: 2024-12-09 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '004_add_batch_inference'
+down_revision = '003_add_message_usage'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Create ingestion_jobs table
+    op.create_table(
+        'ingestion_jobs',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('provider', sa.String(length=50), nullable=False),
+        sa.Column('status', sa.String(length=20), nullable=False),
+        sa.Column('source', sa.Text(), nullable=True),
+        sa.Column('user_id', sa.Integer(), nullable=True),
+        sa.Column('details', sa.Text(), nullable=True),
+        sa.Column('error_message', sa.Text(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), server_default=sa.text('now()'), nullable=True),
+        sa.Column('started_at', sa.DateTime(), nullable=True),
+        sa.Column('finished_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='SET NULL'),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('idx_ingestion_jobs_user_id', 'ingestion_jobs', ['user_id'])
+    op.create_index('idx_ingestion_jobs_provider_status', 'ingestion_jobs', ['provider', 'status'])
+
+    # Create batch_inference_results table; one row per job record
+    op.create_table(
+        'batch_inference_results',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('job_id', sa.Integer(), nullable=False),
+        sa.Column('record_id', sa.String(length=255), nullable=False),
+        sa.Column('status', sa.String(length=20), nullable=False),
+        sa.Column('output', sa.Text(), nullable=True),
+        sa.Column('error_message', sa.Text(), nullable=True),
+        sa.Column('input_tokens', sa.Integer(), nullable=True),
+        sa.Column('output_tokens', sa.Integer(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), server_default=sa.text('now()'), nullable=True),
+        sa.ForeignKeyConstraint(['job_id'], ['ingestion_jobs.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('job_id', 'record_id', name='uq_batch_inference_results_job_record')
+    )
+
+
+def downgrade():
+    op.drop_table('batch_inference_results')
+    op.drop_index('idx_ingestion_jobs_provider_status', table_name='ingestion_jobs')
+    op.drop_index('idx_ingestion_jobs_user_id', table_name='ingestion_jobs')
+    op.drop_table('ingestion_jobs')
@@ -0,0 +1,25 @@
+"""Add tool call columns to messages
+
+Revision ID: 005_add_message_tool_calls
+Revises: 004_add_batch_inference
+Create Date: 2024-12-16 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '005_add_message_tool_calls'
+down_revision = '004_add_batch_inference'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('messages', sa.Column('tool_calls', sa.Text(), nullable=True))
+    op.add_column('messages', sa.Column('tool_results', sa.Text(), nullable=True))
+
+
+def downgrade():
+    op.drop_column('messages', 'tool_results')
+    op.drop_column('messages', 'tool_calls')
@@ -0,0 +1,59 @@
+"""Admin controller."""
+
+from typing import Any, Dict
+from fastapi import Depends, Query
+from schemas.conversation_schema import UsageReport
+from infrastructure.postgresql.models import User
+from api.middlewares.jwt_middleware import require_admin
+from infrastructure.ai_services.providers.scheduler import get_llm_scheduler
+from infrastructure.ai_services.provider_pool import get_llm_provider_pool
+from infrastructure.ai_services.tools.executor import get_tool_stats
+from infrastructure.auth.password_hasher import get_password_hasher
+from infrastructure.postgresql.connection.database import db_manager
+from usecases.conversation_use_cases import GetUsageReportUseCase
+from core.dependencies import get_usage_report_use_case
+
+
+async def get_usage_report(
+    group_by: str = Query("provider", pattern="^(provider|chatbot|user)$"),
+    days: int = Query(7, ge=1, le=365),
+    current_user: User = Depends(require_admin),
+    use_case: GetUsageReportUseCase = Depends(get_usage_report_use_case)
+) -> UsageReport:
+    """
+    Report LLM token usage and latency (admin only).
+
+    Args:
+        group_by: Group by provider (and model), chatbot or user
+        days: Number of days to report on
+        current_user: Authenticated admin user
+        use_case: Usage report use case instance
+
+    Returns:
+        UsageReport: Persisted usage per group and this process's live totals
+    """
+    return await use_case.execute(group_by=group_by, days=days)
+
+
+async def get_llm_capacity(current_user: User = Depends(require_admin)) -> Dict[str, Any]:
+    """
+    Report LLM call concurrency and queueing, and other shared pools, in this process (admin only).
+
+    Args:
+        current_user: Authenticated admin user
+
+    Returns:
+        Dict[str, Any]: In-flight and queued calls, queue times per priority,
+            the current (adaptive) limit and throttle count per model, the
+            pooled provider instances, and tool calls (model round trips per
+            answer, calls, errors, cache hits and latency per tool), the
+            password hashing pool (queue depth, rejections and wait times)
+            and the database connection pool (checkouts and wait times)
+    """
+    return {
+        **get_llm_scheduler().stats(),
+        "provider_pool": get_llm_provider_pool().stats(),
+        "tools": get_tool_stats().snapshot(),
+        "password_hashing": get_password_hasher().get_metrics(),
+        "database_pool": db_manager.get_pool_metrics()
+    }
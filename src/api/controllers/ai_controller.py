@@ -1,16 +1,25 @@
 from fastapi import APIRouter, Depends, HTTPException
-from typing import Dict, Any
+from fastapi.responses import StreamingResponse
+from typing import Dict, Any, AsyncIterator
 from schemas.rag_schema import QueryRequest, ChatResponse, SearchResponse, ContextResponse
-from usecases.rag_use_cases import ChatWithDocumentsUseCase, SemanticSearchUseCase, RetrieveContextsUseCase
+from usecases.rag_use_cases import (
+    ChatWithDocumentsUseCase,
+    StreamChatWithDocumentsUseCase,
+    SemanticSearchUseCase,
+    RetrieveContextsUseCase
+)
 from core.dependencies import (
     get_chat_with_documents_use_case, 
+    get_stream_chat_with_documents_use_case,
     get_semantic_search_use_case,
     get_retrieve_contexts_use_case,
     get_rag_service
 )
 from shared.interfaces.services.ai_services.rag_service import IRAGService
 from infrastructure.ai_services.factory import LLMFactory
+from infrastructure.streaming import format_sse
 from core.logger import logger
+from core.errors import BaseAppException
 from pydantic import BaseModel
 
 class LLMTestRequest(BaseModel):
@@ -38,6 +47,8 @@ class AIController:
                     "models": models,
                     "current_provider": "bedrock"  # Default from config
                 }
+            except BaseAppException:
+                raise
             except Exception as e:
                 logger.error(f"Error getting providers: {e}")
                 raise HTTPException(status_code=500, detail="Failed to get providers")
@@ -56,6 +67,7 @@ class AIController:
                     "vector_store": "S3 + OpenSearch",
                     "available_endpoints": [
                         "/ai/chat - Chat with documents (RAG)",
+                        "/ai/chat/stream - Chat with documents, streamed as Server-Sent Events",
                         "/ai/generate - Direct LLM generation",
                         "/ai/search - Semantic search",
                         "/ai/contexts - Retrieve contexts only",
@@ -63,6 +75,8 @@ class AIController:
                         "/ai/test - Test LLM with prompt"
                     ]
                 }
+            except BaseAppException:
+                raise
             except Exception as e:
                 logger.error(f"AI system info error: {e}")
                 raise HTTPException(status_code=500, detail="Failed to get AI system info")
@@ -87,6 +101,8 @@ class AIController:
                     "prompt": request.prompt
                 }
                 
+            except BaseAppException:
+                raise
             except Exception as e:
                 logger.error(f"Error testing LLM: {e}")
                 raise HTTPException(status_code=500, detail=f"LLM test failed: {str(e)}")
@@ -110,6 +126,8 @@ class AIController:
                     "prompt": request.prompt
                 }
                 
+            except BaseAppException:
+                raise
             except Exception as e:
                 logger.error(f"Error generating text: {e}")
                 raise HTTPException(status_code=500, detail=f"Text generation failed: {str(e)}")
@@ -126,13 +144,41 @@ class AIController:
                 result = await use_case.execute(
                     query=request.query,
                     domain=request.domain,
-                    context_limit=request.context_limit
+                    context_limit=request.context_limit,
+                    domains=request.domains,
+                    conversation_id=request.conversation_id
                 )
                 return ChatResponse(**result)
+            except BaseAppException:
+                raise
             except Exception as e:
                 logger.error(f"Chat error: {e}")
                 raise HTTPException(status_code=500, detail="Failed to process chat request")
         
+        @self.router.post("/chat/stream")
+        async def chat_with_documents_stream(
+            request: QueryRequest,
+            use_case: StreamChatWithDocumentsUseCase = Depends(get_stream_chat_with_documents_use_case)
+        ):
+            """
+            Chat with documents, streaming the answer as Server-Sent Events.
+
+            Events: ``contexts`` (retrieved contexts), ``token`` (text chunks),
+            ``done`` (usage and latency) or ``error``.
+            """
+            events = use_case.execute(
+                query=request.query,
+                domain=request.domain,
+                context_limit=request.context_limit,
+                domains=request.domains,
+                conversation_id=request.conversation_id
+            )
+            return StreamingResponse(
+                self._sse_stream(events),
+                media_type="text/event-stream",
+                headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+            )
+        
         @self.router.post("/search", response_model=SearchResponse)
         async def semantic_search(
             request: QueryRequest,
@@ -143,9 +189,12 @@ class AIController:
                 result = await use_case.execute(
                     search_query=request.query,
                     domain=request.domain,
-                    result_limit=request.context_limit
+                    result_limit=request.context_limit,
+                    domains=request.domains
                 )
                 return SearchResponse(**result)
+            except BaseAppException:
+                raise
             except Exception as e:
                 logger.error(f"Search error: {e}")
                 raise HTTPException(status_code=500, detail="Failed to process search request")
@@ -160,13 +209,32 @@ class AIController:
                 contexts = await use_case.execute(
                     query=request.query,
                     domain=request.domain,
-                    top_k=request.context_limit
+                    top_k=request.context_limit,
+                    domains=request.domains
                 )
                 return ContextResponse(
                     contexts=contexts,
                     query=request.query,
                     domain=request.domain
                 )
+            except BaseAppException:
+                raise
             except Exception as e:
                 logger.error(f"Context retrieval error: {e}")
-                raise HTTPException(status_code=500, detail="Failed to retrieve contexts")
\ No newline at end of file
+                raise HTTPException(status_code=500, detail="Failed to retrieve contexts")
+    
+    async def _sse_stream(self, events: AsyncIterator[Dict[str, Any]]) -> AsyncIterator[str]:
+        """
+        Format use case events as SSE.
+
+        On client disconnect Starlette cancels this generator; closing
+        ``events`` then closes the upstream LLM stream.
+        """
+        try:
+            async for event in events:
+                yield format_sse(event["event"], event["data"])
+        except Exception as e:
+            logger.error(f"Streaming chat error: {e}")
+            yield format_sse("error", {"detail": "Failed to process chat request"})
+        finally:
+            await events.aclose()
@@ -0,0 +1,97 @@
+"""Batch inference controller."""
+
+from fastapi import Depends, Query
+from typing import List
+from schemas.batch_schema import BatchJobCreate, BatchJobResponse, BatchResultResponse
+from infrastructure.postgresql.models import User
+from api.middlewares.jwt_middleware import require_admin
+from usecases.batch_inference_use_cases import (
+    SubmitBatchJobUseCase,
+    GetBatchJobUseCase,
+    ListBatchJobsUseCase,
+    ListBatchResultsUseCase
+)
+from core.dependencies import (
+    get_submit_batch_job_use_case,
+    get_batch_job_use_case,
+    get_list_batch_jobs_use_case,
+    get_list_batch_results_use_case
+)
+
+
+async def submit_batch_job(
+    job_data: BatchJobCreate,
+    current_user: User = Depends(require_admin),
+    use_case: SubmitBatchJobUseCase = Depends(get_submit_batch_job_use_case)
+) -> BatchJobResponse:
+    """
+    Submit a batch inference job (admin only).
+
+    Args:
+        job_data: Job name and records
+        current_user: Authenticated admin user
+        use_case: Submit batch job use case instance
+
+    Returns:
+        BatchJobResponse: Created job, in progress or pending
+    """
+    return await use_case.execute(job_data, current_user.id)
+
+
+async def list_batch_jobs(
+    current_user: User = Depends(require_admin),
+    use_case: ListBatchJobsUseCase = Depends(get_list_batch_jobs_use_case)
+) -> List[BatchJobResponse]:
+    """
+    List the current user's batch inference jobs (admin only).
+
+    Args:
+        current_user: Authenticated admin user
+        use_case: List batch jobs use case instance
+
+    Returns:
+        List[BatchJobResponse]: Jobs, newest first
+    """
+    return await use_case.execute(current_user.id)
+
+
+async def get_batch_job(
+    job_id: int,
+    current_user: User = Depends(require_admin),
+    use_case: GetBatchJobUseCase = Depends(get_batch_job_use_case)
+) -> BatchJobResponse:
+    """
+    Get a batch inference job, syncing it with the backend (admin only).
+
+    Args:
+        job_id: Job ID
+        current_user: Authenticated admin user
+        use_case: Get batch job use case instance
+
+    Returns:
+        BatchJobResponse: Job status and progress
+    """
+    return await use_case.execute(job_id)
+
+
+async def list_batch_results(
+    job_id: int,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000),
+    current_user: User = Depends(require_admin),
+    use_case: ListBatchResultsUseCase = Depends(get_list_batch_results_use_case)
+) -> List[BatchResultResponse]:
+    """
+    List the stored results of a batch inference job (admin only).
+
+    Args:
+        job_id: Job ID
+        skip: Number of results to skip
+        limit: Maximum number of results to return
+        current_user: Authenticated admin user
+        use_case: List batch results use case instance
+
+    Returns:
+        List[BatchResultResponse]: Stored results
+    """
+    return await use_case.execute(job_id, skip=skip, limit=limit)
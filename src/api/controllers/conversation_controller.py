@@ -7,7 +7,8 @@ from schemas.conversation_schema import (
     ConversationCreate,
     ConversationWithMessages,
     MessageCreate,
-    MessageResponse
+    MessageResponse,
+    ReplyCreate
 )
 from infrastructure.postgresql.models import User
 from api.middlewares.jwt_middleware import get_current_user
@@ -16,6 +17,7 @@ from usecases.conversation_use_cases import (
     GetConversationUseCase,
     CreateConversationUseCase,
     CreateMessageUseCase,
+    ReplyToConversationUseCase,
     DeleteConversationUseCase
 )
 from core.dependencies import (
@@ -23,6 +25,7 @@ from core.dependencies import (
     get_conversation_use_case,
     get_create_conversation_use_case,
     get_create_message_use_case,
+    get_reply_to_conversation_use_case,
     get_delete_conversation_use_case
 )
 
@@ -107,6 +110,27 @@ async def create_message(
     return await use_case.execute(conversation_id, message_data, current_user.id)
 
 
+async def reply_to_conversation(
+    conversation_id: int,
+    reply_data: ReplyCreate,
+    current_user: User = Depends(get_current_user),
+    use_case: ReplyToConversationUseCase = Depends(get_reply_to_conversation_use_case)
+) -> MessageResponse:
+    """
+    Send a message and get the assistant's reply.
+
+    Args:
+        conversation_id: Conversation ID
+        reply_data: User message and retrieval options
+        current_user: Authenticated user
+        use_case: Reply use case instance
+
+    Returns:
+        MessageResponse: Assistant message, with token usage and latency
+    """
+    return await use_case.execute(conversation_id, reply_data, current_user.id)
+
+
 async def delete_conversation(
     conversation_id: int,
     current_user: User = Depends(get_current_user),
@@ -1,10 +1,23 @@
 from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form
-from schemas.document_schema import DocumentUploadResponse, DocumentListResponse, DocumentStatusResponse
-from usecases.document_use_cases import UploadDocumentUseCase, DeleteDocumentUseCase, ListUserDocumentsUseCase
+from schemas.document_schema import (
+    DocumentUploadResponse,
+    DocumentListResponse,
+    DocumentStatusResponse,
+    DocumentProcessedRequest
+)
+from usecases.document_use_cases import (
+    UploadDocumentUseCase,
+    DeleteDocumentUseCase,
+    ListUserDocumentsUseCase,
+    MarkDocumentProcessedUseCase
+)
+from infrastructure.postgresql.models import User
+from api.middlewares.jwt_middleware import require_admin
 from core.dependencies import (
     get_upload_document_use_case,
     get_delete_document_use_case, 
-    get_list_user_documents_use_case
+    get_list_user_documents_use_case,
+    get_mark_document_processed_use_case
 )
 from core.logger import logger
 
@@ -59,6 +72,18 @@ class DocumentController:
                 logger.error(f"Delete error: {e}")
                 raise HTTPException(status_code=500, detail="Delete failed")
         
+        @self.router.post("/{document_id}/processed")
+        async def mark_document_processed(
+            document_id: str,
+            request: DocumentProcessedRequest,
+            current_user: User = Depends(require_admin),  # Called by the ingestion pipeline
+            use_case: MarkDocumentProcessedUseCase = Depends(get_mark_document_processed_use_case)
+        ):
+            success = await use_case.execute(document_id, request.error_message)
+            if not success:
+                raise HTTPException(status_code=404, detail="Document not found")
+            return {"message": "Document status updated"}
+        
         @self.router.get("/", response_model=DocumentListResponse)
         async def list_documents(
             user_id: str,  # In real app, get from JWT token
@@ -1,8 +1,19 @@
 """API middlewares package."""
 
-from api.middlewares.jwt_middleware import get_current_user, require_admin
+from core.lazy_import import lazy_exports
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "get_current_user": "api.middlewares.jwt_middleware",
+    "require_admin": "api.middlewares.jwt_middleware",
+    "rate_limit_middleware": "api.middlewares.rate_limit_middleware",
+    "rate_limit_by_body_field": "api.middlewares.rate_limit_middleware",
+    "DeadlineMiddleware": "api.middlewares.deadline_middleware",
+})
 
 __all__ = [
     "get_current_user",
-    "require_admin"
+    "require_admin",
+    "rate_limit_middleware",
+    "rate_limit_by_body_field",
+    "DeadlineMiddleware"
 ]
@@ -0,0 +1,55 @@
+"""Request deadline middleware."""
+
+import asyncio
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from core.config import settings
+from core.deadline import RequestDeadline, request_deadline
+
+
+class DeadlineMiddleware:
+    """
+    Attach a ``RequestDeadline`` to each HTTP request.
+
+    The deadline is ``REQUEST_TIMEOUT_SECONDS`` (``STREAMING_REQUEST_TIMEOUT_SECONDS``
+    for ``/stream`` routes), further capped by the remaining Lambda invocation
+    time when running under Mangum. Incoming ASGI messages are read by a
+    background task so a client disconnect cancels the deadline, and with it
+    any running retrieval or generation, even while the endpoint is not
+    reading the request.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timeout = (
+            settings.STREAMING_REQUEST_TIMEOUT_SECONDS
+            if scope["path"].endswith("/stream")
+            else settings.REQUEST_TIMEOUT_SECONDS
+        )
+        lambda_context = scope.get("aws.context")
+        if lambda_context is not None:
+            deadline = RequestDeadline.from_lambda_context(lambda_context, timeout)
+        else:
+            deadline = RequestDeadline(timeout)
+
+        messages: "asyncio.Queue[Message]" = asyncio.Queue()
+
+        async def pump() -> None:
+            while True:
+                message = await receive()
+                await messages.put(message)
+                if message["type"] == "http.disconnect":
+                    deadline.cancel("Client disconnected")
+                    return
+
+        pump_task = asyncio.create_task(pump())
+        try:
+            with request_deadline(deadline):
+                await self.app(scope, messages.get, send)
+        finally:
+            pump_task.cancel()
@@ -0,0 +1,165 @@
+"""Rate limiting middleware and dependencies."""
+
+from typing import Optional
+from fastapi import Request
+from fastapi.responses import JSONResponse
+from core.config import settings
+from core.errors import RateLimitExceededError
+from infrastructure.rate_limit import RateLimitResult, get_rate_limiter
+
+# Route prefixes mapped to rate limit classes, most specific first
+ROUTE_CLASSES = [
+    ("/api/v1/auth", "auth"),
+    ("/api/v1/ai", "chat"),
+    ("/api/v1/documents/upload", "upload"),
+]
+
+EXEMPT_PATHS = {"/", "/health", "/health/database", "/docs", "/redoc", "/openapi.json"}
+
+
+def classify_route(path: str) -> str:
+    """
+    Get rate limit class for a request path.
+
+    Args:
+        path: Request URL path
+
+    Returns:
+        str: Route class name (auth, chat, upload or api)
+    """
+    for prefix, route_class in ROUTE_CLASSES:
+        if path.startswith(prefix):
+            return route_class
+    return "api"
+
+
+def get_client_ip(request: Request) -> str:
+    """
+    Get the client IP a request came from.
+
+    On Lambda the source IP is taken from the API Gateway request context.
+    Behind ``RATE_LIMIT_TRUSTED_PROXY_HOPS`` proxies (e.g. 1 for an ALB), it
+    is the X-Forwarded-For entry appended by the outermost trusted proxy,
+    counted from the right; entries left of it are set by the client and are
+    not trusted. Otherwise the peer address is used.
+    """
+    event = request.scope.get("aws.event") or {}
+    request_context = event.get("requestContext") or {}
+    source_ip = (request_context.get("identity") or {}).get("sourceIp") or (
+        request_context.get("http") or {}
+    ).get("sourceIp")
+    if source_ip:
+        return source_ip
+
+    hops = settings.RATE_LIMIT_TRUSTED_PROXY_HOPS
+    forwarded_for = request.headers.get("X-Forwarded-For")
+    if hops > 0 and forwarded_for:
+        entries = [entry.strip() for entry in forwarded_for.split(",") if entry.strip()]
+        if len(entries) >= hops:
+            return entries[-hops]
+    return request.client.host if request.client else "unknown"
+
+
+def get_request_identity(request: Request) -> str:
+    """
+    Get the identity to rate limit a request by.
+
+    Uses the JWT subject when a valid bearer token is present (signature check
+    only, no database lookup) and falls back to the client IP.
+    """
+    authorization = request.headers.get("Authorization", "")
+    if authorization.lower().startswith("bearer "):
+        from infrastructure.auth.jwt_handler import get_jwt_handler
+
+        try:
+            subject = get_jwt_handler().decode_token(authorization[7:]).get("sub")
+            if subject:
+                return f"user:{subject}"
+        except Exception:
+            pass
+    return f"ip:{get_client_ip(request)}"
+
+
+def _rate_limit_headers(result: RateLimitResult) -> dict:
+    """Build standard rate limit response headers."""
+    headers = {
+        "X-RateLimit-Limit": str(result.limit),
+        "X-RateLimit-Remaining": str(result.remaining),
+        "X-RateLimit-Reset": str(int(result.reset_after + 0.999)),
+    }
+    if not result.allowed:
+        headers["Retry-After"] = str(int(result.retry_after + 0.999))
+    return headers
+
+
+def _rejection_response(route_class: str, result: RateLimitResult) -> JSONResponse:
+    """Build 429 response for a rejected request."""
+    policy = get_rate_limiter().get_policy(route_class)
+    error = RateLimitExceededError(policy.limit, policy.window_seconds, result.retry_after)
+    return JSONResponse(
+        status_code=error.status_code,
+        content=error.to_dict(),
+        headers=_rate_limit_headers(result)
+    )
+
+
+async def rate_limit_middleware(request: Request, call_next):
+    """
+    Enforce per-IP and per-identity route class limits.
+
+    Runs before routing so over-limit requests are shed before any database,
+    bcrypt or LLM work is started.
+    """
+    if not settings.RATE_LIMIT_ENABLED or request.url.path in EXEMPT_PATHS:
+        return await call_next(request)
+
+    limiter = get_rate_limiter()
+
+    ip_result = await limiter.hit("ip", get_client_ip(request))
+    if not ip_result.allowed:
+        return _rejection_response("ip", ip_result)
+
+    route_class = classify_route(request.url.path)
+    result = await limiter.hit(route_class, get_request_identity(request))
+    if not result.allowed:
+        return _rejection_response(route_class, result)
+
+    response = await call_next(request)
+    response.headers.update(_rate_limit_headers(result))
+    return response
+
+
+def rate_limit_by_body_field(route_class: str = "auth", field: str = "email"):
+    """
+    Create a dependency limiting requests per value of a JSON body field.
+
+    Used on login and registration so that credential stuffing against one
+    account is throttled even when spread across many IPs.
+
+    Args:
+        route_class: Policy name to apply
+        field: JSON body field identifying the subject
+
+    Returns:
+        Dependency callable raising RateLimitExceededError when over limit
+    """
+
+    async def dependency(request: Request) -> None:
+        if not settings.RATE_LIMIT_ENABLED:
+            return
+
+        try:
+            body = await request.json()
+        except Exception:
+            return
+        value: Optional[str] = body.get(field) if isinstance(body, dict) else None
+        if not value:
+            return
+
+        limiter = get_rate_limiter()
+        result = await limiter.hit(route_class, f"{field}:{str(value).strip().lower()}")
+        if not result.allowed:
+            policy = limiter.get_policy(route_class)
+            raise RateLimitExceededError(policy.limit, policy.window_seconds, result.retry_after)
+
+    return dependency
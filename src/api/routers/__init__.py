@@ -1,9 +1,13 @@
 """API routers package."""
 
-from api.routers.auth_routes import router as auth_router
-from api.routers.user_routes import router as user_router
-from api.routers.chatbot_routes import router as chatbot_router
-from api.routers.conversation_routes import router as conversation_router
+from core.lazy_import import lazy_exports
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "auth_router": "api.routers.auth_routes:router",
+    "user_router": "api.routers.user_routes:router",
+    "chatbot_router": "api.routers.chatbot_routes:router",
+    "conversation_router": "api.routers.conversation_routes:router",
+})
 
 __all__ = [
     "auth_router",
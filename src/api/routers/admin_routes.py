@@ -0,0 +1,29 @@
+"""Admin routes."""
+
+from fastapi import APIRouter, status
+from api.controllers.admin_controller import get_usage_report, get_llm_capacity
+from schemas.conversation_schema import UsageReport
+
+router = APIRouter()
+
+router.add_api_route(
+    "/usage",
+    get_usage_report,
+    methods=["GET"],
+    response_model=UsageReport,
+    status_code=status.HTTP_200_OK,
+    summary="LLM usage report",
+    description="Token usage and latency per provider, chatbot or user"
+)
+
+router.add_api_route(
+    "/llm-capacity",
+    get_llm_capacity,
+    methods=["GET"],
+    status_code=status.HTTP_200_OK,
+    summary="LLM capacity",
+    description=(
+        "Concurrency, queue depth, queue times and throttling of LLM calls in this process, "
+        "the password hashing queue and the database connection pool"
+    )
+)
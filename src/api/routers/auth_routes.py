@@ -1,7 +1,8 @@
 """Authentication routes."""
 
-from fastapi import APIRouter, status
+from fastapi import APIRouter, Depends, status
 from api.controllers.auth_controller import login, register
+from api.middlewares.rate_limit_middleware import rate_limit_by_body_field
 from schemas.auth_schema import LoginResponse
 
 router = APIRouter()
@@ -12,6 +13,7 @@ router.add_api_route(
     methods=["POST"],
     response_model=LoginResponse,
     status_code=status.HTTP_200_OK,
+    dependencies=[Depends(rate_limit_by_body_field("auth", "email"))],
     summary="User login",
     description="Authenticate user and return JWT tokens"
 )
@@ -22,6 +24,7 @@ router.add_api_route(
     methods=["POST"],
     response_model=LoginResponse,
     status_code=status.HTTP_201_CREATED,
+    dependencies=[Depends(rate_limit_by_body_field("auth", "email"))],
     summary="User registration",
     description="Register new user and return JWT tokens"
 )
@@ -0,0 +1,53 @@
+"""Batch inference routes."""
+
+from fastapi import APIRouter, status
+from typing import List
+from api.controllers.batch_controller import (
+    submit_batch_job,
+    list_batch_jobs,
+    get_batch_job,
+    list_batch_results
+)
+from schemas.batch_schema import BatchJobResponse, BatchResultResponse
+
+router = APIRouter()
+
+router.add_api_route(
+    "/",
+    submit_batch_job,
+    methods=["POST"],
+    response_model=BatchJobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Submit batch job",
+    description="Run prompts as an offline batch inference job"
+)
+
+router.add_api_route(
+    "/",
+    list_batch_jobs,
+    methods=["GET"],
+    response_model=List[BatchJobResponse],
+    status_code=status.HTTP_200_OK,
+    summary="List batch jobs",
+    description="List the current user's batch inference jobs"
+)
+
+router.add_api_route(
+    "/{job_id}",
+    get_batch_job,
+    methods=["GET"],
+    response_model=BatchJobResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Get batch job",
+    description="Sync a batch job with its backend and return its progress"
+)
+
+router.add_api_route(
+    "/{job_id}/results",
+    list_batch_results,
+    methods=["GET"],
+    response_model=List[BatchResultResponse],
+    status_code=status.HTTP_200_OK,
+    summary="List batch results",
+    description="Results stored for a batch job"
+)
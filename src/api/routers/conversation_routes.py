@@ -7,6 +7,7 @@ from api.controllers.conversation_controller import (
     get_conversation,
     create_conversation,
     create_message,
+    reply_to_conversation,
     delete_conversation
 )
 from schemas.conversation_schema import (
@@ -57,6 +58,16 @@ router.add_api_route(
     description="Create new message in conversation"
 )
 
+router.add_api_route(
+    "/{conversation_id}/reply",
+    reply_to_conversation,
+    methods=["POST"],
+    response_model=MessageResponse,
+    status_code=status.HTTP_201_CREATED,
+    summary="Reply to message",
+    description="Add a user message and generate the assistant's reply, stored with its LLM usage"
+)
+
 router.add_api_route(
     "/{conversation_id}",
     delete_conversation,
@@ -0,0 +1,82 @@
+"""
+Router registry with optional lazy loading.
+
+In lazy mode (the default on Lambda) a router module, and everything it
+imports, is loaded on the first request whose path falls under its prefix
+instead of at application import time.
+"""
+
+import importlib
+import time
+from dataclasses import dataclass, field
+from typing import List
+from fastapi import FastAPI, Request
+from core.logger import logger
+
+
+@dataclass(frozen=True)
+class RouterSpec:
+    """
+    Declarative router registration.
+
+    Attributes:
+        module: Module defining the router
+        attr: Router attribute, or factory function when ``factory`` is set
+        prefix: Prefix passed to ``include_router``
+        tags: OpenAPI tags
+        match_prefix: Request path prefix that triggers loading (defaults to prefix)
+        factory: Whether ``attr`` is a callable returning the router
+    """
+
+    module: str
+    attr: str
+    prefix: str
+    tags: List[str] = field(default_factory=list)
+    match_prefix: str = ""
+    factory: bool = False
+
+    @property
+    def trigger_prefix(self) -> str:
+        return self.match_prefix or self.prefix
+
+
+# Paths that need the complete route table
+FULL_SCHEMA_PATHS = {"/docs", "/redoc", "/openapi.json"}
+
+
+class RouterRegistry:
+    """Registers routers on an app, eagerly or on first matching request."""
+
+    def __init__(self, app: FastAPI, specs: List[RouterSpec]):
+        self.app = app
+        self._pending = list(specs)
+
+    def include_all(self) -> None:
+        """Import and include every pending router."""
+        while self._pending:
+            self._include(self._pending.pop(0))
+
+    def enable_lazy_loading(self) -> None:
+        """Install middleware that includes routers on first matching request."""
+        self.app.middleware("http")(self._lazy_loading_middleware)
+
+    async def _lazy_loading_middleware(self, request: Request, call_next):
+        if self._pending:
+            path = request.url.path
+            if path in FULL_SCHEMA_PATHS:
+                self.include_all()
+            else:
+                for spec in [s for s in self._pending if path.startswith(s.trigger_prefix)]:
+                    self._pending.remove(spec)
+                    self._include(spec)
+        return await call_next(request)
+
+    def _include(self, spec: RouterSpec) -> None:
+        start = time.perf_counter()
+        router = getattr(importlib.import_module(spec.module), spec.attr)
+        if spec.factory:
+            router = router()
+        self.app.include_router(router, prefix=spec.prefix, tags=spec.tags)
+        # Invalidate cached OpenAPI schema now that routes changed
+        self.app.openapi_schema = None
+        logger.info(f"Loaded router {spec.module} in {(time.perf_counter() - start) * 1000:.0f}ms")
@@ -1,13 +1,19 @@
 """Application services package."""
 
-from application.services.auth_service import AuthService
-from application.services.user_service import UserService
-from application.services.chatbot_service import ChatbotService
-from application.services.conversation_service import ConversationService
+from core.lazy_import import lazy_exports
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "AuthService": "application.services.auth_service",
+    "UserService": "application.services.user_service",
+    "ChatbotService": "application.services.chatbot_service",
+    "ConversationService": "application.services.conversation_service",
+    "WebSocketChatService": "application.services.websocket_chat_service",
+})
 
 __all__ = [
     "AuthService",
     "UserService",
     "ChatbotService",
-    "ConversationService"
+    "ConversationService",
+    "WebSocketChatService"
 ]
@@ -5,14 +5,12 @@ Handles user authentication and token management.
 """
 
 from typing import Optional
-from passlib.context import CryptContext
 from shared.interfaces.repositories.user_repository import UserRepository
 from infrastructure.auth.jwt_handler import JWTHandler
+from infrastructure.auth.password_hasher import PasswordHasher, get_password_hasher
 from infrastructure.postgresql.models import User
 from core.errors import AuthenticationError, ValidationError
-
-
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+from core.logger import logger
 
 
 class AuthService:
@@ -20,17 +18,23 @@ class AuthService:
     Service for authentication operations.
     """
 
-    def __init__(self, user_repository: UserRepository, jwt_handler: JWTHandler):
+    def __init__(
+        self,
+        user_repository: UserRepository,
+        jwt_handler: JWTHandler,
+        password_hasher: Optional[PasswordHasher] = None
+    ):
         self.user_repository = user_repository
         self.jwt_handler = jwt_handler
+        self.password_hasher = password_hasher or get_password_hasher()
 
-    def verify_password(self, plain_password: str, hashed_password: str) -> bool:
+    async def verify_password(self, plain_password: str, hashed_password: str) -> bool:
         """Verify password against hash."""
-        return pwd_context.verify(plain_password, hashed_password)
+        return await self.password_hasher.verify_password(plain_password, hashed_password)
 
-    def hash_password(self, password: str) -> str:
+    async def hash_password(self, password: str) -> str:
         """Hash password."""
-        return pwd_context.hash(password)
+        return await self.password_hasher.hash_password(password)
 
     async def authenticate_user(self, email: str, password: str) -> User:
         """
@@ -50,11 +54,20 @@ class AuthService:
         if not user:
             raise AuthenticationError("Invalid email or password")
 
-        if not self.verify_password(password, user.password_hash):
+        verified, new_hash = await self.password_hasher.verify_and_update(
+            password, user.hashed_password
+        )
+        if not verified:
             raise AuthenticationError("Invalid email or password")
 
-        if user.status != "active":
-            raise AuthenticationError(f"User account is {user.status}")
+        if not user.is_active:
+            raise AuthenticationError("User account is disabled")
+
+        if new_hash:
+            # Hash parameters changed since the password was stored
+            user.update_password(new_hash)
+            user = await self.user_repository.update(user)
+            logger.info(f"Password rehashed with updated parameters for user: {user.id}")
 
         return user
 
@@ -77,7 +90,7 @@ class AuthService:
         if existing_user:
             raise ValidationError("Email already registered")
 
-        hashed_password = self.hash_password(password)
+        hashed_password = await self.hash_password(password)
 
         user = User(
             email=email,
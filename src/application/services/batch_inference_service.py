@@ -0,0 +1,276 @@
+"""
+Batch inference service.
+
+Runs bulk generation (summaries, FAQ answers, ...) as offline batch jobs
+instead of on-demand calls. Records are written as JSONL and submitted to an
+``IBatchInferenceBackend``; each job is tracked as an ``IngestionJob`` whose
+``details`` are its checkpoint: the backend job, the attempt, and how many
+results have been stored. ``sync`` moves a job forward and is safe to call
+repeatedly or after a restart:
+
+- pending jobs are submitted once fewer than ``BATCH_INFERENCE_MAX_ACTIVE_JOBS``
+  jobs of the backend are in progress
+- results of finished jobs are stored in chunks, skipping records already
+  stored, with the details updated after every chunk
+- jobs the backend lost are resubmitted with only the records that have no
+  result yet
+
+``sync_active`` syncs every unfinished job; it runs on a schedule so
+results are stored without a client polling each job.
+"""
+
+import json
+from typing import Any, Dict, List, Optional
+from domain.entities.batch_inference import BatchInferenceRecord, BatchInferenceResult
+from domain.entities.ingestion_job import IngestionJob
+from shared.interfaces.repositories.ingestion_job_repository import IngestionJobRepository
+from shared.interfaces.repositories.batch_inference_result_repository import BatchInferenceResultRepository
+from shared.interfaces.services.ai_services.batch_inference_backend import IBatchInferenceBackend
+from infrastructure.ai_services.providers.scheduler import llm_call_scope
+from core.config import settings
+from core.errors import NotFoundError, ValidationError
+from core.logger import logger
+
+JOB_KIND = "batch_inference"
+
+
+class BatchInferenceService:
+    """Service for submitting and tracking batch inference jobs."""
+
+    def __init__(
+        self,
+        job_repository: IngestionJobRepository,
+        result_repository: BatchInferenceResultRepository,
+        backend: IBatchInferenceBackend,
+        model_id: Optional[str] = None
+    ):
+        self.job_repository = job_repository
+        self.result_repository = result_repository
+        self.backend = backend
+        self.model_id = model_id or settings.BATCH_INFERENCE_MODEL_ID or settings.BEDROCK_MODEL_ID
+
+    async def submit(self, records: List[BatchInferenceRecord], user_id: int, name: str) -> IngestionJob:
+        """
+        Create a batch job and submit it if the backend has capacity.
+
+        Args:
+            records: Prompts to run; record IDs must be unique
+            user_id: Submitting user
+            name: Job name
+
+        Returns:
+            IngestionJob: The job, ``in_progress`` or ``pending``
+
+        Raises:
+            ValidationError: If there are no records, too many, or duplicate IDs
+        """
+        if not records:
+            raise ValidationError("At least one record is required")
+        if len(records) > settings.BATCH_INFERENCE_MAX_RECORDS:
+            raise ValidationError(f"At most {settings.BATCH_INFERENCE_MAX_RECORDS} records are allowed per job")
+        if len({record.record_id for record in records}) != len(records):
+            raise ValidationError("Record IDs must be unique")
+
+        job = await self.job_repository.create(IngestionJob(
+            id=None,
+            provider=self.backend.name,
+            status="pending",
+            source=name,
+            user_id=user_id,
+            details={"kind": JOB_KIND, "name": name, "model_id": self.model_id, "total": len(records)}
+        ))
+        details = {
+            **job.details,
+            "attempt": 1,
+            "input_location": await self.backend.stage_input(
+                self._input_key(job.id, 1), [self._input_line(record) for record in records]
+            ),
+            "backend_job_id": None,
+            "succeeded": 0,
+            "failed": 0
+        }
+        await self.job_repository.update_details(job.id, details)
+        job.details = details
+        return await self._start(job)
+
+    async def sync(self, job_id: int) -> IngestionJob:
+        """
+        Move a job forward: submit it, store its results, or resubmit what is left.
+
+        Args:
+            job_id: Job ID
+
+        Returns:
+            IngestionJob: The job after syncing
+
+        Raises:
+            NotFoundError: If the job does not exist
+        """
+        job = await self.get_job(job_id)
+        if job.status in ("completed", "failed"):
+            return job
+        if job.status == "pending":
+            return await self._start(job)
+
+        details = job.details
+        status = await self.backend.status(details["backend_job_id"])
+        if status == "in_progress":
+            return job
+
+        await self._ingest(job)
+        if status == "completed":
+            return await self._finish(job, "completed")
+        if status == "failed":
+            return await self._finish(job, "failed", "Batch job failed in the backend")
+        return await self._resume(job)
+
+    async def sync_active(self) -> List[IngestionJob]:
+        """
+        Sync every pending or in-progress job of the backend, oldest first.
+
+        A job failing to sync is logged and retried on the next run.
+
+        Returns:
+            List[IngestionJob]: The jobs synced, after syncing
+        """
+        jobs = await self.job_repository.find_by_status(self.backend.name, ["pending", "in_progress"])
+        synced = []
+        for job in jobs:
+            if not isinstance(job.details, dict) or job.details.get("kind") != JOB_KIND:
+                continue
+            try:
+                synced.append(await self.sync(job.id))
+            except Exception as e:
+                logger.error(f"Failed to sync batch job {job.id}: {e}")
+        return synced
+
+    async def get_job(self, job_id: int) -> IngestionJob:
+        """
+        Get a batch job.
+
+        Raises:
+            NotFoundError: If the job does not exist or is not a batch job
+        """
+        job = await self.job_repository.find_by_id(job_id)
+        if not job or not isinstance(job.details, dict) or job.details.get("kind") != JOB_KIND:
+            raise NotFoundError(f"Batch job with ID {job_id} not found")
+        return job
+
+    async def list_jobs(self, user_id: int) -> List[IngestionJob]:
+        """List a user's batch jobs, newest first."""
+        jobs = await self.job_repository.find_by_user(user_id)
+        return [job for job in jobs if isinstance(job.details, dict) and job.details.get("kind") == JOB_KIND]
+
+    async def list_results(self, job_id: int, skip: int = 0, limit: int = 100) -> List[BatchInferenceResult]:
+        """List the stored results of a batch job."""
+        await self.get_job(job_id)
+        return await self.result_repository.find_by_job(job_id, skip=skip, limit=limit)
+
+    async def _start(self, job: IngestionJob) -> IngestionJob:
+        active = await self.job_repository.count_by_status(self.backend.name, ["in_progress"])
+        if active >= settings.BATCH_INFERENCE_MAX_ACTIVE_JOBS:
+            logger.info(f"Batch job {job.id} waiting: {active} jobs in progress on {self.backend.name}")
+            return job
+
+        details = job.details
+        with llm_call_scope(f"user:{job.user_id}", priority="batch"):
+            details["backend_job_id"] = await self.backend.submit(
+                f"batch-{job.id}-{details['attempt']}", details["input_location"], details["model_id"]
+            )
+        await self.job_repository.update_details(job.id, details, status="in_progress")
+        logger.info(f"Submitted batch job {job.id} (attempt {details['attempt']}) as {details['backend_job_id']}")
+        return await self.get_job(job.id)
+
+    async def _ingest(self, job: IngestionJob) -> None:
+        """Store the backend's results in chunks, checkpointing after each."""
+        stored = await self.result_repository.find_record_ids(job.id)
+        chunk: List[BatchInferenceResult] = []
+        async for line in self.backend.results(job.details["backend_job_id"]):
+            record_id = str(line.get("recordId"))
+            if record_id in stored:
+                continue
+            stored.add(record_id)
+            chunk.append(self._parse_output(job.id, record_id, line))
+            if len(chunk) >= settings.BATCH_INFERENCE_RESULT_CHUNK_SIZE:
+                await self._store(job, chunk)
+                chunk = []
+        if chunk:
+            await self._store(job, chunk)
+
+    async def _store(self, job: IngestionJob, results: List[BatchInferenceResult]) -> None:
+        await self.result_repository.save_all(results)
+        job.details["succeeded"] = await self.result_repository.count_by_status(job.id, "succeeded")
+        job.details["failed"] = await self.result_repository.count_by_status(job.id, "failed")
+        await self.job_repository.update_details(job.id, job.details)
+
+    async def _resume(self, job: IngestionJob) -> IngestionJob:
+        """Resubmit the records without a result after the backend lost the job."""
+        details = job.details
+        stored = await self.result_repository.find_record_ids(job.id)
+        remaining = [
+            line for line in await self.backend.read_input(details["input_location"])
+            if str(json.loads(line)["recordId"]) not in stored
+        ]
+        if not remaining:
+            return await self._finish(job, "completed")
+        if details["attempt"] >= settings.BATCH_INFERENCE_MAX_ATTEMPTS:
+            return await self._finish(job, "failed", f"Batch job lost after {details['attempt']} attempts")
+
+        details["attempt"] += 1
+        details["input_location"] = await self.backend.stage_input(
+            self._input_key(job.id, details["attempt"]), remaining
+        )
+        details["backend_job_id"] = None
+        await self.job_repository.update_details(job.id, details, status="pending")
+        logger.warning(f"Batch job {job.id} lost by {self.backend.name}; resubmitting {len(remaining)} records")
+        job.status = "pending"
+        return await self._start(job)
+
+    async def _finish(self, job: IngestionJob, status: str, error_message: Optional[str] = None) -> IngestionJob:
+        await self.job_repository.update_details(job.id, job.details, status=status)
+        if error_message:
+            await self.job_repository.update_status(job.id, status, error_message)
+        logger.info(
+            f"Batch job {job.id} {status}: {job.details['succeeded']} succeeded, {job.details['failed']} failed"
+        )
+        return await self.get_job(job.id)
+
+    @staticmethod
+    def _input_key(job_id: int, attempt: int) -> str:
+        return f"job-{job_id}/attempt-{attempt}"
+
+    @staticmethod
+    def _input_line(record: BatchInferenceRecord) -> str:
+        content = record.prompt
+        if record.context:
+            content = f"<context>\n{record.context}\n</context>\n\n{record.prompt}"
+        model_input: Dict[str, Any] = {
+            "anthropic_version": "bedrock-2023-05-31",
+            "max_tokens": record.max_tokens,
+            "temperature": record.temperature,
+            "messages": [{"role": "user", "content": content}]
+        }
+        if record.system:
+            model_input["system"] = [{"type": "text", "text": record.system}]
+        return json.dumps({"recordId": record.record_id, "modelInput": model_input})
+
+    @staticmethod
+    def _parse_output(job_id: int, record_id: str, line: Dict[str, Any]) -> BatchInferenceResult:
+        output = line.get("modelOutput")
+        if output is None or line.get("error"):
+            error = line.get("error") or "No output"
+            return BatchInferenceResult(
+                job_id=job_id,
+                record_id=record_id,
+                status="failed",
+                error_message=error.get("errorMessage", str(error)) if isinstance(error, dict) else str(error)
+            )
+        usage = output.get("usage") or {}
+        return BatchInferenceResult(
+            job_id=job_id,
+            record_id=record_id,
+            status="succeeded",
+            output="".join(block.get("text", "") for block in output.get("content", []) if block.get("type") == "text"),
+            input_tokens=usage.get("input_tokens"),
+            output_tokens=usage.get("output_tokens")
+        )
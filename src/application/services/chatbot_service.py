@@ -4,9 +4,11 @@ ChatbotEntity service.
 Handles chatbot management business logic.
 """
 
+from datetime import datetime
 from typing import List, Optional
 from decimal import Decimal
 from shared.interfaces.repositories.chatbot_repository import ChatbotRepository
+from infrastructure.cache.chatbot_configs import ChatbotConfigCache
 from domain.entities.chatbot import Chatbot
 from domain.value_objects.uuid_vo import UUID
 from core.errors import NotFoundError
@@ -18,8 +20,9 @@ class ChatbotService:
     Works exclusively with domain entities, not ORM models.
     """
 
-    def __init__(self, chatbot_repository: ChatbotRepository):
+    def __init__(self, chatbot_repository: ChatbotRepository, config_cache: Optional[ChatbotConfigCache] = None):
         self.chatbot_repository = chatbot_repository
+        self.config_cache = config_cache
 
     async def get_chatbot_by_id(self, chatbot_id: str) -> Chatbot:
         """
@@ -39,6 +42,32 @@ class ChatbotService:
             raise NotFoundError(f"Chatbot with ID {chatbot_id} not found")
         return chatbot
 
+    async def get_chatbot_config(self, chatbot_id: str) -> Chatbot:
+        """
+        Get chatbot configuration for serving a chat turn.
+
+        Reads through the config cache when one is configured; the returned
+        chatbot may be shared with other requests and must not be modified.
+
+        Args:
+            chatbot_id: Chatbot ID
+
+        Returns:
+            Chatbot: Chatbot configuration
+
+        Raises:
+            NotFoundError: If chatbot not found
+        """
+        if self.config_cache is None:
+            return await self.get_chatbot_by_id(chatbot_id)
+
+        chatbot = self.config_cache.get(chatbot_id)
+        if chatbot is None:
+            generation = self.config_cache.generation(chatbot_id)
+            chatbot = await self.get_chatbot_by_id(chatbot_id)
+            self.config_cache.put(chatbot_id, chatbot, generation)
+        return chatbot
+
     async def list_chatbots(self, skip: int = 0, limit: int = 100) -> List[Chatbot]:
         """
         List all chatbots with pagination.
@@ -161,7 +190,9 @@ class ChatbotService:
             else:
                 chatbot.deactivate()
 
-        return await self.chatbot_repository.update(chatbot)
+        chatbot = await self.chatbot_repository.update(chatbot)
+        await self._publish_change(chatbot_id, chatbot.updated_at)
+        return chatbot
 
     async def delete_chatbot(self, chatbot_id: str) -> bool:
         """
@@ -179,4 +210,12 @@ class ChatbotService:
         if not await self.chatbot_repository.exists(chatbot_id):
             raise NotFoundError(f"Chatbot with ID {chatbot_id} not found")
 
-        return await self.chatbot_repository.delete(chatbot_id)
+        deleted = await self.chatbot_repository.delete(chatbot_id)
+        await self._publish_change(chatbot_id)
+        return deleted
+
+    async def _publish_change(self, chatbot_id: str, version: Optional[datetime] = None) -> None:
+        """Invalidate the cached config here and, on commit, in other workers."""
+        if self.config_cache is not None:
+            self.config_cache.invalidate(chatbot_id, version)
+        await self.chatbot_repository.publish_change(chatbot_id, version)
@@ -0,0 +1,212 @@
+"""
+Token-budgeted packing of retrieved contexts into a prompt.
+
+Retrieved chunks are often redundant: the same passage indexed twice, or
+neighbouring chunks of one document that overlap by a third or more of their
+text. ``ContextPacker`` drops near-duplicates (MinHash over word shingles),
+stitches overlapping chunks from the same source back together, and fills
+the token budget in rank order.
+"""
+
+import hashlib
+import heapq
+import math
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Set
+from core.config import settings
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (~4 characters per token)."""
+    return math.ceil(len(text) / 4)
+
+
+def _hash(value: str) -> int:
+    return int.from_bytes(hashlib.blake2b(value.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+def minhash_signature(words: List[str], shingle_size: int = 5, num_hashes: int = 64) -> Set[int]:
+    """
+    Bottom-k MinHash sketch of a text's word shingles.
+
+    Args:
+        words: Lower-cased words of the text
+        shingle_size: Words per shingle
+        num_hashes: Sketch size (k smallest shingle hashes kept)
+
+    Returns:
+        Set[int]: Sketch
+    """
+    if len(words) < shingle_size:
+        shingles = {" ".join(words)}
+    else:
+        shingles = {" ".join(words[i:i + shingle_size]) for i in range(len(words) - shingle_size + 1)}
+    return set(heapq.nsmallest(num_hashes, (_hash(shingle) for shingle in shingles)))
+
+
+def estimate_similarity(a: Set[int], b: Set[int], num_hashes: int = 64) -> float:
+    """Estimate the Jaccard similarity of two texts from their sketches."""
+    if not a or not b:
+        return 0.0
+    union_sketch = set(heapq.nsmallest(num_hashes, a | b))
+    return len(union_sketch & a & b) / len(union_sketch)
+
+
+@dataclass
+class _Block:
+    text: str
+    source: str
+    signature: Set[int]
+
+
+@dataclass
+class PackedContext:
+    """Packing result."""
+
+    text: str
+    estimated_tokens: int
+    blocks: int
+    duplicates_removed: int = 0
+    chunks_merged: int = 0
+    truncated: bool = False
+    dropped: int = 0
+
+
+class ContextPacker:
+    """Deduplicate, merge and budget retrieved contexts."""
+
+    def __init__(
+        self,
+        similarity_threshold: Optional[float] = None,
+        shingle_size: int = 5,
+        num_hashes: int = 64,
+        min_overlap_words: int = 8,
+        min_partial_tokens: int = 64
+    ):
+        """
+        Initialize packer.
+
+        Args:
+            similarity_threshold: Estimated Jaccard similarity above which a
+                chunk is dropped as a near-duplicate of a higher-ranked one
+            shingle_size: Words per shingle
+            num_hashes: MinHash sketch size
+            min_overlap_words: Shortest shared run of words at which two
+                chunks from one source are treated as adjacent and merged
+            min_partial_tokens: Smallest remainder of the budget worth filling
+                with a truncated chunk
+        """
+        self.similarity_threshold = (
+            settings.RAG_DEDUP_SIMILARITY if similarity_threshold is None else similarity_threshold
+        )
+        self.shingle_size = shingle_size
+        self.num_hashes = num_hashes
+        self.min_overlap_words = min_overlap_words
+        self.min_partial_tokens = min_partial_tokens
+
+    def pack(self, contexts: List[Dict[str, Any]], token_budget: int) -> PackedContext:
+        """
+        Build the context text for a prompt.
+
+        Args:
+            contexts: Retrieved contexts, best first
+            token_budget: Most tokens the context text may use
+
+        Returns:
+            PackedContext: Context text and packing statistics
+        """
+        blocks: List[_Block] = []
+        duplicates = 0
+        merged = 0
+
+        for ctx in contexts:
+            text = " ".join(ctx.get("text", "").split())
+            if not text:
+                continue
+            words = text.lower().split()
+            signature = minhash_signature(words, self.shingle_size, self.num_hashes)
+
+            if any(
+                estimate_similarity(signature, block.signature, self.num_hashes) >= self.similarity_threshold
+                for block in blocks
+            ):
+                duplicates += 1
+                continue
+
+            source = ctx.get("source") or ""
+            if source and self._merge_into(blocks, source, text):
+                merged += 1
+                continue
+
+            blocks.append(_Block(text=text, source=source, signature=signature))
+
+        return self._fit(blocks, token_budget, duplicates, merged)
+
+    def _merge_into(self, blocks: List[_Block], source: str, text: str) -> bool:
+        """Stitch ``text`` onto an overlapping block from the same source."""
+        original_words = text.split()
+        for block in blocks:
+            if block.source != source:
+                continue
+            block_words = block.text.split()
+            stitched = self._stitch(block_words, original_words) or self._stitch(original_words, block_words)
+            if stitched is None:
+                continue
+            block.text = " ".join(stitched)
+            block.signature = minhash_signature(block.text.lower().split(), self.shingle_size, self.num_hashes)
+            return True
+        return False
+
+    def _stitch(self, first: List[str], second: List[str]) -> Optional[List[str]]:
+        """Join two word lists if ``first`` ends with a prefix of ``second``."""
+        if not second:
+            return None
+        lowered_first = [word.lower() for word in first]
+        lowered_second = [word.lower() for word in second]
+        start = max(0, len(first) - len(second))
+        for i in range(start, len(first) - self.min_overlap_words + 1):
+            if lowered_first[i] != lowered_second[0]:
+                continue
+            overlap = len(first) - i
+            if lowered_first[i:] == lowered_second[:overlap]:
+                return first + second[overlap:]
+        return None
+
+    def _fit(self, blocks: List[_Block], token_budget: int, duplicates: int, merged: int) -> PackedContext:
+        parts: List[str] = []
+        used = 0
+        truncated = False
+
+        for block in blocks:
+            part = f"Context {len(parts) + 1}: {block.text}"
+            cost = estimate_tokens(part) + 1  # +1 for the separating newline
+            if used + cost <= token_budget:
+                parts.append(part)
+                used += cost
+                continue
+
+            remaining = token_budget - used
+            if remaining >= self.min_partial_tokens:
+                part = self._truncate(part, remaining - 1)
+                parts.append(part)
+                used += estimate_tokens(part) + 1
+                truncated = True
+            break
+
+        return PackedContext(
+            text="\n".join(parts),
+            estimated_tokens=used,
+            blocks=len(parts),
+            duplicates_removed=duplicates,
+            chunks_merged=merged,
+            truncated=truncated,
+            dropped=len(blocks) - len(parts)
+        )
+
+    @staticmethod
+    def _truncate(text: str, tokens: int) -> str:
+        limit = max(0, tokens * 4 - 3)
+        if len(text) <= limit:
+            return text
+        cut = text.rfind(" ", 0, limit)
+        return text[:cut if cut > 0 else limit] + "..."
@@ -0,0 +1,69 @@
+"""
+Ranking helpers for contexts retrieved from several sources.
+
+Scores from different knowledge bases or vector stores are not directly
+comparable, so each result set is normalized against its own best score
+before the sets are merged, deduplicated and cut to a global top-k.
+"""
+
+import hashlib
+import re
+from typing import Any, Dict, List
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_scores(contexts: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Add ``normalized_score`` in [0, 1] relative to the set's best score.
+
+    Args:
+        contexts: Contexts from one source, each with a ``score``
+
+    Returns:
+        List[Dict[str, Any]]: Copies of the contexts with ``normalized_score``
+    """
+    best = max((float(ctx.get("score") or 0.0) for ctx in contexts), default=0.0)
+    normalized = []
+    for ctx in contexts:
+        score = float(ctx.get("score") or 0.0)
+        normalized.append({**ctx, "normalized_score": score / best if best > 0 else 0.0})
+    return normalized
+
+
+def context_key(context: Dict[str, Any]) -> str:
+    """
+    Identity of a context for deduplication.
+
+    The same chunk indexed in two knowledge bases shares its text, so the key
+    is a hash of the whitespace- and case-normalized text, falling back to the
+    source URI for contexts without text.
+    """
+    text = _WHITESPACE.sub(" ", context.get("text", "")).strip().lower()
+    if not text:
+        return f"source:{context.get('source', '')}"
+    return "text:" + hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+def merge_ranked_contexts(result_sets: List[List[Dict[str, Any]]], top_k: int) -> List[Dict[str, Any]]:
+    """
+    Merge per-source results into one globally ranked list.
+
+    Args:
+        result_sets: One list of contexts per source
+        top_k: Number of contexts to return
+
+    Returns:
+        List[Dict[str, Any]]: Deduplicated contexts, best ``normalized_score`` first
+    """
+    best_by_key: Dict[str, Dict[str, Any]] = {}
+    for contexts in result_sets:
+        for ctx in normalize_scores(contexts):
+            key = context_key(ctx)
+            current = best_by_key.get(key)
+            if current is None or ctx["normalized_score"] > current["normalized_score"]:
+                best_by_key[key] = ctx
+
+    # Raw scores are not comparable across sources, so ties keep source order
+    ranked = sorted(best_by_key.values(), key=lambda ctx: ctx["normalized_score"], reverse=True)
+    return ranked[:top_k]
@@ -4,7 +4,8 @@ Conversation service.
 Handles conversation and message management business logic.
 """
 
-from typing import List, Optional
+import json
+from typing import Any, Dict, List, Optional
 from datetime import datetime
 from shared.interfaces.repositories.conversation_repository import ConversationRepository
 from shared.interfaces.repositories.message_repository import MessageRepository
@@ -152,7 +153,11 @@ class ConversationService:
         conversation_id: int,
         user_id: int,
         content: str,
-        role: str = "user"
+        role: str = "user",
+        usage: Optional[Dict[str, Any]] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        tool_calls: Optional[List[Dict[str, Any]]] = None,
+        tool_results: Optional[List[Dict[str, Any]]] = None
     ) -> Message:
         """
         Create new message in conversation.
@@ -162,6 +167,11 @@ class ConversationService:
             user_id: User ID to verify ownership
             content: Message content
             role: Message role (user, assistant, system, tool)
+            usage: LLM usage summary for assistant messages (see
+                ``UsageCollector.summary``)
+            metadata: Additional message data, stored as JSON
+            tool_calls: Tool calls made for an assistant message, stored as JSON
+            tool_results: Results of those calls, stored as JSON
 
         Returns:
             Message: Created message
@@ -179,8 +189,18 @@ class ConversationService:
         message = Message(
             conversation_id=conversation_id,
             role=role,
-            content=content
+            content=content,
+            message_metadata=json.dumps(metadata) if metadata else None,
+            tool_calls=json.dumps(tool_calls) if tool_calls else None,
+            tool_results=json.dumps(tool_results) if tool_results else None
         )
+        if usage:
+            message.provider = usage.get("provider")
+            message.model_id = usage.get("model_id")
+            message.input_tokens = usage.get("input_tokens")
+            message.output_tokens = usage.get("output_tokens")
+            message.latency_ms = usage.get("total_ms")
+            message.time_to_first_token_ms = usage.get("time_to_first_token_ms")
 
         created_message = await self.message_repository.create(message)
 
@@ -212,3 +232,21 @@ class ConversationService:
         """
         await self.get_conversation_by_id(conversation_id, user_id)
         return await self.message_repository.find_by_conversation(conversation_id)
+
+    async def get_usage_report(self, group_by: str, since: Optional[datetime] = None) -> List[Dict[str, Any]]:
+        """
+        Aggregate LLM usage of assistant messages.
+
+        Args:
+            group_by: ``provider``, ``chatbot`` or ``user``
+            since: Only include messages created at or after this time
+
+        Returns:
+            List[Dict[str, Any]]: Usage per group, highest output tokens first
+
+        Raises:
+            ValidationError: If the grouping is not supported
+        """
+        if group_by not in ("provider", "chatbot", "user"):
+            raise ValidationError(f"Invalid usage grouping: {group_by}")
+        return await self.message_repository.aggregate_usage(group_by, since)
@@ -3,7 +3,7 @@ from shared.interfaces.services.storage.file_storage_service import IFileStorage
 from shared.interfaces.repositories.document_repository import DocumentRepository
 from domain.entities.document import Document
 from domain.value_objects.uuid_vo import UUID
-from typing import BinaryIO
+from typing import BinaryIO, Optional
 import os
 
 class DocumentUploadService(IDocumentUploadService):
@@ -56,6 +56,13 @@ class DocumentUploadService(IDocumentUploadService):
         
         return file_deleted and record_deleted
     
+    async def mark_processed(self, document_id: str, error_message: Optional[str] = None) -> bool:
+        # A completed ingestion invalidates cached retrievals of the document's
+        # knowledge base in every worker (see DocumentRepositoryImpl.update_status)
+        if error_message:
+            return await self.document_repository.update_status(document_id, "failed", "error", error_message)
+        return await self.document_repository.update_status(document_id, "processed", "completed")
+    
     def validate_file(self, filename: str, content_type: str, file_size: int) -> bool:
         if file_size > self.max_file_size:
             return False
@@ -0,0 +1,67 @@
+"""
+Lightweight classification of chat queries.
+
+Used to recognise conversational follow-ups ("thanks", "explain more") that
+can be answered from the previous turn's contexts without a new retrieval,
+and anaphoric ones ("how long does that take?") that refer back to it.
+"""
+
+import re
+
+_CONVERSATIONAL_PATTERNS = [
+    r"(ok(ay)?|great|cool|nice|perfect|got it|i see|understood)",
+    r"(thanks|thank you|thx|cheers)( (so|very) much)?( for (that|this|the (answer|help|explanation)))?",
+    r"(can you |could you |please )?(explain|elaborate|expand)( (on )?(that|this|it))?( (more|further|in more detail))?( please)?",
+    r"(tell me|say) more( (about|on) (that|this|it))?( please)?",
+    r"(more|further) (details|detail|info|information)( please)?",
+    r"(what|how) do you mean",
+    r"(why|how|really|and then|go on|continue|keep going)",
+    r"(can you |could you )?(summari[sz]e|simplify|rephrase|shorten) (that|this|it)( please)?",
+    r"(give me |show me )?an example( please)?",
+]
+
+_CONVERSATIONAL = re.compile(
+    r"^(" + "|".join(_CONVERSATIONAL_PATTERNS) + r")$"
+)
+_NORMALIZE = re.compile(r"[^\w\s']")
+_REFERENTIAL = re.compile(
+    r"\b(it|its|that|this|those|these|they|them|their|he|she|him|her|one|ones|"
+    r"first|second|third|last|former|latter|same|above|previous|there|what about|how about)\b",
+    re.IGNORECASE
+)
+
+
+def is_conversational_query(query: str) -> bool:
+    """
+    Whether a query only refers back to the conversation.
+
+    Such queries carry no new search terms, so retrieving for them finds
+    nothing better than what the previous turn already used.
+
+    Args:
+        query: User message
+
+    Returns:
+        bool: True for acknowledgements and requests to expand on the last answer
+    """
+    normalized = " ".join(_NORMALIZE.sub(" ", query.lower()).split())
+    return bool(normalized) and bool(_CONVERSATIONAL.match(normalized))
+
+
+
+def is_anaphoric_query(query: str) -> bool:
+    """
+    Whether a query refers back to something said earlier ("it", "the second one").
+
+    Args:
+        query: User message
+
+    Returns:
+        bool: True if the query contains a referring expression
+    """
+    return bool(_REFERENTIAL.search(query))
+
+
+def is_followup_query(query: str) -> bool:
+    """Whether a query is about the previous turn rather than a new topic."""
+    return is_conversational_query(query) or is_anaphoric_query(query)
@@ -0,0 +1,188 @@
+"""
+Query preprocessing for retrieval.
+
+Normalizes the user's message, condenses follow-ups that depend on the
+conversation ("what about the second one?") into a standalone query with a
+small, fast model, and computes the query embedding once so vector search and
+other consumers do not each embed the same text. Results are cached per
+conversation turn.
+"""
+
+import hashlib
+import json
+import unicodedata
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+from shared.interfaces.services.ai_services.embedding_service import IEmbeddingService
+from application.services.query_classification import is_anaphoric_query
+from infrastructure.ai_services.providers.base import BaseLLMService
+from core.config import settings
+from core.deadline import get_request_deadline
+from core.errors import RequestCancelledError
+from core.logger import logger
+
+
+_CONDENSE_INSTRUCTIONS = (
+    "Rewrite the user's last message as a standalone search query that can be "
+    "understood without the conversation. Resolve references such as 'it' or "
+    "'the second one'. Reply with the query only."
+)
+
+
+def normalize_query_text(query: str) -> str:
+    """Unicode- and whitespace-normalize a query, keeping its case."""
+    return " ".join(unicodedata.normalize("NFKC", query).split())
+
+
+def needs_condensing(query: str) -> bool:
+    """Whether a query likely depends on earlier turns to be understood."""
+    return len(query.split()) <= 3 or is_anaphoric_query(query)
+
+
+@dataclass
+class PreparedQuery:
+    """Query ready for retrieval."""
+
+    original: str
+    normalized: str
+    standalone: str
+    embedding: Optional[List[float]] = None
+
+    @property
+    def rewritten(self) -> bool:
+        """Whether the standalone query differs from the normalized one."""
+        return self.standalone != self.normalized
+
+
+class QueryPreprocessor:
+    """Normalize, condense and embed queries, cached per conversation turn."""
+
+    def __init__(
+        self,
+        rewriter: Optional[BaseLLMService] = None,
+        embedding_service: Optional[IEmbeddingService] = None,
+        max_history_messages: int = 6,
+        max_entries: int = 1024
+    ):
+        """
+        Initialize preprocessor.
+
+        Args:
+            rewriter: Small LLM used to condense follow-ups; None disables rewriting
+            embedding_service: Service embedding the standalone query; None disables it
+            max_history_messages: Most recent messages shown to the rewriter
+            max_entries: Most prepared queries cached
+        """
+        self.rewriter = rewriter
+        self.embedding_service = embedding_service
+        self.max_history_messages = max_history_messages
+        self.max_entries = max_entries
+        self._cache: "OrderedDict[Tuple[str, str, str], PreparedQuery]" = OrderedDict()
+
+    def will_rewrite(self, query: str, history: Optional[List[Dict[str, str]]]) -> bool:
+        """Whether ``prepare`` would ask the rewriter to condense this query."""
+        return self.rewriter is not None and bool(history) and needs_condensing(normalize_query_text(query))
+
+    async def prepare(
+        self,
+        query: str,
+        conversation_id: Optional[str] = None,
+        history: Optional[List[Dict[str, str]]] = None
+    ) -> PreparedQuery:
+        """
+        Prepare a query for retrieval.
+
+        Rewriting and embedding are optional deadline stages: when time is
+        short, or the model fails, the normalized query is used as is.
+
+        Args:
+            query: User message
+            conversation_id: Conversation the turn belongs to, for caching
+            history: Earlier messages as ``{"role", "content"}`` dicts
+
+        Returns:
+            PreparedQuery: Normalized and standalone query, and its embedding
+        """
+        normalized = normalize_query_text(query)
+        history = (history or [])[-self.max_history_messages:]
+        key = (conversation_id, normalized, self._history_key(history)) if conversation_id else None
+        if key is not None and key in self._cache:
+            self._cache.move_to_end(key)
+            return self._cache[key]
+
+        deadline = get_request_deadline()
+        standalone = normalized
+        if self.will_rewrite(normalized, history):
+            standalone = await self._optional(
+                deadline.run_optional("rewrite", lambda: self._condense(normalized, history), default=normalized),
+                default=normalized,
+                stage="rewrite"
+            )
+
+        embedding = None
+        if self.embedding_service is not None:
+            embedding = await self._optional(
+                deadline.run_optional(
+                    "embedding", lambda: self.embedding_service.create_single_embedding(standalone), default=None
+                ),
+                default=None,
+                stage="embedding"
+            )
+
+        prepared = PreparedQuery(original=query, normalized=normalized, standalone=standalone, embedding=embedding)
+        if key is not None:
+            self._cache[key] = prepared
+            while len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+        return prepared
+
+    async def _condense(self, query: str, history: List[Dict[str, str]]) -> str:
+        transcript = "\n".join(f"{turn['role']}: {turn['content']}" for turn in history)
+        response = await self.rewriter.generate_response(
+            prompt=f"{_CONDENSE_INSTRUCTIONS}\n\nConversation:\n{transcript}\n\nLast message: {query}\n\nStandalone query:",
+            max_tokens=100,
+            temperature=0.0
+        )
+        rewritten = normalize_query_text(response).strip("\"'")
+        if rewritten:
+            logger.info(f"Rewrote follow-up '{query}' as '{rewritten}'")
+        return rewritten or query
+
+    @staticmethod
+    async def _optional(stage_result, default, stage: str):
+        try:
+            return await stage_result
+        except RequestCancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"Query {stage} failed, continuing without it: {e}")
+            return default
+
+    @staticmethod
+    def _history_key(history: List[Dict[str, str]]) -> str:
+        return hashlib.sha1(json.dumps(history, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+# Singleton instance
+_query_preprocessor: Optional[QueryPreprocessor] = None
+
+
+def get_query_preprocessor() -> QueryPreprocessor:
+    """Get singleton query preprocessor configured from settings."""
+    global _query_preprocessor
+    if _query_preprocessor is None:
+        rewriter = None
+        if settings.RAG_QUERY_REWRITE_ENABLED:
+            from infrastructure.ai_services.factory import LLMFactory
+            rewriter = LLMFactory.create(
+                provider=settings.RAG_REWRITE_PROVIDER, model_id=settings.RAG_REWRITE_MODEL_ID
+            )
+        embedding_service = None
+        # Bedrock knowledge bases embed the query themselves
+        if settings.query_embedding_enabled:
+            from infrastructure.ai_services.providers.bedrock import get_bedrock_client
+            from infrastructure.ai_services.services.embedding import BedrockEmbeddingService
+            embedding_service = BedrockEmbeddingService(get_bedrock_client())
+        _query_preprocessor = QueryPreprocessor(rewriter=rewriter, embedding_service=embedding_service)
+    return _query_preprocessor
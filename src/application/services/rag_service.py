@@ -1,54 +1,466 @@
 from shared.interfaces.services.ai_services.rag_service import IRAGService
 from shared.interfaces.services.ai_services.knowledge_base_service import IKnowledgeBaseService
+from shared.interfaces.services.ai_services.reranker import IReranker
+from shared.interfaces.services.ai_services.tool import ToolContext
 from infrastructure.ai_services.providers.base import BaseLLMService
-from typing import List, Dict, Any
+from infrastructure.cache.retrieval_cache import RetrievalCache
+from infrastructure.cache.conversation_contexts import ConversationContextCache
+from infrastructure.cache.single_flight import SingleFlight, flight_key
+from application.services.context_packing import ContextPacker
+from application.services.context_ranking import merge_ranked_contexts
+from application.services.query_classification import is_conversational_query, is_followup_query
+from application.services.query_rewriting import PreparedQuery, QueryPreprocessor, normalize_query_text
+from application.services.tool_calling import ToolCallingLoop
+from core.config import settings
+from core.deadline import RequestDeadline, get_request_deadline, request_deadline
+from core.errors import DeadlineExceededError, RequestCancelledError
+from core.logger import logger
+from dataclasses import dataclass, field
+from typing import List, Dict, Any, Optional, Awaitable, Callable, Tuple
+import asyncio
+import time
+
+
+@dataclass
+class TurnRetrieval:
+    """
+    Contexts chosen for one conversation turn.
+
+    ``source`` is ``retrieved`` (new retrieval), ``previous`` (the last
+    turn's contexts were reused) or ``none``.
+    """
+
+    contexts: List[Dict[str, Any]]
+    source: str
+    history: Any = None
+    retrieval_ms: Optional[float] = None
+    skipped: List[str] = field(default_factory=list)
+    prepared: Optional[PreparedQuery] = None
 
 class RAGService(IRAGService):
     """
     RAG (Retrieval-Augmented Generation) Service.
     Combines knowledge base retrieval with LLM generation.
+
+    Every stage runs under the current request deadline: retrieval gets a
+    share of the remaining time with enough kept back for generation, and
+    both are aborted when the request is cancelled.
+
+    When several domains are requested, their knowledge bases are queried
+    concurrently and the results merged into one ranked list, so retrieval
+    takes as long as the slowest domain rather than the sum of all of them.
+
+    With a ``RetrievalCache``, repeated queries against the same knowledge
+    base skip retrieval; in stale-while-revalidate mode expired results are
+    returned immediately and refreshed in the background.
+
+    With an ``IReranker``, ``RAG_RERANK_CANDIDATES`` contexts are retrieved
+    and scored in one batch, and only the best ``top_k`` are kept. Reranking
+    is optional: when time is short or the reranker fails, the top retrieval
+    results are used as they are.
+
+    Conversation turns (``conversation_id`` given) run in pipelined mode:
+    retrieval starts at once, concurrently with loading history. The previous
+    turn's contexts, if retrieved from the same domains, are reused for
+    conversational follow-ups ("explain more"); for follow-ups referring back
+    to it ("how long does that take?") they are also reused on low-confidence
+    results and when retrieval is still running after
+    ``RAG_FOLLOWUP_RETRIEVAL_WAIT_MS``, in which case retrieval finishes in the
+    background so the next turn can use it. Other turns wait for retrieval.
+
+    With a ``QueryPreprocessor``, follow-ups that refer back to the
+    conversation are condensed into standalone queries before retrieval, and
+    the query embedding is computed once and handed to the retrieval backends.
+    While the rewrite runs, retrieval starts speculatively on the original
+    query and is kept if the rewrite turns out not to change it.
+
+    With a ``SingleFlight`` group, concurrent identical requests (same query,
+    domains and model) share one retrieval, one generation, or one stream.
+    Conversation turns are not coalesced since they update per-conversation
+    state.
+
+    With a ``ToolCallingLoop``, calls naming ``tools`` on a model that
+    supports tool use are answered in a tool-use loop: the model may call the
+    tools, several at once, before answering. The model can then look up what
+    retrieval missed, so such calls are answered even without contexts.
+
+    Recent turns are kept per conversation in ``conversation_contexts``. With
+    a ``history_loader``, a conversation that cache does not know (restart,
+    other worker) has its recent turns loaded from storage instead.
     """
     
     def __init__(
         self,
         knowledge_base_service: IKnowledgeBaseService,
         llm_provider: BaseLLMService,
+        domain_sources: Optional[Dict[str, IKnowledgeBaseService]] = None,
+        retrieval_cache: Optional[RetrievalCache] = None,
+        reranker: Optional[IReranker] = None,
+        context_packer: Optional[ContextPacker] = None,
+        conversation_contexts: Optional[ConversationContextCache] = None,
+        query_preprocessor: Optional[QueryPreprocessor] = None,
+        single_flight: Optional[SingleFlight] = None,
+        tool_loop: Optional[ToolCallingLoop] = None,
+        history_loader: Optional[Callable[[str, int], Awaitable[List[Dict[str, str]]]]] = None,
     ):
+        """
+        Initialize RAG service.
+
+        Args:
+            knowledge_base_service: Default retrieval backend
+            llm_provider: LLM used for generation
+            domain_sources: Optional per-domain retrieval backends (e.g. the
+                vector stores of ``RAG_VECTOR_STORE_DOMAINS``) overriding
+                ``knowledge_base_service``
+            retrieval_cache: Optional cache of retrieval results
+            reranker: Optional reranker applied to over-fetched candidates
+            context_packer: Packer fitting contexts into the prompt budget
+            conversation_contexts: Store of each conversation's last-turn
+                contexts; a private one is used if omitted
+            query_preprocessor: Optional query rewriting and embedding stage
+            single_flight: Optional group coalescing identical in-flight calls
+            tool_loop: Optional tool-use loop for calls that name tools
+            history_loader: Optional loader of a conversation's latest stored
+                messages, called with the conversation ID and a message limit
+        """
         self.knowledge_base_service = knowledge_base_service
         self.llm_provider = llm_provider
+        self.domain_sources = domain_sources or {}
+        self.retrieval_cache = retrieval_cache
+        self.reranker = reranker
+        self.context_packer = context_packer or ContextPacker()
+        self.conversation_contexts = conversation_contexts or ConversationContextCache(
+            ttl_seconds=settings.RAG_FOLLOWUP_CONTEXT_TTL_SECONDS
+        )
+        self.query_preprocessor = query_preprocessor
+        self.single_flight = single_flight
+        self.tool_loop = tool_loop
+        self.history_loader = history_loader
+        self._refreshing: Dict[tuple, asyncio.Task] = {}
+        self._background: set = set()
 
     async def retrieve_and_generate(
-        self, query: str, domain: str = "general", top_k: int = 5
+        self,
+        query: str,
+        domain: str = "general",
+        top_k: int = 5,
+        domains: Optional[List[str]] = None,
+        conversation_id: Optional[str] = None,
+        system_prompt: Optional[str] = None,
+        llm: Optional[BaseLLMService] = None,
+        max_tokens: int = 1000,
+        temperature: float = 0.7,
+        tools: Optional[List[str]] = None
     ) -> Dict[str, Any]:
         """
         Full RAG workflow: retrieve contexts and generate response.
+
+        With ``conversation_id`` the turn is retrieved in pipelined mode
+        (see ``retrieve_for_turn``) and the conversation's recent turns are
+        sent to the model as chat messages. ``llm`` overrides the service's
+        LLM for this call, e.g. with the chatbot's own model. ``tools`` names
+        the tools the model may call, within the requested domains; the result
+        then also carries the ``tool_calls`` made, their ``tool_results`` and
+        the model ``tool_rounds``.
         """
-        contexts = await self.retrieve_contexts(query, domain, top_k)
+        llm = llm or self.llm_provider
+        if self.single_flight is not None and not conversation_id:
+            key = flight_key(
+                "answer", self._model_key(llm), query, domain, top_k, domains, system_prompt, max_tokens, temperature,
+                tools
+            )
+            result = await self.single_flight.do(
+                key,
+                lambda: self._retrieve_and_generate(
+                    query, domain, top_k, domains, system_prompt=system_prompt,
+                    llm=llm, max_tokens=max_tokens, temperature=temperature, tools=tools
+                )
+            )
+            # Each caller gets its own copy of the shared result
+            return dict(result)
+        return await self._retrieve_and_generate(
+            query, domain, top_k, domains, conversation_id, system_prompt, llm, max_tokens, temperature, tools
+        )
 
-        if not contexts:
+    async def _retrieve_and_generate(
+        self,
+        query: str,
+        domain: str,
+        top_k: int,
+        domains: Optional[List[str]] = None,
+        conversation_id: Optional[str] = None,
+        system_prompt: Optional[str] = None,
+        llm: Optional[BaseLLMService] = None,
+        max_tokens: int = 1000,
+        temperature: float = 0.7,
+        tools: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        llm = llm or self.llm_provider
+        use_tools = bool(tools) and self.tool_loop is not None and llm.supports_tools()
+        deadline = get_request_deadline()
+        context_source = "retrieved"
+        history: List[Dict[str, str]] = []
+        if conversation_id:
+            turn = await deadline.run(
+                "retrieval",
+                self.retrieve_for_turn(
+                    query, conversation_id, domain, top_k, domains, history=self.load_history(conversation_id, query)
+                ),
+                share=settings.RAG_RETRIEVAL_BUDGET_SHARE,
+                reserve=settings.RAG_MIN_GENERATION_SECONDS
+            )
+            contexts, context_source, history = turn.contexts, turn.source, turn.history
+        else:
+            contexts, _ = await deadline.run(
+                "retrieval",
+                self._retrieve_turn(query, None, [], domain, top_k, domains),
+                share=settings.RAG_RETRIEVAL_BUDGET_SHARE,
+                reserve=settings.RAG_MIN_GENERATION_SECONDS
+            )
+
+        if not contexts and not use_tools:
             return {
                 "response": "No relevant information found.", 
                 "contexts": [], 
                 "query": query,
-                "llm_provider": self.llm_provider.get_provider_name()
+                "context_count": 0,
+                "llm_provider": llm.get_provider_name()
             }
 
-        context_text = self._build_context_text(contexts)
-        response = await self.llm_provider.generate_response(
-            prompt=query,
-            context=context_text,
-            max_tokens=1000,
-            temperature=0.7
-        )
+        context_text = self.build_context_text(contexts, max_tokens=max_tokens, llm=llm) if contexts else None
+        if use_tools:
+            generation = self.tool_loop.run(
+                llm,
+                history + [{"role": "user", "content": query}],
+                tools,
+                system=system_prompt,
+                context=context_text,
+                max_tokens=max_tokens,
+                temperature=temperature,
+                # Tools search only the domains this call asked about
+                tool_context=ToolContext(domains=list(domains or [domain]))
+            )
+        elif history or system_prompt:
+            # Earlier turns go to the model as messages, after the system prompt
+            # and contexts, rather than being folded into a rewritten question
+            generation = llm.generate_chat(
+                history + [{"role": "user", "content": query}],
+                system=system_prompt,
+                context=context_text,
+                max_tokens=max_tokens,
+                temperature=temperature
+            )
+        else:
+            generation = llm.generate_response(
+                prompt=query,
+                context=context_text,
+                max_tokens=max_tokens,
+                temperature=temperature
+            )
+        response = await deadline.run("generation", generation)
+        tool_usage: Dict[str, Any] = {}
+        if use_tools:
+            tool_usage = {
+                "tool_calls": [call.to_dict() for call in response.calls],
+                "tool_results": [call.to_result_dict() for call in response.calls],
+                "tool_rounds": response.rounds
+            }
+            response = response.response
+        if conversation_id:
+            self.conversation_contexts.append_turn(
+                conversation_id, "assistant", response[:settings.RAG_REWRITE_MAX_TURN_CHARS]
+            )
 
         return {
             "response": response,
             "contexts": contexts,
             "query": query,
             "context_count": len(contexts),
-            "llm_provider": self.llm_provider.get_provider_name()
+            "context_source": context_source,
+            "llm_provider": llm.get_provider_name(),
+            **tool_usage
         }
 
+    async def retrieve_for_turn(
+        self,
+        query: str,
+        conversation_id: str,
+        domain: str = "general",
+        top_k: int = 5,
+        domains: Optional[List[str]] = None,
+        history: Optional[Awaitable[Any]] = None
+    ) -> TurnRetrieval:
+        """
+        Choose contexts for a conversation turn, pipelining retrieval.
+
+        Args:
+            query: User message
+            conversation_id: Conversation the turn belongs to
+            domain: Knowledge domain
+            top_k: Number of contexts
+            domains: Optional list of domains to search at once
+            history: Optional awaitable loading conversation history; it runs
+                concurrently with retrieval and its result is returned
+
+        Returns:
+            TurnRetrieval: Contexts, where they came from, and the history
+        """
+        scope = self._retrieval_scope(domain, domains)
+        previous = self.conversation_contexts.get(conversation_id, scope)
+        turns = self.conversation_contexts.get_turns(conversation_id)
+        self.conversation_contexts.append_turn(
+            conversation_id, "user", query[:settings.RAG_REWRITE_MAX_TURN_CHARS]
+        )
+
+        if previous and is_conversational_query(query):
+            logger.info(f"Conversational follow-up in {conversation_id}; reusing previous contexts")
+            loaded = await history if history is not None else None
+            return TurnRetrieval(contexts=previous, source="previous", history=loaded, skipped=["retrieval"])
+
+        # A new topic must not be answered from the last turn's contexts
+        if not is_followup_query(query):
+            previous = None
+
+        start = time.perf_counter()
+        retrieval = asyncio.ensure_future(
+            self._retrieve_turn(query, conversation_id, turns, domain, top_k, domains)
+        )
+        try:
+            loaded = await history if history is not None else None
+
+            if previous:
+                wait = settings.RAG_FOLLOWUP_RETRIEVAL_WAIT_MS / 1000
+                done, _ = await asyncio.wait({retrieval}, timeout=max(0.0, wait - (time.perf_counter() - start)))
+                if not done:
+                    # Answer from the previous turn now; keep the new results for the next one
+                    logger.info(
+                        f"Retrieval for {conversation_id} still running; starting generation with previous contexts"
+                    )
+                    self._remember_when_done(conversation_id, scope, retrieval)
+                    return TurnRetrieval(contexts=previous, source="previous", history=loaded)
+
+            contexts, prepared = await retrieval
+        except BaseException:
+            retrieval.cancel()
+            raise
+        retrieval_ms = (time.perf_counter() - start) * 1000
+
+        if previous and self._low_confidence(contexts):
+            logger.info(f"Low-confidence retrieval for {conversation_id}; reusing previous contexts")
+            return TurnRetrieval(
+                contexts=previous, source="previous", history=loaded, retrieval_ms=retrieval_ms, prepared=prepared
+            )
+
+        if contexts:
+            self.conversation_contexts.put(conversation_id, contexts, scope)
+        return TurnRetrieval(
+            contexts=contexts,
+            source="retrieved" if contexts else "none",
+            history=loaded,
+            retrieval_ms=retrieval_ms,
+            prepared=prepared
+        )
+
+    def load_history(self, conversation_id: str, query: Optional[str] = None) -> Awaitable[List[Dict[str, str]]]:
+        """
+        Load the turns before the current one, for ``retrieve_for_turn(history=...)``.
+
+        The cached turns are read now, before the current turn is recorded;
+        when the cache has none they are loaded with ``history_loader``.
+
+        Args:
+            conversation_id: Conversation the turn belongs to
+            query: Current user message, dropped if storage already has it
+
+        Returns:
+            Awaitable[List[Dict[str, str]]]: ``{"role", "content"}`` dicts, oldest first
+        """
+        return self._load_history(conversation_id, query, self.conversation_contexts.get_turns(conversation_id))
+
+    async def _load_history(
+        self, conversation_id: str, query: Optional[str], turns: List[Dict[str, str]]
+    ) -> List[Dict[str, str]]:
+        if turns or self.history_loader is None:
+            return turns
+        limit = self.conversation_contexts.max_turns
+        try:
+            # One extra in case the current message was stored before answering
+            stored = await self.history_loader(conversation_id, limit + 1)
+        except Exception as e:
+            logger.warning(f"Loading history for {conversation_id} failed, answering without it: {e}")
+            return []
+        if stored and stored[-1]["role"] == "user" and stored[-1]["content"] == query:
+            stored = stored[:-1]
+        turns = [
+            {"role": message["role"], "content": message["content"][:settings.RAG_REWRITE_MAX_TURN_CHARS]}
+            for message in stored[-limit:]
+        ]
+        self.conversation_contexts.prepend_turns(conversation_id, turns)
+        return turns
+
+    async def _retrieve_turn(
+        self,
+        query: str,
+        conversation_id: Optional[str],
+        turns: List[Dict[str, str]],
+        domain: str,
+        top_k: int,
+        domains: Optional[List[str]]
+    ) -> Tuple[List[Dict[str, Any]], Optional[PreparedQuery]]:
+        """Prepare the query, if configured, and retrieve contexts for it."""
+        if self.query_preprocessor is None:
+            return await self._retrieve_contexts(query, domain, top_k, domains), None
+
+        if not self.query_preprocessor.will_rewrite(query, turns):
+            prepared = await self.query_preprocessor.prepare(query, conversation_id, turns)
+            contexts = await self._retrieve_contexts(
+                prepared.standalone, domain, top_k, domains, prepared.embedding
+            )
+            return contexts, prepared
+
+        # Retrieve for the query as typed while the rewriter runs
+        speculative = asyncio.ensure_future(
+            self._retrieve_contexts(normalize_query_text(query), domain, top_k, domains)
+        )
+        try:
+            prepared = await self.query_preprocessor.prepare(query, conversation_id, turns)
+            if not prepared.rewritten:
+                return await speculative, prepared
+        except BaseException:
+            speculative.cancel()
+            raise
+        speculative.cancel()
+        contexts = await self._retrieve_contexts(
+            prepared.standalone, domain, top_k, domains, prepared.embedding
+        )
+        return contexts, prepared
+
+    def _low_confidence(self, contexts: List[Dict[str, Any]]) -> bool:
+        if not contexts:
+            return True
+        best = max(float(ctx.get("score") or 0.0) for ctx in contexts)
+        return best < settings.RAG_FOLLOWUP_MIN_SCORE
+
+    @staticmethod
+    def _retrieval_scope(domain: str, domains: Optional[List[str]]) -> Tuple[str, ...]:
+        """Domains a turn searches, as a key for reusing its contexts."""
+        return tuple(sorted(set(domains))) if domains else (domain,)
+
+    def _remember_when_done(self, conversation_id: str, scope: Tuple[str, ...], retrieval: asyncio.Future) -> None:
+        """Store a background retrieval's contexts for the conversation's next turn."""
+        def done(task: asyncio.Future) -> None:
+            self._background.discard(task)
+            if task.cancelled():
+                return
+            error = task.exception()
+            if error is not None:
+                logger.warning(f"Background retrieval for {conversation_id} failed: {error}")
+            elif not self._low_confidence(task.result()[0]):
+                self.conversation_contexts.put(conversation_id, task.result()[0], scope)
+
+        self._background.add(retrieval)
+        retrieval.add_done_callback(done)
+
     async def generate_response(
         self,
         prompt: str,
@@ -61,12 +473,15 @@ class RAGService(IRAGService):
         Generate response using LLM provider (with optional context).
         Can be used for both RAG and direct LLM calls.
         """
-        return await self.llm_provider.generate_response(
-            prompt=prompt,
-            context=context,
-            max_tokens=max_tokens,
-            temperature=temperature,
-            **kwargs
+        return await get_request_deadline().run(
+            "generation",
+            self.llm_provider.generate_response(
+                prompt=prompt,
+                context=context,
+                max_tokens=max_tokens,
+                temperature=temperature,
+                **kwargs
+            )
         )
     
     async def generate_streaming_response(
@@ -79,22 +494,259 @@ class RAGService(IRAGService):
     ):
         """
         Generate streaming response using LLM provider.
+
+        Identical concurrent streams share one upstream generation.
         """
-        async for chunk in self.llm_provider.generate_streaming_response(
-            prompt=prompt,
-            context=context,
-            max_tokens=max_tokens,
-            temperature=temperature,
-            **kwargs
-        ):
+        def open_stream():
+            return self.llm_provider.generate_streaming_response(
+                prompt=prompt,
+                context=context,
+                max_tokens=max_tokens,
+                temperature=temperature,
+                **kwargs
+            )
+
+        if self.single_flight is not None:
+            key = flight_key("stream", self._model_key(), prompt, context, max_tokens, temperature, kwargs)
+            stream = self.single_flight.stream(key, open_stream)
+        else:
+            stream = open_stream()
+        async for chunk in get_request_deadline().stream("generation", stream):
             yield chunk
 
+    async def generate_chat_stream(
+        self,
+        messages: List[Dict[str, str]],
+        system: Optional[str] = None,
+        context: Optional[str] = None,
+        max_tokens: int = 1000,
+        temperature: float = 0.7,
+        conversation_id: Optional[str] = None,
+        llm: Optional[BaseLLMService] = None,
+        **kwargs
+    ):
+        """
+        Stream the next assistant message of a conversation.
+
+        ``messages`` are the earlier turns followed by the user message; they
+        are sent to the model after the system prompt and contexts. With
+        ``conversation_id`` the reply is recorded as the conversation's next
+        turn once the stream completes; such streams are not shared, other
+        identical concurrent streams share one upstream generation.
+        """
+        llm = llm or self.llm_provider
+
+        def open_stream():
+            return llm.generate_chat_stream(
+                messages,
+                system=system,
+                context=context,
+                max_tokens=max_tokens,
+                temperature=temperature,
+                **kwargs
+            )
+
+        if self.single_flight is not None and not conversation_id:
+            key = flight_key(
+                "chat_stream", self._model_key(llm), messages, system, context, max_tokens, temperature, kwargs
+            )
+            stream = self.single_flight.stream(key, open_stream)
+        else:
+            stream = open_stream()
+        chunks: List[str] = []
+        async for chunk in get_request_deadline().stream("generation", stream):
+            chunks.append(chunk)
+            yield chunk
+        if conversation_id:
+            self.conversation_contexts.append_turn(
+                conversation_id, "assistant", "".join(chunks)[:settings.RAG_REWRITE_MAX_TURN_CHARS]
+            )
+
     async def retrieve_contexts(
-        self, query: str, domain: str = "general", top_k: int = 5
+        self,
+        query: str,
+        domain: str = "general",
+        top_k: int = 5,
+        domains: Optional[List[str]] = None
     ) -> List[Dict[str, Any]]:
         """Retrieve relevant contexts from knowledge base."""
-        knowledge_base_id = await self.knowledge_base_service.get_knowledge_base_by_domain(domain)
-        return await self.knowledge_base_service.retrieve_contexts(query, knowledge_base_id, top_k)
+        async def retrieve() -> List[Dict[str, Any]]:
+            contexts, _ = await get_request_deadline().run(
+                "retrieval", self._retrieve_turn(query, None, [], domain, top_k, domains)
+            )
+            return contexts
+
+        if self.single_flight is not None:
+            contexts = await self.single_flight.do(
+                flight_key("retrieve", query, domain, top_k, domains), retrieve, stage="retrieval"
+            )
+            return list(contexts)
+        return await retrieve()
+
+    async def _retrieve_contexts(
+        self,
+        query: str,
+        domain: str,
+        top_k: int,
+        domains: Optional[List[str]] = None,
+        query_embedding: Optional[List[float]] = None
+    ) -> List[Dict[str, Any]]:
+        if self.reranker is None:
+            return await self._retrieve_candidates(query, domain, top_k, domains, query_embedding)
+
+        candidates = await self._retrieve_candidates(
+            query, domain, max(top_k, settings.RAG_RERANK_CANDIDATES), domains, query_embedding
+        )
+        return await self._rerank(query, candidates, top_k)
+
+    async def _rerank(
+        self, query: str, candidates: List[Dict[str, Any]], top_k: int
+    ) -> List[Dict[str, Any]]:
+        if len(candidates) <= 1:
+            return candidates[:top_k]
+        try:
+            return await get_request_deadline().run_optional(
+                "rerank",
+                lambda: self.reranker.rerank(query, candidates, top_k),
+                default=candidates[:top_k]
+            )
+        except (RequestCancelledError, DeadlineExceededError):
+            raise
+        except Exception as e:
+            logger.warning(f"Reranking failed, using retrieval order: {e}")
+            return candidates[:top_k]
+
+    async def _retrieve_candidates(
+        self,
+        query: str,
+        domain: str,
+        top_k: int,
+        domains: Optional[List[str]] = None,
+        query_embedding: Optional[List[float]] = None
+    ) -> List[Dict[str, Any]]:
+        if domains:
+            # Preserve order while dropping repeated domains
+            domains = list(dict.fromkeys(domains))
+            if len(domains) > 1:
+                return await self._retrieve_multi_domain(query, domains, top_k, query_embedding)
+            domain = domains[0]
+        return await self._retrieve_domain(query, domain, top_k, query_embedding)
+
+    async def _retrieve_domain(
+        self, query: str, domain: str, top_k: int, query_embedding: Optional[List[float]] = None
+    ) -> List[Dict[str, Any]]:
+        source = self.domain_sources.get(domain, self.knowledge_base_service)
+        knowledge_base_id = await source.get_knowledge_base_by_domain(domain)
+        if self.retrieval_cache is None:
+            return await self._query_source(source, query, knowledge_base_id, top_k, query_embedding)
+
+        cached = self.retrieval_cache.get(knowledge_base_id, query, top_k)
+        if cached is not None:
+            if not cached.fresh:
+                self._schedule_refresh(source, knowledge_base_id, domain, query, top_k, query_embedding)
+            return cached.contexts
+        return await self._fetch_and_cache(source, knowledge_base_id, domain, query, top_k, query_embedding)
+
+    @staticmethod
+    async def _query_source(
+        source: IKnowledgeBaseService,
+        query: str,
+        knowledge_base_id: str,
+        top_k: int,
+        query_embedding: Optional[List[float]] = None
+    ) -> List[Dict[str, Any]]:
+        if query_embedding is None:
+            return await source.retrieve_contexts(query, knowledge_base_id, top_k)
+        return await source.retrieve_contexts(query, knowledge_base_id, top_k, query_embedding=query_embedding)
+
+    async def _fetch_and_cache(
+        self,
+        source: IKnowledgeBaseService,
+        knowledge_base_id: str,
+        domain: str,
+        query: str,
+        top_k: int,
+        query_embedding: Optional[List[float]] = None
+    ) -> List[Dict[str, Any]]:
+        generation = self.retrieval_cache.generation(knowledge_base_id)
+        contexts = await self._query_source(source, query, knowledge_base_id, top_k, query_embedding)
+        self.retrieval_cache.put(knowledge_base_id, query, top_k, contexts, generation=generation)
+        return contexts
+
+    def _schedule_refresh(
+        self,
+        source: IKnowledgeBaseService,
+        knowledge_base_id: str,
+        domain: str,
+        query: str,
+        top_k: int,
+        query_embedding: Optional[List[float]] = None
+    ) -> None:
+        """Refresh a stale cache entry in the background, once per key."""
+        key = (knowledge_base_id, query, top_k)
+        if key in self._refreshing:
+            return
+
+        async def refresh() -> None:
+            # Detached from the request: its deadline and cancellation must
+            # not cut the refresh short
+            with request_deadline(RequestDeadline(settings.RAG_DOMAIN_TIMEOUT_SECONDS)):
+                try:
+                    await self._fetch_and_cache(source, knowledge_base_id, domain, query, top_k, query_embedding)
+                except Exception as e:
+                    logger.warning(f"Background refresh for domain '{domain}' failed: {e}")
+                finally:
+                    self._refreshing.pop(key, None)
+
+        self._refreshing[key] = asyncio.create_task(refresh())
+
+    async def _retrieve_multi_domain(
+        self, query: str, domains: List[str], top_k: int, query_embedding: Optional[List[float]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Query each domain concurrently and merge the results.
+
+        Every domain is asked for ``top_k`` contexts and bounded by
+        ``RAG_DOMAIN_TIMEOUT_SECONDS``; a domain that fails or times out is
+        left out rather than failing the request. Scores are normalized per
+        domain before merging so one knowledge base's scale cannot crowd out
+        the others.
+        """
+        start = time.perf_counter()
+        result_sets = await asyncio.gather(
+            *(self._retrieve_domain_bounded(query, domain, top_k, query_embedding) for domain in domains)
+        )
+        contexts = merge_ranked_contexts(result_sets, top_k)
+        logger.info(
+            f"Retrieved {len(contexts)} contexts from {len(domains)} domains "
+            f"in {(time.perf_counter() - start) * 1000:.0f}ms"
+        )
+        return contexts
+
+    async def _retrieve_domain_bounded(
+        self, query: str, domain: str, top_k: int, query_embedding: Optional[List[float]] = None
+    ) -> List[Dict[str, Any]]:
+        try:
+            contexts = await asyncio.wait_for(
+                self._retrieve_domain(query, domain, top_k, query_embedding),
+                timeout=settings.RAG_DOMAIN_TIMEOUT_SECONDS
+            )
+        except (RequestCancelledError, DeadlineExceededError):
+            raise
+        except asyncio.TimeoutError:
+            logger.warning(
+                f"Retrieval for domain '{domain}' timed out after {settings.RAG_DOMAIN_TIMEOUT_SECONDS}s"
+            )
+            return []
+        except Exception as e:
+            logger.warning(f"Retrieval for domain '{domain}' failed: {e}")
+            return []
+        return [{**ctx, "domain": domain} for ctx in contexts]
+
+    def _model_key(self, llm: Optional[BaseLLMService] = None) -> List[Any]:
+        llm = llm or self.llm_provider
+        info = llm.get_model_info()
+        return [llm.get_provider_name(), info.get("model_id") or info.get("model_name")]
 
     def get_provider_name(self) -> str:
         """Get current LLM provider name."""
@@ -104,8 +756,39 @@ class RAGService(IRAGService):
         """Get current model information."""
         return self.llm_provider.get_model_info()
 
-    def _build_context_text(self, contexts: List[Dict[str, Any]]) -> str:
-        """Build context text from retrieved contexts."""
-        return "\n".join(
-            [f"Context {i+1}: {ctx.get('text', '')}" for i, ctx in enumerate(contexts)]
-        )
+    def build_context_text(
+        self,
+        contexts: List[Dict[str, Any]],
+        max_tokens: int = 1000,
+        llm: Optional[BaseLLMService] = None
+    ) -> str:
+        """
+        Build the prompt context from retrieved contexts.
+
+        Near-duplicate chunks are dropped, overlapping chunks from one source
+        merged, and the result cut to the context token budget.
+
+        Args:
+            contexts: Retrieved contexts, best first
+            max_tokens: Tokens reserved for the response
+            llm: LLM the context is for; defaults to the service's LLM
+
+        Returns:
+            str: Context text
+        """
+        packed = self.context_packer.pack(contexts, self._context_token_budget(max_tokens, llm))
+        if packed.duplicates_removed or packed.chunks_merged or packed.dropped or packed.truncated:
+            logger.info(
+                f"Packed {len(contexts)} contexts into {packed.blocks} blocks (~{packed.estimated_tokens} tokens): "
+                f"{packed.duplicates_removed} duplicates removed, {packed.chunks_merged} merged, "
+                f"{packed.dropped} dropped, truncated={packed.truncated}"
+            )
+        return packed.text
+
+    def _context_token_budget(self, max_tokens: int, llm: Optional[BaseLLMService] = None) -> int:
+        """Context tokens allowed by settings and the model's context window."""
+        budget = settings.RAG_CONTEXT_MAX_TOKENS
+        max_input_tokens = (llm or self.llm_provider).get_model_info().get("max_input_tokens")
+        if max_input_tokens:
+            budget = min(budget, max_input_tokens - max_tokens - settings.RAG_PROMPT_RESERVE_TOKENS)
+        return max(0, budget)
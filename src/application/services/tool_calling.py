@@ -0,0 +1,137 @@
+"""
+Tool-use loop: generate, run the requested tools, feed back the results.
+
+Each round sends the conversation plus the tool turns of this answer so far
+to the model. When the model stops to call tools, all calls of that turn
+run concurrently (see ``ToolExecutor``) and their results go back as the
+next user turn. The loop ends when the model answers without calling tools,
+or after ``max_rounds`` model calls; the last round then asks the model to
+answer with what it has. A model that still answers with tool calls only
+gets a fixed answer in its place, so the answer is never empty.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+from infrastructure.ai_services.providers.base import BaseLLMService
+from infrastructure.ai_services.tools.executor import ToolCallResult, ToolExecutor
+from infrastructure.ai_services.tools.registry import ToolRegistry
+from shared.interfaces.services.ai_services.tool import ToolContext
+
+# Appended to the tool results of the last allowed round
+_ROUND_LIMIT_NOTICE = "Tool call limit reached. Answer now using the information you already have."
+
+# Answer when the model ends without any text
+NO_ANSWER_RESPONSE = "I couldn't complete the lookup needed to answer this. Please try asking again."
+
+
+@dataclass
+class ToolLoopResult:
+    """Final answer and the tool calls that led to it."""
+
+    response: str
+    rounds: int
+    calls: List[ToolCallResult] = field(default_factory=list)
+    hit_round_limit: bool = False
+
+
+class ToolCallingLoop:
+    """Runs the tool-use loop for one answer."""
+
+    def __init__(self, registry: ToolRegistry, executor: ToolExecutor, max_rounds: int = 5):
+        """
+        Initialize loop.
+
+        Args:
+            registry: Tool implementations, for the model's tool definitions
+            executor: Runs the calls of each turn
+            max_rounds: Most model calls per answer; at least two, one to
+                call tools and one to answer with their results
+        """
+        self.registry = registry
+        self.executor = executor
+        self.max_rounds = max(2, max_rounds)
+
+    def tool_specs(self, tool_names: List[str], context: Optional[ToolContext] = None) -> List[Dict[str, Any]]:
+        """Tool definitions for the implemented tools among ``tool_names``."""
+        return self.registry.specs(tool_names, context)
+
+    async def run(
+        self,
+        llm: BaseLLMService,
+        messages: List[Dict[str, str]],
+        tool_names: List[str],
+        system: Optional[str] = None,
+        context: Optional[str] = None,
+        max_tokens: int = 1000,
+        temperature: float = 0.7,
+        tool_context: Optional[ToolContext] = None
+    ) -> ToolLoopResult:
+        """
+        Answer the last user message, calling tools as the model requests.
+
+        Args:
+            llm: Service supporting ``generate_tool_turn``
+            messages: Conversation so far, ending with the user's message
+            tool_names: Tools the model may call
+            system: Optional system prompt
+            context: Retrieved context from knowledge base
+            max_tokens: Maximum tokens per model call
+            temperature: Sampling temperature
+            tool_context: What the caller allows the tools to reach, e.g. its domains
+
+        Returns:
+            ToolLoopResult: Answer text, model round trips and tool calls made
+        """
+        tools = self.tool_specs(tool_names, tool_context)
+        allowed = [tool["name"] for tool in tools]
+        tool_turns: List[Dict[str, Any]] = []
+        calls: List[ToolCallResult] = []
+        rounds = 0
+        hit_limit = False
+        try:
+            while True:
+                rounds += 1
+                turn = await llm.generate_tool_turn(
+                    messages, tools, system=system, context=context, max_tokens=max_tokens,
+                    temperature=temperature, tool_turns=tool_turns
+                )
+                content = turn.get("content") or []
+                tool_uses = [block for block in content if block.get("type") == "tool_use"]
+                if turn.get("stop_reason") != "tool_use" or not tool_uses or hit_limit:
+                    hit_limit = hit_limit and bool(tool_uses)
+                    return ToolLoopResult(_text(content) or NO_ANSWER_RESPONSE, rounds, calls, hit_limit)
+
+                results = await self.executor.execute(tool_uses, allowed, tool_context)
+                calls.extend(results)
+                result_blocks: List[Dict[str, Any]] = [result.to_block() for result in results]
+                if rounds + 1 >= self.max_rounds:
+                    # The model can still ask for tools; its text is used as the answer then
+                    hit_limit = True
+                    result_blocks.append({"type": "text", "text": _ROUND_LIMIT_NOTICE})
+                tool_turns.extend([
+                    {"role": "assistant", "content": content},
+                    {"role": "user", "content": result_blocks}
+                ])
+        finally:
+            self.executor.stats.record_loop(rounds, hit_limit)
+
+
+def _text(content: List[Dict[str, Any]]) -> str:
+    return "".join(block.get("text", "") for block in content if block.get("type") == "text").strip()
+
+
+# Singleton instance
+_tool_calling_loop: Optional[ToolCallingLoop] = None
+
+
+def get_tool_calling_loop() -> ToolCallingLoop:
+    """Get singleton tool-use loop configured from settings."""
+    global _tool_calling_loop
+    if _tool_calling_loop is None:
+        from infrastructure.ai_services.tools.executor import get_tool_executor
+        from infrastructure.ai_services.tools.registry import get_tool_registry
+        from core.config import settings
+        _tool_calling_loop = ToolCallingLoop(
+            get_tool_registry(), get_tool_executor(), max_rounds=settings.TOOL_MAX_ROUNDS
+        )
+    return _tool_calling_loop
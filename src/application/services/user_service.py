@@ -5,17 +5,14 @@ Handles user management business logic.
 """
 
 from typing import List, Optional
-from passlib.context import CryptContext
 from shared.interfaces.repositories.user_repository import UserRepository
 from domain.entities.user import User
 from domain.value_objects.email import Email
 from domain.value_objects.uuid_vo import UUID
+from infrastructure.auth.password_hasher import PasswordHasher, get_password_hasher
 from core.errors import NotFoundError, ValidationError
 
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
-
 class UserService:
     """
     Service for user management operations.
@@ -23,8 +20,13 @@ class UserService:
     Works exclusively with domain entities, not ORM models.
     """
 
-    def __init__(self, user_repository: UserRepository):
+    def __init__(
+        self,
+        user_repository: UserRepository,
+        password_hasher: Optional[PasswordHasher] = None
+    ):
         self.user_repository = user_repository
+        self.password_hasher = password_hasher or get_password_hasher()
 
     async def get_user_by_id(self, user_id: str) -> User:
         """
@@ -83,7 +85,7 @@ class UserService:
         if existing_user:
             raise ValidationError("Email already registered")
 
-        hashed_password = pwd_context.hash(password)
+        hashed_password = await self.password_hasher.hash_password(password)
 
         # Create domain entity
         user = User(
@@ -175,6 +177,6 @@ class UserService:
             NotFoundError: If user not found
         """
         user = await self.get_user_by_id(user_id)
-        new_hash = pwd_context.hash(new_password)
+        new_hash = await self.password_hasher.hash_password(new_password)
         user.update_password(new_hash)
         return await self.user_repository.update(user)
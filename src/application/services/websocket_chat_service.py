@@ -0,0 +1,176 @@
+"""
+WebSocket chat service.
+
+Streams RAG answers to a WebSocket connection as a sequence of JSON frames:
+
+    {"type": "start", "request_id": ..., "context_count": ...}
+    {"type": "delta", "request_id": ..., "seq": 0, "text": "..."}
+    ...
+    {"type": "end", "request_id": ..., "frames": ..., "chars": ..., "latency_ms": ...}
+
+An ``{"type": "error", ...}`` frame replaces ``end`` when generation fails.
+"""
+
+import time
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import uuid4
+from shared.interfaces.services.ai_services.rag_service import IRAGService
+from infrastructure.streaming import coalesce_deltas
+from infrastructure.websocket.management_api import BaseManagementApiClient
+from core.config import settings
+from core.deadline import get_request_deadline
+from core.errors import ConnectionNotFoundError, RequestCancelledError
+from core.logger import logger
+
+
+class WebSocketChatService:
+    """
+    Service streaming chat responses over WebSocket.
+    """
+
+    def __init__(
+        self,
+        rag_service: IRAGService,
+        management_client: BaseManagementApiClient,
+        frame_min_chars: int = None,
+        frame_max_delay_ms: int = None,
+        system_prompt: Optional[str] = None
+    ):
+        self.rag_service = rag_service
+        self.system_prompt = system_prompt
+        self.management_client = management_client
+        self.frame_min_chars = frame_min_chars or settings.WEBSOCKET_FRAME_MIN_CHARS
+        self.frame_max_delay = (frame_max_delay_ms or settings.WEBSOCKET_FRAME_MAX_DELAY_MS) / 1000
+
+    async def stream_chat(self, connection_id: str, message: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Answer a chat message, streaming the response to the connection.
+
+        Args:
+            connection_id: API Gateway connection ID
+            message: Client message with ``content`` and optional ``domain``,
+                ``top_k``, ``max_tokens``, ``temperature``, ``request_id`` and
+                ``conversation_id`` (sends the earlier turns to the model and
+                enables follow-up context reuse)
+
+        Returns:
+            Dict[str, Any]: Summary with status, frame count and latency
+
+        Raises:
+            ConnectionNotFoundError: If the client disconnected mid-stream
+        """
+        request_id = message.get("request_id") or uuid4().hex
+        query = (message.get("content") or "").strip()
+        if not query:
+            await self._send(connection_id, {
+                "type": "error", "request_id": request_id, "error": "Message content is required"
+            })
+            return {"status": "rejected", "request_id": request_id}
+
+        start = time.perf_counter()
+        conversation_id = message.get("conversation_id")
+        contexts, history = await self._retrieve_contexts(
+            query,
+            message.get("domain", "general"),
+            int(message.get("top_k", 5)),
+            conversation_id
+        )
+        await self._send(connection_id, {
+            "type": "start", "request_id": request_id, "context_count": len(contexts)
+        })
+
+        max_tokens = int(message.get("max_tokens", 1000))
+        frames = coalesce_deltas(
+            self.rag_service.generate_chat_stream(
+                history + [{"role": "user", "content": query}],
+                system=self.system_prompt,
+                context=self.rag_service.build_context_text(contexts, max_tokens) or None,
+                max_tokens=max_tokens,
+                temperature=float(message.get("temperature", 0.7)),
+                conversation_id=conversation_id
+            ),
+            min_chars=self.frame_min_chars,
+            max_delay=self.frame_max_delay
+        )
+
+        seq = 0
+        chars = 0
+        first_frame_ms = None
+        try:
+            async for text in frames:
+                if first_frame_ms is None:
+                    first_frame_ms = (time.perf_counter() - start) * 1000
+                await self._send(connection_id, {
+                    "type": "delta", "request_id": request_id, "seq": seq, "text": text
+                })
+                seq += 1
+                chars += len(text)
+        except ConnectionNotFoundError:
+            logger.info(f"Connection {connection_id} closed during stream {request_id}")
+            raise
+        except Exception as e:
+            logger.error(f"Streaming chat failed for {connection_id}: {e}")
+            await self._send(connection_id, {
+                "type": "error", "request_id": request_id, "error": "Failed to generate response"
+            })
+            return {"status": "error", "request_id": request_id, "frames": seq}
+        finally:
+            # Stops the upstream LLM stream if we exit early
+            await frames.aclose()
+
+        latency_ms = (time.perf_counter() - start) * 1000
+        await self._send(connection_id, {
+            "type": "end",
+            "request_id": request_id,
+            "frames": seq,
+            "chars": chars,
+            "latency_ms": round(latency_ms, 1)
+        })
+
+        logger.info(
+            f"Streamed {chars} chars in {seq} frames to {connection_id} "
+            f"(first frame {first_frame_ms or 0:.0f}ms, total {latency_ms:.0f}ms)"
+        )
+        return {
+            "status": "completed",
+            "request_id": request_id,
+            "frames": seq,
+            "chars": chars,
+            "first_frame_ms": first_frame_ms,
+            "latency_ms": latency_ms
+        }
+
+    async def _retrieve_contexts(
+        self, query: str, domain: str, top_k: int, conversation_id: Optional[str] = None
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, str]]]:
+        """
+        Retrieve contexts and earlier turns, answering without them if retrieval is unavailable.
+
+        Retrieval is optional here: it is skipped when the invocation does not
+        have enough time left for both retrieval and generation.
+        """
+        async def retrieve() -> Tuple[List[Dict[str, Any]], List[Dict[str, str]]]:
+            if conversation_id:
+                turn = await self.rag_service.retrieve_for_turn(
+                    query, conversation_id, domain, top_k,
+                    history=self.rag_service.load_history(conversation_id, query)
+                )
+                return turn.contexts, turn.history
+            return await self.rag_service.retrieve_contexts(query, domain, top_k), []
+
+        try:
+            return await get_request_deadline().run_optional(
+                "retrieval",
+                retrieve,
+                default=([], []),
+                share=settings.RAG_RETRIEVAL_BUDGET_SHARE,
+                reserve=settings.RAG_MIN_GENERATION_SECONDS
+            )
+        except RequestCancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"Context retrieval failed, answering without context: {e}")
+            return [], []
+
+    async def _send(self, connection_id: str, payload: Dict[str, Any]) -> None:
+        await self.management_client.send_json(connection_id, payload)
@@ -7,7 +7,7 @@ database connections, JWT secrets, and service endpoints.
 
 import os
 import json
-from typing import Optional, Union
+from typing import Dict, List, Optional, Union
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import field_validator
 from functools import lru_cache
@@ -27,6 +27,21 @@ class Settings(BaseSettings):
     DEBUG: bool = False
     LOG_LEVEL: str = "INFO"
 
+    # Import routers on first matching request; None enables it on Lambda only
+    LAZY_ROUTER_LOADING: Optional[bool] = None
+
+    @property
+    def is_lambda(self) -> bool:
+        """Whether the process is running inside an AWS Lambda runtime."""
+        return "AWS_LAMBDA_FUNCTION_NAME" in os.environ
+
+    @property
+    def lazy_router_loading(self) -> bool:
+        """Whether routers should be imported lazily."""
+        if self.LAZY_ROUTER_LOADING is not None:
+            return self.LAZY_ROUTER_LOADING
+        return self.is_lambda
+
     # AWS Configuration
     AWS_REGION: str = "us-east-1"
     AWS_ACCOUNT_ID: Optional[str] = None
@@ -41,6 +56,39 @@ class Settings(BaseSettings):
     DB_PASSWORD: str = ""
     DB_MAX_CONNECTIONS: int = 20
     DB_MIN_CONNECTIONS: int = 5
+    DB_POOL_MODE: Optional[str] = None  # queue, single or null; None picks by runtime
+    DB_POOL_TIMEOUT_SECONDS: float = 30.0
+    DB_POOL_RECYCLE_SECONDS: int = 3600
+    DB_CONNECT_TIMEOUT_SECONDS: float = 10.0
+    DB_TRANSACTION_POOLING: bool = False  # True behind RDS Proxy / pgbouncer transaction mode
+    DB_STATEMENT_CACHE_SIZE: int = 100
+
+    @property
+    def db_pool_mode(self) -> str:
+        """
+        Resolve connection pool mode.
+
+        ``single`` keeps one connection per Lambda container that is reused
+        across warm invocations, ``null`` opens a connection per session (for
+        use behind RDS Proxy), ``queue`` is a sized pool for long-running
+        servers.
+        """
+        if self.DB_POOL_MODE:
+            return self.DB_POOL_MODE.lower()
+        return "single" if self.is_lambda else "queue"
+
+    @property
+    def websocket_registry_backend(self) -> str:
+        """
+        Resolve WebSocket connection registry backend.
+
+        On Lambda, ``$connect``, message and ``$disconnect`` invocations run
+        in different containers, so the registry must be shared (``redis``);
+        long-running servers default to the in-process ``memory`` registry.
+        """
+        if self.WEBSOCKET_REGISTRY_BACKEND:
+            return self.WEBSOCKET_REGISTRY_BACKEND.lower()
+        return "redis" if self.is_lambda else "memory"
 
     @property
     def postgres_url(self) -> str:
@@ -62,14 +110,122 @@ class Settings(BaseSettings):
     JWT_REFRESH_TOKEN_EXPIRE_DAYS: int = 7
     JWT_REFRESH_TOKEN_EXPIRE_MINUTES: int = 7 * 24 * 60  # Alias for compatibility
 
+    # Password Hashing
+    PASSWORD_HASH_ROUNDS: Optional[int] = None  # bcrypt cost; None uses the environment default
+    PASSWORD_HASH_WORKERS: int = 4
+    PASSWORD_HASH_MAX_QUEUE: int = 64
+
+    @property
+    def password_hash_rounds(self) -> int:
+        """Resolve bcrypt cost factor for the current environment."""
+        if self.PASSWORD_HASH_ROUNDS:
+            return self.PASSWORD_HASH_ROUNDS
+        return {
+            "production": 12,
+            "staging": 12,
+            "development": 10,
+            "testing": 4
+        }.get(self.ENVIRONMENT, 12)
+
     # AWS Bedrock
     BEDROCK_MODEL_ID: str = "anthropic.claude-3-sonnet-20240229-v1:0"
     BEDROCK_REGION: str = "us-east-1"
     BEDROCK_MAX_TOKENS: int = 4096
     BEDROCK_TEMPERATURE: float = 0.7
+    BEDROCK_MAX_POOL_CONNECTIONS: int = 25  # Shared HTTP pool per Bedrock client
+    BEDROCK_PROMPT_CACHING_ENABLED: bool = True  # Cache checkpoints on stable prompt prefixes (supported models)
+    BEDROCK_PROMPT_CACHE_TTL_SECONDS: float = 300.0  # Bedrock keeps a cached prefix this long after its last use
+
+    # Bedrock Knowledge Bases
+    BEDROCK_KB_BACKEND: str = "aws"  # aws or local
+    BEDROCK_KB_GENERAL_ID: Optional[str] = None
+    BEDROCK_KB_HEALTHCARE_ID: Optional[str] = None
+    BEDROCK_KB_EDUCATION_ID: Optional[str] = None
+    BEDROCK_KB_FINANCE_ID: Optional[str] = None
+    BEDROCK_KB_MAX_RESULTS_PER_PAGE: int = 100  # Retrieve API page size limit
+    BEDROCK_KB_WORKERS: int = 16  # Threads for retrieve/rerank calls; keep within BEDROCK_MAX_POOL_CONNECTIONS
+    BEDROCK_RERANK_MODEL_ID: str = "amazon.rerank-v1:0"
+    RAG_VECTOR_STORE_DOMAINS: str = ""  # Comma-separated domains retrieved from the vector store instead
+
+    @property
+    def bedrock_rerank_model_arn(self) -> str:
+        """Foundation model ARN of the reranking model."""
+        return f"arn:aws:bedrock:{self.BEDROCK_REGION}::foundation-model/{self.BEDROCK_RERANK_MODEL_ID}"
+
+    @property
+    def knowledge_base_ids(self) -> Dict[str, str]:
+        """Configured knowledge base ID for each domain."""
+        configured = {
+            "general": self.BEDROCK_KB_GENERAL_ID,
+            "healthcare": self.BEDROCK_KB_HEALTHCARE_ID,
+            "education": self.BEDROCK_KB_EDUCATION_ID,
+            "finance": self.BEDROCK_KB_FINANCE_ID,
+        }
+        return {domain: kb_id for domain, kb_id in configured.items() if kb_id}
+
+    @property
+    def vector_store_domains(self) -> List[str]:
+        """Domains served by the vector store rather than a Bedrock knowledge base."""
+        return [domain.strip() for domain in self.RAG_VECTOR_STORE_DOMAINS.split(",") if domain.strip()]
 
     # LLM Configuration
-    LLM_PROVIDER: str = "bedrock"  # bedrock or gemini
+    LLM_PROVIDER: str = "bedrock"  # bedrock, gemini or router
+
+    # LLM routing (LLM_PROVIDER=router)
+    LLM_ROUTER_TARGETS: str = "bedrock:anthropic.claude-3-sonnet-20240229-v1:0,gemini:gemini-1.5-pro"
+    LLM_ROUTER_POLICY: str = "primary"  # primary (fallback in listed order), cheapest or fastest
+    LLM_ROUTER_HEDGE_ENABLED: bool = True
+    LLM_ROUTER_HEDGE_PERCENTILE: float = 95.0  # Hedge to the next target past this latency percentile
+    LLM_ROUTER_MIN_SAMPLES: int = 20  # Requests measured before latency drives routing
+    LLM_ROUTER_WINDOW_SIZE: int = 200
+    LLM_ROUTER_BREAKER_THRESHOLD: int = 3  # Consecutive throttling errors that open the breaker
+    LLM_ROUTER_BREAKER_COOLDOWN_SECONDS: float = 30.0
+
+    # LLM call scheduling: concurrency caps and per-tenant fair queuing
+    LLM_SCHEDULER_ENABLED: bool = True
+    LLM_MAX_CONCURRENCY: int = 32  # Calls in flight across all models
+    LLM_DEFAULT_MODEL_CONCURRENCY: int = 16  # Calls in flight per model unless overridden
+    LLM_MODEL_CONCURRENCY: str = ""  # provider:model=limit,... e.g. bedrock:anthropic.claude-3-sonnet-20240229-v1:0=8
+    LLM_SCHEDULER_MAX_QUEUE: int = 500  # Queued calls before new ones are rejected with 503
+    LLM_BATCH_MAX_SHARE: float = 0.5  # Share of LLM_MAX_CONCURRENCY batch calls may use
+    LLM_TENANT_WEIGHTS: str = ""  # tenant=weight,... e.g. workspace:<id>=2
+    LLM_THROTTLE_MIN_CONCURRENCY: int = 1  # Lowest per-model limit after throttling
+    LLM_THROTTLE_COOLDOWN_SECONDS: float = 5.0  # Minimum time between two limit decreases
+
+    # Per-chatbot LLM provider instances
+    LLM_PROVIDER_POOL_MAX_ENTRIES: int = 64  # Provider instances kept; least recently used are dropped
+    LLM_PROVIDER_POOL_IDLE_SECONDS: float = 1800.0  # Unused instances are dropped after this long
+    CHATBOT_API_KEY_ENCRYPTION_KEY: Optional[str] = None  # Fernet key encrypting chatbots' provider API keys
+
+    # Tool use (chatbots with enable_function_calling and linked tools)
+    TOOLS_ENABLED: bool = True
+    TOOL_MAX_ROUNDS: int = 5  # Model calls per answer, including the final one
+    TOOL_TIMEOUT_SECONDS: float = 10.0  # Per call, for tools without their own timeout
+    TOOL_MAX_PARALLEL_CALLS: int = 8  # Calls of one model turn running at once
+    TOOL_MAX_RESULT_CHARS: int = 20000  # Longer results are truncated before going back to the model
+    TOOL_RESULT_CACHE_ENABLED: bool = True  # Cache results of idempotent tools
+    TOOL_RESULT_CACHE_MAX_ENTRIES: int = 2048
+    TOOL_DOCUMENT_ANALYZER_CACHE_TTL_SECONDS: float = 300.0
+
+    # Offline batch inference
+    BATCH_INFERENCE_BACKEND: Optional[str] = None  # bedrock or local; None uses bedrock on Lambda, local elsewhere
+    BATCH_INFERENCE_MODEL_ID: Optional[str] = None  # Defaults to BEDROCK_MODEL_ID
+    BATCH_INFERENCE_MAX_RECORDS: int = 50000  # Records accepted per job
+    BATCH_INFERENCE_MAX_ACTIVE_JOBS: int = 10  # Jobs running per backend; later jobs wait as pending
+    BATCH_INFERENCE_MAX_ATTEMPTS: int = 3  # Resubmissions of the remaining records after a job is lost
+    BATCH_INFERENCE_RESULT_CHUNK_SIZE: int = 500  # Results stored per checkpoint
+    BATCH_INFERENCE_S3_BUCKET: Optional[str] = None
+    BATCH_INFERENCE_S3_PREFIX: str = "batch-inference"
+    BATCH_INFERENCE_ROLE_ARN: Optional[str] = None  # Service role Bedrock assumes to read and write S3
+    BATCH_INFERENCE_LOCAL_DIR: str = "/tmp/batch-inference"
+    BATCH_INFERENCE_LOCAL_CONCURRENCY: int = 4  # Records in flight per local job
+
+    @property
+    def batch_inference_backend(self) -> str:
+        """Batch inference backend; local jobs die with a Lambda invocation, so Lambda defaults to Bedrock."""
+        if self.BATCH_INFERENCE_BACKEND:
+            return self.BATCH_INFERENCE_BACKEND.lower()
+        return "bedrock" if self.is_lambda else "local"
     
     # Google Gemini
     GEMINI_API_KEY: Optional[str] = None
@@ -88,6 +244,82 @@ class Settings(BaseSettings):
     # WebSocket
     WEBSOCKET_API_ENDPOINT: Optional[str] = None
     CONNECTION_TTL_SECONDS: int = 3600
+    WEBSOCKET_REGISTRY_BACKEND: Optional[str] = None  # memory, redis or fake_redis; None picks by runtime
+    WEBSOCKET_MANAGEMENT_BACKEND: str = "aws"  # aws or local
+    WEBSOCKET_MAX_POOL_CONNECTIONS: int = 10
+    WEBSOCKET_FRAME_MIN_CHARS: int = 64
+    WEBSOCKET_FRAME_MAX_DELAY_MS: int = 50
+
+    # Request deadlines
+    REQUEST_TIMEOUT_SECONDS: float = 30.0
+    STREAMING_REQUEST_TIMEOUT_SECONDS: float = 120.0
+    LAMBDA_DEADLINE_MARGIN_SECONDS: float = 1.0  # Time kept back to return a response
+    RAG_RETRIEVAL_BUDGET_SHARE: float = 0.3  # Share of the remaining time retrieval may use
+    RAG_MIN_GENERATION_SECONDS: float = 3.0  # Time always reserved for generation
+    RAG_MIN_OPTIONAL_STAGE_SECONDS: float = 0.5  # Optional stages are skipped below this
+    RAG_DOMAIN_TIMEOUT_SECONDS: float = 3.0  # Per-domain cap in multi-domain retrieval
+
+    # Retrieval cache
+    RAG_CACHE_ENABLED: bool = True
+    RAG_CACHE_TTL_SECONDS: float = 300.0
+    RAG_CACHE_STALE_WHILE_REVALIDATE: bool = False
+    RAG_CACHE_STALE_TTL_SECONDS: float = 600.0  # How long past the TTL stale results may be served
+    RAG_CACHE_MAX_ENTRIES: int = 1024
+
+    # Chatbot config cache
+    CHATBOT_CONFIG_CACHE_ENABLED: bool = True
+    CHATBOT_CONFIG_CACHE_TTL_SECONDS: float = 300.0  # Upper bound on staleness if a change notification is missed
+    CHATBOT_CONFIG_CACHE_MAX_ENTRIES: int = 1024
+    CHATBOT_CONFIG_NOTIFY_CHANNEL: str = "chatbot_config_changed"
+    KNOWLEDGE_BASE_NOTIFY_CHANNEL: str = "knowledge_base_changed"  # Ingestion completions, for the retrieval cache
+    CHATBOT_CONFIG_LISTEN_ENABLED: Optional[bool] = None  # None enables it unless on Lambda or transaction pooling
+
+    @property
+    def chatbot_config_listen_enabled(self) -> bool:
+        """Whether this worker listens for chatbot and knowledge base change notifications."""
+        if self.CHATBOT_CONFIG_LISTEN_ENABLED is not None:
+            return self.CHATBOT_CONFIG_LISTEN_ENABLED
+        caching = self.CHATBOT_CONFIG_CACHE_ENABLED or self.RAG_CACHE_ENABLED
+        return caching and not self.is_lambda and not self.DB_TRANSACTION_POOLING
+
+    # Reranking
+    RAG_RERANK_ENABLED: bool = False
+    RAG_RERANKER: str = "lexical"  # lexical or bedrock
+    RAG_RERANK_CANDIDATES: int = 20  # Contexts over-fetched for the reranker to choose from
+
+    # Context packing
+    RAG_CONTEXT_MAX_TOKENS: int = 6000  # Cap on context tokens, even for large context windows
+    RAG_PROMPT_RESERVE_TOKENS: int = 500  # Question and instructions around the context
+    RAG_DEDUP_SIMILARITY: float = 0.8  # Estimated Jaccard similarity treated as a duplicate chunk
+
+    # Conversation follow-ups
+    RAG_FOLLOWUP_RETRIEVAL_WAIT_MS: int = 300  # Longest a follow-up waits for new retrieval
+    RAG_FOLLOWUP_MIN_SCORE: float = 0.35  # Below this best score the previous turn's contexts are reused
+    RAG_FOLLOWUP_CONTEXT_TTL_SECONDS: float = 1800.0
+
+    # Query rewriting and embedding
+    RAG_QUERY_REWRITE_ENABLED: bool = False  # Condense follow-ups into standalone queries
+    RAG_REWRITE_PROVIDER: str = "bedrock"  # Provider serving RAG_REWRITE_MODEL_ID
+    RAG_REWRITE_MODEL_ID: str = "anthropic.claude-3-haiku-20240307-v1:0"
+    RAG_REWRITE_MAX_TURN_CHARS: int = 500  # Per-message cap on history shown to the rewriter
+    RAG_QUERY_EMBEDDING_ENABLED: bool = False  # Embed each query once for RAG_VECTOR_STORE_DOMAINS sources
+
+    @property
+    def query_preprocessing_enabled(self) -> bool:
+        """Whether queries go through the rewriting/embedding stage before retrieval."""
+        return self.RAG_QUERY_REWRITE_ENABLED or self.query_embedding_enabled
+
+    @property
+    def query_embedding_enabled(self) -> bool:
+        """Whether queries are embedded up front; only vector-store domains use the embedding."""
+        return self.RAG_QUERY_EMBEDDING_ENABLED and bool(self.vector_store_domains)
+
+    # Request coalescing
+    SINGLE_FLIGHT_ENABLED: bool = True  # Identical in-flight retrievals and generations share one call
+
+    # Server-Sent Events
+    SSE_FLUSH_MIN_CHARS: int = 32
+    SSE_FLUSH_MAX_DELAY_MS: int = 50
 
     # API Gateway
     API_GATEWAY_ENDPOINT: Optional[str] = None
@@ -124,8 +356,18 @@ class Settings(BaseSettings):
     INGESTION_BATCH_SIZE: int = 100
 
     # Rate Limiting
+    RATE_LIMIT_ENABLED: bool = True
+    RATE_LIMIT_BACKEND: str = "memory"  # memory, redis or fake_redis
     RATE_LIMIT_PER_USER: int = 100
+    RATE_LIMIT_PER_IP: int = 300
+    RATE_LIMIT_AUTH_PER_IDENTITY: int = 10
+    RATE_LIMIT_CHAT_PER_USER: int = 30
+    RATE_LIMIT_UPLOAD_PER_USER: int = 10
     RATE_LIMIT_WINDOW_SECONDS: int = 60
+    RATE_LIMIT_TRUSTED_PROXY_HOPS: int = 0  # Proxies appending to X-Forwarded-For in front of the app (1 for an ALB)
+
+    # Redis
+    REDIS_URL: str = "redis://localhost:6379/0"
 
     model_config = SettingsConfigDict(
         env_file=".env",
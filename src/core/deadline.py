@@ -0,0 +1,260 @@
+"""
+Request-scoped deadlines and cancellation.
+
+A ``RequestDeadline`` is created per request (by ``DeadlineMiddleware`` for
+HTTP, from the Lambda context for WebSocket events) and stored in a context
+variable, so services and providers can read it without threading it through
+every signature. Stages run under ``deadline.run`` get a share of the
+remaining time and are aborted as soon as the request is cancelled or the
+deadline passes; optional stages are skipped when too little time is left.
+"""
+
+import asyncio
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterator, List, Optional, TypeVar
+from core.config import settings
+from core.errors import DeadlineExceededError, RequestCancelledError
+from core.logger import logger
+
+T = TypeVar("T")
+
+
+class RequestDeadline:
+    """Time budget and cancellation signal for one request."""
+
+    def __init__(self, timeout: Optional[float] = None, clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize deadline.
+
+        Args:
+            timeout: Seconds until the deadline; None for no deadline
+            clock: Monotonic time source
+        """
+        self._clock = clock
+        self.expires_at = None if timeout is None else clock() + timeout
+        self.cancel_reason: Optional[str] = None
+        self.skipped_stages: List[str] = []
+        self.stage_timings: Dict[str, float] = {}
+        self._cancelled: Optional[asyncio.Event] = None
+
+    @classmethod
+    def from_lambda_context(cls, context: Any, timeout: Optional[float] = None) -> "RequestDeadline":
+        """
+        Create a deadline ending shortly before the Lambda invocation times out.
+
+        Args:
+            context: Lambda context object
+            timeout: Optional cap on the deadline in seconds
+
+        Returns:
+            RequestDeadline: Deadline bounded by the invocation's remaining time
+        """
+        remaining = context.get_remaining_time_in_millis() / 1000 - settings.LAMBDA_DEADLINE_MARGIN_SECONDS
+        remaining = max(0.0, remaining)
+        return cls(remaining if timeout is None else min(remaining, timeout))
+
+    @property
+    def cancelled(self) -> bool:
+        """Whether the request has been cancelled."""
+        return self.cancel_reason is not None
+
+    @property
+    def expired(self) -> bool:
+        """Whether the deadline has passed."""
+        return self.expires_at is not None and self._clock() >= self.expires_at
+
+    def remaining(self) -> Optional[float]:
+        """Seconds left, or None when there is no deadline."""
+        if self.expires_at is None:
+            return None
+        return max(0.0, self.expires_at - self._clock())
+
+    def cancel(self, reason: str = "Request cancelled") -> None:
+        """Cancel the request; running stages are aborted."""
+        if self.cancel_reason is None:
+            self.cancel_reason = reason
+            logger.info(f"Request cancelled: {reason}")
+        if self._cancelled is not None:
+            self._cancelled.set()
+
+    def check(self, stage: Optional[str] = None) -> None:
+        """
+        Raise if the request can no longer make progress.
+
+        Raises:
+            RequestCancelledError: If the request was cancelled
+            DeadlineExceededError: If the deadline has passed
+        """
+        if self.cancelled:
+            raise RequestCancelledError(self.cancel_reason)
+        if self.expired:
+            raise DeadlineExceededError(stage)
+
+    def budget(self, share: float = 1.0, reserve: float = 0.0) -> Optional[float]:
+        """
+        Time a stage may use.
+
+        Args:
+            share: Fraction of the remaining time to allocate
+            reserve: Seconds to keep back for later stages
+
+        Returns:
+            Optional[float]: Seconds allowed, or None when unbounded
+        """
+        remaining = self.remaining()
+        if remaining is None:
+            return None
+        return max(0.0, min(remaining * share, remaining - reserve))
+
+    def allows(self, min_seconds: float, share: float = 1.0, reserve: float = 0.0) -> bool:
+        """Whether a stage needing ``min_seconds`` fits in its budget."""
+        if self.cancelled:
+            return False
+        budget = self.budget(share, reserve)
+        return budget is None or budget >= min_seconds
+
+    async def run(self, stage: str, awaitable: Awaitable[T], share: float = 1.0, reserve: float = 0.0) -> T:
+        """
+        Run a stage within its budget, aborting it on cancellation.
+
+        Args:
+            stage: Stage name for logs and errors
+            awaitable: Work to run
+            share: Fraction of the remaining time the stage may use
+            reserve: Seconds to keep back for later stages
+
+        Returns:
+            The stage result
+
+        Raises:
+            RequestCancelledError: If the request is cancelled while running
+            DeadlineExceededError: If the stage runs out of time
+        """
+        task = asyncio.ensure_future(awaitable)
+        try:
+            self.check(stage)
+        except Exception:
+            task.cancel()
+            raise
+
+        timeout = self.budget(share, reserve)
+        waiter = asyncio.ensure_future(self._cancel_event().wait())
+        start = time.perf_counter()
+        try:
+            done, _ = await asyncio.wait({task, waiter}, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+        except asyncio.CancelledError:
+            task.cancel()
+            raise
+        finally:
+            waiter.cancel()
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            self.stage_timings[stage] = self.stage_timings.get(stage, 0.0) + elapsed_ms
+
+        if task in done:
+            return task.result()
+
+        task.cancel()
+        try:
+            await task
+        except (asyncio.CancelledError, Exception):
+            pass
+        if self.cancelled:
+            raise RequestCancelledError(self.cancel_reason, details={"stage": stage})
+        logger.warning(f"Stage '{stage}' exceeded its {timeout:.2f}s budget")
+        raise DeadlineExceededError(stage)
+
+    async def run_optional(
+        self,
+        stage: str,
+        factory: Callable[[], Awaitable[T]],
+        default: T,
+        min_seconds: Optional[float] = None,
+        share: float = 1.0,
+        reserve: float = 0.0
+    ) -> T:
+        """
+        Run a stage that may be skipped when time is short.
+
+        Args:
+            stage: Stage name
+            factory: Callable creating the work, only called if the stage runs
+            default: Result to use when the stage is skipped or times out
+            min_seconds: Minimum budget worth starting the stage with
+            share: Fraction of the remaining time the stage may use
+            reserve: Seconds to keep back for later stages
+
+        Returns:
+            The stage result, or ``default``
+
+        Raises:
+            RequestCancelledError: If the request was cancelled
+        """
+        min_seconds = settings.RAG_MIN_OPTIONAL_STAGE_SECONDS if min_seconds is None else min_seconds
+        if not self.allows(min_seconds, share, reserve):
+            self.check(stage)
+            logger.info(f"Skipping optional stage '{stage}': insufficient time budget")
+            self.skipped_stages.append(stage)
+            return default
+        try:
+            return await self.run(stage, factory(), share, reserve)
+        except DeadlineExceededError:
+            self.skipped_stages.append(stage)
+            return default
+
+    async def stream(self, stage: str, source: AsyncIterator[T]) -> AsyncIterator[T]:
+        """
+        Iterate a stream, closing it on cancellation or when the deadline passes.
+
+        Args:
+            stage: Stage name
+            source: Async iterator to consume
+
+        Yields:
+            Items from ``source``
+        """
+        iterator = source.__aiter__()
+        try:
+            while True:
+                try:
+                    item = await self.run(stage, iterator.__anext__())
+                except StopAsyncIteration:
+                    return
+                yield item
+        finally:
+            aclose = getattr(iterator, "aclose", None)
+            if aclose is not None:
+                await aclose()
+
+    def _cancel_event(self) -> asyncio.Event:
+        # Created lazily so the event binds to the loop that awaits it
+        if self._cancelled is None:
+            self._cancelled = asyncio.Event()
+            if self.cancelled:
+                self._cancelled.set()
+        return self._cancelled
+
+
+_current_deadline: ContextVar[Optional[RequestDeadline]] = ContextVar("request_deadline", default=None)
+
+
+def get_request_deadline() -> RequestDeadline:
+    """
+    Get the deadline of the current request.
+
+    Returns:
+        RequestDeadline: Current deadline, or an unbounded one outside a request
+    """
+    deadline = _current_deadline.get()
+    return deadline if deadline is not None else RequestDeadline()
+
+
+@contextmanager
+def request_deadline(deadline: RequestDeadline) -> Iterator[RequestDeadline]:
+    """Make ``deadline`` current for the enclosed code."""
+    token = _current_deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current_deadline.reset(token)
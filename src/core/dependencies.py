@@ -8,6 +8,7 @@ from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 from infrastructure.postgresql.connection import get_db_session
 from infrastructure.auth.jwt_handler import JWTHandler
+from infrastructure.auth.password_hasher import PasswordHasher, get_password_hasher
 from core.config import settings
 
 # Vector Store & RAG dependencies
@@ -63,6 +64,8 @@ from usecases.conversation_use_cases import (
     GetConversationUseCase,
     CreateConversationUseCase,
     CreateMessageUseCase,
+    ReplyToConversationUseCase,
+    GetUsageReportUseCase,
     DeleteConversationUseCase
 )
 
@@ -110,24 +113,30 @@ def get_message_repository(
 # Service dependencies (use interfaces)
 def get_auth_service(
     user_repository: UserRepository = Depends(get_user_repository),
-    jwt_handler: JWTHandler = Depends(get_jwt_handler)
+    jwt_handler: JWTHandler = Depends(get_jwt_handler),
+    password_hasher: PasswordHasher = Depends(get_password_hasher)
 ) -> AuthService:
     """Get auth service instance."""
-    return AuthService(user_repository, jwt_handler)
+    return AuthService(user_repository, jwt_handler, password_hasher)
 
 
 def get_user_service(
-    user_repository: UserRepository = Depends(get_user_repository)
+    user_repository: UserRepository = Depends(get_user_repository),
+    password_hasher: PasswordHasher = Depends(get_password_hasher)
 ) -> UserService:
     """Get user service instance."""
-    return UserService(user_repository)
+    return UserService(user_repository, password_hasher)
 
 
 def get_chatbot_service(
     chatbot_repository: ChatbotRepository = Depends(get_chatbot_repository)
 ) -> ChatbotService:
     """Get chatbot service instance."""
-    return ChatbotService(chatbot_repository)
+    from infrastructure.cache.chatbot_configs import get_chatbot_config_cache
+    return ChatbotService(
+        chatbot_repository,
+        config_cache=get_chatbot_config_cache() if settings.CHATBOT_CONFIG_CACHE_ENABLED else None
+    )
 
 
 def get_conversation_service(
@@ -269,8 +278,9 @@ def get_delete_conversation_use_case(
 
 
 def get_bedrock_client() -> BedrockClient:
-    """Get Bedrock client instance."""
-    return BedrockClient()
+    """Get the shared Bedrock client instance."""
+    from infrastructure.ai_services.providers.bedrock import get_bedrock_client as get_shared_bedrock_client
+    return get_shared_bedrock_client()
 
 def get_vector_store_service() -> VectorStoreService:
     """Get vector store service instance."""
@@ -288,15 +298,94 @@ def get_rag_service(
     knowledge_base_service: IKnowledgeBaseService = Depends(get_knowledge_base_service)
 ) -> IRAGService:
     """Get RAG service instance with direct LLM provider."""
-    from infrastructure.ai_services.factory import LLMFactory
-    llm_provider = LLMFactory.create()  # Direct provider
-    return RAGService(knowledge_base_service, llm_provider)
+    from infrastructure.ai_services.provider_pool import get_llm_provider_pool
+    from infrastructure.cache.retrieval_cache import get_retrieval_cache
+    from infrastructure.cache.conversation_contexts import get_conversation_context_cache
+    from infrastructure.cache.single_flight import get_single_flight
+    from infrastructure.ai_services.services.reranker import create_reranker
+    from application.services.query_rewriting import get_query_preprocessor
+    from application.services.tool_calling import get_tool_calling_loop
+    from infrastructure.ai_services.services.knowledge_base import resolve_domain_sources
+    from infrastructure.postgresql.conversation_history import load_recent_turns
+    llm_provider = get_llm_provider_pool().get()  # Default provider, built once per process
+    return RAGService(
+        knowledge_base_service,
+        llm_provider,
+        domain_sources=resolve_domain_sources(),
+        retrieval_cache=get_retrieval_cache() if settings.RAG_CACHE_ENABLED else None,
+        reranker=create_reranker() if settings.RAG_RERANK_ENABLED else None,
+        conversation_contexts=get_conversation_context_cache(),
+        query_preprocessor=get_query_preprocessor() if settings.query_preprocessing_enabled else None,
+        single_flight=get_single_flight() if settings.SINGLE_FLIGHT_ENABLED else None,
+        tool_loop=get_tool_calling_loop() if settings.TOOLS_ENABLED else None,
+        history_loader=load_recent_turns
+    )
+
+def get_reply_to_conversation_use_case(
+    conversation_service: ConversationService = Depends(get_conversation_service),
+    rag_service: IRAGService = Depends(get_rag_service),
+    chatbot_service: ChatbotService = Depends(get_chatbot_service)
+) -> ReplyToConversationUseCase:
+    """Get reply to conversation use case instance."""
+    from infrastructure.ai_services.provider_pool import get_llm_provider_pool
+    return ReplyToConversationUseCase(conversation_service, rag_service, chatbot_service, get_llm_provider_pool())
+
+
+def get_usage_report_use_case(
+    conversation_service: ConversationService = Depends(get_conversation_service)
+) -> GetUsageReportUseCase:
+    """Get usage report use case instance."""
+    return GetUsageReportUseCase(conversation_service)
+
+# Batch inference
+def get_batch_inference_service(
+    session: AsyncSession = Depends(get_db_session)
+):
+    """Get batch inference service instance."""
+    from infrastructure.postgresql.repositories import (
+        IngestionJobRepositoryImpl,
+        BatchInferenceResultRepositoryImpl
+    )
+    from infrastructure.ai_services.services.batch_inference import get_batch_inference_backend
+    from application.services.batch_inference_service import BatchInferenceService
+    return BatchInferenceService(
+        IngestionJobRepositoryImpl(session),
+        BatchInferenceResultRepositoryImpl(session),
+        get_batch_inference_backend()
+    )
+
+def get_submit_batch_job_use_case(
+    batch_service = Depends(get_batch_inference_service)
+):
+    """Get submit batch job use case."""
+    from usecases.batch_inference_use_cases import SubmitBatchJobUseCase
+    return SubmitBatchJobUseCase(batch_service)
+
+def get_batch_job_use_case(
+    batch_service = Depends(get_batch_inference_service)
+):
+    """Get batch job use case."""
+    from usecases.batch_inference_use_cases import GetBatchJobUseCase
+    return GetBatchJobUseCase(batch_service)
+
+def get_list_batch_jobs_use_case(
+    batch_service = Depends(get_batch_inference_service)
+):
+    """Get list batch jobs use case."""
+    from usecases.batch_inference_use_cases import ListBatchJobsUseCase
+    return ListBatchJobsUseCase(batch_service)
+
+def get_list_batch_results_use_case(
+    batch_service = Depends(get_batch_inference_service)
+):
+    """Get list batch results use case."""
+    from usecases.batch_inference_use_cases import ListBatchResultsUseCase
+    return ListBatchResultsUseCase(batch_service)
 
 # Document services and repositories
 from shared.interfaces.repositories.document_repository import DocumentRepository
 from infrastructure.postgresql.repositories import DocumentRepositoryImpl
 from shared.interfaces.services.storage.file_storage_service import IFileStorageService
-from infrastructure.s3.s3_file_storage_service import S3FileStorageService
 from shared.interfaces.services.upload.document_upload_service import IDocumentUploadService
 from application.services.document_upload_service import DocumentUploadService
 
@@ -308,6 +397,7 @@ def get_document_repository(
 
 def get_file_storage_service() -> IFileStorageService:
     """Get file storage service instance."""
+    from infrastructure.s3.s3_file_storage_service import S3FileStorageService
     return S3FileStorageService()
 
 def get_document_upload_service(
@@ -332,6 +422,13 @@ def get_delete_document_use_case(
     from usecases.document_use_cases import DeleteDocumentUseCase
     return DeleteDocumentUseCase(upload_service)
 
+def get_mark_document_processed_use_case(
+    upload_service: IDocumentUploadService = Depends(get_document_upload_service)
+):
+    """Get mark document processed use case."""
+    from usecases.document_use_cases import MarkDocumentProcessedUseCase
+    return MarkDocumentProcessedUseCase(upload_service)
+
 def get_list_user_documents_use_case(
     document_repository: DocumentRepository = Depends(get_document_repository)
 ):
@@ -347,6 +444,13 @@ def get_chat_with_documents_use_case(
     from usecases.rag_use_cases import ChatWithDocumentsUseCase
     return ChatWithDocumentsUseCase(rag_service)
 
+def get_stream_chat_with_documents_use_case(
+    rag_service: IRAGService = Depends(get_rag_service)
+):
+    """Get streaming chat with documents use case."""
+    from usecases.rag_use_cases import StreamChatWithDocumentsUseCase
+    return StreamChatWithDocumentsUseCase(rag_service)
+
 def get_semantic_search_use_case(
     rag_service: IRAGService = Depends(get_rag_service)
 ):
@@ -217,12 +217,55 @@ class BusinessRuleViolationError(BaseAppException):
 class RateLimitExceededError(BaseAppException):
     """Raised when rate limit is exceeded."""
 
-    def __init__(self, limit: int, window_seconds: int):
+    def __init__(self, limit: int, window_seconds: int, retry_after: Optional[float] = None):
+        details = {"limit": limit, "window_seconds": window_seconds}
+        if retry_after is not None:
+            details["retry_after"] = round(retry_after, 3)
         super().__init__(
             message=f"Rate limit exceeded: {limit} requests per {window_seconds} seconds",
             status_code=429,
             error_code="RATE_LIMIT_EXCEEDED",
-            details={"limit": limit, "window_seconds": window_seconds}
+            details=details
+        )
+
+
+class ServiceOverloadedError(BaseAppException):
+    """Raised when a bounded internal queue is full and work is shed."""
+
+    def __init__(self, message: str = "Service is overloaded", details: Optional[Dict[str, Any]] = None):
+        super().__init__(
+            message=message,
+            status_code=503,
+            error_code="SERVICE_OVERLOADED",
+            details=details
+        )
+
+
+# Request Lifetime Errors
+class DeadlineExceededError(BaseAppException):
+    """Raised when a request runs out of its time budget."""
+
+    def __init__(self, stage: Optional[str] = None, details: Optional[Dict[str, Any]] = None):
+        details = details or {}
+        if stage:
+            details["stage"] = stage
+        super().__init__(
+            message=f"Deadline exceeded{f' during {stage}' if stage else ''}",
+            status_code=504,
+            error_code="DEADLINE_EXCEEDED",
+            details=details
+        )
+
+
+class RequestCancelledError(BaseAppException):
+    """Raised when the caller went away and the request was cancelled."""
+
+    def __init__(self, reason: str = "Request cancelled", details: Optional[Dict[str, Any]] = None):
+        super().__init__(
+            message=reason,
+            status_code=499,
+            error_code="REQUEST_CANCELLED",
+            details=details
         )
 
 
@@ -0,0 +1,52 @@
+"""
+Lazy re-export helpers for package ``__init__`` modules.
+
+Keeps package-level imports such as ``from infrastructure.ai_services import
+LLMFactory`` working while deferring the actual module import (and its heavy
+third-party dependencies) until the attribute is first accessed. This keeps
+Lambda cold starts limited to the code a request actually needs.
+"""
+
+import importlib
+from typing import Callable, Dict, List, Tuple
+
+
+def lazy_exports(package: str, exports: Dict[str, str]) -> Tuple[Callable, Callable]:
+    """
+    Build module-level ``__getattr__`` and ``__dir__`` for lazy re-exports.
+
+    Args:
+        package: Name of the package defining the exports (``__name__``)
+        exports: Mapping of exported name to the module that defines it.
+            Relative module names are resolved against ``package``; use
+            ``"module:attr"`` when the attribute is named differently.
+
+    Returns:
+        Tuple of (__getattr__, __dir__) functions to assign in the package
+
+    Usage:
+        __getattr__, __dir__ = lazy_exports(__name__, {
+            "LLMFactory": ".factory",
+        })
+    """
+
+    def __getattr__(name: str):
+        module_name = exports.get(name)
+        if module_name is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        module_name, _, attr = module_name.partition(":")
+        module = importlib.import_module(module_name, package)
+        value = getattr(module, attr or name)
+        # Cache on the package so later lookups bypass __getattr__
+        setattr(importlib.import_module(package), name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(exports) | set(globals_of(package)))
+
+    return __getattr__, __dir__
+
+
+def globals_of(package: str) -> List[str]:
+    """Get names already defined on a package module."""
+    return list(vars(importlib.import_module(package)))
@@ -0,0 +1,248 @@
+"""
+Token usage and latency telemetry for LLM calls.
+
+Providers report each call with ``record_llm_usage``: input and output
+tokens from the model's usage block (plus prompt cache reads and writes,
+which are not part of ``input_tokens``), time to first token for streams,
+and total latency. Calls are added to the current request's ``UsageCollector``
+(a context variable, like the request deadline, so usage does not have to be
+threaded through ``BaseLLMService`` return values) and to a process-wide
+``UsageAggregator`` broken down by provider and model.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from core.logger import logger
+
+
+@dataclass
+class LLMCallUsage:
+    """Usage and timing of one LLM call."""
+
+    provider: str
+    model_id: str
+    input_tokens: int = 0
+    output_tokens: int = 0
+    total_ms: float = 0.0
+    time_to_first_token_ms: Optional[float] = None
+    streamed: bool = False
+    cache_read_tokens: int = 0
+    cache_write_tokens: int = 0
+
+    @property
+    def tokens_per_second(self) -> Optional[float]:
+        """Output rate once generation started (after the first token for streams)."""
+        generation_ms = self.total_ms - (self.time_to_first_token_ms or 0.0)
+        if not self.output_tokens or generation_ms <= 0:
+            return None
+        return self.output_tokens / (generation_ms / 1000)
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data["tokens_per_second"] = (
+            round(self.tokens_per_second, 1) if self.tokens_per_second is not None else None
+        )
+        return data
+
+
+class UsageCollector:
+    """LLM calls made while serving one request."""
+
+    def __init__(self):
+        self.calls: List[LLMCallUsage] = []
+
+    def record(self, usage: LLMCallUsage) -> None:
+        self.calls.append(usage)
+
+    def summary(self) -> Optional[Dict[str, Any]]:
+        """
+        Usage of the request's calls per provider and model, or None if no call was made.
+
+        A request may call several models (a query rewriter, then the model
+        that answers). The top level describes the model of the last call,
+        which produced the answer: its tokens, plus that call's time to first
+        token and output rate; ``total_ms`` and ``llm_calls`` cover all calls.
+        ``by_model`` holds the totals of every provider and model used.
+        """
+        if not self.calls:
+            return None
+        groups: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        for call in self.calls:
+            group = groups.setdefault((call.provider, call.model_id), {
+                "provider": call.provider,
+                "model_id": call.model_id,
+                "input_tokens": 0,
+                "output_tokens": 0,
+                "cache_read_tokens": 0,
+                "cache_write_tokens": 0,
+                "total_ms": 0.0,
+                "llm_calls": 0
+            })
+            group["input_tokens"] += call.input_tokens
+            group["output_tokens"] += call.output_tokens
+            group["cache_read_tokens"] += call.cache_read_tokens
+            group["cache_write_tokens"] += call.cache_write_tokens
+            group["total_ms"] += call.total_ms
+            group["llm_calls"] += 1
+        for group in groups.values():
+            group["total_ms"] = round(group["total_ms"], 1)
+
+        last = self.calls[-1]
+        summary = {
+            **groups[(last.provider, last.model_id)],
+            "total_ms": round(sum(call.total_ms for call in self.calls), 1),
+            "time_to_first_token_ms": last.time_to_first_token_ms,
+            "tokens_per_second": last.to_dict()["tokens_per_second"],
+            "llm_calls": len(self.calls),
+            "by_model": list(groups.values())
+        }
+        if summary["time_to_first_token_ms"] is not None:
+            summary["time_to_first_token_ms"] = round(summary["time_to_first_token_ms"], 1)
+        return summary
+
+
+@dataclass
+class _Totals:
+    calls: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cache_read_tokens: int = 0
+    cache_write_tokens: int = 0
+    total_ms: float = 0.0
+    first_token_ms: float = 0.0
+    streamed_calls: int = 0
+
+
+class UsageAggregator:
+    """Process-wide usage totals per provider and model."""
+
+    def __init__(self):
+        self._totals: Dict[Tuple[str, str], _Totals] = {}
+        self._lock = threading.Lock()
+        self.started_at = time.time()
+
+    def record(self, usage: LLMCallUsage) -> None:
+        with self._lock:
+            totals = self._totals.setdefault((usage.provider, usage.model_id), _Totals())
+            totals.calls += 1
+            totals.input_tokens += usage.input_tokens
+            totals.output_tokens += usage.output_tokens
+            totals.cache_read_tokens += usage.cache_read_tokens
+            totals.cache_write_tokens += usage.cache_write_tokens
+            totals.total_ms += usage.total_ms
+            if usage.time_to_first_token_ms is not None:
+                totals.first_token_ms += usage.time_to_first_token_ms
+                totals.streamed_calls += 1
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        """Totals and averages per provider and model since the process started."""
+        with self._lock:
+            items = [(key, _Totals(**asdict(totals))) for key, totals in self._totals.items()]
+        return [
+            {
+                "provider": provider,
+                "model_id": model_id,
+                "calls": totals.calls,
+                "input_tokens": totals.input_tokens,
+                "output_tokens": totals.output_tokens,
+                "cache_read_tokens": totals.cache_read_tokens,
+                "cache_write_tokens": totals.cache_write_tokens,
+                "avg_latency_ms": round(totals.total_ms / totals.calls, 1),
+                "avg_time_to_first_token_ms": (
+                    round(totals.first_token_ms / totals.streamed_calls, 1) if totals.streamed_calls else None
+                )
+            }
+            for (provider, model_id), totals in sorted(items)
+        ]
+
+    def reset(self) -> None:
+        with self._lock:
+            self._totals.clear()
+            self.started_at = time.time()
+
+
+_current_collector: ContextVar[Optional[UsageCollector]] = ContextVar("usage_collector", default=None)
+_usage_aggregator = UsageAggregator()
+
+
+def get_usage_aggregator() -> UsageAggregator:
+    """Get the process-wide usage aggregator."""
+    return _usage_aggregator
+
+
+def get_usage_collector() -> Optional[UsageCollector]:
+    """Get the current request's usage collector, if one is active."""
+    return _current_collector.get()
+
+
+@contextmanager
+def usage_collector(collector: Optional[UsageCollector] = None) -> Iterator[UsageCollector]:
+    """Collect the usage of LLM calls made in the enclosed code."""
+    collector = collector or UsageCollector()
+    token = _current_collector.set(collector)
+    try:
+        yield collector
+    finally:
+        _current_collector.reset(token)
+
+
+def record_llm_usage(
+    provider: str,
+    model_id: str,
+    input_tokens: Optional[int],
+    output_tokens: Optional[int],
+    started: float,
+    first_token_at: Optional[float] = None,
+    streamed: bool = False,
+    cache_read_tokens: Optional[int] = None,
+    cache_write_tokens: Optional[int] = None,
+    finished_at: Optional[float] = None
+) -> LLMCallUsage:
+    """
+    Record one LLM call.
+
+    Args:
+        provider: Provider name
+        model_id: Model ID
+        input_tokens: Prompt tokens reported by the model
+        output_tokens: Generated tokens reported by the model
+        started: ``time.perf_counter()`` when the call started
+        first_token_at: ``time.perf_counter()`` when the first chunk arrived
+        streamed: Whether the response was streamed
+        cache_read_tokens: Prompt tokens read from the provider's prompt cache
+        cache_write_tokens: Prompt tokens written to the provider's prompt cache
+        finished_at: ``time.perf_counter()`` when the call finished, if not now
+
+    Returns:
+        LLMCallUsage: The recorded usage
+    """
+    now = finished_at if finished_at is not None else time.perf_counter()
+    usage = LLMCallUsage(
+        provider=provider,
+        model_id=model_id,
+        input_tokens=int(input_tokens or 0),
+        output_tokens=int(output_tokens or 0),
+        total_ms=(now - started) * 1000,
+        time_to_first_token_ms=(first_token_at - started) * 1000 if first_token_at is not None else None,
+        streamed=streamed,
+        cache_read_tokens=int(cache_read_tokens or 0),
+        cache_write_tokens=int(cache_write_tokens or 0)
+    )
+    _usage_aggregator.record(usage)
+    collector = _current_collector.get()
+    if collector is not None:
+        collector.record(usage)
+    logger.info(
+        f"LLM call {provider}/{model_id}: {usage.input_tokens} in, {usage.output_tokens} out, "
+        f"{usage.total_ms:.0f}ms"
+        + (f" (first token {usage.time_to_first_token_ms:.0f}ms)" if first_token_at is not None else "")
+        + (
+            f", cache {usage.cache_read_tokens} read / {usage.cache_write_tokens} written"
+            if usage.cache_read_tokens or usage.cache_write_tokens else ""
+        )
+    )
+    return usage
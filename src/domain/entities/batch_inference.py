@@ -0,0 +1,31 @@
+"""
+Batch inference domain entities.
+
+A batch inference job is tracked as an ``IngestionJob`` whose ``details``
+hold the job's progress; these entities are the records it processes and
+the results it produces.
+"""
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass
+class BatchInferenceRecord:
+    record_id: str
+    prompt: str
+    system: Optional[str] = None
+    context: Optional[str] = None
+    max_tokens: int = 1000
+    temperature: float = 0.7
+
+
+@dataclass
+class BatchInferenceResult:
+    job_id: int
+    record_id: str
+    status: str  # succeeded or failed
+    output: Optional[str] = None
+    error_message: Optional[str] = None
+    input_tokens: Optional[int] = None
+    output_tokens: Optional[int] = None
+    created_at: Optional[str] = None
@@ -22,8 +22,12 @@ class Chatbot:
         model_id: Bedrock model identifier
         temperature: Model temperature (0.0-1.0)
         max_tokens: Maximum tokens for response
-        tools: List of tool IDs this chatbot can use
+        tools: Names of the tools this chatbot can use (``ITool.name``)
+        enable_function_calling: Whether the model may call the chatbot's tools
         is_active: Whether chatbot is active
+        provider: LLM provider serving the chatbot (None for the default)
+        api_key_encrypted: Encrypted provider API key, if the chatbot has its own
+        api_base_url: Provider endpoint override
         created_at: Creation timestamp
         updated_at: Last update timestamp
     """
@@ -40,6 +44,10 @@ class Chatbot:
     is_active: bool = True
     created_at: datetime = field(default_factory=datetime.utcnow)
     updated_at: datetime = field(default_factory=datetime.utcnow)
+    provider: Optional[str] = None
+    api_key_encrypted: Optional[str] = field(default=None, repr=False)
+    api_base_url: Optional[str] = None
+    enable_function_calling: bool = True
 
     def __post_init__(self):
         """Validate chatbot invariants."""
@@ -79,16 +87,16 @@ class Chatbot:
             self.max_tokens = max_tokens
         self.updated_at = datetime.utcnow()
 
-    def add_tool(self, tool_id: str) -> None:
+    def add_tool(self, tool_name: str) -> None:
         """Add a tool to the chatbot."""
-        if tool_id not in self.tools:
-            self.tools.append(tool_id)
+        if tool_name not in self.tools:
+            self.tools.append(tool_name)
             self.updated_at = datetime.utcnow()
 
-    def remove_tool(self, tool_id: str) -> None:
+    def remove_tool(self, tool_name: str) -> None:
         """Remove a tool from the chatbot."""
-        if tool_id in self.tools:
-            self.tools.remove(tool_id)
+        if tool_name in self.tools:
+            self.tools.remove(tool_name)
             self.updated_at = datetime.utcnow()
 
     def to_dict(self) -> dict:
@@ -103,6 +111,7 @@ class Chatbot:
             "temperature": self.temperature,
             "max_tokens": self.max_tokens,
             "tools": self.tools,
+            "enable_function_calling": self.enable_function_calling,
             "is_active": self.is_active,
             "created_at": self.created_at.isoformat(),
             "updated_at": self.updated_at.isoformat()
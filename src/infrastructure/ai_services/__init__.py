@@ -1,14 +1,29 @@
 # LLM Infrastructure module
+#
+# Exports are resolved lazily so that importing one provider does not pull in
+# every SDK (boto3, google.generativeai) at Lambda cold start.
 
-# Providers
-from .providers.base import BaseLLMService
-from .providers.bedrock import BedrockLLMService, BedrockClient, get_bedrock_client
-from .providers.gemini import GeminiLLMService
-from .factory import LLMFactory
+from core.lazy_import import lazy_exports
 
-# Services
-from .services.knowledge_base import BedrockKnowledgeBaseService
-from .services.embedding import BedrockEmbeddingService
+__getattr__, __dir__ = lazy_exports(__name__, {
+    # Providers
+    "BaseLLMService": ".providers.base",
+    "BedrockLLMService": ".providers.bedrock",
+    "BedrockClient": ".providers.bedrock",
+    "get_bedrock_client": ".providers.bedrock",
+    "GeminiLLMService": ".providers.gemini",
+    "LLMFactory": ".factory",
+    "LLMProviderPool": ".provider_pool",
+    "get_llm_provider_pool": ".provider_pool",
+    # Tools
+    "ToolRegistry": ".tools.registry",
+    "get_tool_registry": ".tools.registry",
+    "ToolExecutor": ".tools.executor",
+    "get_tool_executor": ".tools.executor",
+    # Services
+    "BedrockKnowledgeBaseService": ".services.knowledge_base",
+    "BedrockEmbeddingService": ".services.embedding",
+})
 
 __all__ = [
     # Providers
@@ -18,7 +33,14 @@ __all__ = [
     "get_bedrock_client",
     "GeminiLLMService", 
     "LLMFactory",
+    "LLMProviderPool",
+    "get_llm_provider_pool",
+    # Tools
+    "ToolRegistry",
+    "get_tool_registry",
+    "ToolExecutor",
+    "get_tool_executor",
     # Services
     "BedrockKnowledgeBaseService",
     "BedrockEmbeddingService"
-]
\ No newline at end of file
+]
@@ -4,8 +4,6 @@ AI Services Factory for creating provider instances.
 
 from typing import Optional
 from infrastructure.ai_services.providers.base import BaseLLMService
-from infrastructure.ai_services.providers.bedrock import BedrockLLMService
-from infrastructure.ai_services.providers.gemini import GeminiLLMService
 from core.config import settings
 from core.logger import logger
 
@@ -20,9 +18,13 @@ class LLMFactory:
     ) -> BaseLLMService:
         """
         Create LLM service instance based on provider.
+
+        With ``LLM_SCHEDULER_ENABLED``, provider services are wrapped in a
+        ``ScheduledLLMService`` sharing the process-wide concurrency caps.
         
         Args:
-            provider: LLM provider ('bedrock', 'gemini')
+            provider: LLM provider ('bedrock', 'gemini', or 'router' to route
+                across ``LLM_ROUTER_TARGETS``)
             model_id: Specific model ID/name
             **kwargs: Additional provider-specific parameters
             
@@ -33,24 +35,40 @@ class LLMFactory:
         
         logger.info(f"Creating LLM service: {provider}")
         
+        # Provider modules are imported on demand so that only the selected
+        # SDK is loaded.
         if provider.lower() == "bedrock":
-            return BedrockLLMService(
+            from infrastructure.ai_services.providers.bedrock import BedrockLLMService
+            service = BedrockLLMService(
                 model_id=model_id or settings.BEDROCK_MODEL_ID
             )
         
         elif provider.lower() == "gemini":
-            return GeminiLLMService(
+            from infrastructure.ai_services.providers.gemini import GeminiLLMService
+            service = GeminiLLMService(
                 api_key=kwargs.get('api_key'),
-                model_name=model_id or settings.GEMINI_MODEL_NAME
+                model_name=model_id or settings.GEMINI_MODEL_NAME,
+                api_base_url=kwargs.get('api_base_url')
             )
         
+        elif provider.lower() == "router":
+            # Shared so latency history and breakers outlive the request; its
+            # targets are scheduled individually
+            from infrastructure.ai_services.providers.router import get_llm_router
+            return get_llm_router()
+        
         else:
             raise ValueError(f"Unsupported LLM provider: {provider}")
+
+        if settings.LLM_SCHEDULER_ENABLED:
+            from infrastructure.ai_services.providers.scheduler import ScheduledLLMService
+            service = ScheduledLLMService(service)
+        return service
     
     @staticmethod
     def get_available_providers() -> list[str]:
         """Get list of available LLM providers."""
-        return ["bedrock", "gemini"]
+        return ["bedrock", "gemini", "router"]
     
     @staticmethod
     def get_provider_models() -> dict[str, list[str]]:
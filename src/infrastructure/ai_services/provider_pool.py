@@ -0,0 +1,224 @@
+"""
+Pool of LLM provider instances built from chatbot configurations.
+
+Each chatbot names a provider and model and may bring its own API key and
+endpoint. Building a provider per request would redo client setup (and
+decrypt the key) every turn, so instances are kept in an LRU pool keyed on
+(provider, model, credentials hash) and shared by all chatbots with the same
+configuration. The hash is taken over the encrypted key, so plaintext keys
+never appear in keys, logs or stats; they are decrypted only when an instance
+is built and held only by that instance. Instances idle for longer than
+``idle_ttl_seconds`` or beyond ``max_entries`` are dropped; calls in flight
+keep theirs until they finish.
+
+Bedrock authenticates with the process's IAM role, so Bedrock chatbots are
+pooled by model only and share the process-wide Bedrock client.
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Tuple
+from domain.entities.chatbot import Chatbot
+from infrastructure.ai_services.providers.base import BaseLLMService
+from core.config import settings
+from core.logger import logger
+
+# Chatbot provider names by LLMFactory provider
+_PROVIDER_ALIASES = {
+    "anthropic": "bedrock",
+    "bedrock": "bedrock",
+    "google": "gemini",
+    "gemini": "gemini",
+}
+
+# Providers that take the chatbot's API key and endpoint
+_KEYED_PROVIDERS = {"gemini"}
+
+PoolKey = Tuple[str, str, str]
+
+
+@dataclass
+class _Entry:
+    service: BaseLLMService
+    last_used: float
+
+
+class LLMProviderPool:
+    """Bounded LRU pool of LLM provider instances."""
+
+    def __init__(
+        self,
+        max_entries: int = 64,
+        idle_ttl_seconds: float = 1800.0,
+        factory: Optional[Callable[..., BaseLLMService]] = None,
+        decrypt: Optional[Callable[[str], str]] = None,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize pool.
+
+        Args:
+            max_entries: Most instances kept; least recently used are dropped
+            idle_ttl_seconds: How long an unused instance is kept
+            factory: Builds an instance from ``(provider, model_id, **kwargs)``;
+                defaults to ``LLMFactory.create``
+            decrypt: Decrypts a stored API key; defaults to the API key cipher
+            clock: Monotonic time source
+        """
+        self.max_entries = max_entries
+        self.idle_ttl_seconds = idle_ttl_seconds
+        self._factory = factory
+        self._decrypt = decrypt
+        self._clock = clock
+        self._entries: "OrderedDict[PoolKey, _Entry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.builds = 0
+        self.evictions = 0
+
+    def get(
+        self,
+        provider: Optional[str] = None,
+        model_id: Optional[str] = None,
+        api_key_encrypted: Optional[str] = None,
+        api_base_url: Optional[str] = None
+    ) -> BaseLLMService:
+        """
+        Get the provider instance for a configuration, building it on first use.
+
+        Args:
+            provider: Provider name (``LLMFactory`` or chatbot naming); defaults to ``LLM_PROVIDER``
+            model_id: Model ID; defaults to the provider's configured model
+            api_key_encrypted: Encrypted API key, if not the process-wide one
+            api_base_url: Endpoint override
+
+        Returns:
+            BaseLLMService: Shared provider instance
+
+        Raises:
+            ValueError: If the provider is unsupported or the key cannot be decrypted
+        """
+        provider = self.resolve_provider(provider or settings.LLM_PROVIDER)
+        if provider not in _KEYED_PROVIDERS:
+            api_key_encrypted = api_base_url = None
+        key = (provider, model_id or "", self._credentials_hash(api_key_encrypted, api_base_url))
+
+        now = self._clock()
+        with self._lock:
+            self._evict_idle(now)
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = _Entry(service=self._build(provider, model_id, api_key_encrypted, api_base_url), last_used=now)
+                self._entries[key] = entry
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+                    self.evictions += 1
+            entry.last_used = now
+            self._entries.move_to_end(key)
+            return entry.service
+
+    def for_chatbot(self, chatbot: Optional[Chatbot]) -> BaseLLMService:
+        """
+        Get the provider instance serving a chatbot.
+
+        Chatbots without a model, or on a provider this deployment does not
+        support, are served by the default provider.
+        """
+        if chatbot is None or not chatbot.model_id:
+            return self.get()
+        provider = self.resolve_provider(chatbot.provider or settings.LLM_PROVIDER)
+        if provider is None:
+            logger.warning(
+                f"Chatbot {chatbot.id} uses unsupported provider '{chatbot.provider}'; using {settings.LLM_PROVIDER}"
+            )
+            return self.get()
+        return self.get(provider, chatbot.model_id, chatbot.api_key_encrypted, chatbot.api_base_url)
+
+    @staticmethod
+    def resolve_provider(provider: str) -> Optional[str]:
+        """``LLMFactory`` provider for a chatbot's provider name, or None if unsupported."""
+        provider = provider.lower()
+        if provider == "router":
+            return provider
+        return _PROVIDER_ALIASES.get(provider)
+
+    def stats(self) -> Dict[str, Any]:
+        """Pooled instances per provider and build/eviction counters."""
+        with self._lock:
+            providers: Dict[str, int] = {}
+            for provider, _, _ in self._entries:
+                providers[provider] = providers.get(provider, 0) + 1
+            return {
+                "entries": len(self._entries),
+                "providers": providers,
+                "builds": self.builds,
+                "evictions": self.evictions
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def _build(
+        self,
+        provider: Optional[str],
+        model_id: Optional[str],
+        api_key_encrypted: Optional[str],
+        api_base_url: Optional[str]
+    ) -> BaseLLMService:
+        if provider is None:
+            raise ValueError("Unsupported LLM provider")
+        kwargs: Dict[str, Any] = {}
+        if api_key_encrypted:
+            kwargs["api_key"] = self._decrypt_key(api_key_encrypted)
+        if api_base_url:
+            kwargs["api_base_url"] = api_base_url
+        service = self._create(provider, model_id, **kwargs)
+        self.builds += 1
+        logger.info(f"Built pooled LLM provider {provider}:{model_id or 'default'}")
+        return service
+
+    def _create(self, provider: str, model_id: Optional[str], **kwargs) -> BaseLLMService:
+        if self._factory is not None:
+            return self._factory(provider, model_id, **kwargs)
+        from infrastructure.ai_services.factory import LLMFactory
+        return LLMFactory.create(provider, model_id, **kwargs)
+
+    def _decrypt_key(self, api_key_encrypted: str) -> str:
+        if self._decrypt is not None:
+            return self._decrypt(api_key_encrypted)
+        from infrastructure.auth.api_key_cipher import get_api_key_cipher
+        return get_api_key_cipher().decrypt(api_key_encrypted)
+
+    def _evict_idle(self, now: float) -> None:
+        # Entries are in last-used order, so idle ones are at the front
+        while self._entries:
+            key, entry = next(iter(self._entries.items()))
+            if now - entry.last_used < self.idle_ttl_seconds:
+                break
+            del self._entries[key]
+            self.evictions += 1
+
+    @staticmethod
+    def _credentials_hash(api_key_encrypted: Optional[str], api_base_url: Optional[str]) -> str:
+        if not api_key_encrypted and not api_base_url:
+            return ""
+        digest = hashlib.sha256(f"{api_key_encrypted or ''}\0{api_base_url or ''}".encode("utf-8"))
+        return digest.hexdigest()[:16]
+
+
+# Singleton instance
+_llm_provider_pool: Optional[LLMProviderPool] = None
+
+
+def get_llm_provider_pool() -> LLMProviderPool:
+    """Get singleton LLM provider pool."""
+    global _llm_provider_pool
+    if _llm_provider_pool is None:
+        _llm_provider_pool = LLMProviderPool(
+            max_entries=settings.LLM_PROVIDER_POOL_MAX_ENTRIES,
+            idle_ttl_seconds=settings.LLM_PROVIDER_POOL_IDLE_SECONDS
+        )
+    return _llm_provider_pool
@@ -1,13 +1,37 @@
 # LLM Providers module
 
-from .base import BaseLLMService
-from .bedrock import BedrockLLMService, BedrockClient, get_bedrock_client  
-from .gemini import GeminiLLMService
+from core.lazy_import import lazy_exports
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "BaseLLMService": ".base",
+    "normalize_chat_messages": ".base",
+    "BedrockLLMService": ".bedrock",
+    "BedrockClient": ".bedrock",
+    "get_bedrock_client": ".bedrock",
+    "GeminiLLMService": ".gemini",
+    "PromptCachePlanner": ".prompt_cache",
+    "get_prompt_cache_planner": ".prompt_cache",
+    "RoutingLLMService": ".router",
+    "LLMScheduler": ".scheduler",
+    "ScheduledLLMService": ".scheduler",
+    "get_llm_scheduler": ".scheduler",
+    "llm_call_scope": ".scheduler",
+    "get_llm_router": ".router",
+})
 
 __all__ = [
     "BaseLLMService",
+    "normalize_chat_messages",
     "BedrockLLMService", 
     "BedrockClient",
     "get_bedrock_client",
-    "GeminiLLMService"
-]
\ No newline at end of file
+    "GeminiLLMService",
+    "PromptCachePlanner",
+    "get_prompt_cache_planner",
+    "RoutingLLMService",
+    "LLMScheduler",
+    "ScheduledLLMService",
+    "get_llm_scheduler",
+    "llm_call_scope",
+    "get_llm_router"
+]
@@ -1,8 +1,47 @@
 from abc import ABC, abstractmethod
 from typing import Dict, Any, List, Optional
 
+ChatMessage = Dict[str, str]
+
+
+def normalize_chat_messages(messages: List[ChatMessage]) -> List[ChatMessage]:
+    """
+    Shape messages the way chat APIs require them.
+
+    Empty messages are dropped, consecutive messages from the same role are
+    merged, and leading assistant messages are removed so the conversation
+    starts with the user.
+
+    Args:
+        messages: ``{"role": "user" | "assistant", "content"}`` dicts, oldest first
+
+    Returns:
+        List[ChatMessage]: Alternating messages starting with ``user``
+    """
+    normalized: List[ChatMessage] = []
+    for message in messages:
+        content = (message.get("content") or "").strip()
+        if not content:
+            continue
+        role = "assistant" if message.get("role") == "assistant" else "user"
+        if normalized and normalized[-1]["role"] == role:
+            normalized[-1] = {"role": role, "content": f"{normalized[-1]['content']}\n\n{content}"}
+        elif normalized or role == "user":
+            normalized.append({"role": role, "content": content})
+    return normalized
+
+
 class BaseLLMService(ABC):
-    """Base abstract class for LLM services."""
+    """
+    Base abstract class for LLM services.
+
+    ``generate_response`` takes a single prompt. ``generate_chat`` takes the
+    conversation as messages plus a system prompt and contexts; providers
+    with a native chat format send the stable parts (system prompt, then
+    contexts) ahead of the turns that change every request, so the prompt
+    prefix can be cached by the provider. The default implementation
+    flattens the conversation into one prompt.
+    """
     
     @abstractmethod
     async def generate_response(
@@ -60,4 +99,113 @@ class BaseLLMService(ABC):
     @abstractmethod
     def get_model_info(self) -> Dict[str, Any]:
         """Get information about the current model."""
-        pass
\ No newline at end of file
+        pass
+
+    async def generate_chat(
+        self,
+        messages: List[ChatMessage],
+        system: Optional[str] = None,
+        context: Optional[str] = None,
+        max_tokens: int = 1000,
+        temperature: float = 0.7,
+        **kwargs
+    ) -> str:
+        """
+        Generate the next assistant message of a conversation.
+
+        Args:
+            messages: Conversation so far, oldest first, ending with the user's message
+            system: Optional system prompt (e.g. the chatbot's instructions)
+            context: Retrieved context from knowledge base
+            max_tokens: Maximum tokens to generate
+            temperature: Sampling temperature
+            **kwargs: Additional provider-specific parameters
+
+        Returns:
+            Generated response string
+        """
+        return await self.generate_response(
+            prompt=self._flatten_chat(messages, system),
+            context=context,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            **kwargs
+        )
+
+    async def generate_chat_stream(
+        self,
+        messages: List[ChatMessage],
+        system: Optional[str] = None,
+        context: Optional[str] = None,
+        max_tokens: int = 1000,
+        temperature: float = 0.7,
+        **kwargs
+    ):
+        """
+        Streaming variant of ``generate_chat``.
+
+        Yields:
+            Response chunks
+        """
+        async for chunk in self.generate_streaming_response(
+            prompt=self._flatten_chat(messages, system),
+            context=context,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            **kwargs
+        ):
+            yield chunk
+
+    def supports_tools(self) -> bool:
+        """Whether ``generate_tool_turn`` is available for this model."""
+        return False
+
+    async def generate_tool_turn(
+        self,
+        messages: List[ChatMessage],
+        tools: List[Dict[str, Any]],
+        system: Optional[str] = None,
+        context: Optional[str] = None,
+        max_tokens: int = 1000,
+        temperature: float = 0.7,
+        tool_turns: Optional[List[Dict[str, Any]]] = None,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Generate one model turn that may call tools.
+
+        Args:
+            messages: Conversation so far, oldest first, ending with the user's message
+            tools: Tool definitions (``name``, ``description``, ``input_schema``)
+            system: Optional system prompt
+            context: Retrieved context from knowledge base
+            max_tokens: Maximum tokens to generate
+            temperature: Sampling temperature
+            tool_turns: Earlier turns of this answer, appended after ``messages``:
+                assistant messages with ``tool_use`` blocks and user messages
+                with the matching ``tool_result`` blocks
+            **kwargs: Additional provider-specific parameters
+
+        Returns:
+            Dict[str, Any]: ``{"content": [blocks], "stop_reason"}`` in Messages API format
+
+        Raises:
+            NotImplementedError: If the model does not support tool use
+        """
+        raise NotImplementedError(f"{self.get_provider_name()} does not support tool use")
+
+    @staticmethod
+    def _flatten_chat(messages: List[ChatMessage], system: Optional[str] = None) -> str:
+        """Single prompt carrying the system prompt, earlier turns and the question."""
+        messages = normalize_chat_messages(messages)
+        if not messages:
+            raise ValueError("At least one user message is required")
+        *history, last = messages
+        parts = [system.strip()] if system and system.strip() else []
+        if history:
+            parts.append("\n".join(
+                f"{'Assistant' if message['role'] == 'assistant' else 'User'}: {message['content']}"
+                for message in history
+            ))
+        parts.append(last["content"])
+        return "\n\n".join(parts)
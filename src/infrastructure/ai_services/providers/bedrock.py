@@ -3,28 +3,63 @@ AWS Bedrock LLM provider with integrated client.
 Combines Bedrock client and LLM service in one module.
 """
 
-import boto3
+import asyncio
+import functools
 import json
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, AsyncGenerator, List, Optional
-from botocore.exceptions import ClientError
-from infrastructure.ai_services.providers.base import BaseLLMService
+from infrastructure.ai_services.providers.base import BaseLLMService, normalize_chat_messages
 from core.config import settings
 from core.logger import logger
 from core.errors import BedrockError
+from core.telemetry import record_llm_usage
+from infrastructure.ai_services.providers.prompt_cache import (
+    PromptCachePlanner,
+    get_prompt_cache_planner,
+    prompt_cache_min_tokens,
+)
 
 
 class BedrockClient:
-    """AWS Bedrock client for invoking AI models."""
+    """
+    AWS Bedrock client for invoking AI models.
 
-    def __init__(self):
-        """Initialize Bedrock client."""
+    boto3 clients are created on first use and are thread-safe, so one
+    instance (see ``get_bedrock_client``) is shared by all requests and its
+    connection pool is reused. Blocking calls run in worker threads;
+    knowledge base retrieval and reranking get a dedicated executor sized by
+    ``BEDROCK_KB_WORKERS``, so they neither queue behind nor starve other
+    work on the event loop's default executor.
+    """
+
+    def __init__(self, agent_runtime_client: Any = None):
+        """
+        Initialize Bedrock client.
+
+        Args:
+            agent_runtime_client: Optional ``bedrock-agent-runtime`` client,
+                e.g. a ``LocalAgentRuntimeClient`` for tests
+        """
         self._client = None
         self._runtime_client = None
+        self._agent_runtime_client = agent_runtime_client
+        self._kb_executor: Optional[ThreadPoolExecutor] = None
+
+    @staticmethod
+    def _client_config():
+        from botocore.config import Config
+        return Config(
+            max_pool_connections=settings.BEDROCK_MAX_POOL_CONNECTIONS,
+            tcp_keepalive=True,
+            retries={"mode": "standard"}
+        )
 
     @property
     def client(self):
         """Get or create Bedrock client."""
         if self._client is None:
+            import boto3  # Deferred to keep boto3 off the cold-start path
             self._client = boto3.client(
                 'bedrock',
                 region_name=settings.BEDROCK_REGION
@@ -35,12 +70,179 @@ class BedrockClient:
     def runtime_client(self):
         """Get or create Bedrock Runtime client."""
         if self._runtime_client is None:
+            import boto3
             self._runtime_client = boto3.client(
                 'bedrock-runtime',
-                region_name=settings.BEDROCK_REGION
+                region_name=settings.BEDROCK_REGION,
+                config=self._client_config()
             )
         return self._runtime_client
 
+    @property
+    def agent_runtime_client(self):
+        """Get or create Bedrock Agent Runtime client (knowledge base retrieval)."""
+        if self._agent_runtime_client is None:
+            if settings.BEDROCK_KB_BACKEND == "local":
+                from infrastructure.ai_services.services.local_agent_runtime import get_local_agent_runtime
+                self._agent_runtime_client = get_local_agent_runtime()
+            else:
+                import boto3
+                self._agent_runtime_client = boto3.client(
+                    'bedrock-agent-runtime',
+                    region_name=settings.BEDROCK_REGION,
+                    config=self._client_config()
+                )
+        return self._agent_runtime_client
+
+    async def _run_kb_call(self, func, **kwargs) -> Any:
+        """Run a blocking agent-runtime call on the knowledge base executor."""
+        if self._kb_executor is None:
+            self._kb_executor = ThreadPoolExecutor(
+                max_workers=settings.BEDROCK_KB_WORKERS,
+                thread_name_prefix="bedrock-kb"
+            )
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._kb_executor, functools.partial(func, **kwargs))
+
+    def shutdown(self) -> None:
+        """Shut down the knowledge base executor."""
+        if self._kb_executor is not None:
+            self._kb_executor.shutdown(wait=False, cancel_futures=True)
+            self._kb_executor = None
+
+    async def invoke_bedrock_agent(
+        self,
+        input_text: str,
+        knowledge_base_id: str,
+        number_of_results: int = 5,
+        retrieval_filter: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Retrieve chunks from a knowledge base.
+
+        Requests more than ``BEDROCK_KB_MAX_RESULTS_PER_PAGE`` results are
+        fetched page by page following ``nextToken``.
+
+        Args:
+            input_text: Query text
+            knowledge_base_id: Bedrock knowledge base ID
+            number_of_results: Number of chunks to return
+            retrieval_filter: Optional metadata filter
+
+        Returns:
+            Dict[str, Any]: ``{"retrievalResults": [...]}`` in Retrieve API format
+
+        Raises:
+            BedrockError: If retrieval fails
+        """
+        from botocore.exceptions import ClientError
+
+        results: List[Dict[str, Any]] = []
+        next_token = None
+        try:
+            while len(results) < number_of_results:
+                vector_config: Dict[str, Any] = {
+                    "numberOfResults": min(
+                        number_of_results - len(results),
+                        settings.BEDROCK_KB_MAX_RESULTS_PER_PAGE
+                    )
+                }
+                if retrieval_filter:
+                    vector_config["filter"] = retrieval_filter
+                request = {
+                    "knowledgeBaseId": knowledge_base_id,
+                    "retrievalQuery": {"text": input_text},
+                    "retrievalConfiguration": {"vectorSearchConfiguration": vector_config},
+                }
+                if next_token:
+                    request["nextToken"] = next_token
+
+                response = await self._run_kb_call(self.agent_runtime_client.retrieve, **request)
+                results.extend(response.get("retrievalResults", []))
+                next_token = response.get("nextToken")
+                if not next_token:
+                    break
+
+            return {"retrievalResults": results[:number_of_results]}
+
+        except ClientError as e:
+            error_code = e.response['Error']['Code']
+            error_message = e.response['Error']['Message']
+            logger.error(f"Knowledge base retrieval failed: {error_code} - {error_message}")
+            raise BedrockError(
+                message=f"Knowledge base retrieval failed: {error_message}",
+                details={"error_code": error_code, "knowledge_base_id": knowledge_base_id}
+            )
+        except Exception as e:
+            logger.error(f"Unexpected error during knowledge base retrieval: {str(e)}")
+            raise BedrockError(
+                message=f"Unexpected retrieval error: {str(e)}",
+                details={"knowledge_base_id": knowledge_base_id}
+            )
+
+    async def rerank(
+        self,
+        query: str,
+        documents: List[str],
+        number_of_results: int,
+        model_arn: str = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Score documents against a query with a Bedrock reranking model.
+
+        All documents are sent in a single Rerank call.
+
+        Args:
+            query: Query text
+            documents: Candidate texts
+            number_of_results: Number of results to return
+            model_arn: Reranking model ARN; defaults to ``settings.bedrock_rerank_model_arn``
+
+        Returns:
+            List[Dict[str, Any]]: ``{"index", "relevanceScore"}`` items, best first
+
+        Raises:
+            BedrockError: If reranking fails
+        """
+        from botocore.exceptions import ClientError
+
+        model_arn = model_arn or settings.bedrock_rerank_model_arn
+        try:
+            response = await self._run_kb_call(
+                self.agent_runtime_client.rerank,
+                queries=[{"type": "TEXT", "textQuery": {"text": query}}],
+                sources=[
+                    {
+                        "type": "INLINE",
+                        "inlineDocumentSource": {"type": "TEXT", "textDocument": {"text": text}}
+                    }
+                    for text in documents
+                ],
+                rerankingConfiguration={
+                    "type": "BEDROCK_RERANKING_MODEL",
+                    "bedrockRerankingConfiguration": {
+                        "numberOfResults": number_of_results,
+                        "modelConfiguration": {"modelArn": model_arn}
+                    }
+                }
+            )
+            return response.get("results", [])
+
+        except ClientError as e:
+            error_code = e.response['Error']['Code']
+            error_message = e.response['Error']['Message']
+            logger.error(f"Bedrock rerank failed: {error_code} - {error_message}")
+            raise BedrockError(
+                message=f"Rerank failed: {error_message}",
+                details={"error_code": error_code, "model_arn": model_arn}
+            )
+        except Exception as e:
+            logger.error(f"Unexpected error during rerank: {str(e)}")
+            raise BedrockError(
+                message=f"Unexpected rerank error: {str(e)}",
+                details={"model_arn": model_arn}
+            )
+
     async def invoke_model(
         self,
         messages: List[Dict[str, Any]] = None,
@@ -52,6 +254,8 @@ class BedrockClient:
         **kwargs
     ) -> Dict[str, Any]:
         """Invoke Bedrock model synchronously."""
+        from botocore.exceptions import ClientError
+
         try:
             model_id = model_id or settings.BEDROCK_MODEL_ID
             
@@ -77,14 +281,17 @@ class BedrockClient:
 
             logger.info(f"Invoking Bedrock model: {model_id}")
 
-            response = self.runtime_client.invoke_model(
+            # boto3 blocks; run it off the event loop so cancellation and
+            # deadlines can abandon the call instead of waiting it out
+            response = await asyncio.to_thread(
+                self.runtime_client.invoke_model,
                 modelId=model_id,
                 contentType="application/json",
                 accept="application/json",
                 body=request_body
             )
 
-            response_body = json.loads(response['body'].read())
+            response_body = json.loads(await asyncio.to_thread(response['body'].read))
             logger.info(f"Model invocation successful")
 
             return response_body
@@ -115,6 +322,8 @@ class BedrockClient:
         **kwargs
     ) -> AsyncGenerator[Dict[str, Any], None]:
         """Invoke Bedrock model with streaming response."""
+        from botocore.exceptions import ClientError
+
         try:
             model_id = model_id or settings.BEDROCK_MODEL_ID
             
@@ -138,20 +347,30 @@ class BedrockClient:
 
             logger.info(f"Starting streaming invocation: {model_id}")
 
-            response = self.runtime_client.invoke_model_with_response_stream(
+            response = await asyncio.to_thread(
+                self.runtime_client.invoke_model_with_response_stream,
                 modelId=model_id,
                 contentType="application/json",
                 accept="application/json",
                 body=request_body
             )
 
-            # Process streaming response
+            # Process streaming response, reading each event off the loop
             stream = response['body']
-            for event in stream:
-                chunk = event.get('chunk')
-                if chunk:
-                    chunk_data = json.loads(chunk['bytes'].decode())
-                    yield chunk_data
+            events = iter(stream)
+            try:
+                while True:
+                    event = await asyncio.to_thread(next, events, None)
+                    if event is None:
+                        break
+                    chunk = event.get('chunk')
+                    if chunk:
+                        chunk_data = json.loads(chunk['bytes'].decode())
+                        yield chunk_data
+            finally:
+                # Closing the HTTP stream stops generation when the consumer
+                # goes away before the end
+                stream.close()
 
             logger.info("Streaming invocation completed")
 
@@ -172,12 +391,38 @@ class BedrockClient:
 
 
 class BedrockLLMService(BaseLLMService):
-    """AWS Bedrock LLM service implementation."""
-    
-    def __init__(self, model_id: str = None):
-        self.bedrock_client = BedrockClient()
+    """
+    AWS Bedrock LLM service implementation.
+
+    Claude models use the Messages API natively: the system prompt and the
+    retrieved contexts go in ``system`` blocks, stable content first, and the
+    conversation in ``messages``. Other models get a single text prompt.
+
+    On models with prompt caching, a ``PromptCachePlanner`` places cache
+    checkpoints on the system prompt and on contexts resent across turns;
+    cache reads and writes are reported with the call's usage.
+    """
+
+    def __init__(self, model_id: str = None, prompt_cache: Optional[PromptCachePlanner] = None):
+        """
+        Initialize Bedrock LLM service.
+
+        Args:
+            model_id: Bedrock model ID; defaults to ``settings.BEDROCK_MODEL_ID``
+            prompt_cache: Checkpoint planner; the shared one is used if omitted
+                and ``BEDROCK_PROMPT_CACHING_ENABLED`` is set
+        """
+        self.bedrock_client = get_bedrock_client()
         self.model_id = model_id or settings.BEDROCK_MODEL_ID
-    
+        self.prompt_cache_min_tokens = prompt_cache_min_tokens(self.model_id)
+        if prompt_cache is None and settings.BEDROCK_PROMPT_CACHING_ENABLED and self.prompt_cache_min_tokens:
+            prompt_cache = get_prompt_cache_planner()
+        self.prompt_cache = prompt_cache if self.prompt_cache_min_tokens else None
+
+    @property
+    def _is_claude(self) -> bool:
+        return "claude" in self.model_id.lower()
+
     async def generate_response(
         self,
         prompt: str,
@@ -187,51 +432,38 @@ class BedrockLLMService(BaseLLMService):
         **kwargs
     ) -> str:
         """Generate response using Bedrock."""
+        if self._is_claude:
+            return await self.generate_chat(
+                [{"role": "user", "content": prompt}], context=context, max_tokens=max_tokens, temperature=temperature
+            )
+
+        started = time.perf_counter()
         try:
-            # Build message format for Claude
-            full_prompt = self._build_prompt(prompt, context)
-            
-            if "claude" in self.model_id.lower():
-                body = {
-                    "anthropic_version": "bedrock-2023-05-31",
-                    "max_tokens": max_tokens,
+            # For other models (e.g., Titan, Llama)
+            body = {
+                "inputText": self._build_prompt(prompt, context),
+                "textGenerationConfig": {
+                    "maxTokenCount": max_tokens,
                     "temperature": temperature,
-                    "messages": [
-                        {
-                            "role": "user",
-                            "content": full_prompt
-                        }
-                    ]
-                }
-                
-                response = await self.bedrock_client.invoke_model(
-                    model_id=self.model_id,
-                    body=json.dumps(body)
-                )
-                
-                return response["content"][0]["text"]
-            else:
-                # For other models (e.g., Titan, Llama)
-                body = {
-                    "inputText": full_prompt,
-                    "textGenerationConfig": {
-                        "maxTokenCount": max_tokens,
-                        "temperature": temperature,
-                        "stopSequences": []
-                    }
+                    "stopSequences": []
                 }
-                
-                response = await self.bedrock_client.invoke_model(
-                    model_id=self.model_id,
-                    body=json.dumps(body)
-                )
-                
-                return response["results"][0]["outputText"]
-                
+            }
+
+            response = await self.bedrock_client.invoke_model(
+                model_id=self.model_id,
+                body=json.dumps(body)
+            )
+
+            result = response["results"][0]
+            record_llm_usage(
+                "bedrock", self.model_id, response.get("inputTextTokenCount"), result.get("tokenCount"), started
+            )
+            return result["outputText"]
+
         except Exception as e:
             logger.error(f"Bedrock LLM error: {e}")
             raise Exception(f"Failed to generate response: {str(e)}")
-    
+
     async def generate_streaming_response(
         self,
         prompt: str,
@@ -241,59 +473,236 @@ class BedrockLLMService(BaseLLMService):
         **kwargs
     ):
         """Generate streaming response using Bedrock."""
+        if self._is_claude:
+            async for chunk in self.generate_chat_stream(
+                [{"role": "user", "content": prompt}], context=context, max_tokens=max_tokens, temperature=temperature
+            ):
+                yield chunk
+            return
+
+        started = time.perf_counter()
+        first_token_at = None
+        usage: Dict[str, Optional[int]] = {"input": None, "output": None}
         try:
-            full_prompt = self._build_prompt(prompt, context)
-            
-            if "claude" in self.model_id.lower():
-                body = {
-                    "anthropic_version": "bedrock-2023-05-31",
-                    "max_tokens": max_tokens,
+            body = {
+                "inputText": self._build_prompt(prompt, context),
+                "textGenerationConfig": {
+                    "maxTokenCount": max_tokens,
                     "temperature": temperature,
-                    "messages": [
-                        {
-                            "role": "user",
-                            "content": full_prompt
-                        }
-                    ]
+                    "stopSequences": []
                 }
-                
-                async for chunk in self.bedrock_client.invoke_model_stream(
-                    model_id=self.model_id,
-                    body=json.dumps(body)
-                ):
-                    if chunk.get("type") == "content_block_delta":
-                        yield chunk["delta"]["text"]
-            else:
-                body = {
-                    "inputText": full_prompt,
-                    "textGenerationConfig": {
-                        "maxTokenCount": max_tokens,
-                        "temperature": temperature,
-                        "stopSequences": []
-                    }
-                }
-                
-                async for chunk in self.bedrock_client.invoke_model_stream(
-                    model_id=self.model_id,
-                    body=json.dumps(body)
-                ):
-                    yield chunk.get("outputText", "")
-                    
+            }
+
+            async for chunk in self.bedrock_client.invoke_model_stream(
+                model_id=self.model_id,
+                body=json.dumps(body)
+            ):
+                self._read_stream_usage(chunk, usage)
+                if first_token_at is None:
+                    first_token_at = time.perf_counter()
+                yield chunk.get("outputText", "")
+
         except Exception as e:
             logger.error(f"Bedrock streaming error: {e}")
             raise Exception(f"Failed to generate streaming response: {str(e)}")
-    
+        finally:
+            # Also recorded when the consumer stops early; those tokens were still generated
+            if first_token_at is not None:
+                record_llm_usage(
+                    "bedrock", self.model_id, usage["input"], usage["output"], started, first_token_at, streamed=True
+                )
+
+    async def generate_chat(
+        self,
+        messages: List[Dict[str, str]],
+        system: Optional[str] = None,
+        context: Optional[str] = None,
+        max_tokens: int = 1000,
+        temperature: float = 0.7,
+        **kwargs
+    ) -> str:
+        """Generate the next assistant message with the Claude Messages API."""
+        if not self._is_claude:
+            return await super().generate_chat(messages, system, context, max_tokens, temperature, **kwargs)
+
+        started = time.perf_counter()
+        try:
+            response = await self.bedrock_client.invoke_model(
+                model_id=self.model_id,
+                body=json.dumps(self._chat_body(messages, system, context, max_tokens, temperature))
+            )
+
+            usage = response.get("usage", {})
+            record_llm_usage(
+                "bedrock", self.model_id, usage.get("input_tokens"), usage.get("output_tokens"), started,
+                cache_read_tokens=usage.get("cache_read_input_tokens"),
+                cache_write_tokens=usage.get("cache_creation_input_tokens")
+            )
+            return "".join(block["text"] for block in response["content"] if block.get("type") == "text")
+
+        except Exception as e:
+            logger.error(f"Bedrock LLM error: {e}")
+            raise Exception(f"Failed to generate response: {str(e)}")
+
+    async def generate_chat_stream(
+        self,
+        messages: List[Dict[str, str]],
+        system: Optional[str] = None,
+        context: Optional[str] = None,
+        max_tokens: int = 1000,
+        temperature: float = 0.7,
+        **kwargs
+    ):
+        """Stream the next assistant message with the Claude Messages API."""
+        if not self._is_claude:
+            async for chunk in super().generate_chat_stream(
+                messages, system, context, max_tokens, temperature, **kwargs
+            ):
+                yield chunk
+            return
+
+        started = time.perf_counter()
+        first_token_at = None
+        usage: Dict[str, Optional[int]] = {"input": None, "output": None, "cache_read": None, "cache_write": None}
+        try:
+            async for chunk in self.bedrock_client.invoke_model_stream(
+                model_id=self.model_id,
+                body=json.dumps(self._chat_body(messages, system, context, max_tokens, temperature))
+            ):
+                self._read_stream_usage(chunk, usage)
+                if chunk.get("type") == "content_block_delta" and "text" in chunk.get("delta", {}):
+                    if first_token_at is None:
+                        first_token_at = time.perf_counter()
+                    yield chunk["delta"]["text"]
+
+        except Exception as e:
+            logger.error(f"Bedrock streaming error: {e}")
+            raise Exception(f"Failed to generate streaming response: {str(e)}")
+        finally:
+            # Also recorded when the consumer stops early; those tokens were still generated
+            if first_token_at is not None:
+                record_llm_usage(
+                    "bedrock", self.model_id, usage["input"], usage["output"], started, first_token_at, streamed=True,
+                    cache_read_tokens=usage["cache_read"], cache_write_tokens=usage["cache_write"]
+                )
+
+    def supports_tools(self) -> bool:
+        """Claude models support tool use."""
+        return self._is_claude
+
+    async def generate_tool_turn(
+        self,
+        messages: List[Dict[str, str]],
+        tools: List[Dict[str, Any]],
+        system: Optional[str] = None,
+        context: Optional[str] = None,
+        max_tokens: int = 1000,
+        temperature: float = 0.7,
+        tool_turns: Optional[List[Dict[str, Any]]] = None,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """Generate one Claude turn with tool definitions; see ``BaseLLMService.generate_tool_turn``."""
+        if not self._is_claude:
+            return await super().generate_tool_turn(
+                messages, tools, system, context, max_tokens, temperature, tool_turns, **kwargs
+            )
+
+        started = time.perf_counter()
+        body = self._chat_body(messages, system, context, max_tokens, temperature)
+        body["messages"] = body["messages"] + list(tool_turns or [])
+        if tools:
+            body["tools"] = tools
+        try:
+            response = await self.bedrock_client.invoke_model(model_id=self.model_id, body=json.dumps(body))
+        except Exception as e:
+            logger.error(f"Bedrock LLM error: {e}")
+            raise Exception(f"Failed to generate response: {str(e)}")
+
+        usage = response.get("usage", {})
+        record_llm_usage(
+            "bedrock", self.model_id, usage.get("input_tokens"), usage.get("output_tokens"), started,
+            cache_read_tokens=usage.get("cache_read_input_tokens"),
+            cache_write_tokens=usage.get("cache_creation_input_tokens")
+        )
+        return {"content": response.get("content", []), "stop_reason": response.get("stop_reason")}
+
+    def _chat_body(
+        self,
+        messages: List[Dict[str, str]],
+        system: Optional[str],
+        context: Optional[str],
+        max_tokens: int,
+        temperature: float
+    ) -> Dict[str, Any]:
+        """
+        Messages API request body.
+
+        The system prompt comes first and the contexts second, so requests
+        from one chatbot share a prefix and only the turns after it change.
+        """
+        messages = normalize_chat_messages(messages)
+        if not messages:
+            raise ValueError("At least one user message is required")
+
+        # (block, stable across requests)
+        prefix = []
+        if system and system.strip():
+            prefix.append(({"type": "text", "text": system.strip()}, True))
+        if context:
+            prefix.append(
+                ({"type": "text", "text": f"{_CONTEXT_INSTRUCTION}\n\n<context>\n{context}\n</context>"}, False)
+            )
+        system_blocks = [block for block, _ in prefix]
+        if self.prompt_cache is not None and prefix:
+            checkpoints = self.prompt_cache.plan(
+                [(block["text"], stable) for block, stable in prefix], self.prompt_cache_min_tokens
+            )
+            for block, checkpoint in zip(system_blocks, checkpoints):
+                if checkpoint:
+                    block["cache_control"] = {"type": "ephemeral"}
+
+        body = {
+            "anthropic_version": "bedrock-2023-05-31",
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+            "messages": messages
+        }
+        if system_blocks:
+            body["system"] = system_blocks
+        return body
+
+    @staticmethod
+    def _read_stream_usage(chunk: Dict[str, Any], usage: Dict[str, Optional[int]]) -> None:
+        """Pick token counts out of stream events."""
+        if chunk.get("type") == "message_start":
+            start_usage = chunk.get("message", {}).get("usage", {})
+            usage["input"] = start_usage.get("input_tokens", usage["input"])
+            usage["cache_read"] = start_usage.get("cache_read_input_tokens", usage.get("cache_read"))
+            usage["cache_write"] = start_usage.get("cache_creation_input_tokens", usage.get("cache_write"))
+        elif chunk.get("type") == "message_delta":
+            usage["output"] = chunk.get("usage", {}).get("output_tokens", usage["output"])
+        # Bedrock appends invocation metrics to the final event of every model's stream
+        metrics = chunk.get("amazon-bedrock-invocationMetrics")
+        if metrics:
+            usage["input"] = metrics.get("inputTokenCount", usage["input"])
+            usage["output"] = metrics.get("outputTokenCount", usage["output"])
+            usage["cache_read"] = metrics.get("cacheReadInputTokenCount", usage.get("cache_read"))
+            usage["cache_write"] = metrics.get("cacheWriteInputTokenCount", usage.get("cache_write"))
+
     def get_provider_name(self) -> str:
         """Get provider name."""
         return "bedrock"
     
     def get_model_info(self) -> Dict[str, Any]:
         """Get model information."""
+        max_input_tokens, max_output_tokens = _model_limits(self.model_id)
         return {
             "provider": "bedrock",
             "model_id": self.model_id,
             "supports_streaming": True,
-            "supports_context": True
+            "supports_context": True,
+            "max_input_tokens": max_input_tokens,
+            "max_output_tokens": max_output_tokens
         }
     
     def _build_prompt(self, prompt: str, context: Optional[str] = None) -> str:
@@ -310,6 +719,29 @@ Answer:"""
         return prompt
 
 
+# Instruction sent with retrieved contexts in the system prompt
+_CONTEXT_INSTRUCTION = (
+    "Answer the user's questions using the following context. If the context "
+    "does not contain the answer, say so."
+)
+
+
+# Context window and output limit by model family; matched anywhere in the
+# model ID so cross-region inference profiles ("us.anthropic...") resolve too
+_MODEL_LIMITS = {
+    "anthropic.claude-3": (200000, 4096),
+    "amazon.titan-text-premier": (32000, 3072),
+    "meta.llama3": (8192, 2048),
+}
+
+
+def _model_limits(model_id: str) -> tuple:
+    for prefix, limits in _MODEL_LIMITS.items():
+        if prefix in model_id:
+            return limits
+    return (8192, 2048)
+
+
 # Singleton instance
 _bedrock_client = None
 
@@ -318,4 +750,11 @@ def get_bedrock_client() -> BedrockClient:
     global _bedrock_client
     if _bedrock_client is None:
         _bedrock_client = BedrockClient()
-    return _bedrock_client
\ No newline at end of file
+    return _bedrock_client
+
+def shutdown_bedrock_client() -> None:
+    """Shut down the singleton Bedrock client if it was created."""
+    global _bedrock_client
+    if _bedrock_client is not None:
+        _bedrock_client.shutdown()
+        _bedrock_client = None
@@ -2,27 +2,58 @@
 Google Gemini LLM provider.
 """
 
-from typing import Dict, Any, Optional
+import asyncio
+import time
+from typing import Dict, Any, List, Optional
 import google.generativeai as genai
-from infrastructure.ai_services.providers.base import BaseLLMService
+from google.ai import generativelanguage as glm
+from infrastructure.ai_services.providers.base import BaseLLMService, normalize_chat_messages
 from core.config import settings
+from core.deadline import get_request_deadline
+from core.errors import DeadlineExceededError, RequestCancelledError
 from core.logger import logger
+from core.telemetry import record_llm_usage
+
+# Instruction sent with retrieved contexts ahead of the conversation
+_CONTEXT_INSTRUCTION = "Hãy trả lời câu hỏi một cách chính xác và chi tiết dựa trên thông tin tham khảo sau đây."
+
+# Older SDKs (0.3.x) return no usage metadata, so tokens are counted separately
+_RESPONSES_REPORT_USAGE = "usage_metadata" in glm.GenerateContentResponse.meta.fields
+
 
 class GeminiLLMService(BaseLLMService):
-    """Google Gemini LLM service implementation."""
+    """
+    Google Gemini LLM service implementation.
+
+    Chats are sent as native ``contents`` turns. google-generativeai 0.3.x
+    has no system instruction, so the system prompt and retrieved contexts
+    lead the first user turn.
+
+    ``GenerativeModel`` only uses the process-wide client of
+    ``genai.configure``. A service with its own key or endpoint (one per
+    chatbot config, kept by the provider pool) sends the same requests
+    through a ``GenerativeServiceAsyncClient`` of its own.
+    """
     
-    def __init__(self, api_key: str = None, model_name: str = "gemini-1.5-pro"):
+    def __init__(self, api_key: str = None, model_name: str = "gemini-1.5-pro", api_base_url: str = None):
         self.api_key = api_key or settings.GEMINI_API_KEY
         self.model_name = model_name
         
         if not self.api_key:
             raise ValueError("Gemini API key is required")
         
-        # Configure Gemini
-        genai.configure(api_key=self.api_key)
+        self._async_client = None
+        if self.api_key == settings.GEMINI_API_KEY and not api_base_url:
+            # Configure Gemini
+            genai.configure(api_key=self.api_key)
+        else:
+            client_options = {"api_key": self.api_key}
+            if api_base_url:
+                client_options["api_endpoint"] = api_base_url
+            self._async_client = glm.GenerativeServiceAsyncClient(client_options=client_options)
         
         # Initialize model
-        self.model = genai.GenerativeModel(model_name)
+        self.model = genai.GenerativeModel(self.model_name)
     
     async def generate_response(
         self,
@@ -33,9 +64,13 @@ class GeminiLLMService(BaseLLMService):
         **kwargs
     ) -> str:
         """Generate response using Gemini."""
+        deadline = get_request_deadline()
+        started = time.perf_counter()
+        prompt_tokens = None
         try:
             # Build full prompt with context
             full_prompt = self._build_prompt(prompt, context)
+            prompt_tokens = self._count_prompt_tokens(full_prompt)
             
             # Configure generation settings
             generation_config = genai.types.GenerationConfig(
@@ -45,17 +80,21 @@ class GeminiLLMService(BaseLLMService):
                 top_k=kwargs.get('top_k', 40)
             )
             
-            # Generate response
-            response = await self.model.generate_content_async(
-                full_prompt,
-                generation_config=generation_config
-            )
+            # Generate response; the SDK takes no per-call timeout, so the
+            # request deadline bounds the call instead
+            response = await deadline.run("generation", self._generate(full_prompt, generation_config))
             
+            await self._record_usage(response, prompt_tokens, response.text, started)
             return response.text
             
+        except (DeadlineExceededError, RequestCancelledError):
+            raise
         except Exception as e:
             logger.error(f"Gemini LLM error: {e}")
             raise Exception(f"Failed to generate response: {str(e)}")
+        finally:
+            if prompt_tokens is not None:
+                prompt_tokens.cancel()
     
     async def generate_streaming_response(
         self,
@@ -66,8 +105,15 @@ class GeminiLLMService(BaseLLMService):
         **kwargs
     ):
         """Generate streaming response using Gemini."""
+        deadline = get_request_deadline()
+        started = time.perf_counter()
+        first_token_at = None
+        last_chunk = None
+        chunks = []
+        prompt_tokens = None
         try:
             full_prompt = self._build_prompt(prompt, context)
+            prompt_tokens = self._count_prompt_tokens(full_prompt)
             
             generation_config = genai.types.GenerationConfig(
                 max_output_tokens=max_tokens,
@@ -77,20 +123,105 @@ class GeminiLLMService(BaseLLMService):
             )
             
             # Generate streaming response
-            response = await self.model.generate_content_async(
-                full_prompt,
-                generation_config=generation_config,
-                stream=True
-            )
+            response = await deadline.run("generation", self._generate(full_prompt, generation_config, stream=True))
             
-            async for chunk in response:
+            async for chunk in deadline.stream("generation", response):
+                last_chunk = chunk
                 if chunk.text:
+                    if first_token_at is None:
+                        first_token_at = time.perf_counter()
+                    chunks.append(chunk.text)
                     yield chunk.text
                     
+        except (DeadlineExceededError, RequestCancelledError):
+            raise
         except Exception as e:
             logger.error(f"Gemini streaming error: {e}")
             raise Exception(f"Failed to generate streaming response: {str(e)}")
+        finally:
+            if first_token_at is not None:
+                # Usage metadata is cumulative; the last chunk seen has the totals
+                await self._record_usage(last_chunk, prompt_tokens, "".join(chunks), started, first_token_at)
+            if prompt_tokens is not None:
+                prompt_tokens.cancel()
     
+    async def generate_chat(
+        self,
+        messages: List[Dict[str, str]],
+        system: Optional[str] = None,
+        context: Optional[str] = None,
+        max_tokens: int = 1000,
+        temperature: float = 0.7,
+        **kwargs
+    ) -> str:
+        """Generate the next assistant message of a conversation using Gemini."""
+        deadline = get_request_deadline()
+        started = time.perf_counter()
+        prompt_tokens = None
+        try:
+            contents = self._chat_contents(messages, system, context)
+            prompt_tokens = self._count_prompt_tokens(contents)
+            response = await deadline.run("generation", self._generate(
+                contents,
+                self._generation_config(max_tokens, temperature, kwargs)
+            ))
+
+            await self._record_usage(response, prompt_tokens, response.text, started)
+            return response.text
+
+        except (DeadlineExceededError, RequestCancelledError):
+            raise
+        except Exception as e:
+            logger.error(f"Gemini LLM error: {e}")
+            raise Exception(f"Failed to generate response: {str(e)}")
+        finally:
+            if prompt_tokens is not None:
+                prompt_tokens.cancel()
+
+    async def generate_chat_stream(
+        self,
+        messages: List[Dict[str, str]],
+        system: Optional[str] = None,
+        context: Optional[str] = None,
+        max_tokens: int = 1000,
+        temperature: float = 0.7,
+        **kwargs
+    ):
+        """Stream the next assistant message of a conversation using Gemini."""
+        deadline = get_request_deadline()
+        started = time.perf_counter()
+        first_token_at = None
+        last_chunk = None
+        chunks = []
+        prompt_tokens = None
+        try:
+            contents = self._chat_contents(messages, system, context)
+            prompt_tokens = self._count_prompt_tokens(contents)
+            response = await deadline.run("generation", self._generate(
+                contents,
+                self._generation_config(max_tokens, temperature, kwargs),
+                stream=True
+            ))
+
+            async for chunk in deadline.stream("generation", response):
+                last_chunk = chunk
+                if chunk.text:
+                    if first_token_at is None:
+                        first_token_at = time.perf_counter()
+                    chunks.append(chunk.text)
+                    yield chunk.text
+
+        except (DeadlineExceededError, RequestCancelledError):
+            raise
+        except Exception as e:
+            logger.error(f"Gemini streaming error: {e}")
+            raise Exception(f"Failed to generate streaming response: {str(e)}")
+        finally:
+            if first_token_at is not None:
+                await self._record_usage(last_chunk, prompt_tokens, "".join(chunks), started, first_token_at)
+            if prompt_tokens is not None:
+                prompt_tokens.cancel()
+
     def get_provider_name(self) -> str:
         """Get provider name."""
         return "gemini"
@@ -106,6 +237,105 @@ class GeminiLLMService(BaseLLMService):
             "max_output_tokens": 8192
         }
     
+    async def _generate(self, contents: Any, generation_config: Any, stream: bool = False) -> Any:
+        """Generate through the model, or this service's own client when it has one."""
+        if self._async_client is None:
+            return await self.model.generate_content_async(
+                contents, generation_config=generation_config, stream=stream
+            )
+        request = glm.GenerateContentRequest(
+            model=self.model.model_name,
+            contents=genai.types.content_types.to_contents(contents),
+            generation_config=genai.types.generation_types.to_generation_config_dict(generation_config)
+        )
+        if stream:
+            iterator = await self._async_client.stream_generate_content(request)
+            return await genai.types.AsyncGenerateContentResponse.from_aiterator(iterator)
+        return genai.types.AsyncGenerateContentResponse.from_response(
+            await self._async_client.generate_content(request)
+        )
+
+    @staticmethod
+    def _chat_contents(
+        messages: List[Dict[str, str]],
+        system: Optional[str] = None,
+        context: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Conversation turns, the first user turn led by the system prompt, then the contexts."""
+        messages = normalize_chat_messages(messages)
+        if not messages:
+            raise ValueError("At least one user message is required")
+        contents = [
+            {"role": "model" if message["role"] == "assistant" else "user", "parts": [message["content"]]}
+            for message in messages
+        ]
+        preamble = [system.strip()] if system and system.strip() else []
+        if context:
+            preamble.append(f"{_CONTEXT_INSTRUCTION}\n\n{context}")
+        # normalize_chat_messages guarantees the conversation starts with the user
+        contents[0]["parts"] = preamble + contents[0]["parts"]
+        return contents
+
+    @staticmethod
+    def _generation_config(max_tokens: int, temperature: float, kwargs: Dict[str, Any]) -> Any:
+        return genai.types.GenerationConfig(
+            max_output_tokens=max_tokens,
+            temperature=temperature,
+            top_p=kwargs.get('top_p', 0.8),
+            top_k=kwargs.get('top_k', 40)
+        )
+
+    def _count_prompt_tokens(self, contents: Any) -> Optional[asyncio.Future]:
+        """Count prompt tokens alongside generation when responses carry no usage."""
+        if _RESPONSES_REPORT_USAGE:
+            return None
+        return asyncio.ensure_future(self._count_tokens(contents))
+
+    async def _count_tokens(self, contents: Any) -> Optional[int]:
+        try:
+            if self._async_client is None:
+                return (await self.model.count_tokens_async(contents)).total_tokens
+            return (await self._async_client.count_tokens(glm.CountTokensRequest(
+                model=self.model.model_name,
+                contents=genai.types.content_types.to_contents(contents)
+            ))).total_tokens
+        except Exception as e:
+            # Usage is best effort; a failed count never fails the answer
+            logger.warning(f"Gemini token count failed: {e}")
+            return None
+
+    async def _record_usage(
+        self,
+        response: Any,
+        prompt_tokens: Optional[asyncio.Future],
+        text: str,
+        started: float,
+        first_token_at: Optional[float] = None
+    ) -> None:
+        finished_at = time.perf_counter()
+        metadata = getattr(response, "usage_metadata", None)
+        if metadata is not None:
+            input_tokens = metadata.prompt_token_count
+            output_tokens = metadata.candidates_token_count
+        else:
+            input_tokens = await prompt_tokens if prompt_tokens is not None else None
+            # Candidates report their own length only on whole responses
+            output_tokens = None if first_token_at is not None else sum(
+                candidate.token_count for candidate in getattr(response, "candidates", [])
+            )
+            if not output_tokens and text:
+                output_tokens = await self._count_tokens(text)
+        record_llm_usage(
+            "gemini",
+            self.model_name,
+            input_tokens,
+            output_tokens,
+            started,
+            first_token_at,
+            streamed=first_token_at is not None,
+            finished_at=finished_at
+        )
+
     def _build_prompt(self, prompt: str, context: Optional[str] = None) -> str:
         """Build the full prompt with context."""
         if context:
@@ -0,0 +1,119 @@
+"""
+Prompt cache checkpoint planning for Bedrock Claude models.
+
+A cache checkpoint (``cache_control``) on a prompt block asks Bedrock to
+cache the prompt prefix up to and including that block; later requests
+starting with the same prefix read it from the cache instead of processing
+it again, which cuts time to first token and input cost. Writing a
+checkpoint costs more than plain input, so it only pays off for prefixes
+that are sent again within the cache TTL.
+
+``PromptCachePlanner`` decides which blocks get a checkpoint: blocks that
+are stable by nature (a chatbot's system prompt) always do, other blocks
+(retrieved contexts) once the same prefix has been seen recently, e.g. on a
+follow-up turn answered from the previous turn's contexts. Prefixes shorter
+than the model's minimum cacheable length never do.
+"""
+
+import hashlib
+import math
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, List, Optional, Tuple
+from core.config import settings
+
+# Minimum cacheable prefix (tokens) by model family; models not listed do not
+# support prompt caching on Bedrock
+_PROMPT_CACHE_MODELS = {
+    "anthropic.claude-3-5-haiku": 2048,
+    "anthropic.claude-3-7-sonnet": 1024,
+    "anthropic.claude-sonnet-4": 1024,
+    "anthropic.claude-opus-4": 1024,
+}
+
+# Bedrock accepts at most this many checkpoints per request
+MAX_CHECKPOINTS = 4
+
+
+def prompt_cache_min_tokens(model_id: str) -> Optional[int]:
+    """Minimum cacheable prefix for a model, or None if it cannot cache prompts."""
+    for prefix, min_tokens in _PROMPT_CACHE_MODELS.items():
+        if prefix in model_id:
+            return min_tokens
+    return None
+
+
+class PromptCachePlanner:
+    """Choose cache checkpoints from the prefixes seen recently."""
+
+    def __init__(
+        self,
+        ttl_seconds: float = 300.0,
+        max_entries: int = 4096,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize planner.
+
+        Args:
+            ttl_seconds: How long a prefix stays cached after its last use
+            max_entries: Most prefixes remembered; least recently used are forgotten
+            clock: Monotonic time source
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._clock = clock
+        self._seen: "OrderedDict[str, float]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def plan(self, blocks: List[Tuple[str, bool]], min_tokens: int) -> List[bool]:
+        """
+        Decide which blocks of a prompt prefix get a cache checkpoint.
+
+        Args:
+            blocks: ``(text, stable)`` pairs in prompt order; ``stable`` marks
+                blocks known to repeat across requests
+            min_tokens: Minimum cacheable prefix for the model
+
+        Returns:
+            List[bool]: Whether each block gets a checkpoint
+        """
+        now = self._clock()
+        digest = hashlib.sha1()
+        tokens = 0
+        checkpoints = []
+        with self._lock:
+            for text, stable in blocks:
+                digest.update(text.encode("utf-8") + b"\0")
+                key = digest.hexdigest()
+                tokens += math.ceil(len(text) / 4)  # ~4 characters per token
+                checkpoints.append(tokens >= min_tokens and (stable or self._recent(key, now)))
+                self._remember(key, now)
+
+        # Keep the longest prefixes if there are more candidates than allowed
+        for index in [i for i, checkpoint in enumerate(checkpoints) if checkpoint][:-MAX_CHECKPOINTS]:
+            checkpoints[index] = False
+        return checkpoints
+
+    def _recent(self, key: str, now: float) -> bool:
+        seen_at = self._seen.get(key)
+        return seen_at is not None and now - seen_at < self.ttl_seconds
+
+    def _remember(self, key: str, now: float) -> None:
+        self._seen[key] = now
+        self._seen.move_to_end(key)
+        while len(self._seen) > self.max_entries:
+            self._seen.popitem(last=False)
+
+
+# Singleton instance
+_prompt_cache_planner: Optional[PromptCachePlanner] = None
+
+
+def get_prompt_cache_planner() -> PromptCachePlanner:
+    """Get singleton prompt cache planner."""
+    global _prompt_cache_planner
+    if _prompt_cache_planner is None:
+        _prompt_cache_planner = PromptCachePlanner(ttl_seconds=settings.BEDROCK_PROMPT_CACHE_TTL_SECONDS)
+    return _prompt_cache_planner
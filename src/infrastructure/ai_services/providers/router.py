@@ -0,0 +1,558 @@
+"""
+Latency-aware routing across LLM providers.
+
+``RoutingLLMService`` implements ``BaseLLMService`` over several provider and
+model targets. Each target keeps a rolling window of latencies and outcomes;
+requests go to targets in policy order (``primary``, ``cheapest`` or
+``fastest``), fail over to the next target on error, and are hedged to a
+second target when the first is slower than its usual p95. Throttling trips
+a per-target circuit breaker so a rate-limited provider is skipped until it
+has had time to recover.
+"""
+
+import asyncio
+import math
+import re
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
+from infrastructure.ai_services.providers.base import BaseLLMService
+from core.config import settings
+from core.errors import BedrockError, DeadlineExceededError, RequestCancelledError, ServiceOverloadedError
+from core.logger import logger
+
+_THROTTLING_CODES = {
+    "ThrottlingException",
+    "TooManyRequestsException",
+    "ServiceQuotaExceededException",
+    "ModelNotReadyException",
+}
+_THROTTLING_MESSAGE = re.compile(
+    r"throttl|too many requests|rate exceeded|resource.?exhausted|quota|\b429\b", re.IGNORECASE
+)
+
+# USD per 1k input and output tokens; matched anywhere in the model ID
+_MODEL_COSTS = {
+    "claude-3-haiku": (0.00025, 0.00125),
+    "claude-3-sonnet": (0.003, 0.015),
+    "claude-3-5-sonnet": (0.003, 0.015),
+    "claude-3-opus": (0.015, 0.075),
+    "titan-text-premier": (0.0005, 0.0015),
+    "llama3-70b": (0.00265, 0.0035),
+    "gemini-1.5-flash": (0.000075, 0.0003),
+    "gemini-1.5-pro": (0.00125, 0.005),
+    "gemini-1.0-pro": (0.0005, 0.0015),
+}
+
+
+def is_throttling_error(error: BaseException) -> bool:
+    """
+    Whether an error, or any error it was raised from, is a throttling error.
+
+    Providers wrap SDK errors in generic exceptions, so the whole
+    ``__cause__``/``__context__`` chain is inspected.
+    """
+    seen = set()
+    while error is not None and id(error) not in seen:
+        seen.add(id(error))
+        if isinstance(error, BedrockError) and error.details.get("error_code") in _THROTTLING_CODES:
+            return True
+        if type(error).__name__ in {"ResourceExhausted", "TooManyRequests", *_THROTTLING_CODES}:
+            return True
+        if _THROTTLING_MESSAGE.search(str(error)):
+            return True
+        error = error.__cause__ or error.__context__
+    return False
+
+
+def model_cost(model_id: str) -> float:
+    """Blended price of a model (input plus output per 1k tokens); unknown models sort last."""
+    for name, (input_cost, output_cost) in _MODEL_COSTS.items():
+        if name in model_id:
+            return input_cost + output_cost
+    return math.inf
+
+
+class LatencyWindow:
+    """Rolling window of request latencies and outcomes."""
+
+    def __init__(self, size: int = 100):
+        self._latencies: deque = deque(maxlen=size)
+        self._outcomes: deque = deque(maxlen=size)
+
+    def record(self, latency: Optional[float], ok: bool) -> None:
+        """Record one request; failed requests only count toward the error rate."""
+        if ok and latency is not None:
+            self._latencies.append(latency)
+        self._outcomes.append(ok)
+
+    @property
+    def samples(self) -> int:
+        """Successful requests in the window."""
+        return len(self._latencies)
+
+    @property
+    def error_rate(self) -> float:
+        """Share of failed requests in the window."""
+        if not self._outcomes:
+            return 0.0
+        return self._outcomes.count(False) / len(self._outcomes)
+
+    def percentile(self, pct: float) -> Optional[float]:
+        """Nearest-rank percentile of the latencies, or None without samples."""
+        if not self._latencies:
+            return None
+        ordered = sorted(self._latencies)
+        rank = max(1, math.ceil(pct / 100 * len(ordered)))
+        return ordered[rank - 1]
+
+
+class CircuitBreaker:
+    """
+    Breaker opened by consecutive throttling errors.
+
+    While open the target is skipped; after ``cooldown_seconds`` one trial
+    request is let through (half-open), which closes the breaker on success
+    and reopens it on another throttling error.
+    """
+
+    def __init__(
+        self,
+        threshold: int = 3,
+        cooldown_seconds: float = 30.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.threshold = threshold
+        self.cooldown_seconds = cooldown_seconds
+        self._clock = clock
+        self._throttles = 0
+        self._opened_at: Optional[float] = None
+        self._probing = False
+
+    @property
+    def state(self) -> str:
+        """``closed``, ``open`` or ``half_open``."""
+        if self._opened_at is None:
+            return "closed"
+        if self._clock() - self._opened_at < self.cooldown_seconds:
+            return "open"
+        return "half_open"
+
+    @property
+    def available(self) -> bool:
+        """Whether a request could be sent now, without claiming the trial request."""
+        state = self.state
+        return state == "closed" or (state == "half_open" and not self._probing)
+
+    def allow(self) -> bool:
+        """Whether a request may be sent; claims the trial request when half-open."""
+        state = self.state
+        if state == "closed":
+            return True
+        if state == "half_open" and not self._probing:
+            self._probing = True
+            return True
+        return False
+
+    def record_success(self) -> None:
+        self._throttles = 0
+        self._opened_at = None
+        self._probing = False
+
+    def record_throttle(self) -> None:
+        self._throttles += 1
+        if self._probing or self._throttles >= self.threshold:
+            self._opened_at = self._clock()
+        self._probing = False
+
+    def release(self) -> None:
+        """Give back a trial request that ended without an outcome (e.g. cancelled)."""
+        self._probing = False
+
+
+@dataclass
+class RouteTarget:
+    """One provider and model the router can send requests to."""
+
+    name: str
+    service: BaseLLMService
+    cost: float = math.inf
+    latency: LatencyWindow = field(default_factory=LatencyWindow)
+    first_chunk: LatencyWindow = field(default_factory=LatencyWindow)
+    breaker: CircuitBreaker = field(default_factory=CircuitBreaker)
+
+
+class RoutingLLMService(BaseLLMService):
+    """LLM service routing each request across several providers."""
+
+    POLICIES = ("primary", "cheapest", "fastest")
+
+    def __init__(
+        self,
+        targets: List[RouteTarget],
+        policy: str = "primary",
+        hedge_enabled: bool = True,
+        hedge_percentile: float = 95.0,
+        min_samples: int = 20,
+        max_error_rate: float = 0.5
+    ):
+        """
+        Initialize router.
+
+        Args:
+            targets: Targets in configured (primary first) order
+            policy: ``primary`` (configured order), ``cheapest`` or ``fastest`` (lowest p50)
+            hedge_enabled: Start a second target when the first is slow
+            hedge_percentile: Latency percentile of the first target after
+                which the request is hedged
+            min_samples: Samples needed before latency is used for routing and hedging
+            max_error_rate: Error rate above which a target is only used as a last resort
+        """
+        if not targets:
+            raise ValueError("At least one routing target is required")
+        if policy not in self.POLICIES:
+            raise ValueError(f"Unsupported routing policy: {policy}")
+        self.targets = targets
+        self.policy = policy
+        self.hedge_enabled = hedge_enabled
+        self.hedge_percentile = hedge_percentile
+        self.min_samples = min_samples
+        self.max_error_rate = max_error_rate
+
+    async def generate_response(
+        self,
+        prompt: str,
+        context: Optional[str] = None,
+        max_tokens: int = 1000,
+        temperature: float = 0.7,
+        **kwargs
+    ) -> str:
+        """Generate a response, failing over and hedging across targets."""
+        def call(target: RouteTarget):
+            return target.service.generate_response(
+                prompt=prompt, context=context, max_tokens=max_tokens, temperature=temperature, **kwargs
+            )
+
+        return await self._route(call)
+
+    async def generate_chat(
+        self,
+        messages: List[Dict[str, str]],
+        system: Optional[str] = None,
+        context: Optional[str] = None,
+        max_tokens: int = 1000,
+        temperature: float = 0.7,
+        **kwargs
+    ) -> str:
+        """Generate the next assistant message, failing over and hedging across targets."""
+        def call(target: RouteTarget):
+            return target.service.generate_chat(
+                messages, system=system, context=context, max_tokens=max_tokens, temperature=temperature, **kwargs
+            )
+
+        return await self._route(call)
+
+    async def _route(self, call) -> str:
+        candidates = self._candidates()
+        last_error: Optional[BaseException] = None
+        while candidates:
+            target = candidates.pop(0)
+            hedge = self._hedge_delay(target.latency) if candidates else None
+            attempts = {asyncio.ensure_future(self._attempt(target, call)): target}
+            try:
+                while attempts:
+                    done, _ = await asyncio.wait(
+                        set(attempts), timeout=hedge, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    if not done:
+                        # First target is slower than usual; race the next one
+                        backup = candidates.pop(0)
+                        logger.info(f"Hedging {target.name} request to {backup.name} after {hedge:.2f}s")
+                        attempts[asyncio.ensure_future(self._attempt(backup, call))] = backup
+                        hedge = None
+                        continue
+                    for task in done:
+                        attempts.pop(task)
+                        if task.exception() is None:
+                            return task.result()
+                        last_error = task.exception()
+                        if isinstance(last_error, (RequestCancelledError, DeadlineExceededError)):
+                            raise last_error
+            finally:
+                for task in attempts:
+                    task.cancel()
+
+        raise self._exhausted(last_error)
+
+    async def generate_streaming_response(
+        self,
+        prompt: str,
+        context: Optional[str] = None,
+        max_tokens: int = 1000,
+        temperature: float = 0.7,
+        **kwargs
+    ):
+        """
+        Stream a response from the first target to produce output.
+
+        Failover and hedging apply until the first chunk arrives; after that
+        the stream is committed to its target.
+        """
+        def open_stream(target: RouteTarget) -> AsyncIterator[str]:
+            return target.service.generate_streaming_response(
+                prompt=prompt, context=context, max_tokens=max_tokens, temperature=temperature, **kwargs
+            )
+
+        async for chunk in self._route_stream(open_stream):
+            yield chunk
+
+    async def generate_chat_stream(
+        self,
+        messages: List[Dict[str, str]],
+        system: Optional[str] = None,
+        context: Optional[str] = None,
+        max_tokens: int = 1000,
+        temperature: float = 0.7,
+        **kwargs
+    ):
+        """Stream the next assistant message; failover and hedging apply until the first chunk."""
+        def open_stream(target: RouteTarget) -> AsyncIterator[str]:
+            return target.service.generate_chat_stream(
+                messages, system=system, context=context, max_tokens=max_tokens, temperature=temperature, **kwargs
+            )
+
+        async for chunk in self._route_stream(open_stream):
+            yield chunk
+
+    async def _route_stream(self, open_stream) -> AsyncIterator[str]:
+        target, stream, first, started = await self._open_first_stream(open_stream)
+        try:
+            if first is not None:
+                yield first
+            async for chunk in stream:
+                yield chunk
+        except Exception as e:
+            self._record_failure(target, e)
+            raise
+        else:
+            target.latency.record(time.perf_counter() - started, ok=True)
+            target.breaker.record_success()
+        finally:
+            await stream.aclose()
+
+    async def _open_first_stream(self, open_stream) -> Tuple[RouteTarget, Any, Optional[str], float]:
+        """Open streams in policy order until one produces its first chunk."""
+        candidates = self._candidates()
+        last_error: Optional[BaseException] = None
+        while candidates:
+            target = candidates.pop(0)
+            hedge = self._hedge_delay(target.first_chunk) if candidates else None
+            attempts = {asyncio.ensure_future(self._first_chunk(target, open_stream)): target}
+            try:
+                while attempts:
+                    done, _ = await asyncio.wait(
+                        set(attempts), timeout=hedge, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    if not done:
+                        backup = candidates.pop(0)
+                        logger.info(f"Hedging {target.name} stream to {backup.name} after {hedge:.2f}s")
+                        attempts[asyncio.ensure_future(self._first_chunk(backup, open_stream))] = backup
+                        hedge = None
+                        continue
+                    for task in done:
+                        winner = attempts.pop(task)
+                        if task.exception() is None:
+                            stream, first, started = task.result()
+                            return winner, stream, first, started
+                        last_error = task.exception()
+                        if isinstance(last_error, (RequestCancelledError, DeadlineExceededError)):
+                            raise last_error
+            finally:
+                for task in attempts:
+                    task.cancel()
+
+        raise self._exhausted(last_error)
+
+    async def _first_chunk(self, target: RouteTarget, open_stream) -> Tuple[Any, Optional[str], float]:
+        self._claim(target)
+        started = time.perf_counter()
+        stream = open_stream(target)
+        try:
+            first = await stream.__anext__()
+        except StopAsyncIteration:
+            first = None
+        except asyncio.CancelledError:
+            target.breaker.release()
+            await stream.aclose()
+            raise
+        except Exception as e:
+            self._record_failure(target, e)
+            await stream.aclose()
+            raise
+        target.first_chunk.record(time.perf_counter() - started, ok=True)
+        return stream, first, started
+
+    async def _attempt(self, target: RouteTarget, call) -> str:
+        self._claim(target)
+        started = time.perf_counter()
+        try:
+            result = await call(target)
+        except asyncio.CancelledError:
+            # Lost a hedge race or the request went away; not the target's fault
+            target.breaker.release()
+            raise
+        except Exception as e:
+            self._record_failure(target, e)
+            raise
+        target.latency.record(time.perf_counter() - started, ok=True)
+        target.breaker.record_success()
+        return result
+
+    @staticmethod
+    def _claim(target: RouteTarget) -> None:
+        # Another request may have taken the half-open trial since candidates were listed
+        if not target.breaker.allow():
+            raise ServiceOverloadedError(
+                f"LLM target {target.name} is throttled", details={"breaker": target.breaker.state}
+            )
+
+    def _record_failure(self, target: RouteTarget, error: Exception) -> None:
+        if isinstance(error, (RequestCancelledError, DeadlineExceededError)):
+            target.breaker.release()
+            return
+        target.latency.record(None, ok=False)
+        if is_throttling_error(error):
+            target.breaker.record_throttle()
+            logger.warning(f"LLM target {target.name} throttled (breaker {target.breaker.state})")
+        else:
+            target.breaker.release()
+            logger.warning(f"LLM target {target.name} failed: {error}")
+
+    def _candidates(self) -> List[RouteTarget]:
+        """Targets whose breaker admits a request, in policy order."""
+        if self.policy == "cheapest":
+            ordered = sorted(self.targets, key=lambda target: target.cost)
+        elif self.policy == "fastest":
+            ordered = sorted(self.targets, key=self._expected_latency)
+        else:
+            ordered = list(self.targets)
+        # Targets failing most requests go last, but remain usable
+        ordered.sort(key=lambda target: self._unhealthy(target))
+        return [target for target in ordered if target.breaker.available]
+
+    def _expected_latency(self, target: RouteTarget) -> float:
+        if target.latency.samples < self.min_samples:
+            # Untried targets sort first so they get measured
+            return 0.0
+        return target.latency.percentile(50)
+
+    def _unhealthy(self, target: RouteTarget) -> bool:
+        return target.latency.samples >= self.min_samples and target.latency.error_rate > self.max_error_rate
+
+    def _hedge_delay(self, window: LatencyWindow) -> Optional[float]:
+        if not self.hedge_enabled or window.samples < self.min_samples:
+            return None
+        return window.percentile(self.hedge_percentile)
+
+    def _exhausted(self, last_error: Optional[BaseException]) -> Exception:
+        if last_error is None:
+            return ServiceOverloadedError(
+                "All LLM providers are throttled",
+                details={"targets": {target.name: target.breaker.state for target in self.targets}}
+            )
+        return last_error
+
+    def get_provider_name(self) -> str:
+        """Get provider name."""
+        return "router"
+
+    def get_model_info(self) -> Dict[str, Any]:
+        """Get model information; limits are the smallest across targets."""
+        infos = [target.service.get_model_info() for target in self.targets]
+        return {
+            "provider": "router",
+            "policy": self.policy,
+            "targets": [target.name for target in self.targets],
+            "supports_streaming": all(info.get("supports_streaming", True) for info in infos),
+            "supports_context": True,
+            "max_input_tokens": min(info.get("max_input_tokens", 8192) for info in infos),
+            "max_output_tokens": min(info.get("max_output_tokens", 2048) for info in infos)
+        }
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Rolling latency, error rate and breaker state per target."""
+        return {
+            target.name: {
+                "p50_ms": _ms(target.latency.percentile(50)),
+                "p95_ms": _ms(target.latency.percentile(95)),
+                "first_chunk_p95_ms": _ms(target.first_chunk.percentile(95)),
+                "error_rate": round(target.latency.error_rate, 3),
+                "samples": target.latency.samples,
+                "breaker": target.breaker.state
+            }
+            for target in self.targets
+        }
+
+
+def _ms(seconds: Optional[float]) -> Optional[float]:
+    return None if seconds is None else round(seconds * 1000, 1)
+
+
+def parse_route_targets(spec: str) -> List[Tuple[str, str]]:
+    """
+    Parse ``provider:model`` pairs from a comma-separated setting.
+
+    Example: ``bedrock:anthropic.claude-3-haiku-20240307-v1:0,gemini:gemini-1.5-flash``
+    (only the first colon separates provider and model).
+    """
+    targets = []
+    for item in spec.split(","):
+        item = item.strip()
+        if not item:
+            continue
+        provider, _, model_id = item.partition(":")
+        targets.append((provider.strip().lower(), model_id.strip()))
+    return targets
+
+
+# Singleton instance; latency history must outlive individual requests
+_llm_router: Optional[RoutingLLMService] = None
+
+
+def get_llm_router() -> RoutingLLMService:
+    """Get singleton router over the targets in ``LLM_ROUTER_TARGETS``."""
+    global _llm_router
+    if _llm_router is None:
+        from infrastructure.ai_services.factory import LLMFactory
+
+        targets = []
+        for provider, model_id in parse_route_targets(settings.LLM_ROUTER_TARGETS):
+            if provider == "router":
+                continue
+            try:
+                service = LLMFactory.create(provider=provider, model_id=model_id or None)
+            except Exception as e:
+                logger.warning(f"Skipping LLM route target {provider}:{model_id}: {e}")
+                continue
+            model_id = getattr(service, "model_id", None) or getattr(service, "model_name", model_id)
+            targets.append(RouteTarget(
+                name=f"{provider}:{model_id}",
+                service=service,
+                cost=model_cost(model_id),
+                latency=LatencyWindow(settings.LLM_ROUTER_WINDOW_SIZE),
+                first_chunk=LatencyWindow(settings.LLM_ROUTER_WINDOW_SIZE),
+                breaker=CircuitBreaker(
+                    threshold=settings.LLM_ROUTER_BREAKER_THRESHOLD,
+                    cooldown_seconds=settings.LLM_ROUTER_BREAKER_COOLDOWN_SECONDS
+                )
+            ))
+        _llm_router = RoutingLLMService(
+            targets,
+            policy=settings.LLM_ROUTER_POLICY,
+            hedge_enabled=settings.LLM_ROUTER_HEDGE_ENABLED,
+            hedge_percentile=settings.LLM_ROUTER_HEDGE_PERCENTILE,
+            min_samples=settings.LLM_ROUTER_MIN_SAMPLES
+        )
+        logger.info(f"LLM router using {settings.LLM_ROUTER_POLICY} policy over {[t.name for t in targets]}")
+    return _llm_router
@@ -0,0 +1,515 @@
+"""
+Bounded, fair scheduling of LLM calls.
+
+``LLMScheduler`` admits LLM calls under a global concurrency cap and a cap
+per model. Calls beyond the caps wait in a queue ordered by priority class
+(``interactive`` before ``batch``) and, within a class, by weighted fair
+queuing across tenants (workspaces or users): each tenant's calls are
+tagged with a virtual finish time that advances by ``1 / weight`` per call,
+so a tenant with a thousand queued batch calls cannot starve one with a
+single question. Batch calls may use at most a share of the global cap, so
+interactive traffic always has headroom.
+
+Per-model caps adapt to the provider: a throttling error halves the model's
+limit (at most once per cooldown) and every successful call raises it by a
+fraction of a slot until it is back at the configured cap.
+
+``ScheduledLLMService`` wraps a ``BaseLLMService`` so that every call,
+including the whole duration of a stream, holds a slot. The caller's tenant
+and priority come from ``llm_call_scope``, a context variable like the
+request deadline.
+"""
+
+import asyncio
+import itertools
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional
+from infrastructure.ai_services.providers.base import BaseLLMService
+from infrastructure.ai_services.providers.router import LatencyWindow, is_throttling_error
+from core.config import settings
+from core.deadline import get_request_deadline
+from core.errors import ServiceOverloadedError
+from core.logger import logger
+
+PRIORITIES = ("interactive", "batch")
+
+
+@dataclass(frozen=True)
+class LLMCallScope:
+    """Who an LLM call is made for and how urgent it is."""
+
+    tenant: str = "default"
+    priority: str = "interactive"
+
+
+_current_scope: ContextVar[LLMCallScope] = ContextVar("llm_call_scope", default=LLMCallScope())
+
+
+def get_llm_call_scope() -> LLMCallScope:
+    """Get the scope of LLM calls made by the current request."""
+    return _current_scope.get()
+
+
+@contextmanager
+def llm_call_scope(tenant: Optional[str] = None, priority: str = "interactive") -> Iterator[LLMCallScope]:
+    """
+    Attribute the LLM calls made in the enclosed code to a tenant and priority class.
+
+    Args:
+        tenant: Tenant key, e.g. ``workspace:<id>`` or ``user:<id>``
+        priority: ``interactive`` or ``batch``
+    """
+    if priority not in PRIORITIES:
+        raise ValueError(f"Unsupported LLM call priority: {priority}")
+    scope = LLMCallScope(tenant=tenant or "default", priority=priority)
+    token = _current_scope.set(scope)
+    try:
+        yield scope
+    finally:
+        _current_scope.reset(token)
+
+
+class AdaptiveLimit:
+    """Concurrency limit with additive increase and multiplicative decrease."""
+
+    def __init__(
+        self,
+        ceiling: int,
+        floor: int = 1,
+        backoff: float = 0.5,
+        cooldown_seconds: float = 5.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize limit.
+
+        Args:
+            ceiling: Configured (and highest) limit
+            floor: Lowest limit after throttling
+            backoff: Factor applied to the limit on throttling
+            cooldown_seconds: Minimum time between two decreases, so one burst
+                of throttled calls counts once
+            clock: Monotonic time source
+        """
+        self.ceiling = ceiling
+        self.floor = max(1, min(floor, ceiling))
+        self.backoff = backoff
+        self.cooldown_seconds = cooldown_seconds
+        self._clock = clock
+        self._value = float(ceiling)
+        self._decreased_at: Optional[float] = None
+
+    @property
+    def limit(self) -> int:
+        return max(self.floor, int(self._value))
+
+    def on_success(self) -> None:
+        self._value = min(float(self.ceiling), self._value + 1 / self._value)
+
+    def on_throttle(self) -> bool:
+        """Lower the limit; returns False if it was lowered too recently."""
+        now = self._clock()
+        if self._decreased_at is not None and now - self._decreased_at < self.cooldown_seconds:
+            return False
+        self._value = max(float(self.floor), self._value * self.backoff)
+        self._decreased_at = now
+        return True
+
+
+@dataclass
+class _Waiter:
+    model: str
+    scope: LLMCallScope
+    tag: float
+    seq: int
+    future: asyncio.Future
+    enqueued_at: float = field(default_factory=time.perf_counter)
+
+
+@dataclass(frozen=True)
+class Lease:
+    """A granted slot; pass it back to ``LLMScheduler.release``."""
+
+    model: str
+    priority: str
+
+
+class LLMScheduler:
+    """Admit LLM calls under global and per-model caps, fairly across tenants."""
+
+    def __init__(
+        self,
+        max_concurrency: int = 32,
+        model_limits: Optional[Dict[str, int]] = None,
+        default_model_limit: int = 16,
+        max_queue: int = 500,
+        batch_max_share: float = 0.5,
+        tenant_weights: Optional[Dict[str, float]] = None,
+        min_concurrency: int = 1,
+        backoff: float = 0.5,
+        throttle_cooldown_seconds: float = 5.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize scheduler.
+
+        Args:
+            max_concurrency: Most LLM calls in flight across all models
+            model_limits: Cap per model key (``provider:model``)
+            default_model_limit: Cap for models not in ``model_limits``
+            max_queue: Most queued calls before new ones are rejected
+            batch_max_share: Share of ``max_concurrency`` batch calls may use
+            tenant_weights: Relative share per tenant (default 1)
+            min_concurrency: Lowest per-model limit after throttling
+            backoff: Factor applied to a model's limit when it is throttled
+            throttle_cooldown_seconds: Minimum time between two decreases
+            clock: Monotonic time source for the adaptive limits
+        """
+        self.max_concurrency = max_concurrency
+        self.model_limits = model_limits or {}
+        self.default_model_limit = default_model_limit
+        self.max_queue = max_queue
+        self.batch_limit = max(1, int(max_concurrency * batch_max_share))
+        self.tenant_weights = tenant_weights or {}
+        self.min_concurrency = min_concurrency
+        self.backoff = backoff
+        self.throttle_cooldown_seconds = throttle_cooldown_seconds
+        self._clock = clock
+
+        self._waiters: List[_Waiter] = []
+        self._in_flight = 0
+        self._in_flight_by_model: Dict[str, int] = {}
+        self._in_flight_by_priority: Dict[str, int] = {priority: 0 for priority in PRIORITIES}
+        self._limits: Dict[str, AdaptiveLimit] = {}
+        self._finish_tags: Dict[str, float] = {}
+        self._virtual_time = 0.0
+        self._seq = itertools.count()
+
+        # Metrics
+        self._queue_times = {priority: LatencyWindow(500) for priority in PRIORITIES}
+        self._granted = {priority: 0 for priority in PRIORITIES}
+        self._rejected = 0
+        self._throttled: Dict[str, int] = {}
+
+    async def acquire(self, model: str, scope: Optional[LLMCallScope] = None) -> Lease:
+        """
+        Wait for a slot for a call to ``model``.
+
+        Args:
+            model: Model key
+            scope: Tenant and priority; defaults to the current ``llm_call_scope``
+
+        Returns:
+            Lease: The granted slot
+
+        Raises:
+            ServiceOverloadedError: If the queue is full
+            DeadlineExceededError: If the request runs out of time while queued
+        """
+        scope = scope or get_llm_call_scope()
+        if len(self._waiters) >= self.max_queue:
+            self._rejected += 1
+            logger.warning(f"LLM queue full ({len(self._waiters)}/{self.max_queue}), rejecting call to {model}")
+            raise ServiceOverloadedError(
+                "The assistant is busy, please retry",
+                details={"queue": "llm", "max_queue": self.max_queue}
+            )
+
+        waiter = _Waiter(
+            model=model,
+            scope=scope,
+            tag=self._finish_tag(scope.tenant),
+            seq=next(self._seq),
+            future=asyncio.get_running_loop().create_future()
+        )
+        self._waiters.append(waiter)
+        self._dispatch()
+        if waiter.future.done():
+            return waiter.future.result()
+
+        try:
+            # Shielded so a deadline abort leaves the future for us to inspect
+            return await get_request_deadline().run("llm_queue", asyncio.shield(waiter.future))
+        except BaseException:
+            if waiter.future.done() and not waiter.future.cancelled():
+                # Granted just as we gave up; hand the slot back
+                self.release(waiter.future.result())
+            else:
+                self._waiters.remove(waiter)
+                waiter.future.cancel()
+            raise
+
+    def release(self, lease: Lease, throttled: bool = False) -> None:
+        """
+        Return a slot and admit queued calls.
+
+        Args:
+            lease: Slot returned by ``acquire``
+            throttled: Whether the call failed because the provider throttled it
+        """
+        self._in_flight -= 1
+        self._in_flight_by_model[lease.model] -= 1
+        self._in_flight_by_priority[lease.priority] -= 1
+        limit = self._limit(lease.model)
+        if throttled:
+            self._throttled[lease.model] = self._throttled.get(lease.model, 0) + 1
+            if limit.on_throttle():
+                logger.warning(f"{lease.model} is throttling; concurrency limit lowered to {limit.limit}")
+        else:
+            limit.on_success()
+        self._dispatch()
+
+    def stats(self) -> Dict[str, Any]:
+        """Concurrency, queue depth, queue times and throttling per priority and model."""
+        return {
+            "in_flight": self._in_flight,
+            "max_concurrency": self.max_concurrency,
+            "queued": len(self._waiters),
+            "rejected": self._rejected,
+            "priorities": {
+                priority: {
+                    "in_flight": self._in_flight_by_priority[priority],
+                    "queued": sum(1 for waiter in self._waiters if waiter.scope.priority == priority),
+                    "granted": self._granted[priority],
+                    "queue_p50_ms": _ms(self._queue_times[priority].percentile(50)),
+                    "queue_p95_ms": _ms(self._queue_times[priority].percentile(95))
+                }
+                for priority in PRIORITIES
+            },
+            "models": {
+                model: {
+                    "in_flight": self._in_flight_by_model.get(model, 0),
+                    "limit": limit.limit,
+                    "max_limit": limit.ceiling,
+                    "throttled": self._throttled.get(model, 0)
+                }
+                for model, limit in self._limits.items()
+            }
+        }
+
+    def _finish_tag(self, tenant: str) -> float:
+        """Virtual finish time of the tenant's next call (self-clocked fair queuing)."""
+        weight = self.tenant_weights.get(tenant, 1.0)
+        tag = max(self._virtual_time, self._finish_tags.get(tenant, 0.0)) + 1 / weight
+        self._finish_tags[tenant] = tag
+        return tag
+
+    def _dispatch(self) -> None:
+        """Admit queued calls in priority, then fair-share, order while capacity allows."""
+        order = sorted(
+            self._waiters,
+            key=lambda waiter: (PRIORITIES.index(waiter.scope.priority), waiter.tag, waiter.seq)
+        )
+        for waiter in order:
+            if self._in_flight >= self.max_concurrency:
+                break
+            if not self._admits(waiter):
+                continue
+            self._waiters.remove(waiter)
+            self._in_flight += 1
+            self._in_flight_by_model[waiter.model] = self._in_flight_by_model.get(waiter.model, 0) + 1
+            self._in_flight_by_priority[waiter.scope.priority] += 1
+            self._virtual_time = max(self._virtual_time, waiter.tag)
+            self._granted[waiter.scope.priority] += 1
+            self._queue_times[waiter.scope.priority].record(time.perf_counter() - waiter.enqueued_at, ok=True)
+            waiter.future.set_result(Lease(model=waiter.model, priority=waiter.scope.priority))
+
+        if not self._waiters:
+            # Idle tenants start level again
+            self._finish_tags.clear()
+
+    def _admits(self, waiter: _Waiter) -> bool:
+        if self._in_flight_by_model.get(waiter.model, 0) >= self._limit(waiter.model).limit:
+            return False
+        if waiter.scope.priority == "batch" and self._in_flight_by_priority["batch"] >= self.batch_limit:
+            return False
+        return True
+
+    def _limit(self, model: str) -> AdaptiveLimit:
+        limit = self._limits.get(model)
+        if limit is None:
+            limit = AdaptiveLimit(
+                ceiling=self.model_limits.get(model, self.default_model_limit),
+                floor=self.min_concurrency,
+                backoff=self.backoff,
+                cooldown_seconds=self.throttle_cooldown_seconds,
+                clock=self._clock
+            )
+            self._limits[model] = limit
+        return limit
+
+
+class ScheduledLLMService(BaseLLMService):
+    """LLM service whose calls are admitted by an ``LLMScheduler``."""
+
+    def __init__(self, service: BaseLLMService, scheduler: Optional[LLMScheduler] = None):
+        """
+        Initialize scheduled service.
+
+        Args:
+            service: Wrapped LLM service
+            scheduler: Scheduler; the shared one is used if omitted
+        """
+        self.service = service
+        self.scheduler = scheduler or get_llm_scheduler()
+        info = service.get_model_info()
+        self.model_key = f"{service.get_provider_name()}:{info.get('model_id') or info.get('model_name')}"
+
+    def __getattr__(self, name: str) -> Any:
+        # Provider attributes such as model_id stay readable through the wrapper
+        if name == "service":
+            raise AttributeError(name)
+        return getattr(self.service, name)
+
+    async def generate_response(
+        self,
+        prompt: str,
+        context: Optional[str] = None,
+        max_tokens: int = 1000,
+        temperature: float = 0.7,
+        **kwargs
+    ) -> str:
+        """Generate a response once the scheduler admits the call."""
+        return await self._call(lambda: self.service.generate_response(
+            prompt=prompt, context=context, max_tokens=max_tokens, temperature=temperature, **kwargs
+        ))
+
+    async def generate_streaming_response(
+        self,
+        prompt: str,
+        context: Optional[str] = None,
+        max_tokens: int = 1000,
+        temperature: float = 0.7,
+        **kwargs
+    ):
+        """Stream a response; the slot is held until the stream ends."""
+        async for chunk in self._stream(lambda: self.service.generate_streaming_response(
+            prompt=prompt, context=context, max_tokens=max_tokens, temperature=temperature, **kwargs
+        )):
+            yield chunk
+
+    async def generate_chat(
+        self,
+        messages: List[Dict[str, str]],
+        system: Optional[str] = None,
+        context: Optional[str] = None,
+        max_tokens: int = 1000,
+        temperature: float = 0.7,
+        **kwargs
+    ) -> str:
+        """Generate the next assistant message once the scheduler admits the call."""
+        return await self._call(lambda: self.service.generate_chat(
+            messages, system=system, context=context, max_tokens=max_tokens, temperature=temperature, **kwargs
+        ))
+
+    async def generate_chat_stream(
+        self,
+        messages: List[Dict[str, str]],
+        system: Optional[str] = None,
+        context: Optional[str] = None,
+        max_tokens: int = 1000,
+        temperature: float = 0.7,
+        **kwargs
+    ):
+        """Stream the next assistant message; the slot is held until the stream ends."""
+        async for chunk in self._stream(lambda: self.service.generate_chat_stream(
+            messages, system=system, context=context, max_tokens=max_tokens, temperature=temperature, **kwargs
+        )):
+            yield chunk
+
+    def supports_tools(self) -> bool:
+        """Whether the wrapped service supports tool use."""
+        return self.service.supports_tools()
+
+    async def generate_tool_turn(
+        self,
+        messages: List[Dict[str, str]],
+        tools: List[Dict[str, Any]],
+        system: Optional[str] = None,
+        context: Optional[str] = None,
+        max_tokens: int = 1000,
+        temperature: float = 0.7,
+        tool_turns: Optional[List[Dict[str, Any]]] = None,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """Generate one tool-use turn once the scheduler admits the call; tools run outside the slot."""
+        return await self._call(lambda: self.service.generate_tool_turn(
+            messages, tools, system=system, context=context, max_tokens=max_tokens,
+            temperature=temperature, tool_turns=tool_turns, **kwargs
+        ))
+
+    def get_provider_name(self) -> str:
+        """Get provider name."""
+        return self.service.get_provider_name()
+
+    def get_model_info(self) -> Dict[str, Any]:
+        """Get model information."""
+        return self.service.get_model_info()
+
+    async def _call(self, call):
+        lease = await self.scheduler.acquire(self.model_key)
+        throttled = False
+        try:
+            return await call()
+        except Exception as e:
+            throttled = is_throttling_error(e)
+            raise
+        finally:
+            self.scheduler.release(lease, throttled=throttled)
+
+    async def _stream(self, open_stream):
+        lease = await self.scheduler.acquire(self.model_key)
+        throttled = False
+        stream = open_stream()
+        try:
+            async for chunk in stream:
+                yield chunk
+        except Exception as e:
+            throttled = is_throttling_error(e)
+            raise
+        finally:
+            await stream.aclose()
+            self.scheduler.release(lease, throttled=throttled)
+
+
+def _ms(seconds: Optional[float]) -> Optional[float]:
+    return None if seconds is None else round(seconds * 1000, 1)
+
+
+def parse_weights(spec: str) -> Dict[str, float]:
+    """
+    Parse ``key=value`` pairs from a comma-separated setting.
+
+    Example: ``bedrock:anthropic.claude-3-sonnet-20240229-v1:0=8,gemini:gemini-1.5-pro=16``
+    (only the last ``=`` separates key and value).
+    """
+    weights = {}
+    for item in spec.split(","):
+        key, _, value = item.strip().rpartition("=")
+        if key.strip() and value.strip():
+            weights[key.strip()] = float(value)
+    return weights
+
+
+# Singleton instance; caps are process-wide
+_llm_scheduler: Optional[LLMScheduler] = None
+
+
+def get_llm_scheduler() -> LLMScheduler:
+    """Get singleton LLM scheduler configured from settings."""
+    global _llm_scheduler
+    if _llm_scheduler is None:
+        _llm_scheduler = LLMScheduler(
+            max_concurrency=settings.LLM_MAX_CONCURRENCY,
+            model_limits={model: int(limit) for model, limit in parse_weights(settings.LLM_MODEL_CONCURRENCY).items()},
+            default_model_limit=settings.LLM_DEFAULT_MODEL_CONCURRENCY,
+            max_queue=settings.LLM_SCHEDULER_MAX_QUEUE,
+            batch_max_share=settings.LLM_BATCH_MAX_SHARE,
+            tenant_weights=parse_weights(settings.LLM_TENANT_WEIGHTS),
+            min_concurrency=settings.LLM_THROTTLE_MIN_CONCURRENCY,
+            throttle_cooldown_seconds=settings.LLM_THROTTLE_COOLDOWN_SECONDS
+        )
+    return _llm_scheduler
@@ -1,9 +1,33 @@
 # LLM Services module
 
-from .embedding import BedrockEmbeddingService
-from .knowledge_base import BedrockKnowledgeBaseService
+from core.lazy_import import lazy_exports
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "BedrockBatchBackend": ".batch_inference",
+    "LocalBatchBackend": ".batch_inference",
+    "get_batch_inference_backend": ".batch_inference",
+    "BedrockEmbeddingService": ".embedding",
+    "BedrockKnowledgeBaseService": ".knowledge_base",
+    "VectorStoreKnowledgeBaseService": ".knowledge_base",
+    "resolve_knowledge_base_ids": ".knowledge_base",
+    "LocalAgentRuntimeClient": ".local_agent_runtime",
+    "get_local_agent_runtime": ".local_agent_runtime",
+    "BedrockReranker": ".reranker",
+    "LexicalReranker": ".reranker",
+    "create_reranker": ".reranker",
+})
 
 __all__ = [
+    "BedrockBatchBackend",
+    "LocalBatchBackend",
+    "get_batch_inference_backend",
     "BedrockEmbeddingService",
-    "BedrockKnowledgeBaseService"
-]
\ No newline at end of file
+    "BedrockKnowledgeBaseService",
+    "VectorStoreKnowledgeBaseService",
+    "resolve_knowledge_base_ids",
+    "LocalAgentRuntimeClient",
+    "get_local_agent_runtime",
+    "BedrockReranker",
+    "LexicalReranker",
+    "create_reranker"
+]
@@ -0,0 +1,286 @@
+"""
+Batch inference backends.
+
+``BedrockBatchBackend`` runs jobs with Bedrock batch inference: input JSONL
+is staged in S3, a model invocation job processes it asynchronously at the
+batch price without using on-demand throughput, and the output JSONL is
+read back from S3. ``LocalBatchBackend`` runs the same JSONL through an LLM
+service in-process, for local runs and tests.
+"""
+
+import asyncio
+import json
+import os
+from typing import Any, AsyncIterator, Dict, List, Optional
+from shared.interfaces.services.ai_services.batch_inference_backend import IBatchInferenceBackend
+from infrastructure.ai_services.providers.base import BaseLLMService
+from core.config import settings
+from core.deadline import RequestDeadline, request_deadline
+from core.logger import logger
+from core.telemetry import usage_collector
+
+# Bedrock model invocation job statuses by the status reported to callers
+_BEDROCK_STATUSES = {
+    "Submitted": "in_progress",
+    "Validating": "in_progress",
+    "Scheduled": "in_progress",
+    "InProgress": "in_progress",
+    "Stopping": "in_progress",
+    "Completed": "completed",
+    "PartiallyCompleted": "completed",
+    "Failed": "failed",
+    "Stopped": "failed",
+    "Expired": "failed",
+}
+
+
+def _split_s3_uri(uri: str) -> tuple:
+    bucket, _, key = uri[len("s3://"):].partition("/")
+    return bucket, key
+
+
+class BedrockBatchBackend(IBatchInferenceBackend):
+    """
+    Batch backend using Bedrock model invocation jobs.
+
+    Bedrock requires a minimum number of records per job (100 for most
+    models) and limits the jobs in progress per account, which
+    ``BATCH_INFERENCE_MAX_ACTIVE_JOBS`` should stay under.
+    """
+
+    name = "bedrock_batch"
+
+    def __init__(
+        self,
+        bucket: Optional[str] = None,
+        prefix: Optional[str] = None,
+        role_arn: Optional[str] = None,
+        bedrock_client: Any = None,
+        s3_client: Any = None
+    ):
+        self.bucket = bucket or settings.BATCH_INFERENCE_S3_BUCKET
+        self.prefix = (prefix if prefix is not None else settings.BATCH_INFERENCE_S3_PREFIX).strip("/")
+        self.role_arn = role_arn or settings.BATCH_INFERENCE_ROLE_ARN
+        if not self.bucket or not self.role_arn:
+            raise ValueError("BATCH_INFERENCE_S3_BUCKET and BATCH_INFERENCE_ROLE_ARN are required for Bedrock batch inference")
+        self._bedrock = bedrock_client
+        self._s3 = s3_client
+
+    @property
+    def bedrock(self):
+        if self._bedrock is None:
+            from infrastructure.ai_services.providers.bedrock import get_bedrock_client
+            self._bedrock = get_bedrock_client().client
+        return self._bedrock
+
+    @property
+    def s3(self):
+        if self._s3 is None:
+            import boto3
+            self._s3 = boto3.client("s3", region_name=settings.BEDROCK_REGION)
+        return self._s3
+
+    async def stage_input(self, job_key: str, lines: List[str]) -> str:
+        key = f"{self.prefix}/{job_key}/input.jsonl"
+        await asyncio.to_thread(
+            self.s3.put_object, Bucket=self.bucket, Key=key, Body="\n".join(lines).encode("utf-8")
+        )
+        return f"s3://{self.bucket}/{key}"
+
+    async def read_input(self, location: str) -> List[str]:
+        bucket, key = _split_s3_uri(location)
+        response = await asyncio.to_thread(self.s3.get_object, Bucket=bucket, Key=key)
+        body = await asyncio.to_thread(response["Body"].read)
+        return [line for line in body.decode("utf-8").splitlines() if line.strip()]
+
+    async def submit(self, job_name: str, input_location: str, model_id: str) -> str:
+        output_uri = input_location.rsplit("/", 1)[0] + "/output/"
+        response = await asyncio.to_thread(
+            self.bedrock.create_model_invocation_job,
+            jobName=job_name,
+            roleArn=self.role_arn,
+            modelId=model_id,
+            inputDataConfig={"s3InputDataConfig": {"s3Uri": input_location, "s3InputFormat": "JSONL"}},
+            outputDataConfig={"s3OutputDataConfig": {"s3Uri": output_uri}}
+        )
+        return response["jobArn"]
+
+    async def status(self, backend_job_id: str) -> str:
+        job = await self._get_job(backend_job_id)
+        if job is None:
+            return "unknown"
+        return _BEDROCK_STATUSES.get(job["status"], "in_progress")
+
+    async def results(self, backend_job_id: str) -> AsyncIterator[Dict[str, Any]]:
+        job = await self._get_job(backend_job_id)
+        if job is None:
+            return
+        # Bedrock writes <output uri>/<job id>/<input file>.out
+        bucket, prefix = _split_s3_uri(job["outputDataConfig"]["s3OutputDataConfig"]["s3Uri"])
+        prefix = f"{prefix.rstrip('/')}/{backend_job_id.rsplit('/', 1)[-1]}/"
+        paginator = self.s3.get_paginator("list_objects_v2")
+        pages = await asyncio.to_thread(lambda: list(paginator.paginate(Bucket=bucket, Prefix=prefix)))
+        for page in pages:
+            for obj in page.get("Contents", []):
+                if not obj["Key"].endswith(".jsonl.out"):
+                    continue
+                response = await asyncio.to_thread(self.s3.get_object, Bucket=bucket, Key=obj["Key"])
+                body = await asyncio.to_thread(response["Body"].read)
+                for line in body.decode("utf-8").splitlines():
+                    if line.strip():
+                        yield json.loads(line)
+
+    async def _get_job(self, backend_job_id: str) -> Optional[Dict[str, Any]]:
+        try:
+            return await asyncio.to_thread(self.bedrock.get_model_invocation_job, jobIdentifier=backend_job_id)
+        except Exception as e:
+            if type(e).__name__ == "ResourceNotFoundException" or "ResourceNotFound" in str(e):
+                return None
+            raise
+
+
+class LocalBatchBackend(IBatchInferenceBackend):
+    """
+    Batch backend running records through an LLM service in this process.
+
+    Each output line is appended as soon as its record finishes, so a job
+    restarted over the same input skips the records already done. Records go
+    to the job's Bedrock model at ``batch`` priority for the tenant that
+    submitted the job, so they yield to interactive traffic under the LLM
+    scheduler's caps. Jobs do not survive a restart, or the end of a Lambda
+    invocation; their status is then ``unknown``.
+    """
+
+    name = "local_batch"
+
+    def __init__(
+        self,
+        root_dir: Optional[str] = None,
+        llm: Optional[BaseLLMService] = None,
+        concurrency: Optional[int] = None
+    ):
+        self.root_dir = root_dir or settings.BATCH_INFERENCE_LOCAL_DIR
+        self._llm = llm
+        self._llms: Dict[str, BaseLLMService] = {}
+        self.concurrency = concurrency or settings.BATCH_INFERENCE_LOCAL_CONCURRENCY
+        self._tasks: Dict[str, asyncio.Task] = {}
+
+    def llm_for(self, model_id: str) -> BaseLLMService:
+        """LLM service for a job's model; a service passed to the backend serves every model."""
+        if self._llm is not None:
+            return self._llm
+        if model_id not in self._llms:
+            from infrastructure.ai_services.factory import LLMFactory
+            # Records are Bedrock model invocation inputs, whatever LLM_PROVIDER is
+            self._llms[model_id] = LLMFactory.create(provider="bedrock", model_id=model_id)
+        return self._llms[model_id]
+
+    async def stage_input(self, job_key: str, lines: List[str]) -> str:
+        job_dir = os.path.join(self.root_dir, job_key)
+        os.makedirs(job_dir, exist_ok=True)
+        location = os.path.join(job_dir, "input.jsonl")
+        with open(location, "w", encoding="utf-8") as f:
+            f.write("\n".join(lines))
+        return location
+
+    async def read_input(self, location: str) -> List[str]:
+        with open(location, encoding="utf-8") as f:
+            return [line for line in f.read().splitlines() if line.strip()]
+
+    async def submit(self, job_name: str, input_location: str, model_id: str) -> str:
+        from infrastructure.ai_services.providers.scheduler import get_llm_call_scope
+        backend_job_id = os.path.dirname(input_location)
+        llm = self.llm_for(model_id)
+        tenant = get_llm_call_scope().tenant
+        self._tasks[backend_job_id] = asyncio.ensure_future(self._run(backend_job_id, input_location, llm, tenant))
+        logger.info(f"Started local batch job {job_name} on {model_id} in {backend_job_id}")
+        return backend_job_id
+
+    async def status(self, backend_job_id: str) -> str:
+        if os.path.exists(os.path.join(backend_job_id, "_SUCCESS")):
+            return "completed"
+        task = self._tasks.get(backend_job_id)
+        if task is None:
+            return "unknown"
+        if not task.done():
+            return "in_progress"
+        return "failed" if task.cancelled() or task.exception() else "completed"
+
+    async def results(self, backend_job_id: str) -> AsyncIterator[Dict[str, Any]]:
+        for line in self._read_output(backend_job_id):
+            yield json.loads(line)
+
+    async def _run(self, backend_job_id: str, input_location: str, llm: BaseLLMService, tenant: str) -> None:
+        from infrastructure.ai_services.providers.scheduler import llm_call_scope
+        done = {json.loads(line)["recordId"] for line in self._read_output(backend_job_id)}
+        pending = [json.loads(line) for line in await self.read_input(input_location)]
+        pending = [record for record in pending if record["recordId"] not in done]
+        semaphore = asyncio.Semaphore(self.concurrency)
+        output_path = os.path.join(backend_job_id, "output.jsonl.out")
+
+        async def run_record(record: Dict[str, Any]) -> None:
+            async with semaphore:
+                line = await self._invoke(llm, record)
+            # Checkpoint: the record is done once its line is on disk
+            with open(output_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(line) + "\n")
+
+        # The job outlives the request that submitted it
+        with request_deadline(RequestDeadline()), llm_call_scope(tenant, priority="batch"):
+            await asyncio.gather(*(run_record(record) for record in pending))
+        open(os.path.join(backend_job_id, "_SUCCESS"), "w").close()
+
+    @staticmethod
+    async def _invoke(llm: BaseLLMService, record: Dict[str, Any]) -> Dict[str, Any]:
+        model_input = record["modelInput"]
+        system = "\n\n".join(block["text"] for block in model_input.get("system", [])) or None
+        try:
+            with usage_collector() as usage:
+                text = await llm.generate_chat(
+                    model_input["messages"],
+                    system=system,
+                    max_tokens=model_input.get("max_tokens", 1000),
+                    temperature=model_input.get("temperature", 0.7)
+                )
+        except Exception as e:
+            logger.warning(f"Batch record {record['recordId']} failed: {e}")
+            return {**record, "error": {"errorCode": 500, "errorMessage": str(e)}}
+        summary = usage.summary() or {}
+        return {
+            **record,
+            "modelOutput": {
+                "content": [{"type": "text", "text": text}],
+                "usage": {
+                    "input_tokens": summary.get("input_tokens"),
+                    "output_tokens": summary.get("output_tokens")
+                }
+            }
+        }
+
+    @staticmethod
+    def _read_output(backend_job_id: str) -> List[str]:
+        output_path = os.path.join(backend_job_id, "output.jsonl.out")
+        if not os.path.exists(output_path):
+            return []
+        with open(output_path, encoding="utf-8") as f:
+            return [line for line in f.read().splitlines() if line.strip()]
+
+
+# Singleton instance
+_batch_inference_backend: Optional[IBatchInferenceBackend] = None
+
+
+def get_batch_inference_backend() -> IBatchInferenceBackend:
+    """Get singleton batch inference backend selected by ``settings.batch_inference_backend``."""
+    global _batch_inference_backend
+    if _batch_inference_backend is None:
+        backend = settings.batch_inference_backend
+        if backend == "bedrock":
+            _batch_inference_backend = BedrockBatchBackend()
+        elif backend == "local":
+            if settings.is_lambda:
+                logger.warning("Local batch jobs stop when a Lambda invocation ends; use the bedrock backend")
+            _batch_inference_backend = LocalBatchBackend()
+        else:
+            raise ValueError(f"Unsupported batch inference backend: {settings.BATCH_INFERENCE_BACKEND}")
+    return _batch_inference_backend
@@ -4,21 +4,38 @@ AWS Bedrock Embedding Service.
 
 from shared.interfaces.services.ai_services.embedding_service import IEmbeddingService
 from infrastructure.ai_services.providers.bedrock import BedrockClient
-from typing import List
+from infrastructure.cache.single_flight import SingleFlight, get_single_flight
+from core.config import settings
+from typing import List, Optional
 import asyncio
+import json
 
 class BedrockEmbeddingService(IEmbeddingService):
-    def __init__(self, bedrock_client: BedrockClient, model_id: str = "amazon.titan-embed-text-v1"):
+    def __init__(
+        self,
+        bedrock_client: BedrockClient,
+        model_id: str = "amazon.titan-embed-text-v1",
+        single_flight: Optional[SingleFlight] = None
+    ):
         self.bedrock_client = bedrock_client
         self.model_id = model_id
+        # Identical texts embedded concurrently share one model call
+        if single_flight is None and settings.SINGLE_FLIGHT_ENABLED:
+            single_flight = get_single_flight()
+        self.single_flight = single_flight
     
     async def create_embeddings(self, texts: List[str]) -> List[List[float]]:
         tasks = [self.create_single_embedding(text) for text in texts]
         return await asyncio.gather(*tasks)
     
     async def create_single_embedding(self, text: str) -> List[float]:
+        if self.single_flight is None:
+            return await self._embed(text)
+        return await self.single_flight.do(("embedding", self.model_id, text), lambda: self._embed(text))
+
+    async def _embed(self, text: str) -> List[float]:
         response = await self.bedrock_client.invoke_model(
             model_id=self.model_id,
-            body={"inputText": text}
+            body=json.dumps({"inputText": text})
         )
         return response.get("embedding", [])
\ No newline at end of file
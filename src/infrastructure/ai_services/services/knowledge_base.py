@@ -3,20 +3,99 @@ AWS Bedrock Knowledge Base Service.
 """
 
 from shared.interfaces.services.ai_services.knowledge_base_service import IKnowledgeBaseService
+from shared.interfaces.services.ai_services.embedding_service import IEmbeddingService
+from shared.interfaces.services.ai_services.vector_store_service import IVectorStore
 from infrastructure.ai_services.providers.bedrock import BedrockClient
-from typing import List, Dict, Any
+from core.config import settings
+from core.deadline import get_request_deadline
+from core.errors import BedrockError
+from core.logger import logger
+from typing import List, Dict, Any, Optional
+import asyncio
+import os
+
+_knowledge_base_ids: Optional[Dict[str, str]] = None
+_domain_sources: Optional[Dict[str, IKnowledgeBaseService]] = None
+
+
+def resolve_knowledge_base_ids() -> Dict[str, str]:
+    """
+    Resolve the domain to knowledge base ID mapping from configuration.
+
+    Resolved once per process (at startup, or on first use) and cached.
+
+    Returns:
+        Dict[str, str]: Knowledge base ID per configured domain
+    """
+    global _knowledge_base_ids
+    if _knowledge_base_ids is None:
+        _knowledge_base_ids = settings.knowledge_base_ids
+        if "general" not in _knowledge_base_ids:
+            logger.warning("BEDROCK_KB_GENERAL_ID is not set; unmapped domains cannot be searched")
+        logger.info(f"Knowledge bases configured for domains: {sorted(_knowledge_base_ids)}")
+    return _knowledge_base_ids
+
+
+def knowledge_base_id_for_domain(domain: str) -> Optional[str]:
+    """
+    Knowledge base ID that retrievals for ``domain`` are cached under.
+
+    Returns:
+        Optional[str]: The domain's vector store or knowledge base, falling
+            back to the general knowledge base; None if neither is configured
+    """
+    if domain in settings.vector_store_domains:
+        return f"vector_store:{domain}"
+    knowledge_base_ids = resolve_knowledge_base_ids()
+    return knowledge_base_ids.get(domain) or knowledge_base_ids.get("general")
+
+
+def resolve_domain_sources() -> Dict[str, IKnowledgeBaseService]:
+    """
+    Resolve the retrieval backends of domains served by the vector store.
+
+    Each domain in ``RAG_VECTOR_STORE_DOMAINS`` gets a vector store of its
+    own (its own ChromaDB directory or S3 prefix), built once per process
+    and cached.
+
+    Returns:
+        Dict[str, IKnowledgeBaseService]: Retrieval backend per vector-store domain
+    """
+    global _domain_sources
+    if _domain_sources is None:
+        from infrastructure.ai_services.providers.bedrock import get_bedrock_client
+        from infrastructure.ai_services.services.embedding import BedrockEmbeddingService
+        from infrastructure.vector_store.factory import VectorStoreFactory
+        embedding_service = BedrockEmbeddingService(get_bedrock_client())
+        provider = os.getenv("VECTOR_STORE_PROVIDER", "chromadb")
+        _domain_sources = {
+            domain: VectorStoreKnowledgeBaseService(
+                VectorStoreFactory.create_domain_specific(provider, domain),
+                embedding_service,
+                name=f"vector_store:{domain}"
+            )
+            for domain in settings.vector_store_domains
+        }
+        if _domain_sources:
+            logger.info(f"Vector store retrieval for domains: {sorted(_domain_sources)}")
+    return _domain_sources
+
 
 class BedrockKnowledgeBaseService(IKnowledgeBaseService):
-    def __init__(self, bedrock_client: BedrockClient):
+    def __init__(self, bedrock_client: BedrockClient, domain_kb_mapping: Optional[Dict[str, str]] = None):
         self.bedrock_client = bedrock_client
-        self.domain_kb_mapping = {
-            "healthcare": "KB_HEALTHCARE_ID",
-            "education": "KB_EDUCATION_ID", 
-            "finance": "KB_FINANCE_ID",
-            "general": "KB_GENERAL_ID"
-        }
+        self.domain_kb_mapping = domain_kb_mapping if domain_kb_mapping is not None else resolve_knowledge_base_ids()
     
-    async def retrieve_contexts(self, query: str, knowledge_base_id: str, top_k: int = 5) -> List[Dict[str, Any]]:
+    async def retrieve_contexts(
+        self,
+        query: str,
+        knowledge_base_id: str,
+        top_k: int = 5,
+        query_embedding: Optional[List[float]] = None
+    ) -> List[Dict[str, Any]]:
+        # The knowledge base embeds the query itself, so a precomputed embedding is not used
+        # Don't start a retrieval the request can no longer use
+        get_request_deadline().check("retrieval")
         response = await self.bedrock_client.invoke_bedrock_agent(
             input_text=query,
             knowledge_base_id=knowledge_base_id,
@@ -36,5 +115,40 @@ class BedrockKnowledgeBaseService(IKnowledgeBaseService):
         return contexts
     
     async def get_knowledge_base_by_domain(self, domain: str) -> str:
-        kb_id = self.domain_kb_mapping.get(domain, self.domain_kb_mapping["general"])
-        return kb_id
\ No newline at end of file
+        kb_id = self.domain_kb_mapping.get(domain) or self.domain_kb_mapping.get("general")
+        if not kb_id:
+            raise BedrockError(
+                message=f"No knowledge base configured for domain '{domain}'",
+                details={"domain": domain}
+            )
+        return kb_id
+
+
+class VectorStoreKnowledgeBaseService(IKnowledgeBaseService):
+    """
+    Retrieval backend over a vector store, for use as a RAGService domain source.
+
+    Uses the query embedding when the caller has already computed one, and
+    embeds the query otherwise.
+    """
+
+    def __init__(self, vector_store: IVectorStore, embedding_service: IEmbeddingService, name: str = "vector_store"):
+        self.vector_store = vector_store
+        self.embedding_service = embedding_service
+        self.name = name
+
+    async def retrieve_contexts(
+        self,
+        query: str,
+        knowledge_base_id: str,
+        top_k: int = 5,
+        query_embedding: Optional[List[float]] = None
+    ) -> List[Dict[str, Any]]:
+        get_request_deadline().check("retrieval")
+        if query_embedding is None:
+            query_embedding = await self.embedding_service.create_single_embedding(query)
+        # Vector store clients are synchronous
+        return await asyncio.to_thread(self.vector_store.query, query_embedding, top_k)
+
+    async def get_knowledge_base_by_domain(self, domain: str) -> str:
+        return self.name
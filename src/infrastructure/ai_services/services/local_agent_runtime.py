@@ -0,0 +1,137 @@
+"""
+In-process stand-in for the Bedrock agent-runtime client.
+
+Implements the ``retrieve`` (with ``nextToken`` pagination) and ``rerank``
+calls of the boto3 ``bedrock-agent-runtime`` client over documents added with
+``add_document``. Results are scored by query-term overlap, so knowledge base
+retrieval can be exercised locally and in tests without AWS.
+"""
+
+import re
+import threading
+from typing import Any, Dict, List, Optional
+
+_TOKEN = re.compile(r"\w+")
+
+
+class LocalAgentRuntimeClient:
+    """Minimal synchronous ``bedrock-agent-runtime`` stand-in."""
+
+    def __init__(self, max_page_size: int = 100):
+        """
+        Initialize local client.
+
+        Args:
+            max_page_size: Most results returned per ``retrieve`` call
+        """
+        self.max_page_size = max_page_size
+        self.calls: List[Dict[str, Any]] = []
+        self._documents: Dict[str, List[Dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+
+    def add_document(
+        self,
+        knowledge_base_id: str,
+        text: str,
+        uri: str = "",
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """Index a chunk in a knowledge base."""
+        with self._lock:
+            self._documents.setdefault(knowledge_base_id, []).append({
+                "text": text,
+                "uri": uri,
+                "metadata": metadata or {},
+            })
+
+    def retrieve(
+        self,
+        knowledgeBaseId: str,
+        retrievalQuery: Dict[str, Any],
+        retrievalConfiguration: Optional[Dict[str, Any]] = None,
+        nextToken: Optional[str] = None,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """Return one page of matching chunks, best first."""
+        with self._lock:
+            self.calls.append({"knowledgeBaseId": knowledgeBaseId, "nextToken": nextToken})
+            documents = list(self._documents.get(knowledgeBaseId, []))
+
+        requested = (
+            (retrievalConfiguration or {})
+            .get("vectorSearchConfiguration", {})
+            .get("numberOfResults", 5)
+        )
+        page_size = min(requested, self.max_page_size)
+
+        query_terms = _terms(retrievalQuery.get("text", ""))
+        scored = []
+        for document in documents:
+            score = _overlap(query_terms, document["text"])
+            if score > 0:
+                scored.append((score, document))
+        scored.sort(key=lambda item: item[0], reverse=True)
+
+        offset = int(nextToken or 0)
+        page = scored[offset:offset + page_size]
+        response: Dict[str, Any] = {
+            "retrievalResults": [
+                {
+                    "content": {"text": document["text"]},
+                    "location": {"type": "S3", "s3Location": {"uri": document["uri"]}},
+                    "score": score,
+                    "metadata": document["metadata"],
+                }
+                for score, document in page
+            ]
+        }
+        if offset + page_size < len(scored):
+            response["nextToken"] = str(offset + page_size)
+        return response
+
+    def rerank(
+        self,
+        queries: List[Dict[str, Any]],
+        sources: List[Dict[str, Any]],
+        rerankingConfiguration: Dict[str, Any],
+        **kwargs
+    ) -> Dict[str, Any]:
+        """Score inline text sources against the query, best first."""
+        with self._lock:
+            self.calls.append({"rerank": len(sources)})
+
+        query_terms = _terms(queries[0]["textQuery"]["text"])
+        number_of_results = rerankingConfiguration["bedrockRerankingConfiguration"]["numberOfResults"]
+        scores = [
+            (index, _overlap(query_terms, source["inlineDocumentSource"]["textDocument"]["text"]))
+            for index, source in enumerate(sources)
+        ]
+        scores.sort(key=lambda item: item[1], reverse=True)
+        return {
+            "results": [
+                {"index": index, "relevanceScore": score}
+                for index, score in scores[:number_of_results]
+            ]
+        }
+
+
+def _terms(text: str) -> set:
+    return set(_TOKEN.findall(text.lower()))
+
+
+def _overlap(query_terms: set, text: str) -> float:
+    """Fraction of query terms present in ``text``."""
+    if not query_terms:
+        return 0.0
+    return len(query_terms & _terms(text)) / len(query_terms)
+
+
+_local_agent_runtime: Optional[LocalAgentRuntimeClient] = None
+
+
+def get_local_agent_runtime() -> LocalAgentRuntimeClient:
+    """Get the process-wide local agent-runtime client."""
+    global _local_agent_runtime
+    if _local_agent_runtime is None:
+        _local_agent_runtime = LocalAgentRuntimeClient()
+    return _local_agent_runtime
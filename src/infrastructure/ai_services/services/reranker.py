@@ -0,0 +1,98 @@
+"""
+Context rerankers.
+
+Retrieval returns candidates ranked by vector similarity alone. A reranker
+scores the query against every candidate in one batch so that only the most
+relevant few are sent to the LLM.
+"""
+
+import math
+import re
+from collections import Counter
+from typing import Any, Dict, List, Optional
+from shared.interfaces.services.ai_services.reranker import IReranker
+from infrastructure.ai_services.providers.bedrock import BedrockClient
+from core.config import settings
+
+_TOKEN = re.compile(r"\w+")
+
+
+class BedrockReranker(IReranker):
+    """Reranker backed by a Bedrock reranking model."""
+
+    def __init__(self, bedrock_client: BedrockClient, model_arn: Optional[str] = None):
+        self.bedrock_client = bedrock_client
+        self.model_arn = model_arn or settings.bedrock_rerank_model_arn
+
+    async def rerank(self, query: str, contexts: List[Dict[str, Any]], top_k: int) -> List[Dict[str, Any]]:
+        if not contexts:
+            return []
+        results = await self.bedrock_client.rerank(
+            query=query,
+            documents=[ctx.get("text", "") for ctx in contexts],
+            number_of_results=min(top_k, len(contexts)),
+            model_arn=self.model_arn
+        )
+        return [
+            {**contexts[result["index"]], "rerank_score": result["relevanceScore"]}
+            for result in results
+        ]
+
+
+class LexicalReranker(IReranker):
+    """
+    Offline reranker scoring candidates with BM25 over the candidate set.
+
+    Needs no model, so it is used for local runs and tests.
+    """
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+
+    async def rerank(self, query: str, contexts: List[Dict[str, Any]], top_k: int) -> List[Dict[str, Any]]:
+        if not contexts:
+            return []
+        query_terms = set(_TOKEN.findall(query.lower()))
+        documents = [Counter(_TOKEN.findall(ctx.get("text", "").lower())) for ctx in contexts]
+        avg_length = sum(sum(doc.values()) for doc in documents) / len(documents) or 1.0
+
+        idf = {}
+        for term in query_terms:
+            df = sum(1 for doc in documents if term in doc)
+            idf[term] = math.log(1 + (len(documents) - df + 0.5) / (df + 0.5))
+
+        scored = []
+        for ctx, doc in zip(contexts, documents):
+            length_norm = self.k1 * (1 - self.b + self.b * sum(doc.values()) / avg_length)
+            score = sum(
+                idf[term] * doc[term] * (self.k1 + 1) / (doc[term] + length_norm)
+                for term in query_terms if term in doc
+            )
+            scored.append({**ctx, "rerank_score": score})
+
+        # Stable sort keeps retrieval order between equal scores
+        scored.sort(key=lambda ctx: ctx["rerank_score"], reverse=True)
+        return scored[:top_k]
+
+
+def create_reranker(reranker: Optional[str] = None, bedrock_client: Optional[BedrockClient] = None) -> IReranker:
+    """
+    Create reranker from settings.
+
+    Args:
+        reranker: Reranker name ('lexical', 'bedrock')
+        bedrock_client: Client for the Bedrock reranker
+
+    Returns:
+        IReranker: Reranker instance
+    """
+    reranker = reranker or settings.RAG_RERANKER
+
+    if reranker == "lexical":
+        return LexicalReranker()
+    elif reranker == "bedrock":
+        from infrastructure.ai_services.providers.bedrock import get_bedrock_client
+        return BedrockReranker(bedrock_client or get_bedrock_client())
+    else:
+        raise ValueError(f"Unsupported reranker: {reranker}")
@@ -0,0 +1,25 @@
+# Tool runtime: registry of tool implementations and their parallel executor
+
+from core.lazy_import import lazy_exports
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "ToolRegistry": ".registry",
+    "get_tool_registry": ".registry",
+    "ToolExecutor": ".executor",
+    "ToolCallResult": ".executor",
+    "ToolStats": ".executor",
+    "get_tool_executor": ".executor",
+    "get_tool_stats": ".executor",
+    "DocumentAnalyzerTool": ".document_analyzer",
+})
+
+__all__ = [
+    "ToolRegistry",
+    "get_tool_registry",
+    "ToolExecutor",
+    "ToolCallResult",
+    "ToolStats",
+    "get_tool_executor",
+    "get_tool_stats",
+    "DocumentAnalyzerTool"
+]
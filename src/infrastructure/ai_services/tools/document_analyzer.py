@@ -0,0 +1,80 @@
+"""
+``document_analyzer`` tool: searches the document knowledge bases.
+"""
+
+from typing import Any, Dict, List, Optional
+from shared.interfaces.services.ai_services.knowledge_base_service import IKnowledgeBaseService
+from shared.interfaces.services.ai_services.tool import ITool, ToolContext
+from core.config import settings
+
+
+class DocumentAnalyzerTool(ITool):
+    """
+    Look up passages in the uploaded documents of a domain.
+
+    Lets the model run its own follow-up searches, e.g. one per entity in a
+    comparison question. Searches stay within the domains the caller asked
+    about: the model may only choose among them, and a search without a
+    domain uses the first. Like ``RAGService``, a domain with a backend of
+    its own in ``domain_sources`` (a vector-store domain) is searched there.
+    Searches have no side effects, so results are cached until a knowledge
+    base changes.
+    """
+
+    name = "document_analyzer"
+    description = (
+        "Search the organization's uploaded documents and return the most relevant passages "
+        "with their sources. Use it for questions the provided context does not answer; "
+        "run several searches at once for questions about several topics."
+    )
+    input_schema = {
+        "type": "object",
+        "properties": {
+            "query": {"type": "string", "description": "What to search for"},
+            "domain": {"type": "string", "description": "Document domain to search"},
+            "top_k": {"type": "integer", "minimum": 1, "maximum": 10, "description": "Passages to return"}
+        },
+        "required": ["query"]
+    }
+    idempotent = True
+    reads_knowledge_bases = True
+
+    def __init__(
+        self,
+        knowledge_base_service: IKnowledgeBaseService,
+        domain_sources: Optional[Dict[str, IKnowledgeBaseService]] = None
+    ):
+        self.knowledge_base_service = knowledge_base_service
+        self.domain_sources = domain_sources or {}
+        self.cache_ttl_seconds = settings.TOOL_DOCUMENT_ANALYZER_CACHE_TTL_SECONDS
+
+    def resolve_arguments(self, arguments: Dict[str, Any], context: Optional[ToolContext] = None) -> Dict[str, Any]:
+        """Arguments with the domain set, checked against the caller's domains."""
+        domains = context.domains if context is not None and context.domains else ["general"]
+        domain = arguments.get("domain") or domains[0]
+        if domain not in domains:
+            raise ValueError(f"Domain '{domain}' is not available; use one of: {', '.join(domains)}")
+        return {**arguments, "domain": domain}
+
+    def to_spec(self, context: Optional[ToolContext] = None) -> Dict[str, Any]:
+        """Tool definition offering only the caller's domains."""
+        domains = context.domains if context is not None and context.domains else ["general"]
+        properties = {
+            **self.input_schema["properties"],
+            "domain": {"type": "string", "enum": list(domains), "description": "Document domain to search"}
+        }
+        return {**super().to_spec(context), "input_schema": {**self.input_schema, "properties": properties}}
+
+    async def run(self, arguments: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Passages matching the query, best first."""
+        query = str(arguments.get("query") or "").strip()
+        if not query:
+            raise ValueError("query is required")
+        top_k = min(max(int(arguments.get("top_k") or 5), 1), 10)
+        source = self.domain_sources.get(arguments["domain"], self.knowledge_base_service)
+        knowledge_base_id = await source.get_knowledge_base_by_domain(arguments["domain"])
+        contexts = await source.retrieve_contexts(query, knowledge_base_id, top_k)
+        return [
+            {"text": context.get("text", ""), "source": context.get("source", ""), "score": context.get("score")}
+            for context in contexts
+        ]
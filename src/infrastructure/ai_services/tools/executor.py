@@ -0,0 +1,294 @@
+"""
+Parallel execution of the tool calls in one model turn.
+
+A model turn can request several tools at once; they are independent by
+construction (none sees another's result), so they run concurrently and the
+turn takes as long as its slowest call rather than the sum of all of them.
+Every call has its own timeout (the tool's, else ``TOOL_TIMEOUT_SECONDS``,
+capped by the request deadline), and failures, timeouts and unknown tools
+become error results the model can react to instead of failing the turn.
+
+Results of idempotent tools are served from a ``ToolResultCache``. Per-tool
+call counts and latencies, and the number of model round trips per answer,
+are kept in a ``ToolStats``.
+"""
+
+import asyncio
+import json
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional
+from shared.interfaces.services.ai_services.tool import ITool, ToolContext
+from infrastructure.ai_services.providers.router import LatencyWindow
+from infrastructure.ai_services.tools.registry import ToolRegistry
+from infrastructure.cache.tool_results import ToolResultCache
+from core.config import settings
+from core.deadline import get_request_deadline
+from core.logger import logger
+
+# Call outcomes that are reported to the model as errors
+_ERROR_STATUSES = {"error", "timeout", "unknown"}
+
+
+@dataclass
+class ToolCallResult:
+    """
+    Outcome of one tool call.
+
+    ``status`` is ``ok``, ``cached``, ``error``, ``timeout`` or ``unknown``
+    (the model asked for a tool it may not use).
+    """
+
+    tool_use_id: str
+    name: str
+    arguments: Dict[str, Any]
+    content: str
+    status: str
+    latency_ms: Optional[float] = None
+
+    @property
+    def is_error(self) -> bool:
+        return self.status in _ERROR_STATUSES
+
+    def to_block(self) -> Dict[str, Any]:
+        """``tool_result`` content block answering the ``tool_use`` block."""
+        block = {"type": "tool_result", "tool_use_id": self.tool_use_id, "content": self.content}
+        if self.is_error:
+            block["is_error"] = True
+        return block
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Summary of the call; arguments are kept, results are not."""
+        return {
+            "id": self.tool_use_id,
+            "name": self.name,
+            "arguments": self.arguments,
+            "status": self.status,
+            "latency_ms": self.latency_ms
+        }
+
+    def to_result_dict(self) -> Dict[str, Any]:
+        """Result returned to the model for the call."""
+        return {"id": self.tool_use_id, "content": self.content, "is_error": self.is_error}
+
+
+@dataclass
+class _ToolTotals:
+    calls: int = 0
+    errors: int = 0
+    timeouts: int = 0
+    cache_hits: int = 0
+    latency: LatencyWindow = field(default_factory=lambda: LatencyWindow(200))
+
+
+class ToolStats:
+    """Process-wide tool call and round-trip counters."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._tools: Dict[str, _ToolTotals] = {}
+        self._rounds: Counter = Counter()
+        self.round_limit_hits = 0
+
+    def record_call(self, result: ToolCallResult) -> None:
+        """Record one tool call; cached results do not count toward latency."""
+        with self._lock:
+            totals = self._tools.setdefault(result.name, _ToolTotals())
+            totals.calls += 1
+            if result.status == "cached":
+                totals.cache_hits += 1
+                return
+            if result.status == "timeout":
+                totals.timeouts += 1
+            elif result.is_error:
+                totals.errors += 1
+            latency = None if result.latency_ms is None else result.latency_ms / 1000
+            totals.latency.record(latency, not result.is_error)
+
+    def record_loop(self, rounds: int, hit_limit: bool = False) -> None:
+        """Record the model round trips one answer took."""
+        with self._lock:
+            self._rounds[rounds] += 1
+            if hit_limit:
+                self.round_limit_hits += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Round-trip distribution and per-tool counters and latency percentiles."""
+        with self._lock:
+            loops = sum(self._rounds.values())
+            round_trips = sum(rounds * count for rounds, count in self._rounds.items())
+            return {
+                "loops": loops,
+                "round_trips": round_trips,
+                "avg_round_trips": round(round_trips / loops, 2) if loops else None,
+                "round_trip_counts": {str(rounds): count for rounds, count in sorted(self._rounds.items())},
+                "round_limit_hits": self.round_limit_hits,
+                "tools": {
+                    name: {
+                        "calls": totals.calls,
+                        "errors": totals.errors,
+                        "timeouts": totals.timeouts,
+                        "cache_hits": totals.cache_hits,
+                        "p50_ms": _ms(totals.latency.percentile(50)),
+                        "p95_ms": _ms(totals.latency.percentile(95))
+                    }
+                    for name, totals in sorted(self._tools.items())
+                }
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._tools.clear()
+            self._rounds.clear()
+            self.round_limit_hits = 0
+
+
+class ToolExecutor:
+    """Runs the ``tool_use`` blocks of a model turn concurrently."""
+
+    def __init__(
+        self,
+        registry: ToolRegistry,
+        cache: Optional[ToolResultCache] = None,
+        stats: Optional[ToolStats] = None,
+        default_timeout_seconds: float = 10.0,
+        max_parallel: int = 8,
+        max_result_chars: int = 20000,
+        clock: Callable[[], float] = time.perf_counter
+    ):
+        """
+        Initialize executor.
+
+        Args:
+            registry: Tool implementations
+            cache: Optional cache for results of idempotent tools
+            stats: Counters to record calls in; a private one is used if omitted
+            default_timeout_seconds: Timeout for tools that do not set their own
+            max_parallel: Most calls of one turn running at once
+            max_result_chars: Longer results are truncated before going back to the model
+            clock: Time source for latencies
+        """
+        self.registry = registry
+        self.cache = cache
+        self.stats = stats or ToolStats()
+        self.default_timeout_seconds = default_timeout_seconds
+        self.max_parallel = max_parallel
+        self.max_result_chars = max_result_chars
+        self._clock = clock
+
+    async def execute(
+        self,
+        tool_uses: List[Dict[str, Any]],
+        allowed: Optional[Iterable[str]] = None,
+        context: Optional[ToolContext] = None
+    ) -> List[ToolCallResult]:
+        """
+        Run the tool calls of one model turn.
+
+        Args:
+            tool_uses: ``tool_use`` content blocks (``id``, ``name``, ``input``)
+            allowed: Tool names the caller may use; all registered tools if omitted
+            context: What the caller allows the tools to reach
+
+        Returns:
+            List[ToolCallResult]: One result per call, in call order
+        """
+        allowed = set(allowed) if allowed is not None else None
+        semaphore = asyncio.Semaphore(self.max_parallel)
+
+        async def bounded(block: Dict[str, Any]) -> ToolCallResult:
+            async with semaphore:
+                return await self._call(block, allowed, context)
+
+        return list(await asyncio.gather(*(bounded(block) for block in tool_uses)))
+
+    async def _call(
+        self,
+        block: Dict[str, Any],
+        allowed: Optional[set],
+        context: Optional[ToolContext]
+    ) -> ToolCallResult:
+        name = block.get("name", "")
+        arguments = block.get("input") or {}
+        tool = self.registry.get(name) if allowed is None or name in allowed else None
+
+        def result(content: str, status: str, latency_ms: Optional[float] = None) -> ToolCallResult:
+            call = ToolCallResult(block.get("id", ""), name, arguments, content, status, latency_ms)
+            self.stats.record_call(call)
+            return call
+
+        if tool is None:
+            return result(f"Unknown tool '{name}'", "unknown")
+        try:
+            # Cached under the resolved arguments, so callers with other contexts never share results
+            arguments = tool.resolve_arguments(arguments, context)
+        except ValueError as e:
+            return result(f"Tool '{name}' failed: {e}", "error")
+
+        cache_key = None
+        if self.cache is not None and tool.idempotent and tool.cache_ttl_seconds > 0:
+            cache_key = self.cache.key(name, arguments)
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return result(cached, "cached")
+
+        timeout = self._timeout(tool)
+        started = self._clock()
+        try:
+            output = await asyncio.wait_for(tool.run(arguments), timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"Tool {name} timed out after {timeout:.1f}s")
+            return result(f"Tool '{name}' timed out", "timeout", _ms(self._clock() - started))
+        except Exception as e:
+            logger.warning(f"Tool {name} failed: {e}")
+            return result(f"Tool '{name}' failed: {e}", "error", _ms(self._clock() - started))
+
+        content = self._to_text(output)
+        if cache_key is not None:
+            self.cache.put(cache_key, content, tool.cache_ttl_seconds, tool.reads_knowledge_bases)
+        return result(content, "ok", _ms(self._clock() - started))
+
+    def _timeout(self, tool: ITool) -> float:
+        timeout = tool.timeout_seconds or self.default_timeout_seconds
+        remaining = get_request_deadline().remaining()
+        return timeout if remaining is None else max(min(timeout, remaining), 0.0)
+
+    def _to_text(self, output: Any) -> str:
+        text = output if isinstance(output, str) else json.dumps(output, default=str)
+        return text[:self.max_result_chars]
+
+
+def _ms(seconds: Optional[float]) -> Optional[float]:
+    return None if seconds is None else round(seconds * 1000, 1)
+
+
+# Singleton instances; counters are process-wide
+_tool_stats: Optional[ToolStats] = None
+_tool_executor: Optional[ToolExecutor] = None
+
+
+def get_tool_stats() -> ToolStats:
+    """Get singleton tool stats."""
+    global _tool_stats
+    if _tool_stats is None:
+        _tool_stats = ToolStats()
+    return _tool_stats
+
+
+def get_tool_executor() -> ToolExecutor:
+    """Get singleton tool executor configured from settings."""
+    global _tool_executor
+    if _tool_executor is None:
+        from infrastructure.ai_services.tools.registry import get_tool_registry
+        from infrastructure.cache.tool_results import get_tool_result_cache
+        _tool_executor = ToolExecutor(
+            get_tool_registry(),
+            cache=get_tool_result_cache() if settings.TOOL_RESULT_CACHE_ENABLED else None,
+            stats=get_tool_stats(),
+            default_timeout_seconds=settings.TOOL_TIMEOUT_SECONDS,
+            max_parallel=settings.TOOL_MAX_PARALLEL_CALLS,
+            max_result_chars=settings.TOOL_MAX_RESULT_CHARS
+        )
+    return _tool_executor
@@ -0,0 +1,76 @@
+"""
+Registry of tool implementations.
+
+Rows in the ``tools`` table name a tool by a hard-coded identifier; the
+registry maps each identifier to the ``ITool`` implementing it. Tools a
+chatbot is linked to but that this deployment does not implement are left
+out of the model's tool list.
+"""
+
+from typing import Any, Dict, Iterable, List, Optional
+from shared.interfaces.services.ai_services.tool import ITool, ToolContext
+from core.logger import logger
+
+
+class ToolRegistry:
+    """Map of tool name to implementation."""
+
+    def __init__(self, tools: Iterable[ITool] = ()):
+        self._tools: Dict[str, ITool] = {}
+        for tool in tools:
+            self.register(tool)
+
+    def register(self, tool: ITool) -> None:
+        """Add a tool, replacing any tool with the same name."""
+        self._tools[tool.name] = tool
+
+    def get(self, name: str) -> Optional[ITool]:
+        """Tool with a name, or None if not implemented."""
+        return self._tools.get(name)
+
+    def names(self) -> List[str]:
+        """Names of all implemented tools."""
+        return list(self._tools)
+
+    def specs(self, names: Iterable[str], context: Optional[ToolContext] = None) -> List[Dict[str, Any]]:
+        """
+        Messages API tool definitions for the implemented tools among ``names``.
+
+        Args:
+            names: Tool names, e.g. a chatbot's tools
+            context: What the caller allows the tools to reach
+
+        Returns:
+            List[Dict[str, Any]]: ``{"name", "description", "input_schema"}`` per tool
+        """
+        specs = []
+        for name in dict.fromkeys(names):
+            tool = self._tools.get(name)
+            if tool is None:
+                logger.debug(f"Tool '{name}' is not implemented; leaving it out")
+                continue
+            specs.append(tool.to_spec(context))
+        return specs
+
+
+# Singleton instance
+_tool_registry: Optional[ToolRegistry] = None
+
+
+def get_tool_registry() -> ToolRegistry:
+    """Get singleton tool registry with the built-in tools."""
+    global _tool_registry
+    if _tool_registry is None:
+        from infrastructure.ai_services.providers.bedrock import get_bedrock_client
+        from infrastructure.ai_services.services.knowledge_base import (
+            BedrockKnowledgeBaseService,
+            resolve_domain_sources,
+        )
+        from infrastructure.ai_services.tools.document_analyzer import DocumentAnalyzerTool
+        _tool_registry = ToolRegistry([
+            DocumentAnalyzerTool(
+                BedrockKnowledgeBaseService(get_bedrock_client()),
+                domain_sources=resolve_domain_sources()
+            )
+        ])
+    return _tool_registry
@@ -0,0 +1,58 @@
+"""
+Encryption of provider API keys stored with chatbots.
+
+Keys are stored Fernet-encrypted (AES-128-CBC with HMAC) under
+``CHATBOT_API_KEY_ENCRYPTION_KEY``. Decrypted keys are only ever held in
+memory by the provider instances built from them.
+"""
+
+from typing import Optional
+from core.config import settings
+
+
+class ApiKeyCipher:
+    """Encrypt and decrypt provider API keys."""
+
+    def __init__(self, key: Optional[str] = None):
+        """
+        Initialize cipher.
+
+        Args:
+            key: URL-safe base64 Fernet key; defaults to ``CHATBOT_API_KEY_ENCRYPTION_KEY``
+
+        Raises:
+            ValueError: If no key is configured
+        """
+        key = key or settings.CHATBOT_API_KEY_ENCRYPTION_KEY
+        if not key:
+            raise ValueError("CHATBOT_API_KEY_ENCRYPTION_KEY is required to store chatbot API keys")
+        from cryptography.fernet import Fernet
+        self._fernet = Fernet(key.encode("ascii"))
+
+    def encrypt(self, api_key: str) -> str:
+        return self._fernet.encrypt(api_key.encode("utf-8")).decode("ascii")
+
+    def decrypt(self, api_key_encrypted: str) -> str:
+        """
+        Decrypt a stored key.
+
+        Raises:
+            ValueError: If the key was not encrypted with the configured key
+        """
+        from cryptography.fernet import InvalidToken
+        try:
+            return self._fernet.decrypt(api_key_encrypted.encode("ascii")).decode("utf-8")
+        except (InvalidToken, UnicodeEncodeError) as e:
+            raise ValueError("Chatbot API key cannot be decrypted") from e
+
+
+# Singleton instance
+_api_key_cipher: Optional[ApiKeyCipher] = None
+
+
+def get_api_key_cipher() -> ApiKeyCipher:
+    """Get singleton API key cipher instance."""
+    global _api_key_cipher
+    if _api_key_cipher is None:
+        _api_key_cipher = ApiKeyCipher()
+    return _api_key_cipher
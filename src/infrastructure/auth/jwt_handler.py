@@ -5,10 +5,10 @@ JWT token handling for authentication.
 from datetime import datetime, timedelta
 from typing import Optional, Dict, Any
 from jose import JWTError, jwt
-from passlib.context import CryptContext
 from core.config import settings
 from core.logger import logger
 from core.errors import TokenExpiredError, InvalidTokenError
+from infrastructure.auth.password_hasher import get_password_hasher
 
 
 class JWTHandler:
@@ -24,11 +24,10 @@ class JWTHandler:
         self.algorithm = settings.JWT_ALGORITHM
         self.access_token_expire_minutes = settings.JWT_ACCESS_TOKEN_EXPIRE_MINUTES
         self.refresh_token_expire_days = settings.JWT_REFRESH_TOKEN_EXPIRE_DAYS
-        self.pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
-    def hash_password(self, password: str) -> str:
+    async def hash_password(self, password: str) -> str:
         """
-        Hash a password using bcrypt.
+        Hash a password using bcrypt on the shared hashing executor.
 
         Args:
             password: Plain text password
@@ -36,11 +35,11 @@ class JWTHandler:
         Returns:
             Hashed password
         """
-        return self.pwd_context.hash(password)
+        return await get_password_hasher().hash_password(password)
 
-    def verify_password(self, plain_password: str, hashed_password: str) -> bool:
+    async def verify_password(self, plain_password: str, hashed_password: str) -> bool:
         """
-        Verify a password against its hash.
+        Verify a password against its hash on the shared hashing executor.
 
         Args:
             plain_password: Plain text password
@@ -49,7 +48,7 @@ class JWTHandler:
         Returns:
             True if password matches, False otherwise
         """
-        return self.pwd_context.verify(plain_password, hashed_password)
+        return await get_password_hasher().verify_password(plain_password, hashed_password)
 
     def create_access_token(
         self,
@@ -0,0 +1,209 @@
+"""
+Asynchronous password hashing.
+
+Runs bcrypt on a dedicated, size-limited thread pool so that hashing and
+verification never block the event loop serving chat traffic.
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Tuple, Dict, Any
+from passlib.context import CryptContext
+from core.config import settings
+from core.logger import logger
+from core.errors import ServiceOverloadedError
+
+
+class PasswordHasher:
+    """
+    Bcrypt password hasher backed by a bounded executor.
+
+    bcrypt releases the GIL while computing, so a small thread pool gives real
+    parallelism without the pickling overhead of a process pool. Calls beyond
+    ``max_queue`` pending operations are rejected instead of piling up.
+    """
+
+    def __init__(
+        self,
+        rounds: Optional[int] = None,
+        max_workers: Optional[int] = None,
+        max_queue: Optional[int] = None
+    ):
+        """
+        Initialize password hasher.
+
+        Args:
+            rounds: bcrypt cost factor (defaults to the per-environment setting)
+            max_workers: Number of hashing threads
+            max_queue: Maximum pending operations before rejecting new ones
+        """
+        self.rounds = rounds or settings.password_hash_rounds
+        self.max_workers = max_workers or settings.PASSWORD_HASH_WORKERS
+        self.max_queue = max_queue or settings.PASSWORD_HASH_MAX_QUEUE
+
+        # Pinning min/max rounds to the configured cost makes needs_update()
+        # flag any hash created with different parameters.
+        self.pwd_context = CryptContext(
+            schemes=["bcrypt"],
+            deprecated="auto",
+            bcrypt__default_rounds=self.rounds,
+            bcrypt__min_rounds=self.rounds,
+            bcrypt__max_rounds=self.rounds
+        )
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix="bcrypt"
+        )
+
+        # Metrics
+        self._pending = 0
+        self._running = 0
+        self._running_lock = threading.Lock()
+        self._max_queue_depth = 0
+        self._completed = 0
+        self._rejected = 0
+        self._total_wait_seconds = 0.0
+        self._total_hash_seconds = 0.0
+
+    async def hash_password(self, password: str) -> str:
+        """
+        Hash a password using bcrypt.
+
+        Args:
+            password: Plain text password
+
+        Returns:
+            Hashed password
+
+        Raises:
+            ServiceOverloadedError: If the hashing queue is full
+        """
+        return await self._run(self.pwd_context.hash, password)
+
+    async def verify_password(self, plain_password: str, hashed_password: str) -> bool:
+        """
+        Verify a password against its hash.
+
+        Args:
+            plain_password: Plain text password
+            hashed_password: Hashed password
+
+        Returns:
+            True if password matches, False otherwise
+
+        Raises:
+            ServiceOverloadedError: If the hashing queue is full
+        """
+        return await self._run(self.pwd_context.verify, plain_password, hashed_password)
+
+    async def verify_and_update(
+        self,
+        plain_password: str,
+        hashed_password: str
+    ) -> Tuple[bool, Optional[str]]:
+        """
+        Verify a password and rehash it if its parameters are outdated.
+
+        Args:
+            plain_password: Plain text password
+            hashed_password: Hashed password
+
+        Returns:
+            Tuple of (matches, new_hash). new_hash is None unless the password
+            matched and the stored hash should be replaced.
+
+        Raises:
+            ServiceOverloadedError: If the hashing queue is full
+        """
+        return await self._run(
+            self.pwd_context.verify_and_update, plain_password, hashed_password
+        )
+
+    def needs_update(self, hashed_password: str) -> bool:
+        """Check whether a hash was created with outdated parameters."""
+        return self.pwd_context.needs_update(hashed_password)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        Get executor metrics.
+
+        Returns:
+            dict: Queue depth, throughput and timing counters
+        """
+        completed = self._completed or 1
+        return {
+            "rounds": self.rounds,
+            "max_workers": self.max_workers,
+            "max_queue": self.max_queue,
+            "queue_depth": self._pending - self._running,
+            "in_flight": self._running,
+            "max_queue_depth": self._max_queue_depth,
+            "completed": self._completed,
+            "rejected": self._rejected,
+            "avg_wait_ms": round(self._total_wait_seconds / completed * 1000, 2),
+            "avg_hash_ms": round(self._total_hash_seconds / completed * 1000, 2)
+        }
+
+    def shutdown(self) -> None:
+        """Shut down the hashing executor."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        logger.info("Password hasher executor shut down")
+
+    async def _run(self, func, *args):
+        """Run a bcrypt operation on the executor with queue accounting."""
+        if self._pending >= self.max_queue:
+            self._rejected += 1
+            logger.warning(
+                f"Password hashing queue full ({self._pending}/{self.max_queue}), rejecting request"
+            )
+            raise ServiceOverloadedError(
+                "Authentication service is busy, please retry",
+                details={"queue": "password_hashing", "max_queue": self.max_queue}
+            )
+
+        self._pending += 1
+        self._max_queue_depth = max(self._max_queue_depth, self._pending - self._running)
+        submitted_at = time.perf_counter()
+
+        def task():
+            started_at = time.perf_counter()
+            with self._running_lock:
+                self._running += 1
+            try:
+                return func(*args), started_at
+            finally:
+                with self._running_lock:
+                    self._running -= 1
+
+        try:
+            loop = asyncio.get_running_loop()
+            result, started_at = await loop.run_in_executor(self._executor, task)
+            finished_at = time.perf_counter()
+            self._completed += 1
+            self._total_wait_seconds += started_at - submitted_at
+            self._total_hash_seconds += finished_at - started_at
+            return result
+        finally:
+            self._pending -= 1
+
+
+# Singleton instance
+_password_hasher = None
+
+
+def get_password_hasher() -> PasswordHasher:
+    """Get singleton password hasher instance."""
+    global _password_hasher
+    if _password_hasher is None:
+        _password_hasher = PasswordHasher()
+    return _password_hasher
+
+
+def shutdown_password_hasher() -> None:
+    """Shut down the singleton password hasher if it was created."""
+    global _password_hasher
+    if _password_hasher is not None:
+        _password_hasher.shutdown()
+        _password_hasher = None
@@ -0,0 +1,25 @@
+"""
+In-process caches.
+"""
+
+from .retrieval_cache import RetrievalCache, CachedRetrieval, get_retrieval_cache, normalize_query
+from .conversation_contexts import ConversationContextCache, get_conversation_context_cache
+from .chatbot_configs import ChatbotConfigCache, get_chatbot_config_cache
+from .single_flight import SingleFlight, flight_key, get_single_flight
+from .tool_results import ToolResultCache, get_tool_result_cache
+
+__all__ = [
+    "RetrievalCache",
+    "CachedRetrieval",
+    "get_retrieval_cache",
+    "normalize_query",
+    "ConversationContextCache",
+    "get_conversation_context_cache",
+    "ChatbotConfigCache",
+    "get_chatbot_config_cache",
+    "SingleFlight",
+    "flight_key",
+    "get_single_flight",
+    "ToolResultCache",
+    "get_tool_result_cache"
+]
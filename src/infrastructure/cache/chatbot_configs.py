@@ -0,0 +1,160 @@
+"""
+Per-worker cache of chatbot configurations.
+
+Every chat turn needs the chatbot's model, sampling settings and system
+prompt, which change rarely. Entries are keyed on chatbot ID and versioned by
+the chatbot's ``updated_at``. Updates and deletes invalidate the entry in the
+worker that made them and publish the new version to the other workers
+(see ``ChatbotConfigListener``). An invalidation carrying a version only drops
+entries older than that version, so a worker that already reloaded the new
+configuration keeps it. The TTL bounds staleness if a notification is missed.
+
+Like the retrieval cache, each chatbot has a generation counter that
+invalidation bumps, so a load that started before an invalidation cannot
+re-insert the configuration it read.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional
+from domain.entities.chatbot import Chatbot
+from core.config import settings
+
+
+@dataclass
+class _Entry:
+    chatbot: Chatbot
+    stored_at: float
+
+
+class ChatbotConfigCache:
+    """
+    Bounded LRU map of chatbot ID to chatbot entity.
+
+    Cached entities are shared between requests and must be treated as
+    read-only; updates load the chatbot from the repository.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = 300.0,
+        max_entries: int = 1024,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize cache.
+
+        Args:
+            ttl_seconds: How long entries are used without a notification
+            max_entries: Most chatbots kept; least recently used are evicted
+            clock: Monotonic time source
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._clock = clock
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._generations: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def generation(self, chatbot_id: Any) -> int:
+        """Current invalidation generation of a chatbot."""
+        with self._lock:
+            return self._generations.get(str(chatbot_id), 0)
+
+    def get(self, chatbot_id: Any) -> Optional[Chatbot]:
+        """Cached chatbot, or None on a miss."""
+        key = str(chatbot_id)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or self._clock() - entry.stored_at >= self.ttl_seconds:
+                self._entries.pop(key, None)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry.chatbot
+
+    def put(self, chatbot_id: Any, chatbot: Chatbot, generation: Optional[int] = None) -> bool:
+        """
+        Store a chatbot loaded from the repository.
+
+        Args:
+            chatbot_id: ID the chatbot was looked up by
+            chatbot: Loaded chatbot
+            generation: Chatbot generation read before the load started
+
+        Returns:
+            bool: False if the chatbot was discarded as outdated
+        """
+        key = str(chatbot_id)
+        with self._lock:
+            if generation is not None and generation != self._generations.get(key, 0):
+                return False
+            self._entries[key] = _Entry(chatbot=chatbot, stored_at=self._clock())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            return True
+
+    def invalidate(self, chatbot_id: Any, version: Optional[datetime] = None) -> bool:
+        """
+        Drop a chatbot's entry.
+
+        Args:
+            chatbot_id: Chatbot ID
+            version: ``updated_at`` of the change; entries at this version or
+                newer are kept. None (e.g. on delete) always drops the entry.
+
+        Returns:
+            bool: Whether an entry was dropped
+        """
+        key = str(chatbot_id)
+        with self._lock:
+            entry = self._entries.get(key)
+            if version is not None and entry is not None and _version(entry.chatbot) >= version:
+                return False
+            self._generations[key] = self._generations.get(key, 0) + 1
+            self.invalidations += 1
+            return self._entries.pop(key, None) is not None
+
+    def clear(self) -> None:
+        """Drop all entries, e.g. after notifications may have been missed."""
+        with self._lock:
+            for key in self._entries:
+                self._generations[key] = self._generations.get(key, 0) + 1
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and size."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "invalidations": self.invalidations
+            }
+
+
+def _version(chatbot: Chatbot) -> datetime:
+    return chatbot.updated_at or datetime.min
+
+
+# Singleton instance
+_chatbot_config_cache: Optional[ChatbotConfigCache] = None
+
+
+def get_chatbot_config_cache() -> ChatbotConfigCache:
+    """Get singleton chatbot config cache instance."""
+    global _chatbot_config_cache
+    if _chatbot_config_cache is None:
+        _chatbot_config_cache = ChatbotConfigCache(
+            ttl_seconds=settings.CHATBOT_CONFIG_CACHE_TTL_SECONDS,
+            max_entries=settings.CHATBOT_CONFIG_CACHE_MAX_ENTRIES
+        )
+    return _chatbot_config_cache
@@ -0,0 +1,125 @@
+"""
+Per-conversation cache of recent turns and the contexts used in the last one.
+
+Follow-up turns ("thanks", "explain more") usually need the same contexts as
+the turn before, so they can be answered without a new retrieval; the recent
+messages let follow-ups like "what about the second one?" be rewritten into
+standalone queries. Contexts are stored with the scope (domains) they were
+retrieved from and only returned for a turn searching the same scope.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Hashable, List, Optional
+from core.config import settings
+
+
+@dataclass
+class _Conversation:
+    contexts: List[Dict[str, Any]] = field(default_factory=list)
+    scope: Optional[Hashable] = None
+    turns: List[Dict[str, str]] = field(default_factory=list)
+    stored_at: float = 0.0
+
+
+class ConversationContextCache:
+    """Bounded LRU map of conversation ID to recent turns and last-turn contexts."""
+
+    def __init__(
+        self,
+        ttl_seconds: float = 1800.0,
+        max_entries: int = 4096,
+        max_turns: int = 6,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize cache.
+
+        Args:
+            ttl_seconds: How long an idle conversation is kept
+            max_entries: Most conversations kept; least recently used are evicted
+            max_turns: Most recent messages kept per conversation
+            clock: Monotonic time source
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.max_turns = max_turns
+        self._clock = clock
+        self._entries: "OrderedDict[str, _Conversation]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, conversation_id: str, scope: Optional[Hashable] = None) -> Optional[List[Dict[str, Any]]]:
+        """Contexts of the conversation's last turn if retrieved for ``scope``, or None."""
+        with self._lock:
+            entry = self._get(conversation_id)
+            if entry is None or not entry.contexts or entry.scope != scope:
+                return None
+            return list(entry.contexts)
+
+    def put(self, conversation_id: str, contexts: List[Dict[str, Any]], scope: Optional[Hashable] = None) -> None:
+        """Remember the contexts used for a turn and the scope they were retrieved for."""
+        with self._lock:
+            entry = self._get_or_create(conversation_id)
+            entry.contexts = list(contexts)
+            entry.scope = scope
+
+    def get_turns(self, conversation_id: str) -> List[Dict[str, str]]:
+        """Recent messages as ``{"role", "content"}`` dicts, oldest first."""
+        with self._lock:
+            entry = self._get(conversation_id)
+            return list(entry.turns) if entry is not None else []
+
+    def append_turn(self, conversation_id: str, role: str, content: str) -> None:
+        """Record a message, keeping only the most recent ``max_turns``."""
+        with self._lock:
+            entry = self._get_or_create(conversation_id)
+            entry.turns.append({"role": role, "content": content})
+            del entry.turns[:-self.max_turns]
+
+    def prepend_turns(self, conversation_id: str, turns: List[Dict[str, str]]) -> None:
+        """Record messages that came before those kept (e.g. loaded from storage)."""
+        with self._lock:
+            entry = self._get_or_create(conversation_id)
+            entry.turns[:0] = turns
+            del entry.turns[:-self.max_turns]
+
+    def remove(self, conversation_id: str) -> None:
+        """Forget a conversation."""
+        with self._lock:
+            self._entries.pop(conversation_id, None)
+
+    def _get(self, conversation_id: str) -> Optional[_Conversation]:
+        entry = self._entries.get(conversation_id)
+        if entry is None:
+            return None
+        if self._clock() - entry.stored_at >= self.ttl_seconds:
+            del self._entries[conversation_id]
+            return None
+        self._entries.move_to_end(conversation_id)
+        return entry
+
+    def _get_or_create(self, conversation_id: str) -> _Conversation:
+        entry = self._get(conversation_id)
+        if entry is None:
+            entry = _Conversation()
+            self._entries[conversation_id] = entry
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        entry.stored_at = self._clock()
+        return entry
+
+
+# Singleton instance
+_conversation_context_cache: Optional[ConversationContextCache] = None
+
+
+def get_conversation_context_cache() -> ConversationContextCache:
+    """Get singleton conversation context cache instance."""
+    global _conversation_context_cache
+    if _conversation_context_cache is None:
+        _conversation_context_cache = ConversationContextCache(
+            ttl_seconds=settings.RAG_FOLLOWUP_CONTEXT_TTL_SECONDS
+        )
+    return _conversation_context_cache
@@ -0,0 +1,218 @@
+"""
+Knowledge base retrieval cache.
+
+Entries are keyed on (knowledge base ID, normalized query) and remember the
+``top_k`` they were fetched with, so a cached top-10 also answers a top-5
+request. Entries are fresh for ``ttl_seconds``; with stale-while-revalidate
+enabled they may then be served for ``stale_ttl_seconds`` more while the
+caller refreshes them in the background.
+
+Each knowledge base has a generation counter that invalidation bumps. A fetch
+records the generation before it starts and its result is dropped if the
+knowledge base was invalidated meanwhile, so a slow retrieval cannot
+re-insert outdated results. Invalidations are triggered by knowledge base
+change notifications (see ``infrastructure.postgresql.notifications``) when
+an ingestion completes.
+"""
+
+import re
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from core.config import settings
+
+_WHITESPACE = re.compile(r"\s+")
+_TRAILING_PUNCTUATION = re.compile(r"[\s?!.]+$")
+
+
+def normalize_query(query: str) -> str:
+    """Case- and whitespace-normalize a query for use as a cache key."""
+    query = _WHITESPACE.sub(" ", query.strip().lower())
+    return _TRAILING_PUNCTUATION.sub("", query)
+
+
+@dataclass
+class _Entry:
+    top_k: int
+    contexts: List[Dict[str, Any]]
+    stored_at: float
+
+
+@dataclass
+class CachedRetrieval:
+    """Cache lookup result."""
+
+    contexts: List[Dict[str, Any]]
+    fresh: bool
+
+
+class RetrievalCache:
+    """Bounded LRU cache of knowledge base retrieval results."""
+
+    def __init__(
+        self,
+        ttl_seconds: float = 300.0,
+        stale_ttl_seconds: float = 0.0,
+        max_entries: int = 1024,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize cache.
+
+        Args:
+            ttl_seconds: How long entries are fresh
+            stale_ttl_seconds: How long expired entries may still be served
+                while being revalidated; 0 disables stale-while-revalidate
+            max_entries: Most entries kept; least recently used are evicted
+            clock: Monotonic time source
+        """
+        self.ttl_seconds = ttl_seconds
+        self.stale_ttl_seconds = stale_ttl_seconds
+        self.max_entries = max_entries
+        self._clock = clock
+        self._entries: "OrderedDict[Tuple[str, str], _Entry]" = OrderedDict()
+        self._generations: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+
+    @property
+    def stale_while_revalidate(self) -> bool:
+        """Whether expired entries may be served during revalidation."""
+        return self.stale_ttl_seconds > 0
+
+    def generation(self, knowledge_base_id: str) -> int:
+        """Current invalidation generation of a knowledge base."""
+        with self._lock:
+            return self._generations.get(knowledge_base_id, 0)
+
+    def get(self, knowledge_base_id: str, query: str, top_k: int) -> Optional[CachedRetrieval]:
+        """
+        Look up cached contexts.
+
+        An entry answers requests for up to its own ``top_k``, or for any
+        ``top_k`` when it holds fewer results than it asked for (the knowledge
+        base had no more matches).
+
+        Returns:
+            Optional[CachedRetrieval]: Contexts and freshness, or None on a miss
+        """
+        key = (knowledge_base_id, normalize_query(query))
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or not self._covers(entry, top_k):
+                self.misses += 1
+                return None
+
+            age = now - entry.stored_at
+            if age >= self.ttl_seconds + self.stale_ttl_seconds:
+                del self._entries[key]
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            fresh = age < self.ttl_seconds
+            if fresh:
+                self.hits += 1
+            else:
+                self.stale_hits += 1
+            return CachedRetrieval(contexts=list(entry.contexts[:top_k]), fresh=fresh)
+
+    def put(
+        self,
+        knowledge_base_id: str,
+        query: str,
+        top_k: int,
+        contexts: List[Dict[str, Any]],
+        generation: Optional[int] = None
+    ) -> bool:
+        """
+        Store retrieval results.
+
+        Args:
+            knowledge_base_id: Knowledge base the results came from
+            query: Query text
+            top_k: Number of results requested
+            contexts: Results returned
+            generation: Knowledge base generation read before the fetch started
+
+        Returns:
+            bool: False if the results were discarded as outdated
+        """
+        key = (knowledge_base_id, normalize_query(query))
+        now = self._clock()
+        with self._lock:
+            if generation is not None and generation != self._generations.get(knowledge_base_id, 0):
+                return False
+
+            current = self._entries.get(key)
+            # Keep a fresh superset rather than replacing it with a smaller answer
+            if (
+                current is not None
+                and current.top_k > top_k
+                and now - current.stored_at < self.ttl_seconds
+            ):
+                return True
+
+            self._entries[key] = _Entry(top_k=top_k, contexts=list(contexts), stored_at=now)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            return True
+
+    def invalidate_knowledge_base(self, knowledge_base_id: str) -> int:
+        """
+        Drop all entries for a knowledge base, e.g. after an ingestion completed.
+
+        Returns:
+            int: Number of entries removed
+        """
+        with self._lock:
+            self._generations[knowledge_base_id] = self._generations.get(knowledge_base_id, 0) + 1
+            keys = [key for key in self._entries if key[0] == knowledge_base_id]
+            for key in keys:
+                del self._entries[key]
+            return len(keys)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        with self._lock:
+            for knowledge_base_id in {key[0] for key in self._entries} | set(self._generations):
+                self._generations[knowledge_base_id] = self._generations.get(knowledge_base_id, 0) + 1
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and size."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "stale_hits": self.stale_hits,
+                "misses": self.misses
+            }
+
+    @staticmethod
+    def _covers(entry: _Entry, top_k: int) -> bool:
+        return entry.top_k >= top_k or len(entry.contexts) < entry.top_k
+
+
+# Singleton instance
+_retrieval_cache: Optional[RetrievalCache] = None
+
+
+def get_retrieval_cache() -> RetrievalCache:
+    """Get singleton retrieval cache instance."""
+    global _retrieval_cache
+    if _retrieval_cache is None:
+        _retrieval_cache = RetrievalCache(
+            ttl_seconds=settings.RAG_CACHE_TTL_SECONDS,
+            stale_ttl_seconds=(
+                settings.RAG_CACHE_STALE_TTL_SECONDS if settings.RAG_CACHE_STALE_WHILE_REVALIDATE else 0.0
+            ),
+            max_entries=settings.RAG_CACHE_MAX_ENTRIES
+        )
+    return _retrieval_cache
@@ -0,0 +1,178 @@
+"""
+Single-flight coalescing of identical in-flight calls.
+
+When many identical requests arrive at once (a popular question during an
+incident), only the first starts the upstream call; the others wait for it
+and receive the same result. Streams are fanned out: every subscriber gets
+the chunks produced so far and then follows the live stream.
+
+The shared call runs under its own deadline, bounded by the time the first
+caller had left, so one caller disconnecting does not abort it for the
+others; it is cancelled only when every caller has gone.
+"""
+
+import asyncio
+import hashlib
+import json
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Hashable, List, Optional, TypeVar
+from core.deadline import RequestDeadline, get_request_deadline, request_deadline
+
+T = TypeVar("T")
+
+
+def flight_key(*parts: Any) -> str:
+    """Compact key for a call from its (JSON-serializable) arguments."""
+    encoded = json.dumps(parts, sort_keys=True, default=str)
+    return hashlib.sha1(encoded.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class _Call:
+    task: asyncio.Task
+    waiters: int = 0
+
+
+@dataclass
+class _Broadcast:
+    chunks: List[Any] = field(default_factory=list)
+    done: bool = False
+    error: Optional[BaseException] = None
+    subscribers: int = 0
+    task: Optional[asyncio.Task] = None
+    changed: asyncio.Condition = field(default_factory=asyncio.Condition)
+
+
+class SingleFlight:
+    """Coalesce concurrent calls that share a key."""
+
+    def __init__(self):
+        self._calls: Dict[Hashable, _Call] = {}
+        self._streams: Dict[Hashable, _Broadcast] = {}
+        self._started = 0
+        self._coalesced = 0
+
+    async def do(self, key: Hashable, factory: Callable[[], Awaitable[T]], stage: str = "coalesced") -> T:
+        """
+        Run ``factory()`` once for all concurrent callers with the same key.
+
+        Args:
+            key: Identity of the call
+            factory: Callable creating the work; only called by the first caller
+            stage: Deadline stage name used while waiting
+
+        Returns:
+            The shared result; errors are raised to every caller
+        """
+        call = self._calls.get(key)
+        if call is None:
+            call = _Call(task=asyncio.ensure_future(self._detached(factory)))
+            self._calls[key] = call
+            call.task.add_done_callback(lambda _: self._forget(self._calls, key, call))
+            self._started += 1
+        else:
+            self._coalesced += 1
+
+        call.waiters += 1
+        try:
+            # Shielded so a caller timing out does not cancel the call for the rest
+            return await get_request_deadline().run(stage, asyncio.shield(call.task))
+        finally:
+            call.waiters -= 1
+            if call.waiters == 0 and not call.task.done():
+                # Nobody is left to use the result; later callers start afresh
+                self._forget(self._calls, key, call)
+                call.task.cancel()
+
+    async def stream(self, key: Hashable, factory: Callable[[], AsyncIterator[T]]) -> AsyncIterator[T]:
+        """
+        Subscribe to a shared stream, starting it if no identical one is running.
+
+        Late subscribers first receive the chunks already produced.
+
+        Args:
+            key: Identity of the stream
+            factory: Callable opening the upstream stream
+
+        Yields:
+            Stream chunks
+        """
+        broadcast = self._streams.get(key)
+        if broadcast is None:
+            broadcast = _Broadcast()
+            broadcast.task = asyncio.ensure_future(self._detached(lambda: self._produce(broadcast, factory)))
+            self._streams[key] = broadcast
+            broadcast.task.add_done_callback(lambda _: self._forget(self._streams, key, broadcast))
+            self._started += 1
+        else:
+            self._coalesced += 1
+
+        broadcast.subscribers += 1
+        position = 0
+        try:
+            while True:
+                while position < len(broadcast.chunks):
+                    yield broadcast.chunks[position]
+                    position += 1
+                if broadcast.done:
+                    if broadcast.error is not None:
+                        raise broadcast.error
+                    return
+                async with broadcast.changed:
+                    await broadcast.changed.wait_for(
+                        lambda: broadcast.done or len(broadcast.chunks) > position
+                    )
+        finally:
+            broadcast.subscribers -= 1
+            if broadcast.subscribers == 0 and not broadcast.task.done():
+                self._forget(self._streams, key, broadcast)
+                broadcast.task.cancel()
+
+    def stats(self) -> Dict[str, int]:
+        """Calls started, calls coalesced into a running one, and calls in flight."""
+        return {
+            "started": self._started,
+            "coalesced": self._coalesced,
+            "in_flight": len(self._calls) + len(self._streams)
+        }
+
+    @staticmethod
+    async def _produce(broadcast: _Broadcast, factory: Callable[[], AsyncIterator[Any]]) -> None:
+        source = factory()
+        try:
+            async for chunk in source:
+                broadcast.chunks.append(chunk)
+                async with broadcast.changed:
+                    broadcast.changed.notify_all()
+        except Exception as e:
+            broadcast.error = e
+        finally:
+            broadcast.done = True
+            async with broadcast.changed:
+                broadcast.changed.notify_all()
+            aclose = getattr(source, "aclose", None)
+            if aclose is not None:
+                await aclose()
+
+    @staticmethod
+    async def _detached(factory: Callable[[], Awaitable[T]]) -> T:
+        remaining = get_request_deadline().remaining()
+        with request_deadline(RequestDeadline(remaining)):
+            return await factory()
+
+    @staticmethod
+    def _forget(registry: Dict[Hashable, Any], key: Hashable, entry: Any) -> None:
+        if registry.get(key) is entry:
+            del registry[key]
+
+
+# Singleton instance
+_single_flight: Optional[SingleFlight] = None
+
+
+def get_single_flight() -> SingleFlight:
+    """Get singleton single-flight group."""
+    global _single_flight
+    if _single_flight is None:
+        _single_flight = SingleFlight()
+    return _single_flight
@@ -0,0 +1,106 @@
+"""
+Per-worker cache of tool results.
+
+Only tools that declare themselves idempotent are cached, each with its own
+TTL. Entries are keyed on the tool name and its arguments in canonical JSON
+form, so argument order and formatting in the model's call do not matter.
+Failed calls are never cached. Results of tools reading the knowledge bases
+are dropped when a knowledge base changes.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional
+from infrastructure.cache.single_flight import flight_key
+from core.config import settings
+
+
+@dataclass
+class _Entry:
+    result: str
+    expires_at: float
+    reads_knowledge_bases: bool = False
+
+
+class ToolResultCache:
+    """Bounded LRU map of (tool, arguments) to tool result text."""
+
+    def __init__(self, max_entries: int = 2048, clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize cache.
+
+        Args:
+            max_entries: Most results kept; least recently used are evicted
+            clock: Monotonic time source
+        """
+        self.max_entries = max_entries
+        self._clock = clock
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(tool_name: str, arguments: Dict[str, Any]) -> str:
+        """Cache key for a call."""
+        return f"{tool_name}:{flight_key(arguments)}"
+
+    def get(self, key: str) -> Optional[str]:
+        """Cached result, or None on a miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or self._clock() >= entry.expires_at:
+                self._entries.pop(key, None)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry.result
+
+    def put(self, key: str, result: str, ttl_seconds: float, reads_knowledge_bases: bool = False) -> None:
+        """Store a result for ``ttl_seconds``; ``reads_knowledge_bases`` marks it outdated by knowledge base changes."""
+        if ttl_seconds <= 0:
+            return
+        with self._lock:
+            self._entries[key] = _Entry(
+                result=result, expires_at=self._clock() + ttl_seconds, reads_knowledge_bases=reads_knowledge_bases
+            )
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate_knowledge_bases(self) -> int:
+        """
+        Drop the results of tools reading the knowledge bases, e.g. after an ingestion completed.
+
+        Returns:
+            int: Number of entries removed
+        """
+        with self._lock:
+            keys = [key for key, entry in self._entries.items() if entry.reads_knowledge_bases]
+            for key in keys:
+                del self._entries[key]
+            return len(keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and size."""
+        with self._lock:
+            return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+# Singleton instance
+_tool_result_cache: Optional[ToolResultCache] = None
+
+
+def get_tool_result_cache() -> ToolResultCache:
+    """Get singleton tool result cache instance."""
+    global _tool_result_cache
+    if _tool_result_cache is None:
+        _tool_result_cache = ToolResultCache(max_entries=settings.TOOL_RESULT_CACHE_MAX_ENTRIES)
+    return _tool_result_cache
@@ -20,7 +20,8 @@ from .repositories import (
     MessageRepositoryImpl,
     DocumentRepositoryImpl,
     EmbeddingIndexRepositoryImpl,
-    IngestionJobRepositoryImpl
+    IngestionJobRepositoryImpl,
+    BatchInferenceResultRepositoryImpl
 )
 
 # Mappers
@@ -43,7 +44,7 @@ __all__ = [
     "UserRepositoryImpl", "ChatbotRepositoryImpl", 
     "ConversationRepositoryImpl", "MessageRepositoryImpl",
     "DocumentRepositoryImpl", "EmbeddingIndexRepositoryImpl", 
-    "IngestionJobRepositoryImpl",
+    "IngestionJobRepositoryImpl", "BatchInferenceResultRepositoryImpl",
     
     # Mappers
     "UserMapper", "ChatbotMapper", "ConversationMapper",
@@ -2,34 +2,35 @@
 Database connection and session management.
 """
 
+import asyncio
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator, Dict, Optional
 from core.config import settings
 from core.logger import logger
+from .pool import PoolMetrics, build_engine_options
 
 
 class DatabaseManager:
-    """Manages database connections and sessions."""
+    """
+    Manages database connections and sessions.
+
+    The engine is created once per process and kept across warm Lambda
+    invocations. asyncpg connections are bound to the event loop that opened
+    them, so the engine is rebuilt if sessions are requested from a new loop.
+    """
     
     def __init__(self):
         self.engine = None
         self.session_factory = None
+        self.metrics = PoolMetrics()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
     
     def initialize(self):
         """Initialize database engine and session factory."""
-        database_url = (
-            f"postgresql+asyncpg://{settings.DB_USER}:{settings.DB_PASSWORD}"
-            f"@{settings.DB_HOST}:{settings.DB_PORT}/{settings.DB_NAME}"
-        )
-        
-        self.engine = create_async_engine(
-            database_url,
-            echo=settings.DEBUG,
-            pool_size=20,
-            max_overflow=30,
-            pool_pre_ping=True,
-            pool_recycle=3600
-        )
+        options = build_engine_options(settings)
+        self.engine = create_async_engine(settings.postgres_url, **options)
+        self.engine.sync_engine.pool.metrics = self.metrics
         
         self.session_factory = async_sessionmaker(
             self.engine,
@@ -37,12 +38,66 @@ class DatabaseManager:
             expire_on_commit=False
         )
         
-        logger.info("Database connection initialized")
+        try:
+            self._loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._loop = None
+        
+        logger.info(
+            f"Database connection initialized (pool_mode={settings.db_pool_mode}, "
+            f"transaction_pooling={settings.DB_TRANSACTION_POOLING})"
+        )
     
-    async def get_session(self) -> AsyncGenerator[AsyncSession, None]:
-        """Get database session."""
+    def _ensure_engine(self) -> None:
+        """Create the engine, or rebuild it if the running event loop changed."""
+        loop = asyncio.get_running_loop()
+        if self.session_factory and self._loop is not None and self._loop is not loop:
+            # Connections belong to the old loop and cannot be closed from this one
+            logger.warning("Event loop changed, discarding database connections")
+            self.engine.sync_engine.dispose(close=False)
+            self.session_factory = None
         if not self.session_factory:
             self.initialize()
+        elif self._loop is None:
+            self._loop = loop
+    
+    def get_pool_metrics(self) -> Dict[str, Any]:
+        """
+        Get connection pool metrics.
+
+        Returns:
+            Dict[str, Any]: Pool mode, checkout counters, wait times and, once
+            the engine exists, the pool's own status line
+        """
+        metrics = {"pool_mode": settings.db_pool_mode, **self.metrics.snapshot()}
+        if self.engine:
+            metrics["pool_status"] = self.engine.sync_engine.pool.status()
+        return metrics
+    
+    async def ping(self, timeout: Optional[float] = None) -> bool:
+        """
+        Check that the database answers a trivial query.
+
+        Args:
+            timeout: Seconds to wait; defaults to ``DB_CONNECT_TIMEOUT_SECONDS``
+
+        Returns:
+            bool: Whether the query succeeded in time
+        """
+        async def query() -> None:
+            async for session in self.get_session():
+                await session.execute(text("SELECT 1"))
+
+        try:
+            await asyncio.wait_for(query(), timeout or settings.DB_CONNECT_TIMEOUT_SECONDS)
+            return True
+        except Exception as e:
+            logger.warning(f"Database health check failed: {e}")
+            return False
+
+    async def get_session(self) -> AsyncGenerator[AsyncSession, None]:
+        """Get database session."""
+        self._ensure_engine()
         
         async with self.session_factory() as session:
             try:
@@ -58,6 +113,9 @@ class DatabaseManager:
         """Close database connections."""
         if self.engine:
             await self.engine.dispose()
+            self.engine = None
+            self.session_factory = None
+            self._loop = None
             logger.info("Database connections closed")
 
 
@@ -0,0 +1,174 @@
+"""
+Deployment-aware connection pool configuration and metrics.
+
+Pool modes:
+    queue:  Sized pool for long-running servers (uvicorn), between
+            ``DB_MIN_CONNECTIONS`` persistent and ``DB_MAX_CONNECTIONS`` total.
+    single: One persistent connection per process. Used on Lambda, where a
+            container serves one request at a time and the connection is
+            reused across warm invocations.
+    null:   No client-side pooling; a connection is opened per session. Used
+            when an external pooler (RDS Proxy) owns the connections.
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+from uuid import uuid4
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool
+from core.config import Settings
+
+POOL_MODES = ("queue", "single", "null")
+
+
+@dataclass
+class PoolMetrics:
+    """Counters for connection checkouts and time spent waiting for one."""
+
+    checkouts: int = 0
+    checkins: int = 0
+    timeouts: int = 0
+    in_use: int = 0
+    max_in_use: int = 0
+    total_wait_ms: float = 0.0
+    max_wait_ms: float = 0.0
+
+    def __post_init__(self):
+        self._lock = threading.Lock()
+
+    def record_checkout(self, wait_ms: float) -> None:
+        """Record a successful checkout and how long it took."""
+        with self._lock:
+            self.checkouts += 1
+            self.in_use += 1
+            self.max_in_use = max(self.max_in_use, self.in_use)
+            self.total_wait_ms += wait_ms
+            self.max_wait_ms = max(self.max_wait_ms, wait_ms)
+
+    def record_checkin(self) -> None:
+        """Record a connection returned to the pool."""
+        with self._lock:
+            self.checkins += 1
+            self.in_use = max(0, self.in_use - 1)
+
+    def record_timeout(self) -> None:
+        """Record a checkout that gave up waiting for a connection."""
+        with self._lock:
+            self.timeouts += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Get a point-in-time copy of the metrics."""
+        with self._lock:
+            return {
+                "checkouts": self.checkouts,
+                "checkins": self.checkins,
+                "timeouts": self.timeouts,
+                "in_use": self.in_use,
+                "max_in_use": self.max_in_use,
+                "avg_wait_ms": round(self.total_wait_ms / self.checkouts, 3) if self.checkouts else 0.0,
+                "max_wait_ms": round(self.max_wait_ms, 3),
+            }
+
+
+class _TimedPoolMixin:
+    """Measures how long each checkout waits for (or opens) a connection."""
+
+    metrics: Optional[PoolMetrics] = None
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except exc.TimeoutError:
+            if self.metrics:
+                self.metrics.record_timeout()
+            raise
+        if self.metrics:
+            self.metrics.record_checkout((time.perf_counter() - start) * 1000)
+        return connection
+
+    def _do_return_conn(self, record) -> None:
+        try:
+            super()._do_return_conn(record)
+        finally:
+            if self.metrics:
+                self.metrics.record_checkin()
+
+    def recreate(self):
+        # engine.dispose() swaps in a fresh pool; keep counting into the same metrics
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+
+class TimedAsyncAdaptedQueuePool(_TimedPoolMixin, AsyncAdaptedQueuePool):
+    """Async queue pool with checkout metrics."""
+
+
+class TimedNullPool(_TimedPoolMixin, NullPool):
+    """Non-pooling pool with checkout metrics."""
+
+
+def _unique_statement_name() -> str:
+    """Prepared statement name that cannot collide on a shared server connection."""
+    return f"__asyncpg_{uuid4()}__"
+
+
+def build_engine_options(settings: Settings) -> Dict[str, Any]:
+    """
+    Build ``create_async_engine`` keyword arguments for the configured pool mode.
+
+    Args:
+        settings: Application settings
+
+    Returns:
+        Dict[str, Any]: Engine options including ``poolclass`` and ``connect_args``
+
+    Raises:
+        ValueError: If the pool mode is unknown
+    """
+    mode = settings.db_pool_mode
+    if mode not in POOL_MODES:
+        raise ValueError(f"Unknown DB_POOL_MODE '{mode}', expected one of {', '.join(POOL_MODES)}")
+
+    connect_args: Dict[str, Any] = {"timeout": settings.DB_CONNECT_TIMEOUT_SECONDS}
+    if settings.DB_TRANSACTION_POOLING:
+        # Transaction poolers hand each transaction a different server
+        # connection, so prepared statements must not be cached or reused by name
+        connect_args.update(
+            statement_cache_size=0,
+            prepared_statement_cache_size=0,
+            prepared_statement_name_func=_unique_statement_name,
+        )
+    else:
+        connect_args.update(
+            statement_cache_size=settings.DB_STATEMENT_CACHE_SIZE,
+            prepared_statement_cache_size=settings.DB_STATEMENT_CACHE_SIZE,
+        )
+
+    options: Dict[str, Any] = {
+        "echo": settings.DEBUG,
+        "pool_pre_ping": True,
+        "connect_args": connect_args,
+    }
+
+    if mode == "null":
+        options["poolclass"] = TimedNullPool
+        return options
+
+    if mode == "single":
+        pool_size, max_overflow = 1, 0
+    else:
+        pool_size = max(1, settings.DB_MIN_CONNECTIONS)
+        max_overflow = max(0, settings.DB_MAX_CONNECTIONS - pool_size)
+
+    options.update(
+        poolclass=TimedAsyncAdaptedQueuePool,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_timeout=settings.DB_POOL_TIMEOUT_SECONDS,
+        pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+    )
+    return options
@@ -0,0 +1,31 @@
+"""
+Recent conversation turns read from the messages table.
+
+``RAGService`` keeps each conversation's recent turns in memory; this loader
+fills them in when that cache has none, e.g. after a restart, on another
+worker, or on a cold Lambda.
+"""
+
+from typing import Dict, List
+from infrastructure.postgresql.connection import db_manager
+from infrastructure.postgresql.repositories import MessageRepositoryImpl
+
+
+async def load_recent_turns(conversation_id: str, limit: int) -> List[Dict[str, str]]:
+    """
+    Load a stored conversation's latest messages.
+
+    Args:
+        conversation_id: Conversation ID; IDs that are not stored
+            conversations (e.g. client-chosen chat session IDs) have no history
+        limit: Maximum number of messages
+
+    Returns:
+        List[Dict[str, str]]: ``{"role", "content"}`` dicts, oldest first
+    """
+    if not str(conversation_id).isdigit():
+        return []
+    async for session in db_manager.get_session():
+        messages = await MessageRepositoryImpl(session).find_recent_by_conversation(int(conversation_id), limit)
+        return [{"role": message.role, "content": message.content} for message in messages]
+    return []
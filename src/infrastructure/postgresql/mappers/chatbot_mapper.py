@@ -4,7 +4,7 @@ Chatbot entity to ORM model mapper.
 Handles conversion between domain Chatbot entity and SQLAlchemy Chatbot model.
 """
 
-from typing import Optional
+from typing import List, Optional
 from decimal import Decimal
 from domain.entities.chatbot import Chatbot as ChatbotEntity
 from domain.value_objects.uuid_vo import UUID as UUIDValue
@@ -19,12 +19,13 @@ class ChatbotMapper:
     """
 
     @staticmethod
-    def to_entity(model: ChatbotModel) -> ChatbotEntity:
+    def to_entity(model: ChatbotModel, tools: Optional[List[str]] = None) -> ChatbotEntity:
         """
         Convert ORM model to domain entity.
 
         Args:
             model: SQLAlchemy Chatbot model
+            tools: Names of the chatbot's active tools, if loaded
 
         Returns:
             Chatbot domain entity
@@ -38,10 +39,14 @@ class ChatbotMapper:
             model_id=model.model,
             temperature=float(model.temperature) if model.temperature else 0.7,
             max_tokens=model.max_tokens or 2048,
-            tools=[],  # Tools would need to be loaded from chatbot_tools relationship
+            tools=list(tools or []),
             is_active=model.status == "active",
             created_at=model.created_at,
-            updated_at=model.updated_at
+            updated_at=model.updated_at,
+            provider=model.provider,
+            api_key_encrypted=model.api_key_encrypted or None,
+            api_base_url=model.api_base_url,
+            enable_function_calling=model.enable_function_calling is not False
         )
 
     @staticmethod
@@ -65,6 +70,7 @@ class ChatbotMapper:
             existing_model.model = entity.model_id
             existing_model.temperature = Decimal(str(entity.temperature))
             existing_model.max_tokens = entity.max_tokens
+            existing_model.enable_function_calling = entity.enable_function_calling
             existing_model.status = "active" if entity.is_active else "disabled"
             existing_model.updated_at = entity.updated_at
             return existing_model
@@ -81,7 +87,7 @@ class ChatbotMapper:
                 top_p=Decimal("1.0"),
                 system_prompt=entity.system_prompt,
                 max_conversation_length=50,
-                enable_function_calling=True,
+                enable_function_calling=entity.enable_function_calling,
                 api_key_encrypted="",  # Would need to be provided
                 created_by=created_by,
                 status="active" if entity.is_active else "disabled",
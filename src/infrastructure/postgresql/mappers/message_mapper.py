@@ -2,6 +2,7 @@
 Message entity mapper.
 """
 
+import json
 from typing import Optional
 from domain.entities.message import Message as MessageEntity
 from infrastructure.postgresql.models.conversation_model import Message as MessageModel
@@ -19,6 +20,8 @@ class MessageMapper:
             role=model.role,
             content=model.content,
             message_metadata=model.message_metadata,
+            tool_calls=json.loads(model.tool_calls) if model.tool_calls else None,
+            tool_results=json.loads(model.tool_results) if model.tool_results else None,
             created_at=model.created_at
         )
     
@@ -31,5 +34,7 @@ class MessageMapper:
             role=entity.role,
             content=entity.content,
             message_metadata=entity.message_metadata,
+            tool_calls=json.dumps(entity.tool_calls) if entity.tool_calls else None,
+            tool_results=json.dumps(entity.tool_results) if entity.tool_results else None,
             created_at=entity.created_at
         )
\ No newline at end of file
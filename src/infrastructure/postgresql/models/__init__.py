@@ -4,13 +4,18 @@ PostgreSQL database models.
 
 from .document_model import DocumentModel
 from .user_model import User
-from .chatbot_model import Chatbot
+from .chatbot_model import Chatbot, Tool, ChatbotTool
 from .conversation_model import Conversation, Message
+from .ingestion_job_model import IngestionJobModel, BatchInferenceResultModel
 
 __all__ = [
     "DocumentModel",
     "User", 
     "Chatbot",
+    "Tool",
+    "ChatbotTool",
     "Conversation",
-    "Message"
+    "Message",
+    "IngestionJobModel",
+    "BatchInferenceResultModel"
 ]
\ No newline at end of file
@@ -25,4 +25,22 @@ class Chatbot(Base):
     created_by = Column(Integer, ForeignKey("users.id", ondelete="SET NULL"), nullable=False)
     status = Column(String(20), default="active")
     created_at = Column(DateTime, default=func.now())
-    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
\ No newline at end of file
+    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
+
+class Tool(Base):
+    """Tool a chatbot can be given; ``name`` is the tool's hard-coded identifier."""
+    __tablename__ = "tools"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    name = Column(String(100), nullable=False, unique=True)
+    description = Column(Text)
+    status = Column(String(20), default="active")
+
+
+class ChatbotTool(Base):
+    """Tool assigned to a chatbot."""
+    __tablename__ = "chatbot_tools"
+
+    chatbot_id = Column(Integer, ForeignKey("chatbots.id", ondelete="CASCADE"), primary_key=True)
+    tool_id = Column(Integer, ForeignKey("tools.id", ondelete="CASCADE"), primary_key=True)
+    added_at = Column(DateTime, default=func.now())
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, ForeignKey, Index
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, ForeignKey, Index, Float
 from sqlalchemy.sql import func
 from infrastructure.postgresql.connection.base import Base
 
@@ -24,6 +24,7 @@ class Message(Base):
     __tablename__ = "messages"
     __table_args__ = (
         Index("idx_messages_conversation_id", "conversation_id"),
+        Index("idx_messages_created_at", "created_at"),
     )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
@@ -31,4 +32,14 @@ class Message(Base):
     role = Column(String(20), nullable=False)
     content = Column(Text, nullable=False)
     message_metadata = Column(Text)  # JSON as text for compatibility
-    created_at = Column(DateTime, default=func.now())
\ No newline at end of file
+    tool_calls = Column(Text)  # JSON list of the tool calls made for an assistant message
+    tool_results = Column(Text)  # JSON list of their results
+    created_at = Column(DateTime, default=func.now())
+
+    # LLM usage, set on assistant messages
+    provider = Column(String(50))
+    model_id = Column(String(255))
+    input_tokens = Column(Integer)
+    output_tokens = Column(Integer)
+    latency_ms = Column(Float)
+    time_to_first_token_ms = Column(Float)
\ No newline at end of file
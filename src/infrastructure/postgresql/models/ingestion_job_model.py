@@ -0,0 +1,41 @@
+from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey, Index, UniqueConstraint
+from sqlalchemy.sql import func
+from infrastructure.postgresql.connection.base import Base
+
+
+class IngestionJobModel(Base):
+    """Long-running background job (document ingestion, batch inference)."""
+    __tablename__ = "ingestion_jobs"
+    __table_args__ = (
+        Index("idx_ingestion_jobs_user_id", "user_id"),
+        Index("idx_ingestion_jobs_provider_status", "provider", "status"),
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    provider = Column(String(50), nullable=False)
+    status = Column(String(20), nullable=False, default="pending")
+    source = Column(Text)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="SET NULL"))
+    details = Column(Text)  # JSON as text for compatibility
+    error_message = Column(Text)
+    created_at = Column(DateTime, default=func.now())
+    started_at = Column(DateTime)
+    finished_at = Column(DateTime)
+
+
+class BatchInferenceResultModel(Base):
+    """Output of one record of a batch inference job."""
+    __tablename__ = "batch_inference_results"
+    __table_args__ = (
+        UniqueConstraint("job_id", "record_id", name="uq_batch_inference_results_job_record"),
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    job_id = Column(Integer, ForeignKey("ingestion_jobs.id", ondelete="CASCADE"), nullable=False)
+    record_id = Column(String(255), nullable=False)
+    status = Column(String(20), nullable=False)  # succeeded, failed
+    output = Column(Text)
+    error_message = Column(Text)
+    input_tokens = Column(Integer)
+    output_tokens = Column(Integer)
+    created_at = Column(DateTime, default=func.now())
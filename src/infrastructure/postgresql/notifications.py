@@ -0,0 +1,161 @@
+"""
+Cross-worker cache invalidation over Postgres LISTEN/NOTIFY.
+
+A chatbot update or delete sends a notification on
+``CHATBOT_CONFIG_NOTIFY_CHANNEL`` in the same transaction, so it is only
+delivered if the change commits. Every worker keeps one dedicated connection
+listening on the channel and drops the changed chatbot from its
+``ChatbotConfigCache``. The same connection listens on
+``KNOWLEDGE_BASE_NOTIFY_CHANNEL``, where a completed ingestion names the
+knowledge base whose cached retrievals and document search tool results are
+now outdated. LISTEN needs a
+session-level connection, so the listener cannot run behind a
+transaction-mode pooler (RDS Proxy, pgbouncer) or on Lambda; there the cache
+TTLs bound staleness.
+"""
+
+import asyncio
+import json
+from datetime import datetime
+from typing import Any, Optional
+from infrastructure.cache.chatbot_configs import ChatbotConfigCache
+from infrastructure.cache.retrieval_cache import RetrievalCache
+from infrastructure.cache.tool_results import ToolResultCache
+from core.config import settings
+from core.logger import logger
+
+
+def chatbot_change_payload(chatbot_id: Any, version: Optional[datetime] = None) -> str:
+    """Notification payload for a changed (``version`` = new ``updated_at``) or deleted chatbot."""
+    return json.dumps({"chatbot_id": str(chatbot_id), "version": version.isoformat() if version else None})
+
+
+def knowledge_base_change_payload(knowledge_base_id: str) -> str:
+    """Notification payload for a knowledge base whose content changed."""
+    return json.dumps({"knowledge_base_id": knowledge_base_id})
+
+
+class ChatbotConfigListener:
+    """Background task applying change notifications to the chatbot config, retrieval and tool result caches."""
+
+    def __init__(
+        self,
+        cache: ChatbotConfigCache,
+        channel: Optional[str] = None,
+        dsn: Optional[str] = None,
+        reconnect_delay: float = 5.0,
+        retrieval_cache: Optional[RetrievalCache] = None,
+        knowledge_base_channel: Optional[str] = None,
+        tool_result_cache: Optional[ToolResultCache] = None
+    ):
+        """
+        Initialize listener.
+
+        Args:
+            cache: Cache to invalidate
+            channel: Notification channel
+            dsn: Postgres DSN; defaults to the application database
+            reconnect_delay: Seconds to wait before reconnecting after a failure
+            retrieval_cache: Optional retrieval cache to invalidate on
+                knowledge base changes
+            knowledge_base_channel: Knowledge base notification channel
+            tool_result_cache: Optional tool result cache whose knowledge
+                base searches are dropped on knowledge base changes
+        """
+        self.cache = cache
+        self.channel = channel or settings.CHATBOT_CONFIG_NOTIFY_CHANNEL
+        self.retrieval_cache = retrieval_cache
+        self.knowledge_base_channel = knowledge_base_channel or settings.KNOWLEDGE_BASE_NOTIFY_CHANNEL
+        self.tool_result_cache = tool_result_cache
+        self.dsn = dsn or settings.postgres_url.replace("+asyncpg", "")
+        self.reconnect_delay = reconnect_delay
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        """Start listening in the background."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.ensure_future(self._run())
+
+    async def stop(self) -> None:
+        """Stop listening and close the connection."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    def handle(self, payload: str) -> None:
+        """Apply one notification payload."""
+        try:
+            change = json.loads(payload)
+            version = datetime.fromisoformat(change["version"]) if change.get("version") else None
+            self.cache.invalidate(change["chatbot_id"], version)
+        except (ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Ignoring malformed chatbot change notification {payload!r}: {e}")
+
+    def handle_knowledge_base_change(self, payload: str) -> None:
+        """Apply one knowledge base change notification."""
+        try:
+            knowledge_base_id = json.loads(payload)["knowledge_base_id"]
+        except (ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Ignoring malformed knowledge base change notification {payload!r}: {e}")
+            return
+        if self.retrieval_cache is not None:
+            removed = self.retrieval_cache.invalidate_knowledge_base(knowledge_base_id)
+            logger.info(f"Knowledge base {knowledge_base_id} changed; dropped {removed} cached retrievals")
+        if self.tool_result_cache is not None:
+            # Tool results are keyed on their arguments, not the knowledge base they read
+            removed = self.tool_result_cache.invalidate_knowledge_bases()
+            logger.info(f"Knowledge base {knowledge_base_id} changed; dropped {removed} cached tool results")
+
+    async def _run(self) -> None:
+        import asyncpg  # Only needed by long-running workers
+        while True:
+            connection = None
+            try:
+                connection = await asyncpg.connect(self.dsn, timeout=settings.DB_CONNECT_TIMEOUT_SECONDS)
+                closed = asyncio.Event()
+                connection.add_termination_listener(lambda _: closed.set())
+                await connection.add_listener(self.channel, lambda _conn, _pid, _channel, payload: self.handle(payload))
+                if self.retrieval_cache is not None or self.tool_result_cache is not None:
+                    await connection.add_listener(
+                        self.knowledge_base_channel,
+                        lambda _conn, _pid, _channel, payload: self.handle_knowledge_base_change(payload)
+                    )
+                # Changes made while not listening were missed
+                self.cache.clear()
+                if self.retrieval_cache is not None:
+                    self.retrieval_cache.clear()
+                if self.tool_result_cache is not None:
+                    self.tool_result_cache.invalidate_knowledge_bases()
+                logger.info(f"Listening for chatbot config changes on '{self.channel}'")
+                await closed.wait()
+                logger.warning("Chatbot config listener connection closed")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Chatbot config listener failed: {e}")
+            finally:
+                if connection is not None and not connection.is_closed():
+                    await connection.close()
+            await asyncio.sleep(self.reconnect_delay)
+
+
+# Singleton instance
+_chatbot_config_listener: Optional[ChatbotConfigListener] = None
+
+
+def get_chatbot_config_listener() -> ChatbotConfigListener:
+    """Get singleton chatbot config listener instance."""
+    global _chatbot_config_listener
+    if _chatbot_config_listener is None:
+        from infrastructure.cache.chatbot_configs import get_chatbot_config_cache
+        from infrastructure.cache.retrieval_cache import get_retrieval_cache
+        from infrastructure.cache.tool_results import get_tool_result_cache
+        _chatbot_config_listener = ChatbotConfigListener(
+            get_chatbot_config_cache(),
+            retrieval_cache=get_retrieval_cache() if settings.RAG_CACHE_ENABLED else None,
+            tool_result_cache=(
+                get_tool_result_cache() if settings.TOOLS_ENABLED and settings.TOOL_RESULT_CACHE_ENABLED else None
+            )
+        )
+    return _chatbot_config_listener
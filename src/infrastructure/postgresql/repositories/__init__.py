@@ -7,7 +7,7 @@ from .chatbot_repository import ChatbotRepositoryImpl
 from .conversation_repository import ConversationRepositoryImpl, MessageRepositoryImpl
 from .document_repository import DocumentRepositoryImpl
 from .embedding_index_repository import EmbeddingIndexRepositoryImpl
-from .ingestion_job_repository import IngestionJobRepositoryImpl
+from .ingestion_job_repository import IngestionJobRepositoryImpl, BatchInferenceResultRepositoryImpl
 
 __all__ = [
     "UserRepositoryImpl",
@@ -16,5 +16,6 @@ __all__ = [
     "MessageRepositoryImpl",
     "DocumentRepositoryImpl",
     "EmbeddingIndexRepositoryImpl",
-    "IngestionJobRepositoryImpl"
+    "IngestionJobRepositoryImpl",
+    "BatchInferenceResultRepositoryImpl"
 ]
\ No newline at end of file
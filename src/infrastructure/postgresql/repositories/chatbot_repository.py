@@ -4,13 +4,16 @@ Chatbot repository implementation.
 Implements chatbot data access using SQLAlchemy.
 """
 
+from datetime import datetime
 from typing import Optional, List
-from sqlalchemy import select
+from sqlalchemy import select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 from domain.entities.chatbot import Chatbot as ChatbotEntity
-from infrastructure.postgresql.models import Chatbot as ChatbotModel
+from infrastructure.postgresql.models import Chatbot as ChatbotModel, ChatbotTool, Tool
 from infrastructure.postgresql.mappers.chatbot_mapper import ChatbotMapper
+from infrastructure.postgresql.notifications import chatbot_change_payload
 from shared.interfaces.repositories.chatbot_repository import ChatbotRepository
+from core.config import settings
 
 
 class ChatbotRepositoryImpl(ChatbotRepository):
@@ -23,7 +26,7 @@ class ChatbotRepositoryImpl(ChatbotRepository):
         self.mapper = ChatbotMapper
 
     async def find_by_id(self, id: int) -> Optional[ChatbotEntity]:
-        """Find chatbot by ID."""
+        """Find chatbot by ID, with the names of its active tools."""
         # Convert string ID to int for ORM query
         try:
             chatbot_id = int(id) if id.isdigit() else int(id.replace('-', '')[:8], 16) % 2147483647
@@ -34,7 +37,18 @@ class ChatbotRepositoryImpl(ChatbotRepository):
             select(ChatbotModel).where(ChatbotModel.id == chatbot_id)
         )
         model = result.scalar_one_or_none()
-        return self.mapper.to_entity(model) if model else None
+        if model is None:
+            return None
+        return self.mapper.to_entity(model, tools=await self._tool_names(model.id))
+
+    async def _tool_names(self, chatbot_id: int) -> List[str]:
+        result = await self.session.execute(
+            select(Tool.name)
+            .join(ChatbotTool, ChatbotTool.tool_id == Tool.id)
+            .where(ChatbotTool.chatbot_id == chatbot_id, Tool.status == "active")
+            .order_by(Tool.id)
+        )
+        return list(result.scalars().all())
 
     async def find_all(self, skip: int = 0, limit: int = 100) -> List[ChatbotEntity]:
         """Find all chatbots with pagination."""
@@ -112,4 +126,11 @@ class ChatbotRepositoryImpl(ChatbotRepository):
             select(ChatbotModel).where(ChatbotModel.created_by == int(workspace_id)).offset(skip).limit(limit)
         )
         models = result.scalars().all()
-        return [self.mapper.to_entity(model) for model in models]
\ No newline at end of file
+        return [self.mapper.to_entity(model) for model in models]
+
+    async def publish_change(self, id: str, version: Optional[datetime] = None) -> None:
+        """Notify listeners of a chatbot change; delivered when the transaction commits."""
+        await self.session.execute(
+            text("SELECT pg_notify(:channel, :payload)"),
+            {"channel": settings.CHATBOT_CONFIG_NOTIFY_CHANNEL, "payload": chatbot_change_payload(id, version)}
+        )
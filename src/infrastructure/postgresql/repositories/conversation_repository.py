@@ -4,8 +4,9 @@ Conversation repository implementation.
 Implements conversation and message data access using SQLAlchemy.
 """
 
-from typing import Optional, List
-from sqlalchemy import select, desc
+from datetime import datetime
+from typing import Any, Dict, Optional, List
+from sqlalchemy import select, desc, func
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 from infrastructure.postgresql.models import Conversation, Message
@@ -158,3 +159,45 @@ class MessageRepositoryImpl(MessageRepository):
             .order_by(Message.created_at)
         )
         return list(result.scalars().all())
+
+    async def find_recent_by_conversation(self, conversation_id: int, limit: int) -> List[Message]:
+        """Find the latest messages in a conversation, oldest first."""
+        result = await self.session.execute(
+            select(Message)
+            .where(Message.conversation_id == conversation_id)
+            .order_by(desc(Message.created_at), desc(Message.id))
+            .limit(limit)
+        )
+        return list(reversed(result.scalars().all()))
+
+    async def aggregate_usage(self, group_by: str, since: Optional[datetime] = None) -> List[Dict[str, Any]]:
+        """Aggregate LLM usage of assistant messages per provider, chatbot or user."""
+        group_columns = {
+            "provider": [Message.provider, Message.model_id],
+            "chatbot": [Conversation.chatbot_id],
+            "user": [Conversation.user_id],
+        }
+        if group_by not in group_columns:
+            raise ValueError(f"Unsupported usage grouping: {group_by}")
+        columns = group_columns[group_by]
+
+        query = (
+            select(
+                *columns,
+                func.count(Message.id).label("messages"),
+                func.coalesce(func.sum(Message.input_tokens), 0).label("input_tokens"),
+                func.coalesce(func.sum(Message.output_tokens), 0).label("output_tokens"),
+                func.avg(Message.latency_ms).label("avg_latency_ms"),
+                func.percentile_cont(0.95).within_group(Message.latency_ms).label("p95_latency_ms"),
+                func.avg(Message.time_to_first_token_ms).label("avg_time_to_first_token_ms"),
+            )
+            .join(Conversation, Conversation.id == Message.conversation_id)
+            .where(Message.role == "assistant", Message.provider.is_not(None))
+            .group_by(*columns)
+            .order_by(desc("output_tokens"))
+        )
+        if since is not None:
+            query = query.where(Message.created_at >= since)
+
+        result = await self.session.execute(query)
+        return [dict(row._mapping) for row in result]
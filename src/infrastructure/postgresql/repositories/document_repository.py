@@ -1,10 +1,13 @@
 from typing import List, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, delete
+from sqlalchemy import select, delete, text
 from shared.interfaces.repositories.document_repository import DocumentRepository
 from domain.entities.document import Document
 from domain.value_objects.uuid_vo import UUID
 from infrastructure.postgresql.models.document_model import DocumentModel
+from infrastructure.cache.retrieval_cache import get_retrieval_cache
+from infrastructure.postgresql.notifications import knowledge_base_change_payload
+from core.config import settings
 from datetime import datetime
 
 class DocumentRepositoryImpl(DocumentRepository):
@@ -76,6 +79,20 @@ class DocumentRepositoryImpl(DocumentRepository):
         await self._session.commit()
         return result.rowcount > 0
     
+    async def create(self, document: Document) -> Document:
+        """Create new document record."""
+        return await self.save(document)
+    
+    async def find_by_user_and_domain(
+        self, user_id: str, domain: str, skip: int = 0, limit: int = 100
+    ) -> List[Document]:
+        """Find documents by user and domain."""
+        return await self.find_by_user_id(user_id, domain, skip, limit)
+    
+    async def delete(self, document_id: str) -> bool:
+        """Delete document record."""
+        return await self.delete_by_id(document_id)
+    
     async def update_status(
         self, 
         document_id: str, 
@@ -96,9 +113,30 @@ class DocumentRepositoryImpl(DocumentRepository):
                 doc_model.processed_at = datetime.utcnow()
         if error_message is not None:
             doc_model.error_message = error_message
+
+        knowledge_base_id = None
+        if processing_status == "completed":
+            # Ingestion finished and the content is searchable: cached
+            # retrievals of the document's knowledge base are outdated
+            from infrastructure.ai_services.services.knowledge_base import knowledge_base_id_for_domain
+            knowledge_base_id = knowledge_base_id_for_domain(doc_model.domain)
+            if knowledge_base_id:
+                await self.publish_knowledge_base_change(knowledge_base_id)
         
         await self._session.commit()
+
+        if knowledge_base_id and settings.RAG_CACHE_ENABLED:
+            # Listeners in other workers get the notification; this process
+            # may not be listening (e.g. on Lambda)
+            get_retrieval_cache().invalidate_knowledge_base(knowledge_base_id)
         return True
+
+    async def publish_knowledge_base_change(self, knowledge_base_id: str) -> None:
+        """Notify listeners that a knowledge base's content changed; delivered when the transaction commits."""
+        await self._session.execute(
+            text("SELECT pg_notify(:channel, :payload)"),
+            {"channel": settings.KNOWLEDGE_BASE_NOTIFY_CHANNEL, "payload": knowledge_base_change_payload(knowledge_base_id)}
+        )
     
     def _to_domain(self, doc_model: DocumentModel) -> Document:
         """Convert database model to domain entity."""
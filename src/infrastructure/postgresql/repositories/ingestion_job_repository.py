@@ -1,30 +1,182 @@
 """
 PostgreSQL implementation of IngestionJobRepository.
 """
-from typing import List, Optional
+import json
+from datetime import datetime
+from typing import Any, List, Optional, Set
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
 from domain.entities.ingestion_job import IngestionJob
+from domain.entities.batch_inference import BatchInferenceResult
+from infrastructure.postgresql.models.ingestion_job_model import BatchInferenceResultModel, IngestionJobModel
 from shared.interfaces.repositories.ingestion_job_repository import IngestionJobRepository
+from shared.interfaces.repositories.batch_inference_result_repository import BatchInferenceResultRepository
+
+# Statuses after which a job no longer changes
+FINAL_STATUSES = ("completed", "failed")
+
 
 class IngestionJobRepositoryImpl(IngestionJobRepository):
-    def __init__(self, session):
+    """
+    Ingestion job repository with PostgreSQL.
+
+    Jobs outlive the request that started them, so every write is committed
+    at once; a job's details double as its progress checkpoint.
+    """
+
+    def __init__(self, session: AsyncSession):
         self.session = session
 
     async def create(self, job: IngestionJob) -> IngestionJob:
-        # Implement SQLAlchemy insert logic here
-        pass
+        model = IngestionJobModel(
+            provider=job.provider,
+            status=job.status,
+            source=job.source,
+            user_id=job.user_id,
+            details=json.dumps(job.details) if job.details is not None else None,
+            error_message=job.error_message
+        )
+        self.session.add(model)
+        await self.session.commit()
+        return self._to_domain(model)
 
     async def find_by_id(self, id: int) -> Optional[IngestionJob]:
-        # Implement SQLAlchemy select by id
-        pass
+        model = await self.session.get(IngestionJobModel, id)
+        return self._to_domain(model) if model else None
 
     async def find_by_user(self, user_id: int) -> List[IngestionJob]:
-        # Implement SQLAlchemy select by user_id
-        pass
+        result = await self.session.execute(
+            select(IngestionJobModel)
+            .where(IngestionJobModel.user_id == user_id)
+            .order_by(IngestionJobModel.created_at.desc())
+        )
+        return [self._to_domain(model) for model in result.scalars().all()]
 
     async def update_status(self, id: int, status: str, error_message: str = None) -> bool:
-        # Implement SQLAlchemy update status
-        pass
+        values = {"status": status, **self._timestamps(status)}
+        if error_message is not None:
+            values["error_message"] = error_message
+        result = await self.session.execute(
+            update(IngestionJobModel).where(IngestionJobModel.id == id).values(**values)
+        )
+        await self.session.commit()
+        return result.rowcount > 0
+
+    async def update_details(self, id: int, details: Any, status: str = None) -> bool:
+        values = {"details": json.dumps(details)}
+        if status is not None:
+            values.update(status=status, **self._timestamps(status))
+        result = await self.session.execute(
+            update(IngestionJobModel).where(IngestionJobModel.id == id).values(**values)
+        )
+        await self.session.commit()
+        return result.rowcount > 0
+
+    async def count_by_status(self, provider: str, statuses: List[str]) -> int:
+        result = await self.session.execute(
+            select(func.count(IngestionJobModel.id)).where(
+                IngestionJobModel.provider == provider,
+                IngestionJobModel.status.in_(statuses)
+            )
+        )
+        return result.scalar_one()
+
+    async def find_by_status(self, provider: str, statuses: List[str]) -> List[IngestionJob]:
+        result = await self.session.execute(
+            select(IngestionJobModel)
+            .where(IngestionJobModel.provider == provider, IngestionJobModel.status.in_(statuses))
+            .order_by(IngestionJobModel.created_at)
+        )
+        return [self._to_domain(model) for model in result.scalars().all()]
 
     async def delete(self, id: int) -> bool:
-        # Implement SQLAlchemy delete by id
-        pass
+        result = await self.session.execute(delete(IngestionJobModel).where(IngestionJobModel.id == id))
+        await self.session.commit()
+        return result.rowcount > 0
+
+    @staticmethod
+    def _timestamps(status: str) -> dict:
+        if status == "in_progress":
+            return {"started_at": datetime.utcnow()}
+        if status in FINAL_STATUSES:
+            return {"finished_at": datetime.utcnow()}
+        return {}
+
+    @staticmethod
+    def _to_domain(model: IngestionJobModel) -> IngestionJob:
+        return IngestionJob(
+            id=model.id,
+            provider=model.provider,
+            status=model.status,
+            source=model.source,
+            user_id=model.user_id,
+            started_at=model.started_at,
+            finished_at=model.finished_at,
+            details=json.loads(model.details) if model.details else None,
+            error_message=model.error_message
+        )
+
+
+class BatchInferenceResultRepositoryImpl(BatchInferenceResultRepository):
+    """Batch inference result repository with PostgreSQL."""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def save_all(self, results: List[BatchInferenceResult]) -> int:
+        if not results:
+            return 0
+        # Re-ingesting after an interruption must not duplicate rows
+        statement = insert(BatchInferenceResultModel).values([
+            {
+                "job_id": result.job_id,
+                "record_id": result.record_id,
+                "status": result.status,
+                "output": result.output,
+                "error_message": result.error_message,
+                "input_tokens": result.input_tokens,
+                "output_tokens": result.output_tokens
+            }
+            for result in results
+        ]).on_conflict_do_nothing(index_elements=["job_id", "record_id"])
+        outcome = await self.session.execute(statement)
+        await self.session.commit()
+        return outcome.rowcount
+
+    async def find_record_ids(self, job_id: int) -> Set[str]:
+        result = await self.session.execute(
+            select(BatchInferenceResultModel.record_id).where(BatchInferenceResultModel.job_id == job_id)
+        )
+        return set(result.scalars().all())
+
+    async def find_by_job(self, job_id: int, skip: int = 0, limit: int = 100) -> List[BatchInferenceResult]:
+        result = await self.session.execute(
+            select(BatchInferenceResultModel)
+            .where(BatchInferenceResultModel.job_id == job_id)
+            .order_by(BatchInferenceResultModel.id)
+            .offset(skip)
+            .limit(limit)
+        )
+        return [
+            BatchInferenceResult(
+                job_id=model.job_id,
+                record_id=model.record_id,
+                status=model.status,
+                output=model.output,
+                error_message=model.error_message,
+                input_tokens=model.input_tokens,
+                output_tokens=model.output_tokens,
+                created_at=model.created_at
+            )
+            for model in result.scalars().all()
+        ]
+
+    async def count_by_status(self, job_id: int, status: str) -> int:
+        result = await self.session.execute(
+            select(func.count(BatchInferenceResultModel.id)).where(
+                BatchInferenceResultModel.job_id == job_id,
+                BatchInferenceResultModel.status == status
+            )
+        )
+        return result.scalar_one()
@@ -0,0 +1,28 @@
+"""
+Rate limiting infrastructure.
+"""
+
+from .base import BaseRateLimitBackend, RateLimitResult
+from .memory import InMemoryRateLimitBackend
+from .redis_store import RedisRateLimitBackend
+from .fake_redis import FakeRedis
+from .limiter import (
+    RateLimiter,
+    RateLimitPolicy,
+    close_rate_limiter,
+    create_rate_limit_backend,
+    get_rate_limiter,
+)
+
+__all__ = [
+    "BaseRateLimitBackend",
+    "RateLimitResult",
+    "InMemoryRateLimitBackend",
+    "RedisRateLimitBackend",
+    "FakeRedis",
+    "RateLimiter",
+    "RateLimitPolicy",
+    "create_rate_limit_backend",
+    "get_rate_limiter",
+    "close_rate_limiter"
+]
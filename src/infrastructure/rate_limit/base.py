@@ -0,0 +1,94 @@
+"""
+Rate limiting primitives shared by all backends.
+
+Backends implement GCRA (Generic Cell Rate Algorithm), which stores a single
+"theoretical arrival time" per key, so memory is O(1) per limited identity.
+"""
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+import math
+
+
+@dataclass
+class RateLimitResult:
+    """
+    Outcome of a rate limit check.
+
+    Attributes:
+        allowed: Whether the request may proceed
+        limit: Maximum requests per window
+        remaining: Requests left in the current window
+        retry_after: Seconds until the next request would be allowed
+        reset_after: Seconds until the key is fully replenished
+    """
+
+    allowed: bool
+    limit: int
+    remaining: int
+    retry_after: float = 0.0
+    reset_after: float = 0.0
+
+
+def gcra_step(tat: float, now: float, limit: int, window_seconds: float):
+    """
+    Apply one GCRA step.
+
+    Args:
+        tat: Stored theoretical arrival time (0 if unknown)
+        now: Current time in seconds
+        limit: Maximum requests per window
+        window_seconds: Window length in seconds
+
+    Returns:
+        Tuple of (new_tat or None when denied, RateLimitResult)
+    """
+    emission_interval = window_seconds / limit
+    tat = max(tat, now)
+    new_tat = tat + emission_interval
+    allow_at = new_tat - window_seconds
+
+    if now < allow_at:
+        return None, RateLimitResult(
+            allowed=False,
+            limit=limit,
+            remaining=0,
+            retry_after=allow_at - now,
+            reset_after=tat - now
+        )
+
+    remaining = int(math.floor((now - allow_at) / emission_interval + 1e-9))
+    return new_tat, RateLimitResult(
+        allowed=True,
+        limit=limit,
+        remaining=min(remaining, limit - 1),
+        reset_after=new_tat - now
+    )
+
+
+class BaseRateLimitBackend(ABC):
+    """Abstract storage backend for rate limit state."""
+
+    @abstractmethod
+    async def hit(self, key: str, limit: int, window_seconds: float) -> RateLimitResult:
+        """
+        Record one request for key and decide whether it is allowed.
+
+        Args:
+            key: Limited identity (user, IP, route class...)
+            limit: Maximum requests per window
+            window_seconds: Window length in seconds
+
+        Returns:
+            RateLimitResult: Decision and quota information
+        """
+        pass
+
+    @abstractmethod
+    async def reset(self, key: str) -> None:
+        """Clear state for key."""
+        pass
+
+    async def close(self) -> None:
+        """Release backend resources."""
+        pass
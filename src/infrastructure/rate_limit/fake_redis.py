@@ -0,0 +1,107 @@
+"""
+In-process stand-in for the asyncio Redis client.
+
+Implements the subset of the redis-py ``redis.asyncio.Redis`` API used by this
+application so Redis-backed components can run in local tests without a
+server. Lua is not interpreted: modules that use ``eval`` register a Python
+equivalent of their script with ``FakeRedis.register_script_handler``.
+"""
+
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+ScriptHandler = Callable[["FakeRedis", List[str], List[Any]], Any]
+
+
+class FakeRedis:
+    """Minimal async Redis stand-in with key expiry."""
+
+    _script_handlers: Dict[str, ScriptHandler] = {}
+
+    def __init__(self, clock: Callable[[], float] = time.time):
+        self._data: Dict[str, Tuple[Any, Optional[float]]] = {}
+        self._clock = clock
+
+    @classmethod
+    def register_script_handler(cls, script: str, handler: ScriptHandler) -> None:
+        """Register the Python equivalent of a Lua script."""
+        cls._script_handlers[script] = handler
+
+    def now(self) -> float:
+        """Current server time in seconds (mirrors Redis TIME)."""
+        return self._clock()
+
+    async def ping(self) -> bool:
+        return True
+
+    async def get(self, name: str) -> Optional[bytes]:
+        value = self._get(name)
+        return None if value is None else str(value).encode()
+
+    async def set(
+        self,
+        name: str,
+        value: Any,
+        ex: Optional[float] = None,
+        px: Optional[float] = None,
+        nx: bool = False
+    ) -> Optional[bool]:
+        if nx and self._get(name) is not None:
+            return None
+        self._set(name, value, ex=ex, px=px)
+        return True
+
+    async def delete(self, *names: str) -> int:
+        removed = 0
+        for name in names:
+            if self._get(name) is not None:
+                del self._data[name]
+                removed += 1
+        return removed
+
+    async def incr(self, name: str, amount: int = 1) -> int:
+        value = int(self._get(name) or 0) + amount
+        expires_at = self._data.get(name, (None, None))[1]
+        self._data[name] = (value, expires_at)
+        return value
+
+    async def expire(self, name: str, seconds: float) -> bool:
+        value = self._get(name)
+        if value is None:
+            return False
+        self._data[name] = (value, self.now() + seconds)
+        return True
+
+    async def eval(self, script: str, numkeys: int, *keys_and_args: Any) -> Any:
+        handler = self._script_handlers.get(script)
+        if handler is None:
+            raise NotImplementedError("Script not registered with FakeRedis")
+        keys = [str(k) for k in keys_and_args[:numkeys]]
+        args = list(keys_and_args[numkeys:])
+        return handler(self, keys, args)
+
+    async def close(self) -> None:
+        self._data.clear()
+
+    async def aclose(self) -> None:
+        await self.close()
+
+    # Synchronous helpers for script handlers
+    def _get(self, name: str) -> Any:
+        entry = self._data.get(name)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at is not None and expires_at <= self.now():
+            del self._data[name]
+            return None
+        return value
+
+    def _set(self, name: str, value: Any, ex: Optional[float] = None, px: Optional[float] = None) -> None:
+        expires_at = None
+        if ex is not None:
+            expires_at = self.now() + ex
+        elif px is not None:
+            expires_at = self.now() + px / 1000
+        self._data[name] = (value, expires_at)
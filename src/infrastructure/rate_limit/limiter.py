@@ -0,0 +1,123 @@
+"""
+Rate limiter with per-route-class policies.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Optional
+from core.config import settings
+from core.logger import logger
+from .base import BaseRateLimitBackend, RateLimitResult
+from .memory import InMemoryRateLimitBackend
+
+
+@dataclass(frozen=True)
+class RateLimitPolicy:
+    """Request budget for one route class."""
+
+    limit: int
+    window_seconds: int
+
+
+class RateLimiter:
+    """
+    Applies named rate limit policies on top of a storage backend.
+
+    Route classes group endpoints by cost: ``auth`` (bcrypt), ``chat`` (LLM),
+    ``upload`` (S3) and ``api`` for everything else. ``ip`` is the global
+    per-client budget applied to every request.
+    """
+
+    def __init__(
+        self,
+        backend: BaseRateLimitBackend,
+        policies: Optional[Dict[str, RateLimitPolicy]] = None
+    ):
+        self.backend = backend
+        self.policies = policies or self.default_policies()
+
+    @staticmethod
+    def default_policies() -> Dict[str, RateLimitPolicy]:
+        """Build policies from settings."""
+        window = settings.RATE_LIMIT_WINDOW_SECONDS
+        return {
+            "ip": RateLimitPolicy(settings.RATE_LIMIT_PER_IP, window),
+            "api": RateLimitPolicy(settings.RATE_LIMIT_PER_USER, window),
+            "auth": RateLimitPolicy(settings.RATE_LIMIT_AUTH_PER_IDENTITY, window),
+            "chat": RateLimitPolicy(settings.RATE_LIMIT_CHAT_PER_USER, window),
+            "upload": RateLimitPolicy(settings.RATE_LIMIT_UPLOAD_PER_USER, window),
+        }
+
+    async def hit(self, route_class: str, identity: str) -> RateLimitResult:
+        """
+        Record a request for identity under a route class policy.
+
+        Args:
+            route_class: Policy name (ip, api, auth, chat, upload)
+            identity: Limited identity, e.g. "user:42" or "ip:10.0.0.1"
+
+        Returns:
+            RateLimitResult: Decision and quota information
+        """
+        policy = self.policies.get(route_class) or self.policies["api"]
+        result = await self.backend.hit(
+            f"{route_class}:{identity}", policy.limit, policy.window_seconds
+        )
+        if not result.allowed:
+            logger.warning(
+                f"Rate limit exceeded: class={route_class} identity={identity} "
+                f"retry_after={result.retry_after:.1f}s"
+            )
+        return result
+
+    def get_policy(self, route_class: str) -> RateLimitPolicy:
+        """Get policy for route class."""
+        return self.policies.get(route_class) or self.policies["api"]
+
+    async def close(self) -> None:
+        """Release backend resources."""
+        await self.backend.close()
+
+
+def create_rate_limit_backend(backend: Optional[str] = None) -> BaseRateLimitBackend:
+    """
+    Create rate limit backend from settings.
+
+    Args:
+        backend: Backend name ('memory', 'redis', 'fake_redis')
+
+    Returns:
+        BaseRateLimitBackend: Backend instance
+    """
+    backend = backend or settings.RATE_LIMIT_BACKEND
+
+    if backend == "memory":
+        return InMemoryRateLimitBackend()
+    elif backend == "redis":
+        from .redis_store import RedisRateLimitBackend
+        return RedisRateLimitBackend.from_url(settings.REDIS_URL)
+    elif backend == "fake_redis":
+        from .redis_store import RedisRateLimitBackend
+        from .fake_redis import FakeRedis
+        return RedisRateLimitBackend(FakeRedis())
+    else:
+        raise ValueError(f"Unsupported rate limit backend: {backend}")
+
+
+# Singleton instance
+_rate_limiter = None
+
+
+def get_rate_limiter() -> RateLimiter:
+    """Get singleton rate limiter instance."""
+    global _rate_limiter
+    if _rate_limiter is None:
+        _rate_limiter = RateLimiter(create_rate_limit_backend())
+    return _rate_limiter
+
+
+async def close_rate_limiter() -> None:
+    """Close the singleton rate limiter if it was created."""
+    global _rate_limiter
+    if _rate_limiter is not None:
+        await _rate_limiter.close()
+        _rate_limiter = None
@@ -0,0 +1,41 @@
+"""
+In-process rate limit backend.
+"""
+
+import time
+from typing import Dict
+from .base import BaseRateLimitBackend, RateLimitResult, gcra_step
+
+
+class InMemoryRateLimitBackend(BaseRateLimitBackend):
+    """
+    GCRA backend keeping one timestamp per key in process memory.
+
+    Limits are enforced per worker; use the Redis backend to share them
+    across workers and Lambda containers.
+    """
+
+    def __init__(self, max_keys: int = 100_000, clock=time.monotonic):
+        self._tats: Dict[str, float] = {}
+        self._max_keys = max_keys
+        self._clock = clock
+
+    async def hit(self, key: str, limit: int, window_seconds: float) -> RateLimitResult:
+        """Record one request for key using GCRA."""
+        now = self._clock()
+        new_tat, result = gcra_step(self._tats.get(key, 0.0), now, limit, window_seconds)
+        if new_tat is not None:
+            self._tats[key] = new_tat
+            if len(self._tats) > self._max_keys:
+                self._purge(now)
+        return result
+
+    async def reset(self, key: str) -> None:
+        """Clear state for key."""
+        self._tats.pop(key, None)
+
+    def _purge(self, now: float) -> None:
+        """Drop keys whose theoretical arrival time has passed."""
+        expired = [key for key, tat in self._tats.items() if tat <= now]
+        for key in expired:
+            del self._tats[key]
@@ -0,0 +1,88 @@
+"""
+Redis rate limit backend shared across workers and Lambda containers.
+"""
+
+from typing import Any, List
+from .base import BaseRateLimitBackend, RateLimitResult, gcra_step
+from .fake_redis import FakeRedis
+
+
+# GCRA executed atomically on the server, using the Redis clock so that
+# workers with skewed clocks agree. Floats are returned as strings because
+# Redis truncates Lua numbers to integers.
+GCRA_SCRIPT = """
+local limit = tonumber(ARGV[1])
+local window_ms = tonumber(ARGV[2])
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000 + tonumber(t[2]) / 1000
+local interval = window_ms / limit
+local tat = tonumber(redis.call('GET', KEYS[1]) or now)
+if tat < now then tat = now end
+local new_tat = tat + interval
+local allow_at = new_tat - window_ms
+if now < allow_at then
+  return {0, 0, tostring(allow_at - now), tostring(tat - now)}
+end
+redis.call('SET', KEYS[1], tostring(new_tat), 'PX', math.ceil(new_tat - now))
+local remaining = math.floor((now - allow_at) / interval)
+return {1, remaining, '0', tostring(new_tat - now)}
+"""
+
+
+def _gcra_script_handler(fake: FakeRedis, keys: List[str], args: List[Any]) -> list:
+    """Python equivalent of GCRA_SCRIPT for FakeRedis."""
+    limit, window_ms = int(args[0]), float(args[1])
+    now_ms = fake.now() * 1000
+    tat = float(fake._get(keys[0]) or 0.0)
+    new_tat, result = gcra_step(tat, now_ms, limit, window_ms)
+    if new_tat is None:
+        return [0, 0, str(result.retry_after), str(result.reset_after)]
+    fake._set(keys[0], new_tat, px=new_tat - now_ms)
+    return [1, result.remaining, "0", str(result.reset_after)]
+
+
+FakeRedis.register_script_handler(GCRA_SCRIPT, _gcra_script_handler)
+
+
+class RedisRateLimitBackend(BaseRateLimitBackend):
+    """GCRA backend storing one timestamp per key in Redis."""
+
+    def __init__(self, client: Any, key_prefix: str = "ratelimit:"):
+        """
+        Initialize Redis backend.
+
+        Args:
+            client: redis.asyncio.Redis compatible client (or FakeRedis)
+            key_prefix: Namespace for rate limit keys
+        """
+        self.client = client
+        self.key_prefix = key_prefix
+
+    @classmethod
+    def from_url(cls, url: str, **kwargs) -> "RedisRateLimitBackend":
+        """Create backend from a redis:// URL (requires the redis package)."""
+        import redis.asyncio as redis
+
+        return cls(redis.from_url(url), **kwargs)
+
+    async def hit(self, key: str, limit: int, window_seconds: float) -> RateLimitResult:
+        """Record one request for key using the server-side GCRA script."""
+        allowed, remaining, retry_after_ms, reset_after_ms = await self.client.eval(
+            GCRA_SCRIPT, 1, f"{self.key_prefix}{key}", limit, window_seconds * 1000
+        )
+        return RateLimitResult(
+            allowed=bool(int(allowed)),
+            limit=limit,
+            remaining=min(int(remaining), limit - 1),
+            retry_after=float(retry_after_ms) / 1000,
+            reset_after=float(reset_after_ms) / 1000
+        )
+
+    async def reset(self, key: str) -> None:
+        """Clear state for key."""
+        await self.client.delete(f"{self.key_prefix}{key}")
+
+    async def close(self) -> None:
+        """Close the Redis connection."""
+        close = getattr(self.client, "aclose", None) or self.client.close
+        await close()
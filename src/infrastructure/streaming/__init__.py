@@ -0,0 +1,8 @@
+"""
+Streaming helpers shared by WebSocket and SSE transports.
+"""
+
+from .coalescer import coalesce_deltas
+from .sse import format_sse
+
+__all__ = ["coalesce_deltas", "format_sse"]
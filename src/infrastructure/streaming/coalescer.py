@@ -0,0 +1,96 @@
+"""
+Coalescing of small LLM token deltas into larger transport frames.
+
+Providers emit a delta every few characters; sending each one as its own
+WebSocket or SSE frame wastes round trips and per-message overhead. Deltas
+are buffered until either ``min_chars`` accumulate or ``max_delay`` seconds
+pass since the first buffered delta, whichever comes first, so throughput
+improves without adding more than ``max_delay`` of latency.
+"""
+
+import asyncio
+from typing import AsyncIterable, AsyncIterator, List, Optional
+
+
+async def coalesce_deltas(
+    source: AsyncIterable[str],
+    min_chars: int = 64,
+    max_delay: float = 0.05,
+    max_chars: int = 4096,
+) -> AsyncIterator[str]:
+    """
+    Merge text deltas into frames.
+
+    The next delta is read from ``source`` while the consumer is still
+    sending the previous frame, so slow transports do not stall generation.
+
+    Args:
+        source: Async iterable of text deltas
+        min_chars: Flush once the buffer holds at least this many characters
+        max_delay: Flush once the oldest buffered delta is this many seconds old
+        max_chars: Upper bound on frame size; larger buffers are split
+
+    Yields:
+        Coalesced text frames
+    """
+    iterator = source.__aiter__()
+    loop = asyncio.get_running_loop()
+    buffer: List[str] = []
+    size = 0
+    deadline: Optional[float] = None
+    pending: Optional[asyncio.Future] = None
+
+    async def next_delta() -> str:
+        return await iterator.__anext__()
+
+    def take() -> List[str]:
+        nonlocal buffer, size, deadline
+        text = "".join(buffer)
+        buffer, size, deadline = [], 0, None
+        return [text[i:i + max_chars] for i in range(0, len(text), max_chars)]
+
+    try:
+        while True:
+            if pending is None:
+                pending = asyncio.ensure_future(next_delta())
+
+            timeout = None if deadline is None else max(0.0, deadline - loop.time())
+            done, _ = await asyncio.wait({pending}, timeout=timeout)
+            if not done:
+                for frame in take():
+                    yield frame
+                continue
+
+            finished, pending = pending, None
+            try:
+                delta = finished.result()
+            except StopAsyncIteration:
+                break
+
+            if not delta:
+                continue
+            buffer.append(delta)
+            size += len(delta)
+            if deadline is None:
+                deadline = loop.time() + max_delay
+
+            if size >= min_chars:
+                # Start reading ahead before handing the frame to the consumer
+                pending = asyncio.ensure_future(next_delta())
+                for frame in take():
+                    yield frame
+
+        if buffer:
+            for frame in take():
+                yield frame
+    finally:
+        if pending is not None:
+            # Consumer stopped early: stop the read-ahead before closing the source
+            pending.cancel()
+            try:
+                await pending
+            except (asyncio.CancelledError, Exception):
+                pass
+        aclose = getattr(iterator, "aclose", None)
+        if aclose is not None:
+            await aclose()
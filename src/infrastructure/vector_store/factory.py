@@ -1,26 +1,38 @@
 
 import os
 import json
-from typing import Optional, Dict, Type, List
-from .providers.chromadb import ChromaDBVectorStore
-from .providers.s3_vector import S3VectorStore
+import importlib
+from typing import Optional, Dict, Type, List, Union
 from .base import BaseVectorStore
 
 class VectorStoreFactory:
     """
     Factory for creating vector store instances through abstract interface.
     Returns BaseVectorStore interface instead of concrete implementations.
+
+    Providers are registered as "module:Class" paths and imported on first
+    use, so e.g. chromadb is never loaded by a process that only uses S3.
     """
-    _providers: Dict[str, Type[BaseVectorStore]] = {
-        'chromadb': ChromaDBVectorStore,
-        's3': S3VectorStore,
+    _providers: Dict[str, Union[str, Type[BaseVectorStore]]] = {
+        'chromadb': 'infrastructure.vector_store.providers.chromadb:ChromaDBVectorStore',
+        's3': 'infrastructure.vector_store.providers.s3_vector:S3VectorStore',
     }
 
     @classmethod
-    def register_provider(cls, name: str, provider_cls: Type[BaseVectorStore]):
-        """Register a new vector store provider."""
+    def register_provider(cls, name: str, provider_cls: Union[str, Type[BaseVectorStore]]):
+        """Register a new vector store provider (class or "module:Class" path)."""
         cls._providers[name] = provider_cls
 
+    @classmethod
+    def _load_provider(cls, provider: str) -> Type[BaseVectorStore]:
+        """Resolve a provider class, importing its module on first use."""
+        provider_cls = cls._providers[provider]
+        if isinstance(provider_cls, str):
+            module_name, class_name = provider_cls.split(':')
+            provider_cls = getattr(importlib.import_module(module_name), class_name)
+            cls._providers[provider] = provider_cls
+        return provider_cls
+
     @classmethod
     def create(cls, provider: Optional[str] = None, config: Optional[dict] = None, **kwargs) -> BaseVectorStore:
         """
@@ -35,24 +47,15 @@ class VectorStoreFactory:
             BaseVectorStore: Abstract interface implementation
         """
         provider = provider or os.getenv('VECTOR_STORE_PROVIDER', 'chromadb')
-        config = config or {}
-        
-        # Load config from ENV if available
-        env_config = os.getenv('VECTOR_STORE_CONFIG')
-        if env_config:
-            try:
-                config.update(json.loads(env_config))
-            except Exception:
-                pass
-        config.update(kwargs)
+        # ENV config is the base; the argument, then kwargs, override it
+        config = {**cls._env_config(), **(config or {}), **kwargs}
 
         if provider not in cls._providers:
             raise ValueError(f"Unknown vector store provider: {provider}. Available: {list(cls._providers.keys())}")
         
-        provider_cls = cls._providers[provider]
-
         # Create instance with provider-specific configuration
         try:
+            provider_cls = cls._load_provider(provider)
             if provider == 'chromadb':
                 return provider_cls(persist_directory=config.get('persist_directory', '.chromadb'))
             elif provider == 's3':
@@ -85,11 +88,22 @@ class VectorStoreFactory:
             config['domain'] = domain
         elif provider == 'chromadb':
             # Use domain-specific directory for ChromaDB
-            base_dir = config.get('persist_directory', '.chromadb')
+            base_dir = config.get('persist_directory') or cls._env_config().get('persist_directory', '.chromadb')
             config['persist_directory'] = f"{base_dir}/{domain}"
         
         return cls.create(provider=provider, config=config)
 
+    @staticmethod
+    def _env_config() -> dict:
+        """Provider config from the VECTOR_STORE_CONFIG JSON env var, if set and valid."""
+        env_config = os.getenv('VECTOR_STORE_CONFIG')
+        if env_config:
+            try:
+                return json.loads(env_config)
+            except Exception:
+                pass
+        return {}
+
     @classmethod
     def get_available_providers(cls) -> List[str]:
         """Get list of available vector store providers."""
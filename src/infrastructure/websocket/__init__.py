@@ -0,0 +1,35 @@
+"""
+WebSocket connection registry and management API clients.
+"""
+
+from .registry import (
+    WebSocketConnection,
+    BaseConnectionRegistry,
+    InMemoryConnectionRegistry,
+    RedisConnectionRegistry,
+    create_connection_registry,
+    get_connection_registry,
+    close_connection_registry
+)
+from .management_api import (
+    BaseManagementApiClient,
+    ApiGatewayManagementClient,
+    LocalManagementApiClient,
+    get_management_client,
+    close_management_clients
+)
+
+__all__ = [
+    "WebSocketConnection",
+    "BaseConnectionRegistry",
+    "InMemoryConnectionRegistry",
+    "RedisConnectionRegistry",
+    "create_connection_registry",
+    "get_connection_registry",
+    "close_connection_registry",
+    "BaseManagementApiClient",
+    "ApiGatewayManagementClient",
+    "LocalManagementApiClient",
+    "get_management_client",
+    "close_management_clients"
+]
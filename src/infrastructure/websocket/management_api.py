@@ -0,0 +1,182 @@
+"""
+API Gateway WebSocket management API clients.
+
+Messages are pushed to connected clients with ``PostToConnection``. Clients
+are pooled per endpoint and kept for the lifetime of the process so warm
+invocations reuse the same HTTPS connections instead of re-handshaking for
+every frame.
+"""
+
+import asyncio
+import json
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional
+from core.config import settings
+from core.errors import ConnectionNotFoundError, WebSocketError
+from core.logger import logger
+
+
+class BaseManagementApiClient(ABC):
+    """Sends data to WebSocket connections."""
+
+    @abstractmethod
+    async def post_to_connection(self, connection_id: str, data: bytes) -> None:
+        """
+        Send one frame to a connection.
+
+        Raises:
+            ConnectionNotFoundError: If the client has disconnected
+            WebSocketError: If the frame could not be delivered
+        """
+        pass
+
+    @abstractmethod
+    async def delete_connection(self, connection_id: str) -> None:
+        """Close a connection from the server side."""
+        pass
+
+    async def send_json(self, connection_id: str, payload: Dict[str, Any]) -> None:
+        """Send a JSON message to a connection."""
+        await self.post_to_connection(
+            connection_id,
+            json.dumps(payload, separators=(",", ":"), default=str).encode("utf-8")
+        )
+
+    async def close(self) -> None:
+        """Release client resources."""
+        pass
+
+
+class ApiGatewayManagementClient(BaseManagementApiClient):
+    """Client for the ``apigatewaymanagementapi`` endpoint of a WebSocket stage."""
+
+    def __init__(self, endpoint_url: str, max_pool_connections: Optional[int] = None):
+        """
+        Initialize management client.
+
+        Args:
+            endpoint_url: https://{api-id}.execute-api.{region}.amazonaws.com/{stage}
+            max_pool_connections: HTTP connection pool size for the boto3 client
+        """
+        self.endpoint_url = endpoint_url
+        self.max_pool_connections = max_pool_connections or settings.WEBSOCKET_MAX_POOL_CONNECTIONS
+        self._client = None
+
+    @property
+    def client(self):
+        """Get or create the boto3 client."""
+        if self._client is None:
+            import boto3
+            from botocore.config import Config
+
+            self._client = boto3.client(
+                "apigatewaymanagementapi",
+                endpoint_url=self.endpoint_url,
+                region_name=settings.AWS_REGION,
+                config=Config(
+                    max_pool_connections=self.max_pool_connections,
+                    tcp_keepalive=True,
+                    retries={"max_attempts": 3, "mode": "standard"}
+                )
+            )
+        return self._client
+
+    async def close(self) -> None:
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
+    async def post_to_connection(self, connection_id: str, data: bytes) -> None:
+        from botocore.exceptions import ClientError
+
+        try:
+            await asyncio.to_thread(self.client.post_to_connection, ConnectionId=connection_id, Data=data)
+        except ClientError as e:
+            error_code = e.response["Error"]["Code"]
+            if error_code == "GoneException":
+                raise ConnectionNotFoundError(connection_id)
+            logger.error(f"PostToConnection failed for {connection_id}: {error_code}")
+            raise WebSocketError(
+                message=f"Failed to send to connection: {error_code}",
+                details={"connection_id": connection_id, "error_code": error_code}
+            )
+
+    async def delete_connection(self, connection_id: str) -> None:
+        from botocore.exceptions import ClientError
+
+        try:
+            await asyncio.to_thread(self.client.delete_connection, ConnectionId=connection_id)
+        except ClientError as e:
+            if e.response["Error"]["Code"] != "GoneException":
+                raise WebSocketError(
+                    message="Failed to delete connection",
+                    details={"connection_id": connection_id}
+                )
+
+
+class LocalManagementApiClient(BaseManagementApiClient):
+    """
+    In-process stand-in for the management API.
+
+    Records every frame per connection so WebSocket flows can be exercised
+    offline. Connections marked gone raise ``ConnectionNotFoundError`` like
+    API Gateway's ``GoneException``.
+    """
+
+    def __init__(self):
+        self.frames: Dict[str, List[bytes]] = {}
+        self.gone: set = set()
+
+    async def post_to_connection(self, connection_id: str, data: bytes) -> None:
+        if connection_id in self.gone:
+            raise ConnectionNotFoundError(connection_id)
+        self.frames.setdefault(connection_id, []).append(data)
+
+    async def delete_connection(self, connection_id: str) -> None:
+        self.gone.add(connection_id)
+
+    def mark_gone(self, connection_id: str) -> None:
+        """Simulate the client disconnecting."""
+        self.gone.add(connection_id)
+
+    def get_messages(self, connection_id: str) -> List[Dict[str, Any]]:
+        """Get decoded JSON messages sent to a connection."""
+        return [json.loads(frame) for frame in self.frames.get(connection_id, [])]
+
+
+# Pooled clients, one per WebSocket stage endpoint
+_management_clients: Dict[str, BaseManagementApiClient] = {}
+
+
+def get_management_client(endpoint_url: Optional[str] = None) -> BaseManagementApiClient:
+    """
+    Get the pooled management client for an endpoint.
+
+    Args:
+        endpoint_url: Stage endpoint; defaults to ``WEBSOCKET_API_ENDPOINT``
+
+    Returns:
+        BaseManagementApiClient: Shared client instance
+    """
+    if settings.WEBSOCKET_MANAGEMENT_BACKEND == "local":
+        endpoint_url = "local"
+    else:
+        endpoint_url = settings.WEBSOCKET_API_ENDPOINT or endpoint_url
+        if not endpoint_url:
+            raise WebSocketError(message="WebSocket management endpoint is not configured")
+
+    client = _management_clients.get(endpoint_url)
+    if client is None:
+        if endpoint_url == "local":
+            client = LocalManagementApiClient()
+        else:
+            client = ApiGatewayManagementClient(endpoint_url)
+        _management_clients[endpoint_url] = client
+    return client
+
+
+async def close_management_clients() -> None:
+    """Close and forget all pooled management clients."""
+    while _management_clients:
+        _, client = _management_clients.popitem()
+        await client.close()
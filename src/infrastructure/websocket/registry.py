@@ -0,0 +1,214 @@
+"""
+WebSocket connection registry.
+
+Maps API Gateway connection IDs to the authenticated user for the lifetime of
+the connection. Entries expire after ``CONNECTION_TTL_SECONDS`` so that
+connections whose ``$disconnect`` was never delivered do not accumulate.
+"""
+
+import json
+import time
+from abc import ABC, abstractmethod
+from dataclasses import asdict, dataclass, field
+from typing import Any, Callable, Dict, Optional
+from core.config import settings
+
+
+@dataclass
+class WebSocketConnection:
+    """Registered WebSocket connection."""
+
+    connection_id: str
+    user_id: str
+    connected_at: float
+    expires_at: float
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+    def is_expired(self, now: float) -> bool:
+        """Check whether the connection has outlived its TTL."""
+        return now >= self.expires_at
+
+
+class BaseConnectionRegistry(ABC):
+    """Storage for active WebSocket connections."""
+
+    def __init__(self, ttl_seconds: int, clock: Callable[[], float] = time.time):
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+
+    def _new_connection(self, connection_id: str, user_id: str, metadata: Optional[Dict[str, Any]]) -> WebSocketConnection:
+        now = self._clock()
+        return WebSocketConnection(
+            connection_id=connection_id,
+            user_id=user_id,
+            connected_at=now,
+            expires_at=now + self.ttl_seconds,
+            metadata=metadata or {}
+        )
+
+    @abstractmethod
+    async def register(
+        self,
+        connection_id: str,
+        user_id: str,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> WebSocketConnection:
+        """Store a new connection."""
+        pass
+
+    @abstractmethod
+    async def get(self, connection_id: str) -> Optional[WebSocketConnection]:
+        """Get a connection, or None if unknown or expired."""
+        pass
+
+    @abstractmethod
+    async def remove(self, connection_id: str) -> None:
+        """Forget a connection."""
+        pass
+
+    async def close(self) -> None:
+        """Release backend resources."""
+        pass
+
+
+class InMemoryConnectionRegistry(BaseConnectionRegistry):
+    """
+    Process-local registry.
+
+    Only suitable for local development and single-process servers; on Lambda
+    the connect and message routes may run in different containers.
+    """
+
+    def __init__(self, ttl_seconds: int, clock: Callable[[], float] = time.time):
+        super().__init__(ttl_seconds, clock)
+        self._connections: Dict[str, WebSocketConnection] = {}
+
+    async def register(
+        self,
+        connection_id: str,
+        user_id: str,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> WebSocketConnection:
+        self._purge_expired()
+        connection = self._new_connection(connection_id, user_id, metadata)
+        self._connections[connection_id] = connection
+        return connection
+
+    async def get(self, connection_id: str) -> Optional[WebSocketConnection]:
+        connection = self._connections.get(connection_id)
+        if connection and connection.is_expired(self._clock()):
+            del self._connections[connection_id]
+            return None
+        return connection
+
+    async def remove(self, connection_id: str) -> None:
+        self._connections.pop(connection_id, None)
+
+    def _purge_expired(self) -> None:
+        now = self._clock()
+        expired = [cid for cid, conn in self._connections.items() if conn.is_expired(now)]
+        for connection_id in expired:
+            del self._connections[connection_id]
+
+
+class RedisConnectionRegistry(BaseConnectionRegistry):
+    """Registry shared across containers, using Redis key expiry for the TTL."""
+
+    def __init__(
+        self,
+        client: Any,
+        ttl_seconds: int,
+        key_prefix: str = "ws:conn:",
+        clock: Callable[[], float] = time.time
+    ):
+        """
+        Initialize Redis registry.
+
+        Args:
+            client: redis.asyncio.Redis compatible client (or FakeRedis)
+            ttl_seconds: Connection lifetime
+            key_prefix: Namespace for connection keys
+            clock: Time source for connection timestamps
+        """
+        super().__init__(ttl_seconds, clock)
+        self.client = client
+        self.key_prefix = key_prefix
+
+    async def register(
+        self,
+        connection_id: str,
+        user_id: str,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> WebSocketConnection:
+        connection = self._new_connection(connection_id, user_id, metadata)
+        await self.client.set(
+            f"{self.key_prefix}{connection_id}",
+            json.dumps(asdict(connection)),
+            ex=self.ttl_seconds
+        )
+        return connection
+
+    async def get(self, connection_id: str) -> Optional[WebSocketConnection]:
+        raw = await self.client.get(f"{self.key_prefix}{connection_id}")
+        if raw is None:
+            return None
+        return WebSocketConnection(**json.loads(raw))
+
+    async def remove(self, connection_id: str) -> None:
+        await self.client.delete(f"{self.key_prefix}{connection_id}")
+
+    async def close(self) -> None:
+        close = getattr(self.client, "aclose", None) or self.client.close
+        await close()
+
+
+def create_connection_registry(backend: Optional[str] = None) -> BaseConnectionRegistry:
+    """
+    Create connection registry from settings.
+
+    Args:
+        backend: Backend name ('memory', 'redis', 'fake_redis'); defaults
+            to ``redis`` on Lambda and ``memory`` elsewhere
+
+    Returns:
+        BaseConnectionRegistry: Registry instance
+
+    Raises:
+        ValueError: If the backend is unsupported, or is ``memory`` on Lambda
+    """
+    backend = backend or settings.websocket_registry_backend
+    ttl_seconds = settings.CONNECTION_TTL_SECONDS
+
+    if backend == "memory":
+        if settings.is_lambda:
+            # Each Lambda container would see only the connections it accepted
+            raise ValueError("The memory WebSocket registry is per process and cannot be used on Lambda; use redis")
+        return InMemoryConnectionRegistry(ttl_seconds)
+    elif backend == "redis":
+        import redis.asyncio as redis
+        return RedisConnectionRegistry(redis.from_url(settings.REDIS_URL), ttl_seconds)
+    elif backend == "fake_redis":
+        from infrastructure.rate_limit.fake_redis import FakeRedis
+        return RedisConnectionRegistry(FakeRedis(), ttl_seconds)
+    else:
+        raise ValueError(f"Unsupported WebSocket registry backend: {backend}")
+
+
+# Singleton instance
+_connection_registry = None
+
+
+def get_connection_registry() -> BaseConnectionRegistry:
+    """Get singleton connection registry instance."""
+    global _connection_registry
+    if _connection_registry is None:
+        _connection_registry = create_connection_registry()
+    return _connection_registry
+
+
+async def close_connection_registry() -> None:
+    """Close the singleton registry, if created."""
+    global _connection_registry
+    if _connection_registry is not None:
+        await _connection_registry.close()
+        _connection_registry = None
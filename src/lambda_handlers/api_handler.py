@@ -2,20 +2,33 @@
 AWS Lambda handler for REST API using Mangum.
 
 This handler wraps the FastAPI application for deployment on AWS Lambda with API Gateway.
+Routers, providers and their SDKs are imported on first use (see
+``settings.lazy_router_loading``) so cold starts only load the FastAPI core.
 """
 
+import time
+
+_init_start = time.perf_counter()
+
 from mangum import Mangum
 from main import app
 from core.logger import logger
+from lambda_handlers.runtime import get_loop_runner
 
 # Create Lambda handler with API Gateway event format
-handler = Mangum(
+mangum_handler = Mangum(
     app,
     lifespan="off",
     api_gateway_base_path="/prod"  # Adjust based on your API Gateway stage
 )
 
-logger.info("Lambda API handler initialized with routes:")
-for route in app.routes:
-    if hasattr(route, 'methods') and hasattr(route, 'path'):
-        logger.info(f"  {', '.join(route.methods)} {route.path}")
+runner = get_loop_runner()
+
+
+def handler(event, context):
+    """Run the ASGI app on the persistent loop shared by warm invocations."""
+    # Mangum drives the app on the current event loop; make it ours
+    runner.activate()
+    return mangum_handler(event, context)
+
+logger.info(f"Lambda API handler initialized in {(time.perf_counter() - _init_start) * 1000:.0f}ms")
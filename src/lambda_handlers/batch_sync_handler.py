@@ -0,0 +1,49 @@
+"""
+AWS Lambda handler syncing batch inference jobs.
+
+Invoked on a schedule (an EventBridge rule, e.g. every five minutes) so
+pending jobs are submitted and the results of finished jobs are stored
+without a client polling ``GET /api/v1/batch-jobs/{job_id}``.
+"""
+
+import json
+from typing import Any, Dict
+from core.logger import logger
+from lambda_handlers.runtime import get_loop_runner
+
+# One loop for the life of the container so cached clients stay usable
+runner = get_loop_runner()
+
+
+async def sync_batch_jobs() -> Dict[str, int]:
+    """
+    Sync every unfinished batch job.
+
+    Returns:
+        Dict[str, int]: Number of jobs synced by their status afterwards
+    """
+    from application.services.batch_inference_service import BatchInferenceService
+    from infrastructure.ai_services.services.batch_inference import get_batch_inference_backend
+    from infrastructure.postgresql.connection.database import db_manager
+    from infrastructure.postgresql.repositories import (
+        IngestionJobRepositoryImpl,
+        BatchInferenceResultRepositoryImpl
+    )
+
+    counts: Dict[str, int] = {}
+    async for session in db_manager.get_session():
+        service = BatchInferenceService(
+            IngestionJobRepositoryImpl(session),
+            BatchInferenceResultRepositoryImpl(session),
+            get_batch_inference_backend()
+        )
+        for job in await service.sync_active():
+            counts[job.status] = counts.get(job.status, 0) + 1
+    return counts
+
+
+def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
+    """Scheduled entry point."""
+    counts = runner.run(sync_batch_jobs())
+    logger.info(f"Synced batch jobs: {counts}")
+    return {"statusCode": 200, "body": json.dumps(counts)}
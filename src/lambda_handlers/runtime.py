@@ -0,0 +1,140 @@
+"""
+Persistent event loop for Lambda handlers.
+
+``asyncio.run`` creates and closes a loop per invocation, which invalidates
+every async client cached at module level (asyncpg pools, aiohttp/aioboto3
+sessions, Redis connections) because they are bound to the loop that created
+them. ``LoopRunner`` keeps one loop for the life of the execution environment
+so warm invocations reuse those clients, and closes them when Lambda enters
+its SHUTDOWN phase (delivered to the runtime as SIGTERM).
+"""
+
+import asyncio
+import atexit
+import inspect
+import signal
+import sys
+from typing import Awaitable, Callable, List, Optional, TypeVar, Union
+from core.logger import logger
+
+T = TypeVar("T")
+
+CleanupCallback = Callable[[], Union[None, Awaitable[None]]]
+
+
+class LoopRunner:
+    """Runs coroutines on one long-lived event loop."""
+
+    def __init__(self):
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._cleanups: List[CleanupCallback] = []
+        self._signal_installed = False
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """Get the persistent loop, creating it on first use."""
+        if self._loop is None or self._loop.is_closed():
+            self._loop = asyncio.new_event_loop()
+            logger.info("Created persistent event loop")
+        return self._loop
+
+    def activate(self) -> asyncio.AbstractEventLoop:
+        """Make the persistent loop the current loop for code using ``get_event_loop``."""
+        loop = self.loop
+        asyncio.set_event_loop(loop)
+        return loop
+
+    def run(self, coroutine: Awaitable[T]) -> T:
+        """
+        Run a coroutine to completion on the persistent loop.
+
+        Args:
+            coroutine: Awaitable to run
+
+        Returns:
+            The coroutine's result
+        """
+        return self.activate().run_until_complete(coroutine)
+
+    def register_cleanup(self, callback: CleanupCallback) -> None:
+        """
+        Register a callback to close loop-bound clients at shutdown.
+
+        Callbacks may be sync or async and run in reverse registration order.
+        """
+        if callback not in self._cleanups:
+            self._cleanups.append(callback)
+
+    def install_shutdown_handler(self) -> None:
+        """Close clients on SIGTERM (Lambda SHUTDOWN phase) and at interpreter exit."""
+        if self._signal_installed:
+            return
+        previous = signal.getsignal(signal.SIGTERM)
+
+        def on_sigterm(signum, frame):
+            logger.info("Received SIGTERM, shutting down event loop")
+            self.shutdown()
+            if callable(previous):
+                previous(signum, frame)
+            else:
+                sys.exit(0)
+
+        try:
+            signal.signal(signal.SIGTERM, on_sigterm)
+        except ValueError:
+            # Not on the main thread (e.g. under a test runner); atexit still applies
+            pass
+        atexit.register(self.shutdown)
+        self._signal_installed = True
+
+    def shutdown(self) -> None:
+        """Run cleanup callbacks, cancel leftover tasks and close the loop."""
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            return
+        if loop.is_running():
+            # SHUTDOWN is only signalled between invocations; never block inside one
+            logger.warning("Event loop still running at shutdown, skipping cleanup")
+            return
+
+        for callback in reversed(self._cleanups):
+            try:
+                result = callback()
+                if inspect.isawaitable(result):
+                    loop.run_until_complete(result)
+            except Exception as e:
+                logger.error(f"Cleanup callback {getattr(callback, '__name__', callback)} failed: {e}")
+
+        pending = [task for task in asyncio.all_tasks(loop) if not task.done()]
+        for task in pending:
+            task.cancel()
+        if pending:
+            loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+
+        loop.run_until_complete(loop.shutdown_asyncgens())
+        loop.run_until_complete(loop.shutdown_default_executor())
+        loop.close()
+        self._loop = None
+        logger.info("Persistent event loop closed")
+
+
+def close_database_connections() -> Optional[Awaitable[None]]:
+    """Dispose the database engine if this process ever created one."""
+    database = sys.modules.get("infrastructure.postgresql.connection.database")
+    if database is None:
+        return None
+    return database.db_manager.close()
+
+
+# Singleton instance
+_loop_runner = None
+
+
+def get_loop_runner() -> LoopRunner:
+    """Get singleton loop runner with SIGTERM handling installed."""
+    global _loop_runner
+    if _loop_runner is None:
+        _loop_runner = LoopRunner()
+        _loop_runner.register_cleanup(close_database_connections)
+        _loop_runner.install_shutdown_handler()
+    return _loop_runner
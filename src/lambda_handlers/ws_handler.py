@@ -5,9 +5,80 @@ Handles WebSocket connection lifecycle and message routing.
 """
 
 import json
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from core.logger import logger
 from core.config import settings
+from core.errors import AuthenticationError, ConnectionNotFoundError
+from core.deadline import RequestDeadline, request_deadline
+from infrastructure.websocket import (
+    get_connection_registry,
+    get_management_client,
+    close_connection_registry,
+    close_management_clients
+)
+from lambda_handlers.runtime import get_loop_runner
+
+# Built on first chat message and reused across warm invocations
+_chat_service = None
+
+
+def _reset_chat_service() -> None:
+    global _chat_service
+    _chat_service = None
+
+
+# One loop for the life of the container so cached clients stay usable
+runner = get_loop_runner()
+runner.register_cleanup(_reset_chat_service)
+runner.register_cleanup(close_management_clients)
+runner.register_cleanup(close_connection_registry)
+
+
+def get_management_endpoint(event: Dict[str, Any]) -> Optional[str]:
+    """Build the management API endpoint for the stage that sent the event."""
+    request_context = event.get('requestContext', {})
+    domain_name = request_context.get('domainName')
+    stage = request_context.get('stage')
+    if not domain_name or not stage:
+        return None
+    return f"https://{domain_name}/{stage}"
+
+
+def get_chat_service(event: Dict[str, Any]):
+    """Get the WebSocket chat service, creating it on first use."""
+    global _chat_service
+    if _chat_service is None:
+        from application.services.rag_service import RAGService
+        from application.services.query_rewriting import get_query_preprocessor
+        from application.services.websocket_chat_service import WebSocketChatService
+        from infrastructure.ai_services.factory import LLMFactory
+        from infrastructure.ai_services.providers.bedrock import get_bedrock_client
+        from infrastructure.ai_services.services.knowledge_base import (
+            BedrockKnowledgeBaseService,
+            resolve_domain_sources,
+        )
+        from infrastructure.ai_services.services.reranker import create_reranker
+        from infrastructure.cache.retrieval_cache import get_retrieval_cache
+        from infrastructure.cache.conversation_contexts import get_conversation_context_cache
+        from infrastructure.cache.single_flight import get_single_flight
+        from infrastructure.postgresql.conversation_history import load_recent_turns
+
+        rag_service = RAGService(
+            BedrockKnowledgeBaseService(get_bedrock_client()),
+            LLMFactory.create(),
+            domain_sources=resolve_domain_sources(),
+            retrieval_cache=get_retrieval_cache() if settings.RAG_CACHE_ENABLED else None,
+            reranker=create_reranker() if settings.RAG_RERANK_ENABLED else None,
+            conversation_contexts=get_conversation_context_cache(),
+            query_preprocessor=get_query_preprocessor() if settings.query_preprocessing_enabled else None,
+            single_flight=get_single_flight() if settings.SINGLE_FLIGHT_ENABLED else None,
+            history_loader=load_recent_turns
+        )
+        _chat_service = WebSocketChatService(
+            rag_service,
+            get_management_client(get_management_endpoint(event))
+        )
+    return _chat_service
 
 
 async def connect_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
@@ -36,14 +107,21 @@ async def connect_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]
                 'body': json.dumps({'error': 'Unauthorized'})
             }
 
-        # Validate token (implement JWT validation)
-        # from infrastructure.auth.jwt_handler import get_jwt_handler
-        # jwt_handler = get_jwt_handler()
-        # user_id = jwt_handler.get_token_subject(token)
+        from infrastructure.auth.jwt_handler import get_jwt_handler
+        jwt_handler = get_jwt_handler()
+        try:
+            jwt_handler.verify_token_type(token, "access")
+            user_id = jwt_handler.get_token_subject(token)
+        except AuthenticationError as e:
+            logger.warning(f"Connection {connection_id} rejected: {e.message}")
+            return {
+                'statusCode': 401,
+                'body': json.dumps({'error': 'Unauthorized'})
+            }
 
-        # await store_connection(connection_id, user_id)
+        await get_connection_registry().register(connection_id, user_id)
 
-        logger.info(f"WebSocket connection established: {connection_id}")
+        logger.info(f"WebSocket connection established: {connection_id} (user {user_id})")
 
         return {
             'statusCode': 200,
@@ -73,7 +151,7 @@ async def disconnect_handler(event: Dict[str, Any], context: Any) -> Dict[str, A
     logger.info(f"WebSocket disconnect request: {connection_id}")
 
     try:
-        # await remove_connection(connection_id)
+        await get_connection_registry().remove(connection_id)
 
         logger.info(f"WebSocket connection closed: {connection_id}")
 
@@ -105,29 +183,42 @@ async def message_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]
     logger.info(f"WebSocket message from: {connection_id}")
 
     try:
-        body = json.loads(event.get('body', '{}'))
+        registry = get_connection_registry()
+        connection = await registry.get(connection_id)
+        if connection is None:
+            logger.warning(f"Message from unregistered or expired connection: {connection_id}")
+            return {
+                'statusCode': 401,
+                'body': json.dumps({'error': 'Connection not registered'})
+            }
+
+        body = json.loads(event.get('body') or '{}')
         message_type = body.get('type')
-        content = body.get('content')
 
         logger.info(f"Message type: {message_type}, connection: {connection_id}")
 
         # Route message based on type
         if message_type == 'chat':
-            # Handle chat message
-            # response = await process_chat_message(connection_id, content)
-            response = {"message": "Chat processing not yet implemented"}
+            try:
+                deadline = (
+                    RequestDeadline.from_lambda_context(context, settings.STREAMING_REQUEST_TIMEOUT_SECONDS)
+                    if hasattr(context, 'get_remaining_time_in_millis')
+                    else RequestDeadline(settings.STREAMING_REQUEST_TIMEOUT_SECONDS)
+                )
+                with request_deadline(deadline):
+                    response = await get_chat_service(event).stream_chat(connection_id, body)
+            except ConnectionNotFoundError:
+                await registry.remove(connection_id)
+                response = {"status": "disconnected"}
         elif message_type == 'typing':
             # Handle typing indicator
             response = {"message": "Typing indicator received"}
         else:
             response = {"error": f"Unknown message type: {message_type}"}
 
-        # Send response back through WebSocket
-        # await send_websocket_message(connection_id, response)
-
         return {
             'statusCode': 200,
-            'body': json.dumps(response)
+            'body': json.dumps(response, default=str)
         }
 
     except Exception as e:
@@ -152,14 +243,12 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     route_key = event['requestContext']['routeKey']
     logger.info(f"WebSocket route: {route_key}")
 
-    import asyncio
-
     if route_key == '$connect':
-        return asyncio.run(connect_handler(event, context))
+        return runner.run(connect_handler(event, context))
     elif route_key == '$disconnect':
-        return asyncio.run(disconnect_handler(event, context))
+        return runner.run(disconnect_handler(event, context))
     elif route_key == '$default' or route_key == 'message':
-        return asyncio.run(message_handler(event, context))
+        return runner.run(message_handler(event, context))
     else:
         logger.warning(f"Unknown route: {route_key}")
         return {
@@ -20,6 +20,8 @@ from fastapi.exceptions import RequestValidationError
 from core.config import settings
 from core.logger import logger
 from core.errors import BaseAppException
+from api.middlewares.rate_limit_middleware import rate_limit_middleware
+from api.middlewares.deadline_middleware import DeadlineMiddleware
 import time
 
 # Create FastAPI application
@@ -31,6 +33,10 @@ app = FastAPI(
     redoc_url="/redoc" if settings.DEBUG else None,
 )
 
+# Rate Limiting Middleware (registered first so it runs inside CORS and
+# rejections still carry CORS headers)
+app.middleware("http")(rate_limit_middleware)
+
 # CORS Middleware
 app.add_middleware(
     CORSMiddleware,
@@ -66,6 +72,11 @@ async def add_process_time_header(request: Request, call_next):
     return response
 
 
+# Deadline Middleware (outermost, so the whole request runs under its budget
+# and a client disconnect is noticed regardless of inner middleware)
+app.add_middleware(DeadlineMiddleware)
+
+
 # Exception Handlers
 @app.exception_handler(BaseAppException)
 async def app_exception_handler(request: Request, exc: BaseAppException):
@@ -139,6 +150,22 @@ async def health_check():
     }
 
 
+@app.get("/health/database", tags=["Health"])
+async def database_health():
+    """
+    Database health check.
+
+    Pool metrics are in the admin capacity report, not on this public route.
+
+    Returns:
+        JSONResponse: ``{"status": "up"}``, or ``{"status": "down"}`` with 503
+    """
+    from infrastructure.postgresql.connection.database import db_manager
+    if await db_manager.ping():
+        return {"status": "up"}
+    return JSONResponse(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, content={"status": "down"})
+
+
 # Root Endpoint
 @app.get("/", tags=["Root"])
 async def root():
@@ -168,6 +195,15 @@ async def startup_event():
     # pg_client = get_postgresql_client()
     # await pg_client.create_tables()  # Create tables if they don't exist
 
+    # Resolve knowledge base IDs once rather than per request
+    from infrastructure.ai_services.services.knowledge_base import resolve_knowledge_base_ids
+    resolve_knowledge_base_ids()
+
+    # Drop cached chatbot configs changed by other workers, and retrievals of re-ingested knowledge bases
+    if settings.chatbot_config_listen_enabled:
+        from infrastructure.postgresql.notifications import get_chatbot_config_listener
+        get_chatbot_config_listener().start()
+
     logger.info("Application startup complete")
 
 
@@ -177,28 +213,48 @@ async def shutdown_event():
     """Run on application shutdown."""
     logger.info(f"{settings.APP_NAME} shutting down...")
 
+    if settings.chatbot_config_listen_enabled:
+        from infrastructure.postgresql.notifications import get_chatbot_config_listener
+        await get_chatbot_config_listener().stop()
+
     # Close database connections
-    # from infrastructure.postgresql.pg_client import get_postgresql_client
-    # pg_client = get_postgresql_client()
-    # await pg_client.close()
+    from infrastructure.postgresql.connection.database import db_manager
+    await db_manager.close()
+
+    from infrastructure.auth.password_hasher import shutdown_password_hasher
+    shutdown_password_hasher()
+
+    from infrastructure.ai_services.providers.bedrock import shutdown_bedrock_client
+    shutdown_bedrock_client()
+
+    from infrastructure.rate_limit import close_rate_limiter
+    await close_rate_limiter()
 
     logger.info("Application shutdown complete")
 
 
-# Import and include routers
-from api.routers.auth_routes import router as auth_router
-from api.routers.user_routes import router as user_router
-from api.routers.chatbot_routes import router as chatbot_router
-from api.routers.conversation_routes import router as conversation_router
-from api.routers.document_routes import router as document_router
-from api.routers.ai_routes import create_ai_routes
-
-app.include_router(auth_router, prefix="/api/v1/auth", tags=["Authentication"])
-app.include_router(user_router, prefix="/api/v1/users", tags=["Users"])
-app.include_router(chatbot_router, prefix="/api/v1/chatbots", tags=["Chatbots"])
-app.include_router(conversation_router, prefix="/api/v1/conversations", tags=["Conversations"])
-app.include_router(document_router, prefix="/api/v1", tags=["Documents"])
-app.include_router(create_ai_routes(), prefix="/api/v1", tags=["AI Services"])
+# Register routers. On Lambda they are imported on first matching request so
+# cold starts only pay for the routes actually hit.
+from api.routers.registry import RouterRegistry, RouterSpec
+
+ROUTERS = [
+    RouterSpec("api.routers.auth_routes", "router", "/api/v1/auth", ["Authentication"]),
+    RouterSpec("api.routers.user_routes", "router", "/api/v1/users", ["Users"]),
+    RouterSpec("api.routers.chatbot_routes", "router", "/api/v1/chatbots", ["Chatbots"]),
+    RouterSpec("api.routers.conversation_routes", "router", "/api/v1/conversations", ["Conversations"]),
+    RouterSpec("api.routers.admin_routes", "router", "/api/v1/admin", ["Admin"]),
+    RouterSpec("api.routers.batch_routes", "router", "/api/v1/batch-jobs", ["Batch Inference"]),
+    RouterSpec("api.routers.document_routes", "router", "/api/v1", ["Documents"],
+               match_prefix="/api/v1/documents"),
+    RouterSpec("api.routers.ai_routes", "create_ai_routes", "/api/v1", ["AI Services"],
+               match_prefix="/api/v1/ai", factory=True),
+]
+
+router_registry = RouterRegistry(app, ROUTERS)
+if settings.lazy_router_loading:
+    router_registry.enable_lazy_loading()
+else:
+    router_registry.include_all()
 
 
 if __name__ == "__main__":
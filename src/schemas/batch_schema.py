@@ -0,0 +1,50 @@
+"""Batch inference schemas."""
+
+from pydantic import BaseModel, Field
+from typing import Optional, List
+from datetime import datetime
+
+
+class BatchRecordCreate(BaseModel):
+    """One prompt of a batch job."""
+    record_id: str = Field(..., min_length=1, max_length=100)
+    prompt: str = Field(..., min_length=1)
+    system: Optional[str] = None
+    context: Optional[str] = None
+    max_tokens: int = Field(1000, ge=1, le=8192)
+    temperature: float = Field(0.7, ge=0.0, le=1.0)
+
+
+class BatchJobCreate(BaseModel):
+    """Batch inference job creation request."""
+    name: str = Field(..., min_length=1, max_length=255)
+    records: List[BatchRecordCreate] = Field(..., min_length=1)
+
+
+class BatchJobResponse(BaseModel):
+    """Batch inference job status and progress."""
+    id: int
+    name: str
+    status: str
+    backend: str
+    model_id: str
+    total: int
+    succeeded: int = 0
+    failed: int = 0
+    attempt: int = 1
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    error_message: Optional[str] = None
+
+
+class BatchResultResponse(BaseModel):
+    """Result of one batch record."""
+    record_id: str
+    status: str
+    output: Optional[str] = None
+    error_message: Optional[str] = None
+    input_tokens: Optional[int] = None
+    output_tokens: Optional[int] = None
+
+    class Config:
+        from_attributes = True
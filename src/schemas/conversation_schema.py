@@ -1,6 +1,7 @@
 """Conversation and message schemas."""
 
-from pydantic import BaseModel, Field
+import json
+from pydantic import BaseModel, Field, model_validator
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 
@@ -18,10 +19,35 @@ class MessageResponse(BaseModel):
     content: str
     metadata: Optional[Dict[str, Any]] = None
     created_at: datetime
+    provider: Optional[str] = None
+    model_id: Optional[str] = None
+    input_tokens: Optional[int] = None
+    output_tokens: Optional[int] = None
+    latency_ms: Optional[float] = None
+    time_to_first_token_ms: Optional[float] = None
+    tool_calls: Optional[List[Dict[str, Any]]] = None
+    tool_results: Optional[List[Dict[str, Any]]] = None
 
     class Config:
         from_attributes = True
 
+    @model_validator(mode="before")
+    @classmethod
+    def _decode_stored_message(cls, data: Any) -> Any:
+        """Read a stored message, whose metadata and tool columns hold JSON text."""
+        if isinstance(data, dict) or not hasattr(data, "message_metadata"):
+            return data
+        return {
+            **{name: getattr(data, name, None) for name in cls.model_fields},
+            "metadata": _json_or_none(data.message_metadata),
+            "tool_calls": _json_or_none(getattr(data, "tool_calls", None)),
+            "tool_results": _json_or_none(getattr(data, "tool_results", None))
+        }
+
+
+def _json_or_none(value: Optional[str]) -> Any:
+    return json.loads(value) if value else None
+
 
 class ConversationCreate(BaseModel):
     """Conversation creation request."""
@@ -49,3 +75,32 @@ class ConversationResponse(BaseModel):
 class ConversationWithMessages(ConversationResponse):
     """Conversation with messages."""
     messages: List[MessageResponse] = []
+
+
+class ReplyCreate(BaseModel):
+    """Request for an assistant reply to a new user message."""
+    content: str = Field(..., min_length=1)
+    domain: str = Field(default="general", description="Knowledge domain")
+    context_limit: int = Field(default=5, ge=1, le=20, description="Maximum contexts to retrieve")
+
+
+class UsageGroup(BaseModel):
+    """LLM usage of assistant messages in one group."""
+    provider: Optional[str] = None
+    model_id: Optional[str] = None
+    chatbot_id: Optional[int] = None
+    user_id: Optional[int] = None
+    messages: int
+    input_tokens: int
+    output_tokens: int
+    avg_latency_ms: Optional[float] = None
+    p95_latency_ms: Optional[float] = None
+    avg_time_to_first_token_ms: Optional[float] = None
+
+
+class UsageReport(BaseModel):
+    """Persisted usage per group, plus this process's live totals per model."""
+    group_by: str
+    since: Optional[datetime] = None
+    groups: List[UsageGroup]
+    process: List[Dict[str, Any]] = Field(default_factory=list)
@@ -14,6 +14,9 @@ class DocumentListResponse(BaseModel):
     documents: List[DocumentUploadResponse] = Field(..., description="List of documents")
     total: int = Field(..., description="Total document count")
 
+class DocumentProcessedRequest(BaseModel):
+    error_message: Optional[str] = Field(None, description="Set when ingestion failed")
+
 class DocumentStatusResponse(BaseModel):
     id: str = Field(..., description="Document ID")
     upload_status: str = Field(..., description="Upload status")
@@ -5,12 +5,24 @@ class QueryRequest(BaseModel):
     query: str = Field(..., min_length=1, description="Search query or question")
     domain: str = Field(default="general", description="Knowledge domain")
     context_limit: int = Field(default=5, ge=1, le=20, description="Maximum contexts to retrieve")
+    domains: Optional[List[str]] = Field(
+        default=None, min_length=1, max_length=5,
+        description="Search several domains at once; overrides domain"
+    )
+    conversation_id: Optional[str] = Field(
+        default=None, max_length=128,
+        description="Conversation this turn belongs to; enables follow-up context reuse"
+    )
 
 class ChatResponse(BaseModel):
     response: str = Field(..., description="Generated response")
     query: str = Field(..., description="Original query")
     contexts: List[Dict[str, Any]] = Field(..., description="Retrieved contexts")
     context_count: int = Field(..., description="Number of contexts used")
+    context_source: Optional[str] = Field(None, description="retrieved, previous (reused from last turn) or none")
+    usage: Optional[Dict[str, Any]] = Field(
+        None, description="Tokens, time to first token, tokens/sec and latency of the LLM calls"
+    )
 
 class SearchResponse(BaseModel):
     query: str = Field(..., description="Search query")
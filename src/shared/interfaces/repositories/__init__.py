@@ -1,5 +1,6 @@
 # Repository interfaces
 from .base_repository import BaseRepository
+from .batch_inference_result_repository import BatchInferenceResultRepository
 from .chatbot_repository import ChatbotRepository
 from .conversation_repository import ConversationRepository
 from .document_repository import DocumentRepository
@@ -10,6 +11,7 @@ from .user_repository import UserRepository
 
 __all__ = [
     'BaseRepository',
+    'BatchInferenceResultRepository',
     'ChatbotRepository', 
     'ConversationRepository',
     'DocumentRepository',
@@ -0,0 +1,25 @@
+"""
+BatchInferenceResult repository interface.
+"""
+from abc import ABC, abstractmethod
+from typing import List, Set
+from domain.entities.batch_inference import BatchInferenceResult
+
+class BatchInferenceResultRepository(ABC):
+    @abstractmethod
+    async def save_all(self, results: List[BatchInferenceResult]) -> int:
+        """Store results, ignoring records already stored for the job; returns the number stored."""
+        pass
+
+    @abstractmethod
+    async def find_record_ids(self, job_id: int) -> Set[str]:
+        """IDs of the records of a job that already have a result."""
+        pass
+
+    @abstractmethod
+    async def find_by_job(self, job_id: int, skip: int = 0, limit: int = 100) -> List[BatchInferenceResult]:
+        pass
+
+    @abstractmethod
+    async def count_by_status(self, job_id: int, status: str) -> int:
+        pass
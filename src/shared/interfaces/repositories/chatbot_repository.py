@@ -5,6 +5,7 @@ Defines the contract for chatbot data access operations.
 """
 
 from abc import abstractmethod
+from datetime import datetime
 from typing import Optional, List
 from shared.interfaces.repositories.base_repository import BaseRepository
 from domain.entities.chatbot import Chatbot
@@ -45,3 +46,14 @@ class ChatbotRepository(BaseRepository[Chatbot, str]):
             List of chatbot entities in the workspace
         """
         pass
+
+    @abstractmethod
+    async def publish_change(self, id: str, version: Optional[datetime] = None) -> None:
+        """
+        Tell other workers a chatbot changed, once the current transaction commits.
+
+        Args:
+            id: Chatbot identifier
+            version: New ``updated_at``, or None if the chatbot was deleted
+        """
+        pass
@@ -2,7 +2,7 @@
 IngestionJob repository interface.
 """
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Any, List, Optional
 from domain.entities.ingestion_job import IngestionJob
 
 class IngestionJobRepository(ABC):
@@ -22,6 +22,20 @@ class IngestionJobRepository(ABC):
     async def update_status(self, id: int, status: str, error_message: str = None) -> bool:
         pass
 
+    @abstractmethod
+    async def update_details(self, id: int, details: Any, status: str = None) -> bool:
+        """Replace a job's progress details, optionally moving it to a new status."""
+        pass
+
+    @abstractmethod
+    async def count_by_status(self, provider: str, statuses: List[str]) -> int:
+        pass
+
+    @abstractmethod
+    async def find_by_status(self, provider: str, statuses: List[str]) -> List[IngestionJob]:
+        """Jobs of a provider in any of the statuses, oldest first."""
+        pass
+
     @abstractmethod
     async def delete(self, id: int) -> bool:
         pass
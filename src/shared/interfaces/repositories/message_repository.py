@@ -5,7 +5,8 @@ Defines the contract for message data access operations.
 """
 
 from abc import abstractmethod
-from typing import List
+from datetime import datetime
+from typing import Any, Dict, List, Optional
 from shared.interfaces.repositories.base_repository import BaseRepository
 from domain.entities.message import Message
 
@@ -29,3 +30,31 @@ class MessageRepository(BaseRepository[Message, str]):
             List of message entities in chronological order
         """
         pass
+
+    @abstractmethod
+    async def find_recent_by_conversation(self, conversation_id: str, limit: int) -> List[Message]:
+        """
+        Find the most recent messages in a conversation.
+
+        Args:
+            conversation_id: Conversation identifier
+            limit: Maximum number of messages
+
+        Returns:
+            Up to ``limit`` latest message entities in chronological order
+        """
+        pass
+
+    @abstractmethod
+    async def aggregate_usage(self, group_by: str, since: Optional[datetime] = None) -> List[Dict[str, Any]]:
+        """
+        Aggregate LLM usage of assistant messages.
+
+        Args:
+            group_by: ``provider`` (provider and model), ``chatbot`` or ``user``
+            since: Only include messages created at or after this time
+
+        Returns:
+            One row per group with message count, token totals and latency
+        """
+        pass
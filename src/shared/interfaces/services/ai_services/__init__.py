@@ -1,12 +1,19 @@
 # AI service interfaces
+from .batch_inference_backend import IBatchInferenceBackend
 from .embedding_service import IEmbeddingService
 from .knowledge_base_service import IKnowledgeBaseService
 from .rag_service import IRAGService
+from .reranker import IReranker
+from .tool import ITool, ToolContext
 from .vector_store_service import IVectorStore
 
 __all__ = [
+    'IBatchInferenceBackend',
     'IEmbeddingService',
     'IKnowledgeBaseService',
     'IRAGService',
+    'IReranker',
+    'ITool',
+    'ToolContext',
     'IVectorStore'
 ]
\ No newline at end of file
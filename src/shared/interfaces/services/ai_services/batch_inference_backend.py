@@ -0,0 +1,39 @@
+from abc import ABC, abstractmethod
+from typing import Any, AsyncIterator, Dict, List
+
+
+class IBatchInferenceBackend(ABC):
+    """
+    Runs batch inference jobs over JSONL input.
+
+    Input lines are ``{"recordId", "modelInput"}`` where ``modelInput`` is a
+    Messages API request body; output lines repeat the record with either
+    ``modelOutput`` (the Messages API response) or ``error``.
+    """
+
+    name: str
+
+    @abstractmethod
+    async def stage_input(self, job_key: str, lines: List[str]) -> str:
+        """Write JSONL input lines and return their location."""
+        pass
+
+    @abstractmethod
+    async def read_input(self, location: str) -> List[str]:
+        """Read back JSONL input lines staged at a location."""
+        pass
+
+    @abstractmethod
+    async def submit(self, job_name: str, input_location: str, model_id: str) -> str:
+        """Start a job over staged input and return the backend's job ID."""
+        pass
+
+    @abstractmethod
+    async def status(self, backend_job_id: str) -> str:
+        """``in_progress``, ``completed``, ``failed``, or ``unknown`` if the backend lost the job."""
+        pass
+
+    @abstractmethod
+    def results(self, backend_job_id: str) -> AsyncIterator[Dict[str, Any]]:
+        """Output records written so far, as parsed JSONL lines."""
+        pass
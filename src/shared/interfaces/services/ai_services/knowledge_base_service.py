@@ -1,10 +1,16 @@
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 
 class IKnowledgeBaseService(ABC):
     @abstractmethod
-    async def retrieve_contexts(self, query: str, knowledge_base_id: str, top_k: int = 5) -> List[Dict[str, Any]]:
-        """Retrieve contexts from Bedrock Knowledge Base."""
+    async def retrieve_contexts(
+        self,
+        query: str,
+        knowledge_base_id: str,
+        top_k: int = 5,
+        query_embedding: Optional[List[float]] = None
+    ) -> List[Dict[str, Any]]:
+        """Retrieve contexts from Bedrock Knowledge Base; ``query_embedding`` is a precomputed query vector."""
         pass
     
     @abstractmethod
@@ -1,17 +1,54 @@
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Awaitable
 
 class IRAGService(ABC):
     """Interface for RAG (Retrieval-Augmented Generation) services."""
     
     @abstractmethod
-    async def retrieve_and_generate(self, query: str, domain: str = "general", top_k: int = 5) -> Dict[str, Any]:
-        """Retrieve relevant contexts and generate response."""
+    async def retrieve_and_generate(
+        self,
+        query: str,
+        domain: str = "general",
+        top_k: int = 5,
+        domains: Optional[List[str]] = None,
+        conversation_id: Optional[str] = None,
+        system_prompt: Optional[str] = None,
+        llm: Optional[Any] = None,
+        max_tokens: int = 1000,
+        temperature: float = 0.7,
+        tools: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Retrieve relevant contexts and generate response; ``domains`` searches several at once.
+
+        ``llm`` (a ``BaseLLMService``) overrides the service's LLM for this call;
+        ``tools`` names tools the model may call while answering.
+        """
+        pass
+    
+    @abstractmethod
+    async def retrieve_for_turn(
+        self,
+        query: str,
+        conversation_id: str,
+        domain: str = "general",
+        top_k: int = 5,
+        domains: Optional[List[str]] = None,
+        history: Optional[Awaitable[Any]] = None
+    ) -> Any:
+        """Choose contexts for a conversation turn, reusing the previous turn's when appropriate."""
         pass
     
     @abstractmethod
-    async def retrieve_contexts(self, query: str, domain: str = "general", top_k: int = 5) -> List[Dict[str, Any]]:
-        """Retrieve relevant contexts for query."""
+    def load_history(self, conversation_id: str, query: Optional[str] = None) -> Awaitable[List[Dict[str, str]]]:
+        """Load a conversation's turns before the current one, as an awaitable for ``retrieve_for_turn``."""
+        pass
+    
+    @abstractmethod
+    async def retrieve_contexts(
+        self, query: str, domain: str = "general", top_k: int = 5, domains: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """Retrieve relevant contexts for query; ``domains`` searches several at once."""
         pass
     
     @abstractmethod
@@ -38,6 +75,26 @@ class IRAGService(ABC):
         """Generate streaming response using LLM."""
         pass
     
+    @abstractmethod
+    async def generate_chat_stream(
+        self,
+        messages: List[Dict[str, str]],
+        system: Optional[str] = None,
+        context: Optional[str] = None,
+        max_tokens: int = 1000,
+        temperature: float = 0.7,
+        conversation_id: Optional[str] = None,
+        llm: Optional[Any] = None,
+        **kwargs
+    ):
+        """Stream the next assistant message; with ``conversation_id`` it is recorded as the next turn."""
+        pass
+    
+    @abstractmethod
+    def build_context_text(self, contexts: List[Dict[str, Any]], max_tokens: int = 1000) -> str:
+        """Build prompt context from retrieved contexts within the model's token budget."""
+        pass
+    
     @abstractmethod
     def get_provider_name(self) -> str:
         """Get current LLM provider name."""
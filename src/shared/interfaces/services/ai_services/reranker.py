@@ -0,0 +1,8 @@
+from abc import ABC, abstractmethod
+from typing import List, Dict, Any
+
+class IReranker(ABC):
+    @abstractmethod
+    async def rerank(self, query: str, contexts: List[Dict[str, Any]], top_k: int) -> List[Dict[str, Any]]:
+        """Score all contexts against the query in one batch and return the best top_k with ``rerank_score``."""
+        pass
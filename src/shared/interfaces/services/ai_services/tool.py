@@ -0,0 +1,53 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+
+@dataclass
+class ToolContext:
+    """
+    What the caller of a tool-use answer allows its tools to reach.
+
+    ``domains`` are the document domains the caller asked about; tools
+    searching documents stay within them.
+    """
+
+    domains: List[str] = field(default_factory=list)
+
+
+class ITool(ABC):
+    """
+    A tool the model can call.
+
+    ``name`` is the identifier stored in the ``tools`` table. Tools that
+    declare themselves ``idempotent`` (same arguments, same result, no side
+    effects) have their results cached for ``cache_ttl_seconds``; for tools
+    that ``read_knowledge_bases`` they are dropped when a knowledge base
+    changes. ``timeout_seconds`` overrides the executor's default timeout.
+    """
+
+    name: str
+    description: str
+    input_schema: Dict[str, Any]
+    idempotent: bool = False
+    cache_ttl_seconds: float = 0.0
+    reads_knowledge_bases: bool = False
+    timeout_seconds: Optional[float] = None
+
+    @abstractmethod
+    async def run(self, arguments: Dict[str, Any]) -> Any:
+        """Run the tool; returns text or a JSON-serializable value. Raises on failure."""
+        pass
+
+    def resolve_arguments(self, arguments: Dict[str, Any], context: Optional[ToolContext] = None) -> Dict[str, Any]:
+        """
+        Arguments the tool runs and is cached with, completed from the caller's context.
+
+        Raises:
+            ValueError: If the arguments reach beyond the context
+        """
+        return arguments
+
+    def to_spec(self, context: Optional[ToolContext] = None) -> Dict[str, Any]:
+        """Tool definition in Messages API format, narrowed to the caller's context."""
+        return {"name": self.name, "description": self.description, "input_schema": self.input_schema}
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import BinaryIO
+from typing import BinaryIO, Optional
 from domain.entities.document import Document
 
 class IDocumentUploadService(ABC):
@@ -14,6 +14,11 @@ class IDocumentUploadService(ABC):
         """Delete document and file."""
         pass
     
+    @abstractmethod
+    async def mark_processed(self, document_id: str, error_message: Optional[str] = None) -> bool:
+        """Record that ingestion of a document finished, or failed with ``error_message``."""
+        pass
+    
     @abstractmethod
     def validate_file(self, filename: str, content_type: str, file_size: int) -> bool:
         """Validate file before upload."""
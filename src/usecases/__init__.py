@@ -1,28 +1,33 @@
 """Application use cases package."""
 
-from usecases.auth_use_cases import LoginUseCase, RegisterUseCase
-from usecases.user_use_cases import (
-    GetCurrentUserUseCase,
-    ListUsersUseCase,
-    GetUserUseCase,
-    CreateUserUseCase,
-    UpdateUserUseCase,
-    DeleteUserUseCase
-)
-from usecases.chatbot_use_cases import (
-    ListChatbotsUseCase,
-    GetChatbotUseCase,
-    CreateChatbotUseCase,
-    UpdateChatbotUseCase,
-    DeleteChatbotUseCase
-)
-from usecases.conversation_use_cases import (
-    ListConversationsUseCase,
-    GetConversationUseCase,
-    CreateConversationUseCase,
-    CreateMessageUseCase,
-    DeleteConversationUseCase
-)
+from core.lazy_import import lazy_exports
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "LoginUseCase": "usecases.auth_use_cases",
+    "RegisterUseCase": "usecases.auth_use_cases",
+    "GetCurrentUserUseCase": "usecases.user_use_cases",
+    "ListUsersUseCase": "usecases.user_use_cases",
+    "GetUserUseCase": "usecases.user_use_cases",
+    "CreateUserUseCase": "usecases.user_use_cases",
+    "UpdateUserUseCase": "usecases.user_use_cases",
+    "DeleteUserUseCase": "usecases.user_use_cases",
+    "ListChatbotsUseCase": "usecases.chatbot_use_cases",
+    "GetChatbotUseCase": "usecases.chatbot_use_cases",
+    "CreateChatbotUseCase": "usecases.chatbot_use_cases",
+    "UpdateChatbotUseCase": "usecases.chatbot_use_cases",
+    "DeleteChatbotUseCase": "usecases.chatbot_use_cases",
+    "ListConversationsUseCase": "usecases.conversation_use_cases",
+    "GetConversationUseCase": "usecases.conversation_use_cases",
+    "CreateConversationUseCase": "usecases.conversation_use_cases",
+    "CreateMessageUseCase": "usecases.conversation_use_cases",
+    "ReplyToConversationUseCase": "usecases.conversation_use_cases",
+    "GetUsageReportUseCase": "usecases.conversation_use_cases",
+    "DeleteConversationUseCase": "usecases.conversation_use_cases",
+    "SubmitBatchJobUseCase": "usecases.batch_inference_use_cases",
+    "GetBatchJobUseCase": "usecases.batch_inference_use_cases",
+    "ListBatchJobsUseCase": "usecases.batch_inference_use_cases",
+    "ListBatchResultsUseCase": "usecases.batch_inference_use_cases",
+})
 
 __all__ = [
     "LoginUseCase",
@@ -42,5 +47,11 @@ __all__ = [
     "GetConversationUseCase",
     "CreateConversationUseCase",
     "CreateMessageUseCase",
-    "DeleteConversationUseCase"
+    "ReplyToConversationUseCase",
+    "GetUsageReportUseCase",
+    "DeleteConversationUseCase",
+    "SubmitBatchJobUseCase",
+    "GetBatchJobUseCase",
+    "ListBatchJobsUseCase",
+    "ListBatchResultsUseCase"
 ]
@@ -0,0 +1,119 @@
+"""
+Batch inference use cases.
+
+Defines application-level use cases for offline batch inference jobs.
+"""
+
+from typing import List
+from application.services.batch_inference_service import BatchInferenceService
+from domain.entities.batch_inference import BatchInferenceRecord
+from domain.entities.ingestion_job import IngestionJob
+from schemas.batch_schema import BatchJobCreate, BatchJobResponse, BatchResultResponse
+
+
+def _to_response(job: IngestionJob) -> BatchJobResponse:
+    details = job.details
+    return BatchJobResponse(
+        id=job.id,
+        name=details["name"],
+        status=job.status,
+        backend=job.provider,
+        model_id=details["model_id"],
+        total=details["total"],
+        succeeded=details.get("succeeded", 0),
+        failed=details.get("failed", 0),
+        attempt=details.get("attempt", 1),
+        started_at=job.started_at,
+        finished_at=job.finished_at,
+        error_message=job.error_message
+    )
+
+
+class SubmitBatchJobUseCase:
+    """
+    Use case for submitting a batch inference job.
+    """
+
+    def __init__(self, batch_service: BatchInferenceService):
+        self.batch_service = batch_service
+
+    async def execute(self, job_data: BatchJobCreate, user_id: int) -> BatchJobResponse:
+        """
+        Execute submit batch job use case.
+
+        Args:
+            job_data: Job name and records
+            user_id: Submitting user ID
+
+        Returns:
+            BatchJobResponse: Created job
+        """
+        records = [BatchInferenceRecord(**record.model_dump()) for record in job_data.records]
+        job = await self.batch_service.submit(records, user_id=user_id, name=job_data.name)
+        return _to_response(job)
+
+
+class GetBatchJobUseCase:
+    """
+    Use case for getting a batch job; syncs it with the backend first.
+    """
+
+    def __init__(self, batch_service: BatchInferenceService):
+        self.batch_service = batch_service
+
+    async def execute(self, job_id: int) -> BatchJobResponse:
+        """
+        Execute get batch job use case.
+
+        Args:
+            job_id: Job ID
+
+        Returns:
+            BatchJobResponse: Job status and progress
+        """
+        return _to_response(await self.batch_service.sync(job_id))
+
+
+class ListBatchJobsUseCase:
+    """
+    Use case for listing a user's batch jobs.
+    """
+
+    def __init__(self, batch_service: BatchInferenceService):
+        self.batch_service = batch_service
+
+    async def execute(self, user_id: int) -> List[BatchJobResponse]:
+        """
+        Execute list batch jobs use case.
+
+        Args:
+            user_id: User ID
+
+        Returns:
+            List[BatchJobResponse]: The user's jobs, newest first
+        """
+        return [_to_response(job) for job in await self.batch_service.list_jobs(user_id)]
+
+
+class ListBatchResultsUseCase:
+    """
+    Use case for listing the stored results of a batch job.
+    """
+
+    def __init__(self, batch_service: BatchInferenceService):
+        self.batch_service = batch_service
+
+    async def execute(self, job_id: int, skip: int = 0, limit: int = 100) -> List[BatchResultResponse]:
+        """
+        Execute list batch results use case.
+
+        Args:
+            job_id: Job ID
+            skip: Number of results to skip
+            limit: Maximum number of results to return
+
+        Returns:
+            List[BatchResultResponse]: Stored results
+        """
+        results = await self.batch_service.list_results(job_id, skip=skip, limit=limit)
+        return [BatchResultResponse.model_validate(result) for result in results]
@@ -4,15 +4,24 @@ Conversation use cases.
 Defines application-level use cases for conversation operations.
 """
 
-from typing import List
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+from application.services.chatbot_service import ChatbotService
 from application.services.conversation_service import ConversationService
+from shared.interfaces.services.ai_services.rag_service import IRAGService
 from schemas.conversation_schema import (
     ConversationCreate,
     ConversationResponse,
     ConversationWithMessages,
     MessageCreate,
-    MessageResponse
+    MessageResponse,
+    ReplyCreate,
+    UsageGroup,
+    UsageReport
 )
+from infrastructure.ai_services.provider_pool import LLMProviderPool
+from infrastructure.ai_services.providers.scheduler import llm_call_scope
+from core.telemetry import get_usage_aggregator, usage_collector
 
 
 class ListConversationsUseCase:
@@ -143,6 +152,130 @@ class CreateMessageUseCase:
         return MessageResponse.model_validate(message)
 
 
+class ReplyToConversationUseCase:
+    """
+    Use case for answering a user message with the conversation's assistant.
+
+    Stores the user message, generates the answer with RAG on the chatbot's
+    model and settings and under its system prompt (LLM calls are scheduled
+    fairly per workspace), and stores the assistant message together with
+    the LLM usage of the turn. Chatbots with function calling enabled may
+    call their tools, within the requested domain, while answering; the
+    calls and their results are stored with the message.
+    """
+
+    def __init__(
+        self,
+        conversation_service: ConversationService,
+        rag_service: IRAGService,
+        chatbot_service: ChatbotService,
+        llm_pool: Optional[LLMProviderPool] = None
+    ):
+        self.conversation_service = conversation_service
+        self.rag_service = rag_service
+        self.chatbot_service = chatbot_service
+        self.llm_pool = llm_pool
+
+    async def execute(
+        self,
+        conversation_id: int,
+        request: ReplyCreate,
+        user_id: int
+    ) -> MessageResponse:
+        """
+        Execute reply use case.
+
+        Args:
+            conversation_id: Conversation ID
+            request: User message and retrieval options
+            user_id: User ID for ownership verification
+
+        Returns:
+            MessageResponse: Assistant message with usage
+        """
+        conversation = await self.conversation_service.get_conversation_by_id(conversation_id, user_id)
+        system_prompt = None
+        tenant = f"user:{user_id}"
+        generation: Dict[str, Any] = {}
+        if conversation.chatbot_id:
+            chatbot = await self.chatbot_service.get_chatbot_config(str(conversation.chatbot_id))
+            system_prompt = chatbot.system_prompt or None
+            tenant = f"workspace:{chatbot.workspace_id}"
+            generation = {"max_tokens": chatbot.max_tokens, "temperature": float(chatbot.temperature)}
+            if self.llm_pool is not None:
+                generation["llm"] = self.llm_pool.for_chatbot(chatbot)
+            if chatbot.enable_function_calling and chatbot.tools:
+                generation["tools"] = chatbot.tools
+
+        await self.conversation_service.create_message(
+            conversation_id=conversation_id,
+            user_id=user_id,
+            content=request.content,
+            role="user"
+        )
+
+        with usage_collector() as usage, llm_call_scope(tenant):
+            result = await self.rag_service.retrieve_and_generate(
+                request.content,
+                request.domain,
+                request.context_limit,
+                conversation_id=str(conversation_id),
+                system_prompt=system_prompt,
+                **generation
+            )
+
+        metadata = {
+            "context_count": result.get("context_count", 0),
+            "context_source": result.get("context_source")
+        }
+        if "tool_rounds" in result:
+            metadata["tool_rounds"] = result["tool_rounds"]
+        summary = usage.summary()
+        if summary and len(summary["by_model"]) > 1:
+            # The message's usage columns hold the answering model; keep the rest
+            metadata["usage_by_model"] = summary["by_model"]
+        message = await self.conversation_service.create_message(
+            conversation_id=conversation_id,
+            user_id=user_id,
+            content=result["response"],
+            role="assistant",
+            usage=summary,
+            metadata=metadata,
+            tool_calls=result.get("tool_calls"),
+            tool_results=result.get("tool_results")
+        )
+        return MessageResponse.model_validate(message)
+
+
+class GetUsageReportUseCase:
+    """
+    Use case for reporting LLM usage (admin only).
+    """
+
+    def __init__(self, conversation_service: ConversationService):
+        self.conversation_service = conversation_service
+
+    async def execute(self, group_by: str = "provider", days: int = 7) -> UsageReport:
+        """
+        Execute usage report use case.
+
+        Args:
+            group_by: ``provider``, ``chatbot`` or ``user``
+            days: Number of days to report on
+
+        Returns:
+            UsageReport: Usage per group and this process's live totals
+        """
+        since = datetime.utcnow() - timedelta(days=days)
+        groups = await self.conversation_service.get_usage_report(group_by, since)
+        return UsageReport(
+            group_by=group_by,
+            since=since,
+            groups=[UsageGroup(**group) for group in groups],
+            process=get_usage_aggregator().snapshot()
+        )
+
+
 class DeleteConversationUseCase:
     """
     Use case for deleting conversation.
@@ -1,6 +1,6 @@
 from shared.interfaces.services.upload.document_upload_service import IDocumentUploadService
 from shared.interfaces.repositories.document_repository import DocumentRepository
-from typing import List
+from typing import List, Optional
 from domain.entities.document import Document
 
 class UploadDocumentUseCase:
@@ -20,6 +20,13 @@ class DeleteDocumentUseCase:
     async def execute(self, document_id: str, user_id: str) -> bool:
         return await self.document_upload_service.delete_document(document_id, user_id)
 
+class MarkDocumentProcessedUseCase:
+    def __init__(self, document_upload_service: IDocumentUploadService):
+        self.document_upload_service = document_upload_service
+    
+    async def execute(self, document_id: str, error_message: Optional[str] = None) -> bool:
+        return await self.document_upload_service.mark_processed(document_id, error_message)
+
 class ListUserDocumentsUseCase:
     def __init__(self, document_repository: DocumentRepository):
         self.document_repository = document_repository
@@ -1,26 +1,157 @@
+import time
 from shared.interfaces.services.ai_services.rag_service import IRAGService
-from typing import Dict, Any, List
+from infrastructure.streaming import coalesce_deltas
+from core.config import settings
+from core.telemetry import usage_collector
+from typing import Dict, Any, List, AsyncIterator, Optional
 
 class RetrieveContextsUseCase:
     def __init__(self, rag_service: IRAGService):
         self.rag_service = rag_service
     
-    async def execute(self, query: str, domain: str = "general", top_k: int = 5) -> List[Dict[str, Any]]:
-        return await self.rag_service.retrieve_contexts(query, domain, top_k)
+    async def execute(
+        self, query: str, domain: str = "general", top_k: int = 5, domains: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
+        return await self.rag_service.retrieve_contexts(query, domain, top_k, domains=domains)
 
 class ChatWithDocumentsUseCase:
     def __init__(self, rag_service: IRAGService):
         self.rag_service = rag_service
     
-    async def execute(self, query: str, domain: str = "general", context_limit: int = 5) -> Dict[str, Any]:
-        return await self.rag_service.retrieve_and_generate(query, domain, context_limit)
+    async def execute(
+        self,
+        query: str,
+        domain: str = "general",
+        context_limit: int = 5,
+        domains: Optional[List[str]] = None,
+        conversation_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        with usage_collector() as usage:
+            result = await self.rag_service.retrieve_and_generate(
+                query, domain, context_limit, domains=domains, conversation_id=conversation_id
+            )
+        return {**result, "usage": usage.summary()}
+
+class StreamChatWithDocumentsUseCase:
+    """
+    Streaming variant of ChatWithDocumentsUseCase.
+
+    Yields events in order: ``contexts`` once retrieval finishes, ``token``
+    for each coalesced chunk of generated text, and a final ``done`` summary
+    with usage and latency. With ``conversation_id`` the earlier turns are
+    sent to the model and the streamed answer is recorded as the next turn.
+    """
+
+    def __init__(
+        self,
+        rag_service: IRAGService,
+        flush_min_chars: int = None,
+        flush_max_delay_ms: int = None
+    ):
+        self.rag_service = rag_service
+        self.flush_min_chars = flush_min_chars or settings.SSE_FLUSH_MIN_CHARS
+        self.flush_max_delay = (flush_max_delay_ms or settings.SSE_FLUSH_MAX_DELAY_MS) / 1000
+
+    async def execute(
+        self,
+        query: str,
+        domain: str = "general",
+        context_limit: int = 5,
+        max_tokens: int = 1000,
+        temperature: float = 0.7,
+        domains: Optional[List[str]] = None,
+        conversation_id: Optional[str] = None,
+        system_prompt: Optional[str] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        # Calls made by the stream are recorded from the tasks it reads in,
+        # which inherit the collector from this context
+        with usage_collector() as usage:
+            start = time.perf_counter()
+            context_source = "retrieved"
+            history: List[Dict[str, str]] = []
+            if conversation_id:
+                turn = await self.rag_service.retrieve_for_turn(
+                    query, conversation_id, domain, context_limit, domains=domains,
+                    history=self.rag_service.load_history(conversation_id, query)
+                )
+                contexts, context_source, history = turn.contexts, turn.source, turn.history
+            else:
+                contexts = await self.rag_service.retrieve_contexts(query, domain, context_limit, domains=domains)
+            retrieval_ms = (time.perf_counter() - start) * 1000
+
+            yield {
+                "event": "contexts",
+                "data": {
+                    "query": query,
+                    "domain": domain,
+                    "domains": domains,
+                    "contexts": contexts,
+                    "context_count": len(contexts),
+                    "context_source": context_source
+                }
+            }
+
+            chunks = 0
+            chars = 0
+            first_token_ms = None
+
+            if not contexts:
+                text = "No relevant information found."
+                chunks, chars = 1, len(text)
+                yield {"event": "token", "data": {"text": text}}
+            else:
+                context_text = self.rag_service.build_context_text(contexts, max_tokens)
+                # Closing this generator (client disconnect) closes the LLM stream
+                frames = coalesce_deltas(
+                    self.rag_service.generate_chat_stream(
+                        history + [{"role": "user", "content": query}],
+                        system=system_prompt,
+                        context=context_text,
+                        max_tokens=max_tokens,
+                        temperature=temperature,
+                        conversation_id=conversation_id
+                    ),
+                    min_chars=self.flush_min_chars,
+                    max_delay=self.flush_max_delay
+                )
+                try:
+                    async for text in frames:
+                        if first_token_ms is None:
+                            first_token_ms = (time.perf_counter() - start) * 1000
+                        chunks += 1
+                        chars += len(text)
+                        yield {"event": "token", "data": {"text": text}}
+                finally:
+                    await frames.aclose()
+
+            total_ms = (time.perf_counter() - start) * 1000
+            yield {
+                "event": "done",
+                "data": {
+                    "llm_provider": self.rag_service.get_provider_name(),
+                    "frames": chunks,
+                    "chars": chars,
+                    "usage": usage.summary(),
+                    "latency": {
+                        "retrieval_ms": round(retrieval_ms, 1),
+                        "time_to_first_token_ms": round(first_token_ms, 1) if first_token_ms is not None else None,
+                        "total_ms": round(total_ms, 1)
+                    }
+                }
+            }
 
 class SemanticSearchUseCase:
     def __init__(self, rag_service: IRAGService):
         self.rag_service = rag_service
     
-    async def execute(self, search_query: str, domain: str = "general", result_limit: int = 10) -> Dict[str, Any]:
-        contexts = await self.rag_service.retrieve_contexts(search_query, domain, result_limit)
+    async def execute(
+        self,
+        search_query: str,
+        domain: str = "general",
+        result_limit: int = 10,
+        domains: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        contexts = await self.rag_service.retrieve_contexts(search_query, domain, result_limit, domains=domains)
         
         return {
             "query": search_query,
@@ -4,14 +4,16 @@ Pytest configuration and fixtures.
 
 import pytest
 import asyncio
+import time
 from typing import AsyncGenerator
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
-from src.infrastructure.postgresql.pg_client import Base
-from src.core.config import settings
+from infrastructure.postgresql.connection.base import Base
+from core.config import settings
+from core.telemetry import record_llm_usage
 
 
 # Override settings for testing
-settings.POSTGRES_DB = "ai_backend_test"
+settings.DB_NAME = "ai_backend_test"
 settings.ENVIRONMENT = "testing"
 
 
@@ -81,3 +83,36 @@ def sample_chatbot_data():
         "temperature": 0.7,
         "max_tokens": 1000
     }
+
+
+class FakeStreamingRAGService:
+    """RAG service stand-in streaming one token at a time."""
+
+    def __init__(self, tokens, delay: float = 0.0):
+        self.tokens = tokens
+        self.delay = delay
+        self.closed = False
+
+    async def retrieve_contexts(self, query, domain="general", top_k=5, domains=None):
+        return [{"text": "Paris is the capital of France."}]
+
+    def build_context_text(self, contexts, max_tokens=1000):
+        return "\n".join(ctx["text"] for ctx in contexts)
+
+    async def generate_chat_stream(self, messages, system=None, context=None, **kwargs):
+        self.messages = messages
+        started = time.perf_counter()
+        try:
+            for token in self.tokens:
+                if self.delay:
+                    await asyncio.sleep(self.delay)
+                yield token
+            record_llm_usage("fake", "fake-model", 12, len(self.tokens), started, started, streamed=True)
+        finally:
+            self.closed = True
+
+
+@pytest.fixture
+def streaming_rag_service():
+    """Factory for RAG services streaming the given tokens."""
+    return FakeStreamingRAGService
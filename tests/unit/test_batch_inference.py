@@ -0,0 +1,233 @@
+"""
+Unit tests for batch inference jobs.
+"""
+
+import asyncio
+import json
+import pytest
+from core.config import settings
+from domain.entities.batch_inference import BatchInferenceRecord
+from application.services.batch_inference_service import BatchInferenceService
+from infrastructure.ai_services.factory import LLMFactory
+from infrastructure.ai_services.services import batch_inference
+from infrastructure.ai_services.services.batch_inference import LocalBatchBackend
+from shared.interfaces.repositories.ingestion_job_repository import IngestionJobRepository
+from shared.interfaces.repositories.batch_inference_result_repository import BatchInferenceResultRepository
+
+
+class InMemoryJobRepository(IngestionJobRepository):
+    """Job repository keeping jobs in a dict; details are stored as JSON like in the database."""
+
+    def __init__(self):
+        self.jobs = {}
+
+    async def create(self, job):
+        job.id = len(self.jobs) + 1
+        self.jobs[job.id] = job
+        job.details = json.loads(json.dumps(job.details))
+        return await self.find_by_id(job.id)
+
+    async def find_by_id(self, id):
+        job = self.jobs.get(id)
+        if job is None:
+            return None
+        return type(job)(**{**job.__dict__, "details": json.loads(json.dumps(job.details))})
+
+    async def find_by_user(self, user_id):
+        return [await self.find_by_id(id) for id, job in self.jobs.items() if job.user_id == user_id]
+
+    async def update_status(self, id, status, error_message=None):
+        self.jobs[id].status = status
+        self.jobs[id].error_message = error_message
+        return True
+
+    async def update_details(self, id, details, status=None):
+        self.jobs[id].details = json.loads(json.dumps(details))
+        if status is not None:
+            self.jobs[id].status = status
+        return True
+
+    async def count_by_status(self, provider, statuses):
+        return sum(1 for job in self.jobs.values() if job.provider == provider and job.status in statuses)
+
+    async def find_by_status(self, provider, statuses):
+        return [
+            await self.find_by_id(id) for id, job in self.jobs.items()
+            if job.provider == provider and job.status in statuses
+        ]
+
+    async def delete(self, id):
+        return self.jobs.pop(id, None) is not None
+
+
+class InMemoryResultRepository(BatchInferenceResultRepository):
+    """Result repository ignoring records stored before, like the unique constraint."""
+
+    def __init__(self):
+        self.results = {}
+
+    async def save_all(self, results):
+        new = [result for result in results if (result.job_id, result.record_id) not in self.results]
+        for result in new:
+            self.results[(result.job_id, result.record_id)] = result
+        return len(new)
+
+    async def find_record_ids(self, job_id):
+        return {record_id for key_job, record_id in self.results if key_job == job_id}
+
+    async def find_by_job(self, job_id, skip=0, limit=100):
+        return [result for (key_job, _), result in self.results.items() if key_job == job_id][skip:skip + limit]
+
+    async def count_by_status(self, job_id, status):
+        return sum(1 for (key_job, _), result in self.results.items() if key_job == job_id and result.status == status)
+
+
+class EchoLLM:
+    """LLM answering with the prompt, failing on request, and hanging on prompts listed in ``hang``."""
+
+    def __init__(self, hang=()):
+        self.hang = set(hang)
+        self.prompts = []
+
+    async def generate_chat(self, messages, system=None, context=None, max_tokens=1000, temperature=0.7, **kwargs):
+        prompt = messages[-1]["content"]
+        self.prompts.append(prompt)
+        if prompt in self.hang:
+            await asyncio.Event().wait()
+        if prompt == "fail":
+            raise RuntimeError("model error")
+        return f"echo: {prompt}"
+
+
+def records(*prompts):
+    return [BatchInferenceRecord(record_id=f"r{i}", prompt=prompt) for i, prompt in enumerate(prompts)]
+
+
+async def sync_until_done(service, job_id):
+    for _ in range(100):
+        job = await service.sync(job_id)
+        if job.status in ("completed", "failed"):
+            return job
+        await asyncio.sleep(0.01)
+    raise AssertionError("Batch job did not finish")
+
+
+@pytest.fixture
+def repositories():
+    return InMemoryJobRepository(), InMemoryResultRepository()
+
+
+class TestBatchInferenceService:
+    """Tests for BatchInferenceService with the local backend."""
+
+    @pytest.mark.asyncio
+    async def test_job_results_are_stored(self, tmp_path, repositories):
+        """Test that a job runs every record and stores outputs and errors."""
+        backend = LocalBatchBackend(str(tmp_path), llm=EchoLLM())
+        service = BatchInferenceService(*repositories, backend, model_id="claude")
+
+        job = await service.submit(records("hello", "fail", "world"), user_id=1, name="faq")
+        job = await sync_until_done(service, job.id)
+
+        assert job.status == "completed"
+        assert job.details["succeeded"] == 2
+        assert job.details["failed"] == 1
+        results = {result.record_id: result for result in await service.list_results(job.id)}
+        assert results["r0"].output == "echo: hello"
+        assert results["r1"].error_message == "model error"
+
+    @pytest.mark.asyncio
+    async def test_lost_job_resumes_with_remaining_records(self, tmp_path, repositories):
+        """Test that after a restart only records without a result are resubmitted."""
+        first = LocalBatchBackend(str(tmp_path), llm=EchoLLM(hang={"slow"}))
+        service = BatchInferenceService(*repositories, first, model_id="claude")
+        job = await service.submit(records("quick", "slow"), user_id=1, name="summaries")
+        for _ in range(100):
+            if [line async for line in first.results(job.details["backend_job_id"])]:
+                break
+            await asyncio.sleep(0.01)
+        for task in first._tasks.values():  # Process restart
+            task.cancel()
+        await asyncio.gather(*first._tasks.values(), return_exceptions=True)
+
+        llm = EchoLLM()
+        restarted = BatchInferenceService(*repositories, LocalBatchBackend(str(tmp_path), llm=llm), model_id="claude")
+        job = await sync_until_done(restarted, job.id)
+
+        assert job.status == "completed"
+        assert job.details["attempt"] == 2
+        assert job.details["succeeded"] == 2
+        assert llm.prompts == ["slow"]
+
+    @pytest.mark.asyncio
+    async def test_job_waits_when_backend_is_at_capacity(self, tmp_path, repositories, monkeypatch):
+        """Test that jobs beyond the active job limit stay pending until a slot frees up."""
+        monkeypatch.setattr(settings, "BATCH_INFERENCE_MAX_ACTIVE_JOBS", 1)
+        backend = LocalBatchBackend(str(tmp_path), llm=EchoLLM())
+        service = BatchInferenceService(*repositories, backend, model_id="claude")
+
+        first = await service.submit(records("a"), user_id=1, name="first")
+        second = await service.submit(records("b"), user_id=1, name="second")
+
+        assert first.status == "in_progress"
+        assert second.status == "pending"
+        await sync_until_done(service, first.id)
+        assert (await sync_until_done(service, second.id)).status == "completed"
+
+    @pytest.mark.asyncio
+    async def test_local_backend_uses_the_job_model(self, tmp_path, repositories, monkeypatch):
+        """Test that local jobs run on the job's Bedrock model, not the default LLM."""
+        created = []
+
+        def create(provider=None, model_id=None, **kwargs):
+            created.append((provider, model_id))
+            return EchoLLM()
+
+        monkeypatch.setattr(LLMFactory, "create", staticmethod(create))
+        service = BatchInferenceService(*repositories, LocalBatchBackend(str(tmp_path)), model_id="claude-haiku")
+
+        job = await sync_until_done(service, (await service.submit(records("a"), user_id=1, name="faq")).id)
+
+        assert job.status == "completed"
+        assert created == [("bedrock", "claude-haiku")]
+
+    @pytest.mark.asyncio
+    async def test_sync_active_stores_results_without_polling(self, tmp_path, repositories, monkeypatch):
+        """Test that a scheduled sync submits waiting jobs and stores finished ones."""
+        monkeypatch.setattr(settings, "BATCH_INFERENCE_MAX_ACTIVE_JOBS", 1)
+        service = BatchInferenceService(*repositories, LocalBatchBackend(str(tmp_path), llm=EchoLLM()), model_id="claude")
+        first = await service.submit(records("a"), user_id=1, name="first")
+        second = await service.submit(records("b"), user_id=1, name="second")
+
+        for _ in range(100):
+            await service.sync_active()
+            jobs = [await service.get_job(first.id), await service.get_job(second.id)]
+            if all(job.status == "completed" for job in jobs):
+                break
+            await asyncio.sleep(0.01)
+
+        assert [job.details["succeeded"] for job in jobs] == [1, 1]
+
+
+class TestBatchBackendSelection:
+    """Tests for choosing the batch backend."""
+
+    @pytest.fixture(autouse=True)
+    def fresh_backend(self, monkeypatch):
+        monkeypatch.setattr(batch_inference, "_batch_inference_backend", None)
+        monkeypatch.setattr(settings, "BATCH_INFERENCE_S3_BUCKET", "batch-bucket")
+        monkeypatch.setattr(settings, "BATCH_INFERENCE_ROLE_ARN", "arn:aws:iam::123456789012:role/batch")
+
+    def test_lambda_defaults_to_bedrock(self, monkeypatch):
+        """Test that Lambda uses Bedrock batch jobs, which outlive the invocation."""
+        monkeypatch.setattr(settings, "BATCH_INFERENCE_BACKEND", None)
+        monkeypatch.setenv("AWS_LAMBDA_FUNCTION_NAME", "chatbot-api")
+
+        assert batch_inference.get_batch_inference_backend().name == "bedrock_batch"
+
+    def test_server_defaults_to_local(self, monkeypatch):
+        """Test that a long-running server runs batch jobs in-process by default."""
+        monkeypatch.setattr(settings, "BATCH_INFERENCE_BACKEND", None)
+        monkeypatch.delenv("AWS_LAMBDA_FUNCTION_NAME", raising=False)
+
+        assert batch_inference.get_batch_inference_backend().name == "local_batch"
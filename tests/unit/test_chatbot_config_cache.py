@@ -0,0 +1,96 @@
+"""
+Unit tests for the chatbot config cache.
+"""
+
+from dataclasses import replace
+from datetime import datetime, timedelta
+import pytest
+from application.services.chatbot_service import ChatbotService
+from domain.entities.chatbot import Chatbot
+from infrastructure.cache.chatbot_configs import ChatbotConfigCache
+from infrastructure.postgresql.notifications import ChatbotConfigListener, chatbot_change_payload
+
+UPDATED_AT = datetime(2024, 5, 1, 12, 0, 0)
+
+
+def make_chatbot(system_prompt="Be brief.", updated_at=UPDATED_AT):
+    return Chatbot(
+        id="7",
+        workspace_id="1",
+        name="Support",
+        description="",
+        system_prompt=system_prompt,
+        updated_at=updated_at
+    )
+
+
+class FakeChatbotRepository:
+    """Chatbot repository counting reads and recording published changes; returns copies like the ORM mapper."""
+
+    def __init__(self, chatbot):
+        self.chatbot = chatbot
+        self.reads = 0
+        self.published = []
+
+    async def find_by_id(self, id):
+        self.reads += 1
+        return replace(self.chatbot)
+
+    async def update(self, entity):
+        entity.updated_at = entity.updated_at + timedelta(seconds=1)
+        self.chatbot = replace(entity)
+        return replace(entity)
+
+    async def publish_change(self, id, version=None):
+        self.published.append(chatbot_change_payload(id, version))
+
+
+class TestChatbotConfigCache:
+    """Tests for ChatbotConfigCache and its use by ChatbotService."""
+
+    @pytest.mark.asyncio
+    async def test_config_is_read_from_the_database_once(self):
+        """Test that repeated config reads after the first do not hit the repository."""
+        repository = FakeChatbotRepository(make_chatbot())
+        service = ChatbotService(repository, config_cache=ChatbotConfigCache())
+
+        for _ in range(3):
+            chatbot = await service.get_chatbot_config("7")
+
+        assert chatbot.system_prompt == "Be brief."
+        assert repository.reads == 1
+
+    @pytest.mark.asyncio
+    async def test_update_invalidates_and_publishes_new_version(self):
+        """Test that an update drops the cached config and notifies other workers of its version."""
+        repository = FakeChatbotRepository(make_chatbot())
+        service = ChatbotService(repository, config_cache=ChatbotConfigCache())
+        await service.get_chatbot_config("7")
+
+        await service.update_chatbot("7", "1", "Support", "claude", system_prompt="Be detailed.")
+
+        assert (await service.get_chatbot_config("7")).system_prompt == "Be detailed."
+        assert repository.reads == 3  # initial load, update, reload
+        assert repository.published == [chatbot_change_payload("7", UPDATED_AT + timedelta(seconds=1))]
+
+    def test_notification_keeps_entries_at_or_past_its_version(self):
+        """Test that a remote change only drops configs older than the notified version."""
+        cache = ChatbotConfigCache()
+        listener = ChatbotConfigListener(cache, channel="chatbot_config_changed", dsn="postgresql://test")
+        cache.put("7", make_chatbot())
+
+        listener.handle(chatbot_change_payload("7", UPDATED_AT))
+        assert cache.get("7") is not None
+
+        listener.handle(chatbot_change_payload("7", UPDATED_AT + timedelta(seconds=1)))
+        assert cache.get("7") is None
+
+    def test_load_started_before_invalidation_is_discarded(self):
+        """Test that a config read before a concurrent change is not cached."""
+        cache = ChatbotConfigCache()
+        generation = cache.generation("7")
+
+        cache.invalidate("7")
+
+        assert cache.put("7", make_chatbot(), generation) is False
+        assert cache.get("7") is None
@@ -0,0 +1,69 @@
+"""
+Cold-start import budget tests for the Lambda API handler.
+"""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+
+SRC_DIR = Path(__file__).resolve().parents[2] / "src"
+
+# Wall-clock budget for importing the handler in a fresh interpreter
+IMPORT_BUDGET_SECONDS = float(os.getenv("COLD_START_IMPORT_BUDGET_SECONDS", "2.0"))
+
+# SDKs that must only load when a request actually needs them
+DEFERRED_MODULES = [
+    "chromadb",
+    "google.generativeai",
+    "boto3",
+    "botocore",
+    "sqlalchemy",
+    "passlib",
+]
+
+MEASURE_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+import lambda_handlers.api_handler
+elapsed = time.perf_counter() - start
+print(json.dumps({"elapsed": elapsed, "modules": sorted(sys.modules)}))
+"""
+
+
+def measure_handler_import() -> dict:
+    """Import the Lambda handler in a fresh interpreter configured like Lambda."""
+    env = {
+        **os.environ,
+        "PYTHONPATH": str(SRC_DIR),
+        "AWS_LAMBDA_FUNCTION_NAME": "api-handler-test",
+    }
+    env.pop("LAZY_ROUTER_LOADING", None)
+    result = subprocess.run(
+        [sys.executable, "-c", MEASURE_SCRIPT],
+        capture_output=True,
+        text=True,
+        env=env,
+        cwd=str(SRC_DIR),
+        check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+class TestLambdaColdStart:
+    """Tests for the cold-start optimized entry mode."""
+
+    def test_handler_import_within_budget(self):
+        """Test that importing the handler stays within the time budget."""
+        measurement = measure_handler_import()
+
+        assert measurement["elapsed"] < IMPORT_BUDGET_SECONDS
+
+    def test_heavy_dependencies_are_deferred(self):
+        """Test that provider SDKs and the ORM are not imported at cold start."""
+        modules = set(measure_handler_import()["modules"])
+
+        loaded = [name for name in DEFERRED_MODULES if name in modules]
+        assert loaded == []
@@ -0,0 +1,49 @@
+"""
+Unit tests for context packing.
+"""
+
+from application.services.context_packing import ContextPacker, estimate_tokens
+
+PASSAGE = (
+    "The warranty covers manufacturing defects for two years from the date of purchase. "
+    "Claims must include the original receipt and a description of the fault. "
+    "Accidental damage, wear and tear and unauthorised repairs are not covered."
+)
+
+
+class TestContextPacker:
+    """Tests for dedup, merge and budgeting."""
+
+    def test_near_duplicates_removed(self):
+        """Test that a re-indexed copy of a chunk is dropped."""
+        packed = ContextPacker().pack([
+            {"text": PASSAGE, "source": "s3://a.pdf"},
+            {"text": PASSAGE.upper() + " Page 3", "source": "s3://b.pdf"},
+        ], token_budget=1000)
+
+        assert packed.duplicates_removed == 1
+        assert packed.blocks == 1
+
+    def test_overlapping_chunks_from_same_source_merged(self):
+        """Test that adjacent chunks are stitched without repeating the overlap."""
+        words = PASSAGE.split()
+        first = " ".join(words[:30])
+        second = " ".join(words[18:])
+
+        packed = ContextPacker().pack([
+            {"text": second, "source": "s3://a.pdf"},
+            {"text": first, "source": "s3://a.pdf"},
+        ], token_budget=1000)
+
+        assert packed.chunks_merged == 1
+        assert packed.text == f"Context 1: {PASSAGE}"
+
+    def test_fits_token_budget(self):
+        """Test that packing stops at the budget, truncating the last block."""
+        contexts = [{"text": f"{i} " + PASSAGE, "source": f"s3://{i}.pdf"} for i in range(20)]
+
+        packed = ContextPacker(similarity_threshold=1.01, min_partial_tokens=10).pack(contexts, token_budget=150)
+
+        assert estimate_tokens(packed.text) <= 150
+        assert packed.truncated
+        assert packed.dropped > 0
@@ -0,0 +1,105 @@
+"""
+Unit tests for deployment-aware database pool configuration.
+"""
+
+import pytest
+from core.config import Settings
+from infrastructure.postgresql.connection.pool import (
+    PoolMetrics,
+    TimedAsyncAdaptedQueuePool,
+    TimedNullPool,
+    build_engine_options,
+)
+
+
+class TestBuildEngineOptions:
+    """Tests for pool mode resolution."""
+
+    def test_queue_mode_sized_from_settings(self):
+        """Test that the uvicorn pool honours DB_MIN/MAX_CONNECTIONS."""
+        options = build_engine_options(
+            Settings(DB_POOL_MODE="queue", DB_MIN_CONNECTIONS=3, DB_MAX_CONNECTIONS=8)
+        )
+
+        assert options["poolclass"] is TimedAsyncAdaptedQueuePool
+        assert options["pool_size"] == 3
+        assert options["max_overflow"] == 5
+
+    def test_lambda_defaults_to_single_connection(self, monkeypatch):
+        """Test that Lambda keeps exactly one reusable connection."""
+        monkeypatch.setenv("AWS_LAMBDA_FUNCTION_NAME", "api-handler")
+
+        options = build_engine_options(Settings())
+
+        assert options["pool_size"] == 1
+        assert options["max_overflow"] == 0
+
+    def test_transaction_pooling_disables_statement_caches(self):
+        """Test that RDS Proxy/pgbouncer mode avoids named prepared statements."""
+        options = build_engine_options(
+            Settings(DB_POOL_MODE="null", DB_TRANSACTION_POOLING=True)
+        )
+        connect_args = options["connect_args"]
+
+        assert options["poolclass"] is TimedNullPool
+        assert connect_args["statement_cache_size"] == 0
+        assert connect_args["prepared_statement_cache_size"] == 0
+        assert connect_args["prepared_statement_name_func"]() != connect_args["prepared_statement_name_func"]()
+
+    def test_unknown_mode_rejected(self):
+        """Test that a misspelt pool mode fails fast."""
+        with pytest.raises(ValueError):
+            build_engine_options(Settings(DB_POOL_MODE="pooled"))
+
+
+class TestPoolMetrics:
+    """Tests for checkout metrics."""
+
+    def test_snapshot_tracks_in_use_and_wait(self):
+        """Test checkout/checkin counters and wait averages."""
+        metrics = PoolMetrics()
+        metrics.record_checkout(2.0)
+        metrics.record_checkout(4.0)
+        metrics.record_checkin()
+
+        snapshot = metrics.snapshot()
+
+        assert snapshot["checkouts"] == 2
+        assert snapshot["in_use"] == 1
+        assert snapshot["max_in_use"] == 2
+        assert snapshot["avg_wait_ms"] == 3.0
+        assert snapshot["max_wait_ms"] == 4.0
+
+
+class TestDatabaseHealth:
+    """Tests for the public database health check."""
+
+    @pytest.mark.asyncio
+    async def test_ping_reports_down_without_raising(self, monkeypatch):
+        """Test that an unreachable database reads as down."""
+        from infrastructure.postgresql.connection.database import DatabaseManager
+        manager = DatabaseManager()
+
+        async def unreachable():
+            raise ConnectionRefusedError("connection refused")
+            yield
+
+        monkeypatch.setattr(manager, "get_session", unreachable)
+
+        assert await manager.ping(timeout=1) is False
+
+    @pytest.mark.asyncio
+    async def test_pool_metrics_are_only_in_the_admin_report(self, monkeypatch):
+        """Test that the public route says up or down and the admin report has the pool metrics."""
+        import main
+        from api.controllers import admin_controller
+        from infrastructure.postgresql.connection.database import db_manager
+
+        async def ping():
+            return True
+
+        monkeypatch.setattr(db_manager, "ping", ping)
+
+        assert await main.database_health() == {"status": "up"}
+        report = await admin_controller.get_llm_capacity(current_user=None)
+        assert report["database_pool"]["pool_mode"]
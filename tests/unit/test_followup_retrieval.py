@@ -0,0 +1,124 @@
+"""
+Unit tests for pipelined retrieval on conversation follow-ups.
+"""
+
+import asyncio
+import time
+import pytest
+from application.services.query_classification import is_conversational_query, is_followup_query
+from application.services.rag_service import RAGService
+
+
+class ScriptedKnowledgeBase:
+    """Knowledge base returning queued results after a delay."""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.calls = 0
+        self.results = {}
+
+    async def get_knowledge_base_by_domain(self, domain):
+        return "kb-general"
+
+    async def retrieve_contexts(self, query, knowledge_base_id, top_k=5):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return self.results.get(query, [])
+
+
+class TestConversationalQueries:
+    """Tests for follow-up classification."""
+
+    def test_classifies_followups(self):
+        """Test that acknowledgements and expand requests are conversational."""
+        assert is_conversational_query("Thanks!")
+        assert is_conversational_query("can you explain that in more detail?")
+        assert not is_conversational_query("What is the refund window for damaged items?")
+
+    def test_classifies_references_to_the_previous_turn(self):
+        """Test that follow-ups referring back are recognised, and new topics are not."""
+        assert is_followup_query("how long does that take?")
+        assert is_followup_query("what about the second one")
+        assert not is_followup_query("and for sale items")
+
+
+class TestRetrieveForTurn:
+    """Tests for RAGService.retrieve_for_turn."""
+
+    @pytest.mark.asyncio
+    async def test_conversational_followup_skips_retrieval(self):
+        """Test that 'explain more' reuses the previous turn's contexts."""
+        kb = ScriptedKnowledgeBase()
+        kb.results["refund window"] = [{"text": "30 days", "score": 0.9}]
+        service = RAGService(kb, llm_provider=None)
+
+        await service.retrieve_for_turn("refund window", "conv-1")
+        turn = await service.retrieve_for_turn("explain more", "conv-1")
+
+        assert turn.source == "previous"
+        assert turn.contexts[0]["text"] == "30 days"
+        assert kb.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_slow_retrieval_does_not_delay_followup(self, monkeypatch):
+        """Test that a follow-up referring back can start with previous contexts while retrieval finishes."""
+        monkeypatch.setattr("core.config.settings.RAG_FOLLOWUP_RETRIEVAL_WAIT_MS", 20)
+        kb = ScriptedKnowledgeBase()
+        kb.results["refund window"] = [{"text": "30 days", "score": 0.9}]
+        kb.results["does that apply online"] = [{"text": "online orders too", "score": 0.8}]
+        service = RAGService(kb, llm_provider=None)
+        await service.retrieve_for_turn("refund window", "conv-1")
+
+        kb.delay = 0.2
+        start = time.perf_counter()
+        turn = await service.retrieve_for_turn("does that apply online", "conv-1")
+
+        assert time.perf_counter() - start < 0.15
+        assert turn.source == "previous"
+        await asyncio.sleep(0.25)
+        assert service.conversation_contexts.get("conv-1", ("general",))[0]["text"] == "online orders too"
+
+    @pytest.mark.asyncio
+    async def test_new_question_waits_for_its_own_retrieval(self, monkeypatch):
+        """Test that a question on a new topic is not answered from the previous turn's contexts."""
+        monkeypatch.setattr("core.config.settings.RAG_FOLLOWUP_RETRIEVAL_WAIT_MS", 20)
+        kb = ScriptedKnowledgeBase()
+        kb.results["refund window"] = [{"text": "30 days", "score": 0.9}]
+        kb.results["and for sale items"] = [{"text": "14 days", "score": 0.8}]
+        service = RAGService(kb, llm_provider=None)
+        await service.retrieve_for_turn("refund window", "conv-1")
+
+        kb.delay = 0.1
+        turn = await service.retrieve_for_turn("and for sale items", "conv-1")
+
+        assert turn.source == "retrieved"
+        assert turn.contexts[0]["text"] == "14 days"
+
+    @pytest.mark.asyncio
+    async def test_previous_contexts_are_not_reused_across_domains(self):
+        """Test that a follow-up searching other domains retrieves instead of reusing contexts."""
+        kb = ScriptedKnowledgeBase()
+        kb.results["refund window"] = [{"text": "30 days", "score": 0.9}]
+        service = RAGService(kb, llm_provider=None)
+        await service.retrieve_for_turn("refund window", "conv-1", domain="finance")
+
+        turn = await service.retrieve_for_turn("explain more", "conv-1", domain="healthcare")
+
+        assert turn.source == "none"
+        assert kb.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_history_loads_concurrently(self):
+        """Test that history loading overlaps retrieval."""
+        kb = ScriptedKnowledgeBase(delay=0.1)
+        service = RAGService(kb, llm_provider=None)
+
+        async def load_history():
+            await asyncio.sleep(0.1)
+            return ["earlier message"]
+
+        start = time.perf_counter()
+        turn = await service.retrieve_for_turn("refund window", "conv-2", history=load_history())
+
+        assert time.perf_counter() - start < 0.18
+        assert turn.history == ["earlier message"]
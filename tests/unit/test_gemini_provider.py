@@ -0,0 +1,175 @@
+"""
+Unit tests for the Gemini provider against the installed google-generativeai SDK.
+
+Only the transport is replaced: requests are built by the real
+``GenerativeModel``, so unsupported arguments fail here as they would live.
+"""
+
+import asyncio
+import pytest
+from google.ai import generativelanguage as glm
+from google.generativeai import client as genai_client
+from core.deadline import RequestDeadline, request_deadline
+from core.errors import DeadlineExceededError
+from core.telemetry import usage_collector
+from infrastructure.ai_services.providers import gemini
+from infrastructure.ai_services.providers.gemini import GeminiLLMService
+
+
+class RecordingGenerativeClient:
+    """Async generative client recording requests."""
+
+    def __init__(self, text="Xin chào", delay=0.0):
+        self.text = text
+        self.delay = delay
+        self.requests = []
+        self.counted = []
+
+    async def generate_content(self, request):
+        self.requests.append(request)
+        await asyncio.sleep(self.delay)
+        return glm.GenerateContentResponse(
+            candidates=[{"content": {"role": "model", "parts": [{"text": self.text}]}, "finish_reason": 1}]
+        )
+
+    async def stream_generate_content(self, request):
+        self.requests.append(request)
+
+        async def chunks():
+            for word in self.text.split(" "):
+                yield glm.GenerateContentResponse(
+                    candidates=[{"content": {"role": "model", "parts": [{"text": word + " "}]}, "index": 0}]
+                )
+
+        return chunks()
+
+    async def count_tokens(self, request):
+        self.counted.append(request)
+        # One token per word
+        words = sum(len(part.text.split()) for content in request.contents for part in content.parts)
+        return glm.CountTokensResponse(total_tokens=words)
+
+
+@pytest.fixture
+def transport(monkeypatch):
+    recording = RecordingGenerativeClient()
+    monkeypatch.setattr(genai_client, "get_default_generative_async_client", lambda: recording)
+    return recording
+
+
+@pytest.fixture
+def service(monkeypatch):
+    # The deployment key goes through genai.configure and the default clients
+    monkeypatch.setattr(gemini.settings, "GEMINI_API_KEY", "test-key")
+    return GeminiLLMService(model_name="gemini-1.5-flash")
+
+
+class TestGeminiGeneration:
+    """Tests for single-prompt generation."""
+
+    @pytest.mark.asyncio
+    async def test_response_uses_generation_settings(self, transport, service):
+        """Test that a prompt is sent with the requested generation settings."""
+        reply = await service.generate_response("Hello?", max_tokens=64, temperature=0.2)
+
+        assert reply == "Xin chào"
+        request = transport.requests[0]
+        assert request.model == "models/gemini-1.5-flash"
+        assert request.generation_config.max_output_tokens == 64
+        assert request.contents[0].parts[0].text == "Hello?"
+
+    @pytest.mark.asyncio
+    async def test_request_deadline_bounds_the_call(self, transport, service):
+        """Test that a slow call is abandoned when the request deadline passes."""
+        transport.delay = 1.0
+
+        with request_deadline(RequestDeadline(0.05)):
+            with pytest.raises(DeadlineExceededError):
+                await asyncio.wait_for(service.generate_response("Hello?"), timeout=0.5)
+
+    @pytest.mark.asyncio
+    async def test_usage_is_counted_when_responses_report_none(self, transport, service):
+        """Test that prompt and output tokens are counted when the response has no usage metadata."""
+        with usage_collector() as usage:
+            await service.generate_response("How long do refunds take?")
+
+        summary = usage.summary()
+        assert summary["provider"] == "gemini"
+        assert summary["input_tokens"] == 5
+        assert summary["output_tokens"] == 2
+        assert [request.contents[0].parts[0].text for request in transport.counted] == [
+            "How long do refunds take?", "Xin chào"
+        ]
+
+
+class TestGeminiChat:
+    """Tests for conversation generation."""
+
+    @pytest.mark.asyncio
+    async def test_system_prompt_and_contexts_lead_the_first_user_turn(self, transport, service):
+        """Test that the system prompt and contexts are sent in the first user turn."""
+        reply = await service.generate_chat(
+            [
+                {"role": "user", "content": "Do you ship abroad?"},
+                {"role": "assistant", "content": "Yes, to 20 countries."},
+                {"role": "user", "content": "How long does it take?"}
+            ],
+            system="You are a support agent.",
+            context="Shipping abroad takes 7 days."
+        )
+
+        assert reply == "Xin chào"
+        contents = transport.requests[0].contents
+        assert [content.role for content in contents] == ["user", "model", "user"]
+        first_turn = [part.text for part in contents[0].parts]
+        assert first_turn[0] == "You are a support agent."
+        assert first_turn[1].endswith("Shipping abroad takes 7 days.")
+        assert first_turn[2] == "Do you ship abroad?"
+        assert contents[2].parts[0].text == "How long does it take?"
+
+    @pytest.mark.asyncio
+    async def test_stream_sends_the_conversation(self, transport, service):
+        """Test that a streamed chat sends the conversation turns."""
+        text = "".join([
+            chunk async for chunk in service.generate_chat_stream(
+                [{"role": "user", "content": "Hello?"}], system="Be brief."
+            )
+        ])
+
+        assert text.strip() == "Xin chào"
+        parts = [part.text for part in transport.requests[0].contents[0].parts]
+        assert parts == ["Be brief.", "Hello?"]
+
+
+class TestGeminiOwnClient:
+    """Tests for a service with its own key, as built for a chatbot config."""
+
+    @pytest.mark.asyncio
+    async def test_requests_go_through_the_service_client(self, monkeypatch, transport):
+        """Test that a chatbot's own key sends requests on its own client, not the default one."""
+        own = RecordingGenerativeClient(text="Hello")
+        options = []
+
+        def create_client(client_options):
+            options.append(client_options)
+            return own
+
+        monkeypatch.setattr(gemini.settings, "GEMINI_API_KEY", "test-key")
+        monkeypatch.setattr(gemini.glm, "GenerativeServiceAsyncClient", create_client)
+        service = GeminiLLMService(api_key="chatbot-key", model_name="gemini-1.5-flash")
+
+        with usage_collector() as usage:
+            reply = await service.generate_chat(
+                [{"role": "user", "content": "Hi there"}], system="Be brief.", max_tokens=32
+            )
+            streamed = "".join([chunk async for chunk in service.generate_chat_stream([{"role": "user", "content": "Hi"}])])
+
+        assert reply == "Hello"
+        assert streamed.strip() == "Hello"
+        assert options == [{"api_key": "chatbot-key"}]
+        assert transport.requests == [] and transport.counted == []
+        request = own.requests[0]
+        assert request.model == "models/gemini-1.5-flash"
+        assert request.generation_config.max_output_tokens == 32
+        assert [part.text for part in request.contents[0].parts] == ["Be brief.", "Hi there"]
+        assert usage.summary()["input_tokens"] == 5
@@ -0,0 +1,74 @@
+"""
+Unit tests for Bedrock knowledge base retrieval.
+"""
+
+import threading
+import pytest
+from core.errors import BedrockError
+from infrastructure.ai_services.providers.bedrock import BedrockClient
+from infrastructure.ai_services.services.knowledge_base import BedrockKnowledgeBaseService
+from infrastructure.ai_services.services.local_agent_runtime import LocalAgentRuntimeClient
+
+
+def make_runtime(count: int, max_page_size: int) -> LocalAgentRuntimeClient:
+    runtime = LocalAgentRuntimeClient(max_page_size=max_page_size)
+    for i in range(count):
+        runtime.add_document("kb-general", f"insulin dosage note {i}", uri=f"s3://docs/{i}.pdf")
+    return runtime
+
+
+class TestInvokeBedrockAgent:
+    """Tests for the Retrieve call."""
+
+    @pytest.mark.asyncio
+    async def test_paginates_until_top_k(self, monkeypatch):
+        """Test that large top_k requests follow nextToken across pages."""
+        monkeypatch.setattr("core.config.settings.BEDROCK_KB_MAX_RESULTS_PER_PAGE", 4)
+        runtime = make_runtime(count=10, max_page_size=4)
+        client = BedrockClient(agent_runtime_client=runtime)
+
+        response = await client.invoke_bedrock_agent("insulin dosage", "kb-general", number_of_results=9)
+
+        assert len(response["retrievalResults"]) == 9
+        assert [call["nextToken"] for call in runtime.calls] == [None, "4", "8"]
+
+    @pytest.mark.asyncio
+    async def test_runs_on_dedicated_executor(self, monkeypatch):
+        """Test that Retrieve calls run on the knowledge base threads, not the default executor."""
+        monkeypatch.setattr("core.config.settings.BEDROCK_KB_WORKERS", 2)
+        runtime = make_runtime(count=2, max_page_size=100)
+        threads = []
+        retrieve = runtime.retrieve
+
+        def recording_retrieve(**request):
+            threads.append(threading.current_thread().name)
+            return retrieve(**request)
+
+        runtime.retrieve = recording_retrieve
+        client = BedrockClient(agent_runtime_client=runtime)
+
+        await client.invoke_bedrock_agent("insulin", "kb-general", number_of_results=2)
+        client.shutdown()
+
+        assert threads[0].startswith("bedrock-kb")
+
+    @pytest.mark.asyncio
+    async def test_maps_results_to_contexts(self):
+        """Test that the service returns text, source and score."""
+        client = BedrockClient(agent_runtime_client=make_runtime(count=2, max_page_size=100))
+        service = BedrockKnowledgeBaseService(client, domain_kb_mapping={"general": "kb-general"})
+
+        kb_id = await service.get_knowledge_base_by_domain("finance")
+        contexts = await service.retrieve_contexts("insulin", kb_id, top_k=5)
+
+        assert kb_id == "kb-general"
+        assert contexts[0]["source"].startswith("s3://docs/")
+        assert contexts[0]["score"] == 1.0
+
+    @pytest.mark.asyncio
+    async def test_unconfigured_domain_raises(self):
+        """Test that a missing mapping fails clearly instead of calling AWS."""
+        service = BedrockKnowledgeBaseService(BedrockClient(), domain_kb_mapping={})
+
+        with pytest.raises(BedrockError):
+            await service.get_knowledge_base_by_domain("finance")
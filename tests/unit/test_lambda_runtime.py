@@ -0,0 +1,40 @@
+"""
+Unit tests for the persistent Lambda event loop runner.
+"""
+
+import asyncio
+from lambda_handlers.runtime import LoopRunner
+
+
+class TestLoopRunner:
+    """Tests for loop reuse and shutdown."""
+
+    def test_loop_reused_across_invocations(self):
+        """Test that warm invocations run on the same loop."""
+        runner = LoopRunner()
+
+        async def current_loop():
+            return asyncio.get_running_loop()
+
+        first = runner.run(current_loop())
+        second = runner.run(current_loop())
+
+        assert first is second
+        runner.shutdown()
+
+    def test_shutdown_runs_cleanups_and_closes_loop(self):
+        """Test that loop-bound clients are closed before the loop."""
+        runner = LoopRunner()
+        closed = []
+
+        async def close_client():
+            closed.append(asyncio.get_running_loop())
+
+        runner.register_cleanup(close_client)
+        loop = runner.activate()
+        runner.run(asyncio.sleep(0))
+
+        runner.shutdown()
+
+        assert closed == [loop]
+        assert loop.is_closed()
@@ -0,0 +1,141 @@
+"""
+Unit tests for the multi-turn chat API of LLM services.
+"""
+
+import json
+import pytest
+from application.services.rag_service import RAGService
+from infrastructure.ai_services.providers import bedrock
+from infrastructure.ai_services.providers.base import BaseLLMService, normalize_chat_messages
+
+CLAUDE = "anthropic.claude-3-haiku-20240307-v1:0"
+
+
+class RecordingBedrockClient:
+    """Bedrock client recording request bodies."""
+
+    def __init__(self):
+        self.bodies = []
+
+    async def invoke_model(self, model_id, body):
+        self.bodies.append(json.loads(body))
+        return {"content": [{"type": "text", "text": "Yes."}], "usage": {"input_tokens": 10, "output_tokens": 1}}
+
+
+class PromptOnlyLLM(BaseLLMService):
+    """LLM without a native chat format."""
+
+    def __init__(self):
+        self.prompts = []
+
+    async def generate_response(self, prompt, context=None, max_tokens=1000, temperature=0.7, **kwargs):
+        self.prompts.append((prompt, context))
+        return "ok"
+
+    async def generate_streaming_response(self, prompt, context=None, max_tokens=1000, temperature=0.7, **kwargs):
+        yield "ok"
+
+    def get_provider_name(self):
+        return "fake"
+
+    def get_model_info(self):
+        return {"model_id": "fake"}
+
+
+class StaticKnowledgeBase:
+    """Knowledge base returning one context."""
+
+    async def get_knowledge_base_by_domain(self, domain):
+        return "kb-general"
+
+    async def retrieve_contexts(self, query, knowledge_base_id, top_k=5, query_embedding=None):
+        return [{"text": "Premium costs $20 a month.", "score": 0.9}]
+
+
+@pytest.fixture
+def client(monkeypatch):
+    client = RecordingBedrockClient()
+    monkeypatch.setattr(bedrock, "get_bedrock_client", lambda: client)
+    return client
+
+
+class TestChatMessages:
+    """Tests for message normalization and the prompt fallback."""
+
+    def test_normalization_merges_roles_and_starts_with_user(self):
+        """Test that chats are reshaped into alternating turns starting with the user."""
+        messages = [
+            {"role": "assistant", "content": "Hi! How can I help?"},
+            {"role": "user", "content": "Plans?"},
+            {"role": "user", "content": "And prices?"},
+            {"role": "assistant", "content": ""},
+        ]
+
+        assert normalize_chat_messages(messages) == [{"role": "user", "content": "Plans?\n\nAnd prices?"}]
+
+    @pytest.mark.asyncio
+    async def test_default_chat_flattens_into_prompt(self):
+        """Test that providers without a chat format get the conversation as one prompt."""
+        llm = PromptOnlyLLM()
+
+        await llm.generate_chat(
+            [{"role": "user", "content": "Plans?"}, {"role": "assistant", "content": "Basic and premium."},
+             {"role": "user", "content": "Price of the second?"}],
+            system="Be brief.",
+            context="Premium costs $20."
+        )
+
+        assert llm.prompts == [(
+            "Be brief.\n\nUser: Plans?\nAssistant: Basic and premium.\n\nPrice of the second?",
+            "Premium costs $20."
+        )]
+
+
+class TestBedrockChat:
+    """Tests for the Bedrock Messages API request."""
+
+    @pytest.mark.asyncio
+    async def test_system_prompt_and_context_precede_turns(self, client):
+        """Test that stable content is sent as system blocks ahead of the conversation."""
+        llm = bedrock.BedrockLLMService(model_id=CLAUDE)
+
+        await llm.generate_chat(
+            [{"role": "user", "content": "Plans?"}, {"role": "assistant", "content": "Basic and premium."},
+             {"role": "user", "content": "Price of the second?"}],
+            system="You are the billing assistant.",
+            context="Premium costs $20."
+        )
+
+        body = client.bodies[0]
+        assert body["system"][0]["text"] == "You are the billing assistant."
+        assert "Premium costs $20." in body["system"][1]["text"]
+        assert [message["role"] for message in body["messages"]] == ["user", "assistant", "user"]
+
+    @pytest.mark.asyncio
+    async def test_single_prompt_keeps_context_out_of_the_question(self, client):
+        """Test that single prompts use the same layout, with the question as the only message."""
+        await bedrock.BedrockLLMService(model_id=CLAUDE).generate_response("Price?", context="Premium costs $20.")
+
+        body = client.bodies[0]
+        assert body["messages"] == [{"role": "user", "content": "Price?"}]
+        assert len(body["system"]) == 1
+
+
+class TestConversationGeneration:
+    """Tests for RAGService generation in conversations."""
+
+    @pytest.mark.asyncio
+    async def test_conversation_turns_are_sent_as_messages(self, client):
+        """Test that follow-ups carry earlier turns and the system prompt to the model."""
+        service = RAGService(StaticKnowledgeBase(), bedrock.BedrockLLMService(model_id=CLAUDE))
+
+        await service.retrieve_and_generate("Which plans are there?", conversation_id="c1", system_prompt="Be brief.")
+        await service.retrieve_and_generate("How much is premium?", conversation_id="c1", system_prompt="Be brief.")
+
+        body = client.bodies[-1]
+        assert body["system"][0]["text"] == "Be brief."
+        assert body["messages"] == [
+            {"role": "user", "content": "Which plans are there?"},
+            {"role": "assistant", "content": "Yes."},
+            {"role": "user", "content": "How much is premium?"},
+        ]
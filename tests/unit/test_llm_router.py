@@ -0,0 +1,165 @@
+"""
+Unit tests for the LLM provider router.
+"""
+
+import asyncio
+import pytest
+from core.errors import BedrockError, ServiceOverloadedError
+from infrastructure.ai_services.providers.router import (
+    CircuitBreaker,
+    LatencyWindow,
+    RouteTarget,
+    RoutingLLMService,
+    is_throttling_error,
+)
+
+
+class FakeLLM:
+    """LLM answering after a delay, or failing with queued errors."""
+
+    def __init__(self, name, delay=0.0, errors=None):
+        self.name = name
+        self.delay = delay
+        self.errors = list(errors or [])
+        self.calls = 0
+
+    async def generate_response(self, prompt, context=None, max_tokens=1000, temperature=0.7, **kwargs):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.errors:
+            raise self.errors.pop(0)
+        return f"{self.name}: {prompt}"
+
+    async def generate_streaming_response(self, prompt, context=None, max_tokens=1000, temperature=0.7, **kwargs):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.errors:
+            raise self.errors.pop(0)
+        for word in (self.name, "says", "hi"):
+            yield word
+
+    def get_provider_name(self):
+        return self.name
+
+    def get_model_info(self):
+        return {"max_input_tokens": 8192, "max_output_tokens": 2048}
+
+
+def throttled():
+    """Provider error wrapping a Bedrock throttling error, as the providers raise it."""
+    try:
+        raise BedrockError("Model invocation failed: Rate exceeded", details={"error_code": "ThrottlingException"})
+    except BedrockError:
+        try:
+            raise Exception("Failed to generate response: Rate exceeded")
+        except Exception as e:
+            return e
+
+
+class TestRouterBuildingBlocks:
+    """Tests for latency windows, breakers and error classification."""
+
+    def test_percentiles_and_error_rate(self):
+        """Test nearest-rank percentiles over the rolling window."""
+        window = LatencyWindow(size=100)
+        for latency in range(1, 101):
+            window.record(latency / 1000, ok=True)
+        window.record(None, ok=False)
+
+        assert window.percentile(50) == pytest.approx(0.050)
+        assert window.percentile(95) == pytest.approx(0.095)
+        assert window.error_rate == pytest.approx(0.01)
+
+    def test_breaker_opens_on_throttling_and_probes_after_cooldown(self):
+        """Test that consecutive throttles open the breaker until one trial request succeeds."""
+        now = [0.0]
+        breaker = CircuitBreaker(threshold=2, cooldown_seconds=10, clock=lambda: now[0])
+        breaker.record_throttle()
+        assert breaker.state == "closed"
+        breaker.record_throttle()
+        assert not breaker.allow()
+
+        now[0] = 11.0
+        assert breaker.allow()
+        assert not breaker.allow()
+        breaker.record_success()
+        assert breaker.state == "closed"
+
+    def test_detects_wrapped_throttling_errors(self):
+        """Test that throttling is recognised through the provider's wrapping exception."""
+        assert is_throttling_error(throttled())
+        assert not is_throttling_error(Exception("Failed to generate response: invalid prompt"))
+
+
+class TestRoutingLLMService:
+    """Tests for RoutingLLMService."""
+
+    @pytest.mark.asyncio
+    async def test_fails_over_and_trips_breaker_on_throttling(self):
+        """Test failover to the fallback and that a throttled primary is skipped."""
+        primary = FakeLLM("bedrock", errors=[throttled(), throttled()])
+        fallback = FakeLLM("gemini")
+        router = RoutingLLMService(
+            [
+                RouteTarget("bedrock", primary, breaker=CircuitBreaker(threshold=2)),
+                RouteTarget("gemini", fallback),
+            ],
+            hedge_enabled=False
+        )
+
+        assert await router.generate_response("q1") == "gemini: q1"
+        assert await router.generate_response("q2") == "gemini: q2"
+        assert await router.generate_response("q3") == "gemini: q3"
+
+        assert primary.calls == 2
+        assert router.stats()["bedrock"]["breaker"] == "open"
+
+    @pytest.mark.asyncio
+    async def test_hedges_slow_primary(self):
+        """Test that a request slower than the primary's p95 is raced against the fallback."""
+        primary = FakeLLM("bedrock", delay=0.5)
+        fallback = FakeLLM("gemini", delay=0.01)
+        target = RouteTarget("bedrock", primary)
+        for _ in range(5):
+            target.latency.record(0.02, ok=True)
+        router = RoutingLLMService([target, RouteTarget("gemini", fallback)], min_samples=5)
+
+        assert await asyncio.wait_for(router.generate_response("q"), timeout=0.3) == "gemini: q"
+        assert primary.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_fastest_policy_prefers_lower_p50(self):
+        """Test that the fastest policy orders measured targets by median latency."""
+        slow, fast = FakeLLM("bedrock"), FakeLLM("gemini")
+        slow_target, fast_target = RouteTarget("bedrock", slow), RouteTarget("gemini", fast)
+        for _ in range(3):
+            slow_target.latency.record(0.8, ok=True)
+            fast_target.latency.record(0.2, ok=True)
+        router = RoutingLLMService([slow_target, fast_target], policy="fastest", min_samples=3, hedge_enabled=False)
+
+        assert await router.generate_response("q") == "gemini: q"
+
+    @pytest.mark.asyncio
+    async def test_stream_fails_over_before_first_chunk(self):
+        """Test that a stream failing before any output is served by the fallback."""
+        router = RoutingLLMService(
+            [
+                RouteTarget("bedrock", FakeLLM("bedrock", errors=[Exception("connection reset")])),
+                RouteTarget("gemini", FakeLLM("gemini")),
+            ],
+            hedge_enabled=False
+        )
+
+        chunks = [chunk async for chunk in router.generate_streaming_response("q")]
+
+        assert chunks == ["gemini", "says", "hi"]
+
+    @pytest.mark.asyncio
+    async def test_all_targets_throttled(self):
+        """Test that requests are shed when every breaker is open."""
+        target = RouteTarget("bedrock", FakeLLM("bedrock"), breaker=CircuitBreaker(threshold=1))
+        target.breaker.record_throttle()
+        router = RoutingLLMService([target])
+
+        with pytest.raises(ServiceOverloadedError):
+            await router.generate_response("q")
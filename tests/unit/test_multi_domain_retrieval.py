@@ -0,0 +1,174 @@
+"""
+Unit tests for parallel multi-domain retrieval.
+"""
+
+import asyncio
+import time
+import pytest
+from application.services.context_ranking import merge_ranked_contexts
+from application.services.rag_service import RAGService
+from infrastructure.ai_services.services import knowledge_base
+from infrastructure.ai_services.services.knowledge_base import VectorStoreKnowledgeBaseService, resolve_domain_sources
+from infrastructure.vector_store.factory import VectorStoreFactory
+
+
+class PersistedVectorStore:
+    """ChromaDB stand-in recording its directory."""
+
+    def __init__(self, persist_directory):
+        self.persist_directory = persist_directory
+
+
+class BucketVectorStore:
+    """S3 vector store stand-in recording its domain."""
+
+    def __init__(self, bucket_name, domain, prefix):
+        self.bucket_name = bucket_name
+        self.domain = domain
+
+
+class DomainKnowledgeBase:
+    """Knowledge base answering each domain after its own delay."""
+
+    def __init__(self, results, delays=None, failing=()):
+        self.results = results
+        self.delays = delays or {}
+        self.failing = failing
+
+    async def get_knowledge_base_by_domain(self, domain):
+        return domain
+
+    async def retrieve_contexts(self, query, knowledge_base_id, top_k=5):
+        await asyncio.sleep(self.delays.get(knowledge_base_id, 0.0))
+        if knowledge_base_id in self.failing:
+            raise RuntimeError("Knowledge base unavailable")
+        return self.results[knowledge_base_id][:top_k]
+
+
+class DomainVectorStore:
+    """Vector store returning its domain's chunk."""
+
+    def __init__(self, domain):
+        self.domain = domain
+
+    def add_vector(self, vector, metadata):
+        return "1"
+
+    def query(self, vector, top_k=5):
+        return [{"text": f"{self.domain} vector chunk", "score": 0.9}]
+
+
+class StaticEmbeddings:
+    """Embedding service returning a fixed vector."""
+
+    async def create_single_embedding(self, text):
+        return [0.1, 0.2]
+
+
+class TestContextRanking:
+    """Tests for merging result sets."""
+
+    def test_scores_normalized_per_source(self):
+        """Test that a source with a smaller score scale is not crowded out."""
+        merged = merge_ranked_contexts([
+            [{"text": "a", "score": 0.9}, {"text": "b", "score": 0.45}],
+            [{"text": "c", "score": 12.0}, {"text": "d", "score": 3.0}],
+        ], top_k=3)
+
+        assert [ctx["text"] for ctx in merged] == ["a", "c", "b"]
+
+    def test_duplicates_keep_best_score(self):
+        """Test that the same chunk from two sources appears once."""
+        merged = merge_ranked_contexts([
+            [{"text": "Shared  chunk", "score": 0.5}, {"text": "other", "score": 1.0}],
+            [{"text": "shared chunk", "score": 2.0}],
+        ], top_k=5)
+
+        assert len(merged) == 2
+        assert merged[0]["normalized_score"] == 1.0
+
+
+class TestMultiDomainRetrieval:
+    """Tests for concurrent fan-out in RAGService."""
+
+    @pytest.mark.asyncio
+    async def test_latency_is_slowest_domain(self):
+        """Test that domains are queried concurrently, not one after another."""
+        kb = DomainKnowledgeBase(
+            {"finance": [{"text": "f", "score": 0.8}], "healthcare": [{"text": "h", "score": 0.7}]},
+            delays={"finance": 0.2, "healthcare": 0.2}
+        )
+        service = RAGService(kb, llm_provider=None)
+
+        start = time.perf_counter()
+        contexts = await service.retrieve_contexts("q", domains=["finance", "healthcare"], top_k=5)
+        elapsed = time.perf_counter() - start
+
+        assert elapsed < 0.35
+        assert {ctx["domain"] for ctx in contexts} == {"finance", "healthcare"}
+
+    @pytest.mark.asyncio
+    async def test_failed_or_slow_domain_is_skipped(self, monkeypatch):
+        """Test that one bad domain does not fail the request."""
+        monkeypatch.setattr("core.config.settings.RAG_DOMAIN_TIMEOUT_SECONDS", 0.05)
+        kb = DomainKnowledgeBase(
+            {"finance": [{"text": "f", "score": 0.8}], "healthcare": [], "education": []},
+            delays={"education": 1.0},
+            failing=("healthcare",)
+        )
+        service = RAGService(kb, llm_provider=None)
+
+        contexts = await service.retrieve_contexts("q", domains=["finance", "healthcare", "education"])
+
+        assert [ctx["text"] for ctx in contexts] == ["f"]
+
+
+class TestDomainSources:
+    """Tests for per-domain retrieval backends."""
+
+    @pytest.mark.asyncio
+    async def test_domain_source_overrides_knowledge_base(self):
+        """Test that a domain with its own source is not sent to the knowledge base."""
+        kb = DomainKnowledgeBase({"finance": [{"text": "f", "score": 0.8}]})
+        store = VectorStoreKnowledgeBaseService(DomainVectorStore("healthcare"), StaticEmbeddings())
+        service = RAGService(kb, llm_provider=None, domain_sources={"healthcare": store})
+
+        contexts = await service.retrieve_contexts("q", domains=["finance", "healthcare"], top_k=5)
+
+        assert {ctx["text"] for ctx in contexts} == {"f", "healthcare vector chunk"}
+
+    def test_sources_built_for_configured_domains(self, monkeypatch):
+        """Test that each RAG_VECTOR_STORE_DOMAINS domain gets a vector store of its own."""
+        monkeypatch.setattr("core.config.settings.RAG_VECTOR_STORE_DOMAINS", "healthcare, education")
+        monkeypatch.setattr(knowledge_base, "_domain_sources", None)
+        monkeypatch.setattr(
+            "infrastructure.ai_services.providers.bedrock.get_bedrock_client", lambda: object()
+        )
+        monkeypatch.delenv("VECTOR_STORE_PROVIDER", raising=False)
+        monkeypatch.setenv("VECTOR_STORE_CONFIG", '{"persist_directory": "/data/chroma"}')
+        monkeypatch.setitem(VectorStoreFactory._providers, "chromadb", PersistedVectorStore)
+
+        sources = resolve_domain_sources()
+
+        assert sorted(sources) == ["education", "healthcare"]
+        assert sources["healthcare"].vector_store.persist_directory == "/data/chroma/healthcare"
+        assert sources["education"].vector_store.persist_directory == "/data/chroma/education"
+        assert sources["healthcare"].name == "vector_store:healthcare"
+        assert resolve_domain_sources() is sources
+
+    def test_s3_sources_use_their_domain_prefix(self, monkeypatch):
+        """Test that S3-backed domains each read their own domain's vectors."""
+        monkeypatch.setattr("core.config.settings.RAG_VECTOR_STORE_DOMAINS", "healthcare, education")
+        monkeypatch.setattr(knowledge_base, "_domain_sources", None)
+        monkeypatch.setattr(
+            "infrastructure.ai_services.providers.bedrock.get_bedrock_client", lambda: object()
+        )
+        monkeypatch.setenv("VECTOR_STORE_PROVIDER", "s3")
+        monkeypatch.setenv("VECTOR_STORE_CONFIG", '{"bucket_name": "vectors", "domain": "general"}')
+        monkeypatch.setitem(VectorStoreFactory._providers, "s3", BucketVectorStore)
+
+        sources = resolve_domain_sources()
+
+        assert {domain: source.vector_store.domain for domain, source in sources.items()} == {
+            "healthcare": "healthcare", "education": "education"
+        }
@@ -0,0 +1,91 @@
+"""
+Unit tests for the password hasher.
+"""
+
+import pytest
+from application.services.auth_service import AuthService
+from domain.entities.user import User
+from domain.value_objects.email import Email
+from domain.value_objects.uuid_vo import UUID
+from infrastructure.auth.password_hasher import PasswordHasher
+
+
+def make_user(hashed_password):
+    return User(
+        id=UUID.generate(),
+        email=Email("jane@example.com"),
+        username="jane",
+        full_name="Jane Doe",
+        hashed_password=hashed_password
+    )
+
+
+class FakeUserRepository:
+    """User repository holding one user and recording updates."""
+
+    def __init__(self, user):
+        self.user = user
+        self.updated = []
+
+    async def find_by_email(self, email):
+        return self.user
+
+    async def update(self, entity):
+        self.updated.append(entity.hashed_password)
+        return entity
+
+
+class TestPasswordHasher:
+    """Tests for PasswordHasher."""
+
+    @pytest.mark.asyncio
+    async def test_hash_and_verify(self):
+        """Test that a hash verifies its password only."""
+        hasher = PasswordHasher(rounds=4, max_workers=1, max_queue=4)
+
+        hashed = await hasher.hash_password("s3cret-pass")
+
+        assert hashed != "s3cret-pass"
+        assert await hasher.verify_password("s3cret-pass", hashed) is True
+        assert await hasher.verify_password("wrong-pass", hashed) is False
+
+    @pytest.mark.asyncio
+    async def test_hash_with_other_cost_needs_rehash(self):
+        """Test that a hash made with different parameters is flagged and replaced on verify."""
+        old_hash = await PasswordHasher(rounds=4).hash_password("s3cret-pass")
+        hasher = PasswordHasher(rounds=5)
+
+        assert hasher.needs_update(old_hash) is True
+        verified, new_hash = await hasher.verify_and_update("s3cret-pass", old_hash)
+
+        assert verified is True
+        assert new_hash is not None and hasher.needs_update(new_hash) is False
+        assert await hasher.verify_and_update("wrong-pass", old_hash) == (False, None)
+
+    @pytest.mark.asyncio
+    async def test_login_rehash_goes_through_the_user_entity(self):
+        """Test that an outdated hash is replaced with User.update_password and saved."""
+        old_hash = await PasswordHasher(rounds=4).hash_password("s3cret-pass")
+        user = make_user(old_hash)
+        repository = FakeUserRepository(user)
+        service = AuthService(repository, jwt_handler=None, password_hasher=PasswordHasher(rounds=5))
+
+        authenticated = await service.authenticate_user("jane@example.com", "s3cret-pass")
+
+        assert authenticated.hashed_password != old_hash
+        assert repository.updated == [authenticated.hashed_password]
+        assert not hasattr(authenticated, "password_hash")
+
+    @pytest.mark.asyncio
+    async def test_admin_capacity_report_includes_hashing_queue(self, monkeypatch):
+        """Test that the admin capacity report shows the hashing queue next to the LLM pools."""
+        from api.controllers import admin_controller
+        hasher = PasswordHasher(rounds=4, max_workers=1, max_queue=4)
+        await hasher.hash_password("s3cret-pass")
+        monkeypatch.setattr(admin_controller, "get_password_hasher", lambda: hasher)
+
+        report = await admin_controller.get_llm_capacity(current_user=None)
+
+        assert report["password_hashing"]["completed"] == 1
+        assert report["password_hashing"]["queue_depth"] == 0
+        assert "avg_wait_ms" in report["password_hashing"]
@@ -0,0 +1,93 @@
+"""
+Unit tests for Bedrock prompt caching.
+"""
+
+import json
+import pytest
+from core.telemetry import usage_collector
+from infrastructure.ai_services.providers import bedrock
+from infrastructure.ai_services.providers.prompt_cache import PromptCachePlanner
+
+SONNET = "us.anthropic.claude-3-7-sonnet-20250219-v1:0"
+SYSTEM_PROMPT = "You are the billing assistant. " * 200  # ~1,500 tokens
+CONTEXT = "Premium costs $20 a month and includes priority support. " * 40
+
+
+class CachingBedrockClient:
+    """Bedrock client reporting a cache write, then cache reads."""
+
+    def __init__(self):
+        self.bodies = []
+
+    async def invoke_model(self, model_id, body):
+        self.bodies.append(json.loads(body))
+        first = len(self.bodies) == 1
+        return {
+            "content": [{"type": "text", "text": "It costs $20."}],
+            "usage": {
+                "input_tokens": 12,
+                "output_tokens": 5,
+                "cache_creation_input_tokens": 1500 if first else 0,
+                "cache_read_input_tokens": 0 if first else 1500
+            }
+        }
+
+
+def checkpoints(body):
+    return ["cache_control" in block for block in body["system"]]
+
+
+class TestPromptCachePlanner:
+    """Tests for PromptCachePlanner."""
+
+    def test_checkpoints_stable_and_repeated_prefixes(self):
+        """Test that stable blocks are cached at once and other blocks once their prefix repeats."""
+        planner = PromptCachePlanner()
+        blocks = [(SYSTEM_PROMPT, True), (CONTEXT, False)]
+
+        assert planner.plan(blocks, min_tokens=1024) == [True, False]
+        assert planner.plan(blocks, min_tokens=1024) == [True, True]
+        assert planner.plan([(SYSTEM_PROMPT, True), ("Other context", False)], min_tokens=1024) == [True, False]
+
+    def test_short_and_expired_prefixes_are_not_cached(self):
+        """Test that prefixes under the minimum or past the TTL get no checkpoint."""
+        now = [0.0]
+        planner = PromptCachePlanner(ttl_seconds=300, clock=lambda: now[0])
+
+        assert planner.plan([("Be brief.", True)], min_tokens=1024) == [False]
+        planner.plan([(SYSTEM_PROMPT, False)], min_tokens=1024)
+        now[0] = 301.0
+        assert planner.plan([(SYSTEM_PROMPT, False)], min_tokens=1024) == [False]
+
+
+class TestBedrockPromptCaching:
+    """Tests for cache checkpoints in Bedrock requests."""
+
+    @pytest.mark.asyncio
+    async def test_follow_up_turn_caches_context_and_reports_reads(self, monkeypatch):
+        """Test that a repeated context gets a checkpoint and cache reads are reported."""
+        client = CachingBedrockClient()
+        monkeypatch.setattr(bedrock, "get_bedrock_client", lambda: client)
+        llm = bedrock.BedrockLLMService(model_id=SONNET, prompt_cache=PromptCachePlanner())
+        turns = [{"role": "user", "content": "How much is premium?"}]
+
+        await llm.generate_chat(turns, system=SYSTEM_PROMPT, context=CONTEXT)
+        with usage_collector() as usage:
+            await llm.generate_chat(
+                turns + [{"role": "assistant", "content": "It costs $20."}, {"role": "user", "content": "Yearly?"}],
+                system=SYSTEM_PROMPT,
+                context=CONTEXT
+            )
+
+        assert checkpoints(client.bodies[0]) == [True, False]
+        assert checkpoints(client.bodies[1]) == [True, True]
+        assert usage.summary()["cache_read_tokens"] == 1500
+
+    def test_unsupported_models_get_no_checkpoints(self, monkeypatch):
+        """Test that models without prompt caching are sent plain system blocks."""
+        monkeypatch.setattr(bedrock, "get_bedrock_client", lambda: CachingBedrockClient())
+        llm = bedrock.BedrockLLMService(model_id="anthropic.claude-3-sonnet-20240229-v1:0")
+
+        body = llm._chat_body([{"role": "user", "content": "Hi"}], SYSTEM_PROMPT, CONTEXT, 100, 0.5)
+
+        assert checkpoints(body) == [False, False]
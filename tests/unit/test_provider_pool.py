@@ -0,0 +1,90 @@
+"""
+Unit tests for the LLM provider pool.
+"""
+
+import pytest
+from domain.entities.chatbot import Chatbot
+from infrastructure.ai_services.provider_pool import LLMProviderPool
+from infrastructure.auth.api_key_cipher import ApiKeyCipher
+
+ENCRYPTION_KEY = "hHbX0Xz1Yk3n8Kc0mF9Q2r5tV7wZ4aB6cD8eF0gH2jI="
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeProvider:
+    """Provider recording how it was built."""
+
+    def __init__(self, provider, model_id, **kwargs):
+        self.provider = provider
+        self.model_id = model_id
+        self.kwargs = kwargs
+
+
+def make_chatbot(provider="google", model_id="gemini-1.5-flash", api_key_encrypted=None):
+    return Chatbot(
+        id="7",
+        workspace_id="1",
+        name="Support",
+        description="",
+        system_prompt="",
+        model_id=model_id,
+        provider=provider,
+        api_key_encrypted=api_key_encrypted
+    )
+
+
+@pytest.fixture
+def cipher():
+    return ApiKeyCipher(ENCRYPTION_KEY)
+
+
+class TestLLMProviderPool:
+    """Tests for LLMProviderPool."""
+
+    def test_chatbots_with_same_config_share_an_instance(self, cipher):
+        """Test that a provider instance is built once per provider, model and key."""
+        pool = LLMProviderPool(factory=FakeProvider, decrypt=cipher.decrypt)
+        key = cipher.encrypt("secret-key")
+
+        first = pool.for_chatbot(make_chatbot(api_key_encrypted=key))
+        second = pool.for_chatbot(make_chatbot(api_key_encrypted=key))
+        other_key = pool.for_chatbot(make_chatbot(api_key_encrypted=cipher.encrypt("other-key")))
+
+        assert first is second
+        assert other_key is not first
+        assert (first.provider, first.model_id, first.kwargs) == ("gemini", "gemini-1.5-flash", {"api_key": "secret-key"})
+        assert pool.stats()["builds"] == 2
+
+    def test_bedrock_chatbots_are_pooled_by_model_only(self, cipher):
+        """Test that Bedrock instances ignore chatbot keys, which Bedrock does not use."""
+        pool = LLMProviderPool(factory=FakeProvider, decrypt=cipher.decrypt)
+
+        first = pool.for_chatbot(make_chatbot("anthropic", "anthropic.claude-3-haiku", cipher.encrypt("a")))
+        second = pool.for_chatbot(make_chatbot("anthropic", "anthropic.claude-3-haiku", cipher.encrypt("b")))
+
+        assert first is second
+        assert first.provider == "bedrock"
+        assert first.kwargs == {}
+
+    def test_idle_and_least_recently_used_instances_are_evicted(self):
+        """Test that instances are dropped after the idle TTL and beyond the size limit."""
+        clock = FakeClock()
+        pool = LLMProviderPool(max_entries=2, idle_ttl_seconds=60, factory=FakeProvider, clock=clock)
+
+        first = pool.get("bedrock", "model-a")
+        pool.get("bedrock", "model-b")
+        pool.get("bedrock", "model-a")
+        pool.get("bedrock", "model-c")  # evicts model-b
+        assert pool.get("bedrock", "model-a") is first
+        assert pool.stats()["entries"] == 2
+
+        clock.now = 61
+        assert pool.get("bedrock", "model-a") is not first
+        assert pool.stats()["entries"] == 1
@@ -0,0 +1,128 @@
+"""
+Unit tests for query rewriting and embedding precomputation.
+"""
+
+import pytest
+from application.services import query_rewriting
+from application.services.query_rewriting import (
+    QueryPreprocessor,
+    get_query_preprocessor,
+    needs_condensing,
+    normalize_query_text,
+)
+from application.services.rag_service import RAGService
+
+
+class FakeRewriter:
+    """LLM returning a fixed standalone query."""
+
+    def __init__(self, rewritten: str):
+        self.rewritten = rewritten
+        self.calls = 0
+
+    async def generate_response(self, prompt, context=None, max_tokens=1000, temperature=0.7, **kwargs):
+        self.calls += 1
+        return self.rewritten
+
+
+class FakeEmbeddings:
+    """Embedding service counting calls."""
+
+    def __init__(self):
+        self.texts = []
+
+    async def create_embeddings(self, texts):
+        return [await self.create_single_embedding(text) for text in texts]
+
+    async def create_single_embedding(self, text):
+        self.texts.append(text)
+        return [float(len(text)), 1.0]
+
+
+class RecordingKnowledgeBase:
+    """Knowledge base recording the queries and embeddings it receives."""
+
+    def __init__(self):
+        self.queries = []
+        self.embeddings = []
+
+    async def get_knowledge_base_by_domain(self, domain):
+        return "kb-general"
+
+    async def retrieve_contexts(self, query, knowledge_base_id, top_k=5, query_embedding=None):
+        self.queries.append(query)
+        self.embeddings.append(query_embedding)
+        return [{"text": f"about {query}", "score": 0.9}]
+
+
+class TestQueryPreprocessor:
+    """Tests for QueryPreprocessor."""
+
+    def test_normalization_and_condensing_heuristic(self):
+        """Test whitespace normalization and which queries need the conversation."""
+        assert normalize_query_text("  what   about\tthe second one? ") == "what about the second one?"
+        assert needs_condensing("what about the second one?")
+        assert not needs_condensing("How long is the refund window for damaged items?")
+
+    @pytest.mark.asyncio
+    async def test_rewrite_is_cached_per_turn(self):
+        """Test that the rewriter runs once per conversation turn."""
+        rewriter = FakeRewriter("premium plan pricing")
+        preprocessor = QueryPreprocessor(rewriter=rewriter)
+        history = [{"role": "user", "content": "Compare the basic and premium plans"}]
+
+        first = await preprocessor.prepare("what about the second one?", "conv-1", history)
+        second = await preprocessor.prepare("what about  the second one?", "conv-1", history)
+
+        assert first.standalone == "premium plan pricing"
+        assert first.rewritten
+        assert second is first
+        assert rewriter.calls == 1
+
+
+class TestRetrievalWithPreprocessing:
+    """Tests for RAGService with a QueryPreprocessor."""
+
+    @pytest.mark.asyncio
+    async def test_followup_is_retrieved_with_standalone_query(self):
+        """Test that a rewritten follow-up is retrieved with its standalone query and embedding."""
+        kb = RecordingKnowledgeBase()
+        embeddings = FakeEmbeddings()
+        preprocessor = QueryPreprocessor(FakeRewriter("premium plan pricing"), embeddings)
+        service = RAGService(kb, llm_provider=None, query_preprocessor=preprocessor)
+
+        await service.retrieve_for_turn("Compare the basic and premium plans", "conv-1")
+        turn = await service.retrieve_for_turn("what about the second one?", "conv-1")
+
+        assert turn.prepared.standalone == "premium plan pricing"
+        assert kb.queries[-1] == "premium plan pricing"
+        assert kb.embeddings[-1] == [20.0, 1.0]
+        assert embeddings.texts == ["Compare the basic and premium plans", "premium plan pricing"]
+
+
+class TestPreprocessorConfiguration:
+    """Tests for building the preprocessor from settings."""
+
+    def test_rewriter_uses_the_provider_of_its_model(self, monkeypatch):
+        """Test that the default rewrite model is created on Bedrock whatever LLM_PROVIDER is."""
+        created = []
+        monkeypatch.setattr("core.config.settings.LLM_PROVIDER", "gemini")
+        monkeypatch.setattr("core.config.settings.RAG_QUERY_REWRITE_ENABLED", True)
+        monkeypatch.setattr(query_rewriting, "_query_preprocessor", None)
+        monkeypatch.setattr(
+            "infrastructure.ai_services.factory.LLMFactory.create",
+            lambda provider=None, model_id=None: created.append((provider, model_id)) or FakeRewriter("")
+        )
+
+        get_query_preprocessor()
+
+        assert created == [("bedrock", "anthropic.claude-3-haiku-20240307-v1:0")]
+
+    def test_no_query_embedding_without_vector_store_domains(self, monkeypatch):
+        """Test that queries are not embedded when only knowledge bases, which embed themselves, are searched."""
+        monkeypatch.setattr("core.config.settings.RAG_QUERY_EMBEDDING_ENABLED", True)
+        monkeypatch.setattr("core.config.settings.RAG_QUERY_REWRITE_ENABLED", False)
+        monkeypatch.setattr("core.config.settings.RAG_VECTOR_STORE_DOMAINS", "")
+        monkeypatch.setattr(query_rewriting, "_query_preprocessor", None)
+
+        assert get_query_preprocessor().embedding_service is None
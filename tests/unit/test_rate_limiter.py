@@ -0,0 +1,146 @@
+"""
+Unit tests for rate limiting backends.
+"""
+
+import pytest
+from starlette.requests import Request
+from api.middlewares.rate_limit_middleware import get_client_ip, settings
+from infrastructure.rate_limit.memory import InMemoryRateLimitBackend
+from infrastructure.rate_limit.redis_store import RedisRateLimitBackend
+from infrastructure.rate_limit.fake_redis import FakeRedis
+
+
+class FakeClock:
+    """Manually advanced clock."""
+
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_backends(clock):
+    return [
+        InMemoryRateLimitBackend(clock=clock),
+        RedisRateLimitBackend(FakeRedis(clock=clock)),
+    ]
+
+
+class TestGCRABackends:
+    """Tests shared by the in-memory and Redis backends."""
+
+    @pytest.mark.asyncio
+    async def test_allows_burst_up_to_limit(self):
+        """Test that a full window's budget can be spent at once."""
+        for backend in make_backends(FakeClock()):
+            results = [await backend.hit("user:1", limit=5, window_seconds=60) for _ in range(5)]
+
+            assert all(r.allowed for r in results)
+            assert [r.remaining for r in results] == [4, 3, 2, 1, 0]
+
+    @pytest.mark.asyncio
+    async def test_rejects_over_limit_with_retry_after(self):
+        """Test that the request beyond the limit is rejected."""
+        for backend in make_backends(FakeClock()):
+            for _ in range(5):
+                await backend.hit("user:1", limit=5, window_seconds=60)
+
+            result = await backend.hit("user:1", limit=5, window_seconds=60)
+
+            assert not result.allowed
+            assert result.retry_after == pytest.approx(12.0)
+
+    @pytest.mark.asyncio
+    async def test_replenishes_one_request_per_emission_interval(self):
+        """Test sliding replenishment instead of fixed window reset."""
+        clock = FakeClock()
+        for backend in make_backends(clock):
+            clock.now = 1000.0
+            for _ in range(5):
+                await backend.hit("user:2", limit=5, window_seconds=60)
+
+            clock.now += 12.0
+            assert (await backend.hit("user:2", limit=5, window_seconds=60)).allowed
+            assert not (await backend.hit("user:2", limit=5, window_seconds=60)).allowed
+
+    @pytest.mark.asyncio
+    async def test_keys_are_independent(self):
+        """Test that limits apply per key."""
+        for backend in make_backends(FakeClock()):
+            for _ in range(3):
+                await backend.hit("ip:a", limit=3, window_seconds=60)
+
+            assert not (await backend.hit("ip:a", limit=3, window_seconds=60)).allowed
+            assert (await backend.hit("ip:b", limit=3, window_seconds=60)).allowed
+
+    @pytest.mark.asyncio
+    async def test_reset_clears_state(self):
+        """Test that reset restores the full budget."""
+        for backend in make_backends(FakeClock()):
+            for _ in range(2):
+                await backend.hit("user:3", limit=2, window_seconds=60)
+            await backend.reset("user:3")
+
+            assert (await backend.hit("user:3", limit=2, window_seconds=60)).allowed
+
+
+class TestClientIP:
+    """Tests for get_client_ip."""
+
+    @staticmethod
+    def make_request(forwarded_for=None, event=None):
+        headers = [(b"x-forwarded-for", forwarded_for.encode())] if forwarded_for else []
+        scope = {"type": "http", "headers": headers, "client": ("10.0.0.9", 443)}
+        if event is not None:
+            scope["aws.event"] = event
+        return Request(scope)
+
+    def test_client_supplied_forwarded_entries_are_ignored(self, monkeypatch):
+        """Test that only the entry added by the trusted proxy is used, so clients cannot pick their key."""
+        monkeypatch.setattr(settings, "RATE_LIMIT_TRUSTED_PROXY_HOPS", 1)
+
+        ip = get_client_ip(self.make_request("6.6.6.6, 203.0.113.7"))
+
+        assert ip == "203.0.113.7"
+
+    def test_forwarded_header_is_untrusted_without_proxies(self, monkeypatch):
+        """Test that the peer address is used when no proxy hops are configured."""
+        monkeypatch.setattr(settings, "RATE_LIMIT_TRUSTED_PROXY_HOPS", 0)
+
+        assert get_client_ip(self.make_request("6.6.6.6")) == "10.0.0.9"
+
+    def test_api_gateway_source_ip_is_preferred(self):
+        """Test that the source IP from the API Gateway request context wins over headers."""
+        event = {"requestContext": {"identity": {"sourceIp": "198.51.100.4"}}}
+
+        assert get_client_ip(self.make_request("6.6.6.6", event)) == "198.51.100.4"
+
+
+class ClosingBackend(InMemoryRateLimitBackend):
+    """In-memory backend recording whether it was closed."""
+
+    closed = False
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+class TestRateLimiterShutdown:
+    """Tests for closing the singleton rate limiter."""
+
+    @pytest.mark.asyncio
+    async def test_close_only_closes_an_existing_limiter(self, monkeypatch):
+        """Test that shutdown does not build a limiter (and backend connection) just to close it."""
+        from infrastructure.rate_limit import limiter
+        monkeypatch.setattr(limiter, "_rate_limiter", None)
+        monkeypatch.setattr(limiter, "create_rate_limit_backend", lambda: pytest.fail("backend created"))
+
+        await limiter.close_rate_limiter()
+
+        backend = ClosingBackend()
+        monkeypatch.setattr(limiter, "_rate_limiter", limiter.RateLimiter(backend))
+        await limiter.close_rate_limiter()
+
+        assert backend.closed is True
+        assert limiter._rate_limiter is None
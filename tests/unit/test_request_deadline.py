@@ -0,0 +1,106 @@
+"""
+Unit tests for request deadlines and cancellation.
+"""
+
+import asyncio
+import pytest
+from core.deadline import RequestDeadline, get_request_deadline, request_deadline
+from core.errors import DeadlineExceededError, RequestCancelledError
+from application.services.rag_service import RAGService
+
+
+class FakeKnowledgeBaseService:
+    """Knowledge base returning one context after an optional delay."""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+
+    async def get_knowledge_base_by_domain(self, domain):
+        return "kb-general"
+
+    async def retrieve_contexts(self, query, knowledge_base_id, top_k=5):
+        await asyncio.sleep(self.delay)
+        return [{"text": "context"}]
+
+
+class SlowLLM:
+    """LLM provider that records whether it was cancelled."""
+
+    def __init__(self, delay: float):
+        self.delay = delay
+        self.cancelled = False
+
+    async def generate_response(self, **kwargs):
+        try:
+            await asyncio.sleep(self.delay)
+            return "answer"
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+
+    def get_provider_name(self):
+        return "fake"
+
+    def get_model_info(self):
+        return {"max_input_tokens": 8192}
+
+
+class TestRequestDeadline:
+    """Tests for stage budgets."""
+
+    @pytest.mark.asyncio
+    async def test_stage_aborted_when_budget_exhausted(self):
+        """Test that a stage exceeding the deadline raises promptly."""
+        deadline = RequestDeadline(0.05)
+
+        with pytest.raises(DeadlineExceededError):
+            await deadline.run("generation", asyncio.sleep(5))
+
+    @pytest.mark.asyncio
+    async def test_optional_stage_skipped_when_time_is_short(self):
+        """Test that optional stages are skipped instead of started."""
+        deadline = RequestDeadline(0.1)
+        started = []
+
+        async def rerank():
+            started.append(True)
+            return ["reranked"]
+
+        result = await deadline.run_optional("rerank", rerank, default=["original"], min_seconds=1.0)
+
+        assert result == ["original"]
+        assert started == []
+        assert deadline.skipped_stages == ["rerank"]
+
+    def test_unbounded_outside_request(self):
+        """Test that code outside a request sees no deadline."""
+        assert get_request_deadline().remaining() is None
+
+
+class TestRAGServiceCancellation:
+    """Tests for deadline propagation through RAGService."""
+
+    @pytest.mark.asyncio
+    async def test_cancel_aborts_generation(self):
+        """Test that cancelling the request cancels the LLM call."""
+        llm = SlowLLM(delay=5)
+        service = RAGService(FakeKnowledgeBaseService(), llm)
+        deadline = RequestDeadline(30)
+        asyncio.get_running_loop().call_later(0.05, deadline.cancel, "Client disconnected")
+
+        with request_deadline(deadline):
+            with pytest.raises(RequestCancelledError):
+                await service.retrieve_and_generate("question")
+
+        assert llm.cancelled
+
+    @pytest.mark.asyncio
+    async def test_retrieval_leaves_time_for_generation(self):
+        """Test that slow retrieval is cut off at its share of the budget."""
+        service = RAGService(FakeKnowledgeBaseService(delay=5), SlowLLM(delay=0))
+
+        with request_deadline(RequestDeadline(4.0)):
+            with pytest.raises(DeadlineExceededError) as exc_info:
+                await service.retrieve_and_generate("question")
+
+        assert exc_info.value.details["stage"] == "retrieval"
@@ -0,0 +1,74 @@
+"""
+Unit tests for context reranking.
+"""
+
+import pytest
+from application.services.rag_service import RAGService
+from infrastructure.ai_services.providers.bedrock import BedrockClient
+from infrastructure.ai_services.services.local_agent_runtime import LocalAgentRuntimeClient
+from infrastructure.ai_services.services.reranker import BedrockReranker, LexicalReranker
+
+
+class RecordingKnowledgeBase:
+    """Knowledge base returning fixed contexts in weak similarity order."""
+
+    def __init__(self, texts):
+        self.texts = texts
+        self.requested_top_k = None
+
+    async def get_knowledge_base_by_domain(self, domain):
+        return "kb-general"
+
+    async def retrieve_contexts(self, query, knowledge_base_id, top_k=5):
+        self.requested_top_k = top_k
+        return [{"text": text, "score": 0.5} for text in self.texts[:top_k]]
+
+
+class FailingReranker:
+    async def rerank(self, query, contexts, top_k):
+        raise RuntimeError("Reranker unavailable")
+
+
+TEXTS = [
+    "Office hours and parking information.",
+    "Refunds are issued within 14 days of a return.",
+    "Our refund policy covers damaged items and late refunds.",
+]
+
+
+class TestReranking:
+    """Tests for the reranking stage."""
+
+    @pytest.mark.asyncio
+    async def test_overfetches_and_keeps_best(self, monkeypatch):
+        """Test that candidates are over-fetched and the most relevant kept."""
+        monkeypatch.setattr("core.config.settings.RAG_RERANK_CANDIDATES", 10)
+        kb = RecordingKnowledgeBase(TEXTS)
+        service = RAGService(kb, llm_provider=None, reranker=LexicalReranker())
+
+        contexts = await service.retrieve_contexts("refund policy", top_k=1)
+
+        assert kb.requested_top_k == 10
+        assert contexts[0]["text"] == TEXTS[2]
+        assert "rerank_score" in contexts[0]
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_retrieval_order(self):
+        """Test that a failing reranker does not fail retrieval."""
+        service = RAGService(RecordingKnowledgeBase(TEXTS), llm_provider=None, reranker=FailingReranker())
+
+        contexts = await service.retrieve_contexts("refund policy", top_k=2)
+
+        assert [ctx["text"] for ctx in contexts] == TEXTS[:2]
+
+    @pytest.mark.asyncio
+    async def test_bedrock_reranker_batches_candidates(self):
+        """Test that all candidates are scored in one Rerank call."""
+        runtime = LocalAgentRuntimeClient()
+        reranker = BedrockReranker(BedrockClient(agent_runtime_client=runtime), model_arn="arn:test")
+        contexts = [{"text": text} for text in TEXTS]
+
+        ranked = await reranker.rerank("refund policy", contexts, top_k=2)
+
+        assert runtime.calls == [{"rerank": 3}]
+        assert ranked[0]["text"] == TEXTS[2]
@@ -0,0 +1,160 @@
+"""
+Unit tests for the retrieval cache.
+"""
+
+import asyncio
+import pytest
+from application.services.rag_service import RAGService
+from infrastructure.cache import RetrievalCache
+from infrastructure.cache.chatbot_configs import ChatbotConfigCache
+from infrastructure.postgresql.models.document_model import DocumentModel
+from infrastructure.postgresql.notifications import ChatbotConfigListener, knowledge_base_change_payload
+from infrastructure.postgresql.repositories import document_repository
+from infrastructure.postgresql.repositories.document_repository import DocumentRepositoryImpl
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class CountingKnowledgeBase:
+    """Knowledge base counting retrieve calls."""
+
+    def __init__(self):
+        self.calls = 0
+
+    async def get_knowledge_base_by_domain(self, domain):
+        return f"kb-{domain}"
+
+    async def retrieve_contexts(self, query, knowledge_base_id, top_k=5):
+        self.calls += 1
+        return [{"text": f"{query} {self.calls}:{i}", "score": 1.0} for i in range(top_k)]
+
+
+class RecordingSession:
+    """Async session holding one document and recording statements."""
+
+    def __init__(self, document):
+        self.document = document
+        self.statements = []
+        self.commits = 0
+
+    async def get(self, model, id):
+        return self.document if id == self.document.id else None
+
+    async def execute(self, statement, params=None):
+        self.statements.append((str(statement), params))
+
+    async def commit(self):
+        self.commits += 1
+
+
+class TestRetrievalCache:
+    """Tests for lookup rules."""
+
+    def test_superset_answers_smaller_top_k(self):
+        """Test that a cached top-10 answers a top-5 request but not a top-20."""
+        cache = RetrievalCache()
+        cache.put("kb", "What is RAG?", 10, [{"text": str(i)} for i in range(10)])
+
+        hit = cache.get("kb", "  what is   rag", 5)
+
+        assert [ctx["text"] for ctx in hit.contexts] == ["0", "1", "2", "3", "4"]
+        assert cache.get("kb", "what is rag", 20) is None
+
+    def test_entries_expire_after_ttl(self):
+        """Test TTL eviction."""
+        clock = FakeClock()
+        cache = RetrievalCache(ttl_seconds=10, clock=clock)
+        cache.put("kb", "q", 5, [{"text": "a"}])
+
+        clock.now = 11
+
+        assert cache.get("kb", "q", 5) is None
+
+    def test_invalidation_discards_in_flight_results(self):
+        """Test that results fetched before an invalidation are not stored."""
+        cache = RetrievalCache()
+        generation = cache.generation("kb")
+
+        cache.invalidate_knowledge_base("kb")
+        stored = cache.put("kb", "q", 5, [{"text": "old"}], generation=generation)
+
+        assert not stored
+        assert cache.get("kb", "q", 5) is None
+
+
+class TestRAGServiceCaching:
+    """Tests for the cache in RAGService."""
+
+    @pytest.mark.asyncio
+    async def test_repeated_query_skips_retrieval(self):
+        """Test that a repeated query is served from the cache."""
+        kb = CountingKnowledgeBase()
+        service = RAGService(kb, llm_provider=None, retrieval_cache=RetrievalCache())
+
+        await service.retrieve_contexts("q", top_k=10)
+        contexts = await service.retrieve_contexts("Q?", top_k=5)
+
+        assert kb.calls == 1
+        assert len(contexts) == 5
+
+    @pytest.mark.asyncio
+    async def test_stale_entry_served_while_refreshing(self):
+        """Test that stale results are returned at once and refreshed in the background."""
+        clock = FakeClock()
+        cache = RetrievalCache(ttl_seconds=10, stale_ttl_seconds=60, clock=clock)
+        kb = CountingKnowledgeBase()
+        service = RAGService(kb, llm_provider=None, retrieval_cache=cache)
+        await service.retrieve_contexts("q", top_k=1)
+
+        clock.now = 15
+        stale = await service.retrieve_contexts("q", top_k=1)
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        fresh = await service.retrieve_contexts("q", top_k=1)
+
+        assert stale[0]["text"] == "q 1:0"
+        assert fresh[0]["text"] == "q 2:0"
+        assert kb.calls == 2
+
+
+class TestIngestionInvalidation:
+    """Tests for invalidating cached retrievals when an ingestion completes."""
+
+    def test_notification_drops_only_that_knowledge_base(self):
+        """Test that a knowledge base change notification leaves other knowledge bases cached."""
+        cache = RetrievalCache()
+        cache.put("kb-finance", "q", 5, [{"text": "old"}])
+        cache.put("kb-general", "q", 5, [{"text": "kept"}])
+        listener = ChatbotConfigListener(ChatbotConfigCache(), dsn="postgresql://test", retrieval_cache=cache)
+
+        listener.handle_knowledge_base_change(knowledge_base_change_payload("kb-finance"))
+
+        assert cache.get("kb-finance", "q", 5) is None
+        assert cache.get("kb-general", "q", 5).contexts == [{"text": "kept"}]
+
+    @pytest.mark.asyncio
+    async def test_completed_processing_publishes_knowledge_base_change(self, monkeypatch):
+        """Test that completing a document notifies workers in its transaction and clears this process."""
+        cache = RetrievalCache()
+        cache.put("kb-finance", "q", 5, [{"text": "old"}])
+        monkeypatch.setattr(document_repository, "get_retrieval_cache", lambda: cache)
+        monkeypatch.setattr(
+            "infrastructure.ai_services.services.knowledge_base._knowledge_base_ids",
+            {"general": "kb-general", "finance": "kb-finance"}
+        )
+        session = RecordingSession(DocumentModel(id="doc-1", domain="finance"))
+
+        updated = await DocumentRepositoryImpl(session).update_status("doc-1", "processed", "completed")
+
+        assert updated
+        statement, params = session.statements[0]
+        assert "pg_notify" in statement
+        assert params["payload"] == knowledge_base_change_payload("kb-finance")
+        assert session.commits == 1
+        assert cache.get("kb-finance", "q", 5) is None
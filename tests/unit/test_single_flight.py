@@ -0,0 +1,139 @@
+"""
+Unit tests for single-flight request coalescing.
+"""
+
+import asyncio
+import pytest
+from application.services.rag_service import RAGService
+from infrastructure.cache.single_flight import SingleFlight
+
+
+class CountingKnowledgeBase:
+    """Knowledge base counting retrievals."""
+
+    def __init__(self):
+        self.calls = 0
+
+    async def get_knowledge_base_by_domain(self, domain):
+        return "kb-general"
+
+    async def retrieve_contexts(self, query, knowledge_base_id, top_k=5):
+        self.calls += 1
+        await asyncio.sleep(0.02)
+        return [{"text": "Refunds are accepted within 30 days.", "score": 0.9}]
+
+
+class CountingLLM:
+    """LLM counting generations and streams."""
+
+    def __init__(self):
+        self.generations = 0
+        self.streams = 0
+
+    async def generate_response(self, prompt, context=None, max_tokens=1000, temperature=0.7, **kwargs):
+        self.generations += 1
+        await asyncio.sleep(0.02)
+        return "Within 30 days."
+
+    async def generate_streaming_response(self, prompt, context=None, max_tokens=1000, temperature=0.7, **kwargs):
+        self.streams += 1
+        for word in ("Within", " 30", " days."):
+            await asyncio.sleep(0.01)
+            yield word
+
+    def get_provider_name(self):
+        return "fake"
+
+    def get_model_info(self):
+        return {"model_id": "fake-1", "max_input_tokens": 8192, "max_output_tokens": 2048}
+
+
+class TestSingleFlight:
+    """Tests for SingleFlight."""
+
+    @pytest.mark.asyncio
+    async def test_identical_calls_share_one_execution(self):
+        """Test that concurrent callers with one key run the work once."""
+        group = SingleFlight()
+        calls = 0
+
+        async def work():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.02)
+            return calls
+
+        results = await asyncio.gather(*(group.do("key", work) for _ in range(10)))
+
+        assert results == [1] * 10
+        assert group.stats() == {"started": 1, "coalesced": 9, "in_flight": 0}
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_others(self):
+        """Test that the shared call survives one caller going away."""
+        group = SingleFlight()
+
+        async def work():
+            await asyncio.sleep(0.05)
+            return "done"
+
+        first = asyncio.ensure_future(group.do("key", work))
+        second = asyncio.ensure_future(group.do("key", work))
+        await asyncio.sleep(0.01)
+        first.cancel()
+
+        assert await second == "done"
+
+    @pytest.mark.asyncio
+    async def test_late_subscriber_receives_whole_stream(self):
+        """Test that a subscriber joining mid-stream first gets the chunks already produced."""
+        group = SingleFlight()
+        opened = 0
+
+        async def upstream():
+            nonlocal opened
+            opened += 1
+            for chunk in ("a", "b", "c"):
+                await asyncio.sleep(0.01)
+                yield chunk
+
+        async def collect(delay):
+            await asyncio.sleep(delay)
+            return [chunk async for chunk in group.stream("key", upstream)]
+
+        early, late = await asyncio.gather(collect(0), collect(0.015))
+
+        assert early == late == ["a", "b", "c"]
+        assert opened == 1
+
+
+class TestRAGServiceCoalescing:
+    """Tests for coalescing in RAGService."""
+
+    @pytest.mark.asyncio
+    async def test_identical_chats_share_retrieval_and_generation(self):
+        """Test that a burst of identical questions reaches the backends once."""
+        kb, llm, group = CountingKnowledgeBase(), CountingLLM(), SingleFlight()
+
+        responses = await asyncio.gather(*(
+            RAGService(kb, llm, single_flight=group).retrieve_and_generate("refund window?")
+            for _ in range(5)
+        ))
+
+        assert {response["response"] for response in responses} == {"Within 30 days."}
+        assert kb.calls == 1
+        assert llm.generations == 1
+
+    @pytest.mark.asyncio
+    async def test_identical_streams_fan_out(self):
+        """Test that identical concurrent streams share one upstream generation."""
+        llm, group = CountingLLM(), SingleFlight()
+        service = RAGService(CountingKnowledgeBase(), llm, single_flight=group)
+
+        async def collect():
+            return "".join([chunk async for chunk in service.generate_streaming_response("q", context="c")])
+
+        results = await asyncio.gather(collect(), collect(), collect())
+
+        assert results == ["Within 30 days."] * 3
+        assert llm.streams == 1
@@ -0,0 +1,111 @@
+"""
+Unit tests for the Server-Sent Events chat stream.
+"""
+
+import pytest
+from application.services.rag_service import RAGService
+from infrastructure.streaming import format_sse
+from usecases.rag_use_cases import StreamChatWithDocumentsUseCase
+
+
+class OneContextKnowledgeBase:
+    """Knowledge base returning the same context for every query."""
+
+    async def get_knowledge_base_by_domain(self, domain):
+        return "kb-general"
+
+    async def retrieve_contexts(self, query, knowledge_base_id, top_k=5):
+        return [{"text": "Refunds are accepted within 30 days.", "score": 0.9}]
+
+
+class RecordingChatLLM:
+    """LLM stand-in streaming a fixed answer and recording the chat it was sent."""
+
+    def __init__(self, tokens):
+        self.tokens = tokens
+        self.calls = []
+
+    async def generate_chat_stream(self, messages, system=None, context=None, **kwargs):
+        self.calls.append({"messages": messages, "system": system, "context": context})
+        for token in self.tokens:
+            yield token
+
+    def get_provider_name(self):
+        return "fake"
+
+    def get_model_info(self):
+        return {"model_id": "fake", "max_input_tokens": 8000}
+
+
+class TestStreamChatWithDocumentsUseCase:
+    """Tests for streamed RAG chat events."""
+
+    @pytest.mark.asyncio
+    async def test_events_ordered_contexts_tokens_done(self, streaming_rag_service):
+        """Test that contexts come first and the stream's reported usage comes last."""
+        rag_service = streaming_rag_service(["The ", "answer ", "is ", "42."])
+        rag_service.get_provider_name = lambda: "fake"
+        use_case = StreamChatWithDocumentsUseCase(rag_service, flush_min_chars=8)
+
+        events = [event async for event in use_case.execute("question")]
+
+        assert events[0]["event"] == "contexts"
+        assert events[-1]["event"] == "done"
+        tokens = [e["data"]["text"] for e in events if e["event"] == "token"]
+        assert "".join(tokens) == "The answer is 42."
+        assert events[-1]["data"]["chars"] == len("The answer is 42.")
+        assert events[-1]["data"]["usage"]["output_tokens"] == 4
+        assert events[-1]["data"]["usage"]["provider"] == "fake"
+
+    @pytest.mark.asyncio
+    async def test_closing_stream_closes_llm_generation(self, streaming_rag_service):
+        """Test that an abandoned stream stops the upstream LLM call."""
+        rag_service = streaming_rag_service(["token "] * 100)
+        use_case = StreamChatWithDocumentsUseCase(rag_service, flush_min_chars=6)
+
+        events = use_case.execute("question")
+        async for event in events:
+            if event["event"] == "token":
+                break
+        await events.aclose()
+
+        assert rag_service.closed
+
+
+    @pytest.mark.asyncio
+    async def test_conversation_stream_sends_history_and_records_reply(self):
+        """Test that stored turns reach the model with the system prompt and the reply is kept."""
+        stored = [
+            {"role": "user", "content": "What is the refund window?"},
+            {"role": "assistant", "content": "30 days."},
+            {"role": "user", "content": "Does that apply online?"},
+        ]
+
+        async def load_stored(conversation_id, limit):
+            return stored[-limit:]
+
+        llm = RecordingChatLLM(["Yes, ", "online too."])
+        rag_service = RAGService(OneContextKnowledgeBase(), llm, history_loader=load_stored)
+        use_case = StreamChatWithDocumentsUseCase(rag_service, flush_min_chars=4)
+
+        events = [
+            event async for event in use_case.execute(
+                "Does that apply online?", conversation_id="42", system_prompt="You are a support agent."
+            )
+        ]
+
+        assert events[-1]["event"] == "done"
+        call = llm.calls[0]
+        assert call["system"] == "You are a support agent."
+        assert call["messages"] == stored
+        assert "30 days" in call["context"]
+        assert rag_service.conversation_contexts.get_turns("42") == stored + [
+            {"role": "assistant", "content": "Yes, online too."}
+        ]
+
+class TestFormatSSE:
+    """Tests for SSE wire formatting."""
+
+    def test_format_event(self):
+        """Test event name and JSON data lines."""
+        assert format_sse("token", {"text": "hi"}) == 'event: token\ndata: {"text":"hi"}\n\n'
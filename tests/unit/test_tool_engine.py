@@ -0,0 +1,384 @@
+"""
+Unit tests for the tool registry, executor and tool-use loop.
+"""
+
+import asyncio
+import json
+import time
+from datetime import datetime
+from types import SimpleNamespace
+import pytest
+from application.services.conversation_service import ConversationService
+from application.services.rag_service import RAGService
+from application.services.tool_calling import NO_ANSWER_RESPONSE, ToolCallingLoop
+from domain.entities.chatbot import Chatbot
+from infrastructure.ai_services.providers import bedrock
+from infrastructure.ai_services.tools.document_analyzer import DocumentAnalyzerTool
+from infrastructure.ai_services.tools.executor import ToolExecutor, ToolStats
+from infrastructure.ai_services.tools.registry import ToolRegistry
+from infrastructure.cache.chatbot_configs import ChatbotConfigCache
+from infrastructure.cache.tool_results import ToolResultCache
+from infrastructure.postgresql.notifications import ChatbotConfigListener, knowledge_base_change_payload
+from schemas.conversation_schema import ReplyCreate
+from shared.interfaces.services.ai_services.tool import ITool, ToolContext
+from usecases.conversation_use_cases import ReplyToConversationUseCase
+
+CLAUDE = "anthropic.claude-3-haiku-20240307-v1:0"
+
+
+class SleepyTool(ITool):
+    """Tool that sleeps, then echoes its arguments; counts its runs."""
+
+    input_schema = {"type": "object", "properties": {"q": {"type": "string"}}}
+
+    def __init__(self, name, delay=0.0, idempotent=False, timeout_seconds=None):
+        self.name = name
+        self.description = f"{name} tool"
+        self.delay = delay
+        self.idempotent = idempotent
+        self.cache_ttl_seconds = 60.0 if idempotent else 0.0
+        self.timeout_seconds = timeout_seconds
+        self.runs = 0
+
+    async def run(self, arguments):
+        self.runs += 1
+        await asyncio.sleep(self.delay)
+        return {"tool": self.name, "q": arguments.get("q")}
+
+
+def tool_use(id, name, **arguments):
+    return {"type": "tool_use", "id": id, "name": name, "input": arguments}
+
+
+class ScriptedLLM:
+    """LLM returning scripted turns and recording the tool turns it was sent."""
+
+    def __init__(self, turns):
+        self.turns = list(turns)
+        self.requests = []
+
+    def supports_tools(self):
+        return True
+
+    def get_provider_name(self):
+        return "scripted"
+
+    def get_model_info(self):
+        return {"model_id": "scripted"}
+
+    async def generate_tool_turn(self, messages, tools, tool_turns=None, **kwargs):
+        self.requests.append({"tools": tools, "tool_turns": list(tool_turns or []), **kwargs})
+        return self.turns.pop(0)
+
+
+class DomainKnowledgeBase:
+    """Knowledge base with one passage per domain, recording the domains searched."""
+
+    def __init__(self):
+        self.searched = []
+
+    async def get_knowledge_base_by_domain(self, domain):
+        return f"kb-{domain}"
+
+    async def retrieve_contexts(self, query, knowledge_base_id, top_k=5, query_embedding=None):
+        self.searched.append(knowledge_base_id)
+        return [{"text": f"{query} in {knowledge_base_id}", "source": "handbook.pdf", "score": 0.9}]
+
+
+class RecordingBedrockClient:
+    """Bedrock client recording request bodies and answering with a tool call."""
+
+    def __init__(self):
+        self.bodies = []
+
+    async def invoke_model(self, model_id, body):
+        self.bodies.append(json.loads(body))
+        return {
+            "content": [tool_use("t1", "document_analyzer", query="leave")],
+            "stop_reason": "tool_use",
+            "usage": {"input_tokens": 50, "output_tokens": 10}
+        }
+
+
+class TestToolExecutor:
+    """Tests for ToolExecutor."""
+
+    @pytest.mark.asyncio
+    async def test_calls_of_one_turn_run_concurrently(self):
+        """Test that independent calls take as long as the slowest, not the sum."""
+        registry = ToolRegistry([SleepyTool("a", delay=0.2), SleepyTool("b", delay=0.2)])
+        executor = ToolExecutor(registry)
+
+        started = time.perf_counter()
+        results = await executor.execute([tool_use("1", "a", q="x"), tool_use("2", "b", q="y")])
+
+        assert time.perf_counter() - started < 0.35
+        assert [(result.tool_use_id, result.status) for result in results] == [("1", "ok"), ("2", "ok")]
+
+    @pytest.mark.asyncio
+    async def test_timeouts_and_unknown_tools_become_error_results(self):
+        """Test that a slow or disallowed call is reported to the model without failing the others."""
+        registry = ToolRegistry([SleepyTool("slow", delay=1.0, timeout_seconds=0.05), SleepyTool("fast")])
+        stats = ToolStats()
+        executor = ToolExecutor(registry, stats=stats)
+
+        results = await executor.execute(
+            [tool_use("1", "slow"), tool_use("2", "fast"), tool_use("3", "missing")], allowed=["slow", "fast"]
+        )
+
+        assert [result.status for result in results] == ["timeout", "ok", "unknown"]
+        assert results[0].to_block()["is_error"] is True
+        assert "is_error" not in results[1].to_block()
+        assert stats.snapshot()["tools"]["slow"]["timeouts"] == 1
+
+    @pytest.mark.asyncio
+    async def test_only_idempotent_tools_are_cached(self):
+        """Test that repeated calls with equal arguments reuse results of idempotent tools only."""
+        search, action = SleepyTool("search", idempotent=True), SleepyTool("action")
+        executor = ToolExecutor(ToolRegistry([search, action]), cache=ToolResultCache())
+
+        await executor.execute([tool_use("1", "search", q="x"), tool_use("2", "action", q="x")])
+        results = await executor.execute([tool_use("3", "search", q="x"), tool_use("4", "action", q="x")])
+
+        assert [result.status for result in results] == ["cached", "ok"]
+        assert (search.runs, action.runs) == (1, 2)
+
+
+class TestToolCallingLoop:
+    """Tests for ToolCallingLoop."""
+
+    @pytest.mark.asyncio
+    async def test_tool_results_are_fed_back_until_the_model_answers(self):
+        """Test that each tool turn is answered with its results and round trips are recorded."""
+        registry = ToolRegistry([SleepyTool("search", idempotent=True)])
+        executor = ToolExecutor(registry)
+        llm = ScriptedLLM([
+            {"content": [tool_use("t1", "search", q="a"), tool_use("t2", "search", q="b")], "stop_reason": "tool_use"},
+            {"content": [{"type": "text", "text": "Done."}], "stop_reason": "end_turn"}
+        ])
+
+        result = await ToolCallingLoop(registry, executor).run(
+            llm, [{"role": "user", "content": "Compare a and b"}], ["search", "unimplemented"]
+        )
+
+        assert (result.response, result.rounds) == ("Done.", 2)
+        assert [tool["name"] for tool in llm.requests[0]["tools"]] == ["search"]
+        assistant, user = llm.requests[1]["tool_turns"]
+        assert assistant["role"] == "assistant"
+        assert [block["tool_use_id"] for block in user["content"]] == ["t1", "t2"]
+        assert executor.stats.snapshot()["round_trip_counts"] == {"2": 1}
+
+    @pytest.mark.asyncio
+    async def test_round_limit_asks_the_model_to_answer(self):
+        """Test that the last allowed round carries a notice and ends the loop."""
+        registry = ToolRegistry([SleepyTool("search")])
+        executor = ToolExecutor(registry)
+        llm = ScriptedLLM([
+            {"content": [tool_use("t1", "search")], "stop_reason": "tool_use"},
+            {"content": [{"type": "text", "text": "Best effort."}, tool_use("t2", "search")], "stop_reason": "tool_use"}
+        ])
+
+        result = await ToolCallingLoop(registry, executor, max_rounds=2).run(
+            llm, [{"role": "user", "content": "Search forever"}], ["search"]
+        )
+
+        assert (result.response, result.rounds, result.hit_round_limit) == ("Best effort.", 2, True)
+        assert llm.requests[1]["tool_turns"][-1]["content"][-1]["type"] == "text"
+        assert executor.stats.snapshot()["round_limit_hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_answer_without_text_falls_back(self):
+        """Test that a last round asking only for tools yields a fixed answer instead of an empty one."""
+        registry = ToolRegistry([SleepyTool("search")])
+        llm = ScriptedLLM([
+            {"content": [tool_use("t1", "search")], "stop_reason": "tool_use"},
+            {"content": [tool_use("t2", "search")], "stop_reason": "tool_use"}
+        ])
+
+        result = await ToolCallingLoop(registry, ToolExecutor(registry), max_rounds=2).run(
+            llm, [{"role": "user", "content": "Search forever"}], ["search"]
+        )
+
+        assert result.response == NO_ANSWER_RESPONSE
+        assert result.hit_round_limit is True
+
+
+class TestDocumentAnalyzer:
+    """Tests for keeping document searches within the caller's domains."""
+
+    def test_model_may_only_choose_the_callers_domains(self):
+        """Test that the tool definition lists only the caller's domains."""
+        tool = DocumentAnalyzerTool(DomainKnowledgeBase())
+
+        spec = tool.to_spec(ToolContext(domains=["hr", "it"]))
+
+        assert spec["input_schema"]["properties"]["domain"]["enum"] == ["hr", "it"]
+        assert "enum" not in tool.input_schema["properties"]["domain"]
+
+    @pytest.mark.asyncio
+    async def test_searches_default_to_and_stay_in_the_callers_domains(self):
+        """Test that a search without a domain uses the caller's and other domains are refused."""
+        knowledge_base = DomainKnowledgeBase()
+        executor = ToolExecutor(ToolRegistry([DocumentAnalyzerTool(knowledge_base)]), cache=ToolResultCache())
+
+        results = await executor.execute(
+            [tool_use("1", "document_analyzer", query="leave"),
+             tool_use("2", "document_analyzer", query="leave", domain="finance")],
+            context=ToolContext(domains=["hr"])
+        )
+        other_caller = await executor.execute(
+            [tool_use("3", "document_analyzer", query="leave")], context=ToolContext(domains=["it"])
+        )
+
+        assert [result.status for result in results] == ["ok", "error"]
+        assert results[0].arguments["domain"] == "hr"
+        assert "not available" in results[1].content
+        # Results are cached per resolved domain, so another caller's search is not served from cache
+        assert other_caller[0].status == "ok"
+        assert knowledge_base.searched == ["kb-hr", "kb-it"]
+
+    @pytest.mark.asyncio
+    async def test_vector_store_domains_search_their_own_source(self):
+        """Test that a domain with its own source is not searched in the default knowledge base."""
+        knowledge_base, handbook_store = DomainKnowledgeBase(), DomainKnowledgeBase()
+        tool = DocumentAnalyzerTool(knowledge_base, domain_sources={"handbook": handbook_store})
+
+        await tool.run({"query": "leave", "domain": "handbook"})
+        await tool.run({"query": "leave", "domain": "hr"})
+
+        assert handbook_store.searched == ["kb-handbook"]
+        assert knowledge_base.searched == ["kb-hr"]
+
+    @pytest.mark.asyncio
+    async def test_knowledge_base_change_drops_cached_searches(self):
+        """Test that a knowledge base change notification drops document search results only."""
+        knowledge_base, other = DomainKnowledgeBase(), SleepyTool("lookup", idempotent=True)
+        cache = ToolResultCache()
+        executor = ToolExecutor(ToolRegistry([DocumentAnalyzerTool(knowledge_base), other]), cache=cache)
+        calls = [tool_use("1", "document_analyzer", query="leave"), tool_use("2", "lookup", q="x")]
+        await executor.execute(calls, context=ToolContext(domains=["hr"]))
+
+        listener = ChatbotConfigListener(ChatbotConfigCache(), dsn="postgresql://test", tool_result_cache=cache)
+        listener.handle_knowledge_base_change(knowledge_base_change_payload("kb-hr"))
+        results = await executor.execute(calls, context=ToolContext(domains=["hr"]))
+
+        assert [result.status for result in results] == ["ok", "cached"]
+        assert knowledge_base.searched == ["kb-hr", "kb-hr"]
+
+
+class TestBedrockToolTurn:
+    """Tests for the Bedrock tool-use request."""
+
+    @pytest.mark.asyncio
+    async def test_tools_are_sent_and_tool_turns_follow_the_conversation(self, monkeypatch):
+        """Test that the body carries the tools, with this answer's tool turns after the messages."""
+        client = RecordingBedrockClient()
+        monkeypatch.setattr(bedrock, "get_bedrock_client", lambda: client)
+        llm = bedrock.BedrockLLMService(model_id=CLAUDE)
+        tools = [DocumentAnalyzerTool(DomainKnowledgeBase()).to_spec(ToolContext(domains=["hr"]))]
+        tool_turns = [
+            {"role": "assistant", "content": [tool_use("t0", "document_analyzer", query="leave")]},
+            {"role": "user", "content": [{"type": "tool_result", "tool_use_id": "t0", "content": "[]"}]}
+        ]
+
+        turn = await llm.generate_tool_turn(
+            [{"role": "user", "content": "Hi"}, {"role": "assistant", "content": "Hello!"},
+             {"role": "user", "content": "How many leave days?"}],
+            tools, system="Be brief.", tool_turns=tool_turns
+        )
+
+        body = client.bodies[0]
+        assert body["tools"] == tools
+        assert [message["role"] for message in body["messages"]] == ["user", "assistant", "user", "assistant", "user"]
+        assert body["messages"][-2:] == tool_turns
+        assert body["system"][0]["text"] == "Be brief."
+        assert turn["stop_reason"] == "tool_use"
+        assert turn["content"][0]["name"] == "document_analyzer"
+
+
+class InMemoryConversations:
+    """Conversation repository with one conversation of user 1 on chatbot 7."""
+
+    def __init__(self):
+        self.conversation = SimpleNamespace(id=1, user_id=1, chatbot_id=7, message_count=0, last_message_at=None)
+
+    async def find_by_id(self, id):
+        return self.conversation if id == 1 else None
+
+    async def update(self, conversation):
+        return conversation
+
+
+class InMemoryMessages:
+    """Message repository assigning IDs and creation times like the database."""
+
+    def __init__(self):
+        self.messages = []
+
+    async def create(self, message):
+        message.id = len(self.messages) + 1
+        message.created_at = datetime.utcnow()
+        self.messages.append(message)
+        return message
+
+
+class FixedChatbots:
+    """Chatbot service returning one chatbot with document_analyzer."""
+
+    async def get_chatbot_config(self, chatbot_id):
+        return Chatbot(
+            id=chatbot_id, workspace_id="w1", name="HR bot", description="", system_prompt="Be brief.",
+            tools=["document_analyzer", "unimplemented"]
+        )
+
+
+class TestToolWiring:
+    """Tests for answering with tools through RAGService and the reply use case."""
+
+    @pytest.fixture
+    def knowledge_base(self):
+        return DomainKnowledgeBase()
+
+    @pytest.fixture
+    def llm(self):
+        return ScriptedLLM([
+            {"content": [tool_use("t1", "document_analyzer", query="parental leave")], "stop_reason": "tool_use"},
+            {"content": [{"type": "text", "text": "You get 12 weeks."}], "stop_reason": "end_turn"}
+        ])
+
+    @pytest.fixture
+    def rag_service(self, knowledge_base, llm):
+        registry = ToolRegistry([DocumentAnalyzerTool(knowledge_base)])
+        return RAGService(knowledge_base, llm, tool_loop=ToolCallingLoop(registry, ToolExecutor(registry)))
+
+    @pytest.mark.asyncio
+    async def test_rag_answers_with_tools_in_the_requested_domain(self, rag_service, llm, knowledge_base):
+        """Test that tools are offered for the requested domain and their calls are returned."""
+        result = await rag_service.retrieve_and_generate(
+            "How long is parental leave?", domain="hr", tools=["document_analyzer"]
+        )
+
+        assert result["response"] == "You get 12 weeks."
+        assert result["tool_rounds"] == 2
+        assert llm.requests[0]["tools"][0]["input_schema"]["properties"]["domain"]["enum"] == ["hr"]
+        assert [call["arguments"]["domain"] for call in result["tool_calls"]] == ["hr"]
+        assert result["tool_results"][0]["id"] == "t1"
+        assert "kb-hr" in result["tool_results"][0]["content"]
+        assert knowledge_base.searched[-1] == "kb-hr"
+
+    @pytest.mark.asyncio
+    async def test_reply_stores_tool_calls_and_results_with_the_message(self, rag_service):
+        """Test that the assistant message carries its tool calls and results."""
+        messages = InMemoryMessages()
+        use_case = ReplyToConversationUseCase(
+            ConversationService(InMemoryConversations(), messages), rag_service, FixedChatbots()
+        )
+
+        reply = await use_case.execute(1, ReplyCreate(content="How long is parental leave?", domain="hr"), user_id=1)
+
+        assert reply.content == "You get 12 weeks."
+        assert reply.metadata["tool_rounds"] == 2
+        assert [call["name"] for call in reply.tool_calls] == ["document_analyzer"]
+        assert reply.tool_results[0]["is_error"] is False
+        stored = messages.messages[-1]
+        assert json.loads(stored.tool_calls)[0]["arguments"]["domain"] == "hr"
@@ -0,0 +1,100 @@
+"""
+Unit tests for LLM token usage telemetry.
+"""
+
+import time
+import pytest
+from core.telemetry import get_usage_aggregator, record_llm_usage, usage_collector
+from infrastructure.ai_services.providers import bedrock
+from usecases.rag_use_cases import ChatWithDocumentsUseCase
+
+CLAUDE = "anthropic.claude-3-haiku-20240307-v1:0"
+
+
+class FakeBedrockClient:
+    """Bedrock client returning canned Claude responses and stream events."""
+
+    async def invoke_model(self, model_id, body):
+        return {
+            "content": [{"type": "text", "text": "Refunds take 5 days."}],
+            "usage": {"input_tokens": 120, "output_tokens": 8}
+        }
+
+    async def invoke_model_stream(self, model_id, body):
+        yield {"type": "message_start", "message": {"usage": {"input_tokens": 120, "output_tokens": 1}}}
+        yield {"type": "content_block_delta", "delta": {"text": "Refunds "}}
+        yield {"type": "content_block_delta", "delta": {"text": "take 5 days."}}
+        yield {"type": "message_delta", "usage": {"output_tokens": 8}}
+
+
+class FakeRAGService:
+    """RAG service answering through the Bedrock service."""
+
+    def __init__(self, llm):
+        self.llm = llm
+
+    async def retrieve_and_generate(self, query, domain="general", context_limit=5, **kwargs):
+        return {"response": await self.llm.generate_response(query), "contexts": [], "query": query}
+
+
+@pytest.fixture
+def llm(monkeypatch):
+    monkeypatch.setattr(bedrock, "get_bedrock_client", lambda: FakeBedrockClient())
+    get_usage_aggregator().reset()
+    return bedrock.BedrockLLMService(model_id=CLAUDE)
+
+
+class TestUsageTelemetry:
+    """Tests for usage recording in providers and use cases."""
+
+    @pytest.mark.asyncio
+    async def test_stream_records_reported_tokens_and_first_token(self, llm):
+        """Test that a stream records the token counts from its events and time to first token."""
+        with usage_collector() as usage:
+            text = "".join([chunk async for chunk in llm.generate_streaming_response("How long do refunds take?")])
+
+        assert text == "Refunds take 5 days."
+        summary = usage.summary()
+        assert summary["input_tokens"] == 120
+        assert summary["output_tokens"] == 8
+        assert summary["time_to_first_token_ms"] is not None
+        assert get_usage_aggregator().snapshot()[0]["calls"] == 1
+
+    @pytest.mark.asyncio
+    async def test_chat_use_case_returns_usage(self, llm):
+        """Test that the chat use case returns the usage of the calls it made."""
+        result = await ChatWithDocumentsUseCase(FakeRAGService(llm)).execute("How long do refunds take?")
+
+        assert result["usage"]["provider"] == "bedrock"
+        assert result["usage"]["model_id"] == CLAUDE
+        assert result["usage"]["input_tokens"] == 120
+        assert result["usage"]["llm_calls"] == 1
+        assert get_usage_aggregator().snapshot() == [
+            {
+                "provider": "bedrock",
+                "model_id": CLAUDE,
+                "calls": 1,
+                "input_tokens": 120,
+                "output_tokens": 8,
+                "cache_read_tokens": 0,
+                "cache_write_tokens": 0,
+                "avg_latency_ms": pytest.approx(0.0, abs=50),
+                "avg_time_to_first_token_ms": None
+            }
+        ]
+
+    def test_summary_groups_tokens_by_provider_and_model(self):
+        """Test that a rewriter's tokens are not attributed to the model that answered."""
+        started = time.perf_counter()
+        with usage_collector() as usage:
+            record_llm_usage("bedrock", CLAUDE, 200, 12, started, None)
+            record_llm_usage("gemini", "gemini-1.5-flash", 900, 150, started, None)
+
+        summary = usage.summary()
+
+        assert (summary["provider"], summary["model_id"]) == ("gemini", "gemini-1.5-flash")
+        assert (summary["input_tokens"], summary["output_tokens"]) == (900, 150)
+        assert summary["llm_calls"] == 2
+        assert [(group["provider"], group["input_tokens"]) for group in summary["by_model"]] == [
+            ("bedrock", 200), ("gemini", 900)
+        ]
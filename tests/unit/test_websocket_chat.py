@@ -0,0 +1,123 @@
+"""
+Unit tests for WebSocket chat streaming.
+"""
+
+import asyncio
+import pytest
+from core.errors import ConnectionNotFoundError
+from application.services.rag_service import TurnRetrieval
+from application.services.websocket_chat_service import WebSocketChatService
+from infrastructure.streaming import coalesce_deltas
+from infrastructure.websocket import InMemoryConnectionRegistry, LocalManagementApiClient, create_connection_registry
+from infrastructure.websocket.registry import RedisConnectionRegistry
+
+
+async def collect(source):
+    return [item async for item in source]
+
+
+async def iterate(items, delay: float = 0.0):
+    for item in items:
+        await asyncio.sleep(delay)
+        yield item
+
+
+class TestCoalesceDeltas:
+    """Tests for delta coalescing."""
+
+    @pytest.mark.asyncio
+    async def test_small_deltas_merged_into_frames(self):
+        """Test that deltas are merged up to min_chars without losing text."""
+        deltas = ["ab"] * 50
+
+        frames = await collect(coalesce_deltas(iterate(deltas), min_chars=20, max_delay=10))
+
+        assert "".join(frames) == "ab" * 50
+        assert len(frames) == 5
+
+    @pytest.mark.asyncio
+    async def test_slow_source_flushed_after_max_delay(self):
+        """Test that a partial frame is sent once max_delay elapses."""
+        frames = await collect(coalesce_deltas(iterate(["a", "b"], delay=0.05), min_chars=100, max_delay=0.01))
+
+        assert frames == ["a", "b"]
+
+
+class TestWebSocketChatService:
+    """Tests for streaming chat over the local management API."""
+
+    @pytest.mark.asyncio
+    async def test_stream_chat_sends_start_deltas_and_end(self, streaming_rag_service):
+        """Test the frame sequence delivered to the connection."""
+        client = LocalManagementApiClient()
+        service = WebSocketChatService(streaming_rag_service(["Par", "is", "."]), client, frame_min_chars=4)
+
+        result = await service.stream_chat("conn-1", {"type": "chat", "content": "Capital of France?"})
+
+        messages = client.get_messages("conn-1")
+        assert messages[0]["type"] == "start"
+        assert messages[-1]["type"] == "end"
+        assert "".join(m["text"] for m in messages if m["type"] == "delta") == "Paris."
+        assert result["status"] == "completed"
+
+    @pytest.mark.asyncio
+    async def test_conversation_turns_are_sent_to_the_model(self, streaming_rag_service):
+        """Test that a message with a conversation ID carries the earlier turns."""
+        rag_service = streaming_rag_service(["Yes."])
+        earlier = [{"role": "user", "content": "Refund window?"}, {"role": "assistant", "content": "30 days."}]
+
+        async def retrieve_for_turn(query, conversation_id, domain="general", top_k=5, history=None):
+            return TurnRetrieval(contexts=[{"text": "30 days"}], source="retrieved", history=await history)
+
+        async def load_history():
+            return earlier
+
+        rag_service.retrieve_for_turn = retrieve_for_turn
+        rag_service.load_history = lambda conversation_id, query: load_history()
+        service = WebSocketChatService(rag_service, LocalManagementApiClient(), system_prompt="Be brief.")
+
+        await service.stream_chat("conn-1", {"content": "Online too?", "conversation_id": "conv-1"})
+
+        assert rag_service.messages == earlier + [{"role": "user", "content": "Online too?"}]
+
+    @pytest.mark.asyncio
+    async def test_disconnect_stops_generation(self, streaming_rag_service):
+        """Test that a gone connection cancels the upstream stream."""
+        client = LocalManagementApiClient()
+        rag_service = streaming_rag_service(["token "] * 100)
+        service = WebSocketChatService(rag_service, client, frame_min_chars=6)
+
+        async def disconnect_after_first_delta(connection_id, data):
+            if b'"delta"' in data:
+                client.mark_gone(connection_id)
+            await LocalManagementApiClient.post_to_connection(client, connection_id, data)
+
+        client.post_to_connection = disconnect_after_first_delta
+
+        with pytest.raises(ConnectionNotFoundError):
+            await service.stream_chat("conn-1", {"type": "chat", "content": "hi"})
+        assert rag_service.closed
+
+
+class TestConnectionRegistry:
+    """Tests for the connection registries."""
+
+    @pytest.mark.asyncio
+    async def test_connection_expires_after_ttl(self):
+        """Test that connections are forgotten after CONNECTION_TTL_SECONDS."""
+        now = [1000.0]
+        registry = InMemoryConnectionRegistry(ttl_seconds=60, clock=lambda: now[0])
+        await registry.register("conn-1", "user-1")
+
+        assert (await registry.get("conn-1")).user_id == "user-1"
+        now[0] += 61
+        assert await registry.get("conn-1") is None
+
+    def test_lambda_defaults_to_shared_registry(self, monkeypatch):
+        """Test that Lambda gets the Redis registry by default and rejects the per-process one."""
+        monkeypatch.setenv("AWS_LAMBDA_FUNCTION_NAME", "chat-ws")
+        monkeypatch.setenv("REDIS_URL", "redis://localhost:6379/0")
+
+        assert isinstance(create_connection_registry(), RedisConnectionRegistry)
+        with pytest.raises(ValueError):
+            create_connection_registry("memory")